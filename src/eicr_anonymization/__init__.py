@@ -0,0 +1,3 @@
+"""Anonymize eICR and RR documents."""
+
+__version__ = "0.3.0"
@@ -1,13 +1,78 @@
 """Main entry point for the EICR anonymization tool."""
 
-from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
+import sys
+from argparse import ArgumentParser, ArgumentTypeError, Namespace, RawDescriptionHelpFormatter
 
-from eicr_anonymization.anonymize_eicr import anonymize
+from eicr_anonymization import __version__
+from eicr_anonymization.data_pools import parse_pool_file
+from eicr_anonymization.sharding import parse_shard, summarize
 
+# Only modules that are quick to import are imported here. Modules that load lxml, pydantic, yaml
+# or usaddress are imported by the subcommand that needs them, so `--help` and `--version` and
+# mistakes in the arguments are reported without waiting for them.
 
-def _parse_arguments() -> Namespace:
+DEFAULT_COMMAND = "anonymize"
+
+
+def _positive_int(value: str) -> int:
+    """Parse a whole number of at least 1 given on the command line."""
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise ArgumentTypeError(f"Expected a whole number, got: {value}") from e  # noqa: TRY003
+    if number < 1:
+        raise ArgumentTypeError(f"Expected a number of at least 1, got: {value}")  # noqa: TRY003
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """Parse a number greater than 0 given on the command line."""
+    try:
+        number = float(value)
+    except ValueError as e:
+        raise ArgumentTypeError(f"Expected a number, got: {value}") from e  # noqa: TRY003
+    if not number > 0:
+        raise ArgumentTypeError(f"Expected a number greater than 0, got: {value}")  # noqa: TRY003
+    return number
+
+
+def _insert_default_command(parser: ArgumentParser, commands: set[str], argv: list[str]):
+    """Insert the default subcommand in front of the first positional argument if none is given.
+
+    argparse always assigns the first positional argument to the subcommand, so without this
+    `anonymize_eicr /path/to/eicrs` would be rejected as an unknown subcommand.
+
+    Args:
+        parser: The top-level argument parser
+        commands: Names of all subcommands
+        argv: Command-line arguments, without the program name
+
+    Returns:
+        Command-line arguments with a subcommand
+
+    """
+    skip_next = False
+    for i, arg in enumerate(argv):
+        if skip_next:
+            skip_next = False
+        elif arg == "--":
+            return [*argv[:i], DEFAULT_COMMAND, *argv[i:]]
+        elif arg.startswith("-"):
+            action = parser._option_string_actions.get(arg)
+            skip_next = action is not None and action.nargs != 0
+        elif arg in commands:
+            return argv
+        else:
+            return [*argv[:i], DEFAULT_COMMAND, *argv[i:]]
+    return argv
+
+
+def _parse_arguments(argv: list[str] | None = None) -> Namespace:
     """Parse command-line arguments for the EICR anonymization tool.
 
+    Args:
+        argv: Command-line arguments, defaults to `sys.argv`
+
     Returns:
         Parsed command-line arguments
 
@@ -20,11 +85,170 @@ def _parse_arguments() -> Namespace:
         "--config",
         help="Path to custom config file.",
     )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="Directory to write the anonymized files to, mirroring the layout of the input directory. Defaults to writing each anonymized file next to its original.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Skip files that are unchanged since they were last anonymized with the same config and version of the tool.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "--no-pretty-print",
+        action="store_false",
+        dest="pretty_print",
+        help="Keep the original whitespace instead of re-indenting the anonymized files.",
+    )
+    parser.add_argument(
+        "--preserve-declaration",
+        action="store_true",
+        help="Keep the XML declaration and encoding of the original files. By default the anonymized files are UTF-8 without an XML declaration.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        help="Compress the anonymized files. zstd requires the optional zstandard package.",
+    )
+
+    parser.add_argument(
+        "--stream",
+        choices=["newline", "length"],
+        help="Treat the input location as a stream of documents, either one document per line (newline) or each document preceded by a line with its length in bytes (length). Newline framing replaces line breaks inside documents with spaces, use length framing to keep them.",  # noqa: E501
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=_positive_int,
+        default=1,
+        help="Number of threads used to anonymize files. Documents in an archive or stream are "
+        "anonymized in parallel as well.",
+    )
+
+    parser.add_argument(
+        "--schedule",
+        choices=["size", "input"],
+        default="size",
+        help="Order to anonymize the files of a directory in: the largest first (size), so the run does not wait on a large file started last, or by path (input). Compressed files are ordered by their uncompressed size. Defaults to size.",  # noqa: E501
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        metavar="N",
+        help="Anonymize files in N worker processes instead of threads. Workers that go over --file-timeout or --max-worker-memory are killed and replaced. Each worker has its own replacements, use keyed mode for the same replacements in every file.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--file-timeout",
+        type=_positive_float,
+        metavar="SECONDS",
+        help="With --workers, fail a file that takes longer than SECONDS to anonymize.",
+    )
+    parser.add_argument(
+        "--max-worker-memory",
+        type=_positive_int,
+        metavar="MIB",
+        help="With --workers, fail the file being anonymized by a worker that uses more than MIB MiB of resident memory, and replace workers that have grown past it. Only on Linux.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--max-files-per-worker",
+        type=_positive_int,
+        metavar="N",
+        help="With --workers, replace every worker after it has anonymized N files.",
+    )
+    parser.add_argument(
+        "--quarantine-dir",
+        help="Copy files, or documents of an archive or stream, that could not be anonymized to this directory, with the reason next to them, and go on with the next files. Without it, the first file that fails stops the run.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "-k",
+        "--key-file",
+        help="File containing a secret key of at least 16 bytes. Turns on keyed mode, where replacements are derived from the original values and the key, so every run and every machine with the same key produces the same replacements. The key can also be given with the EICR_ANONYMIZATION_KEY environment variable.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "--data-pool",
+        type=parse_pool_file,
+        action="append",
+        dest="data_pools",
+        metavar="TYPE=PATH",
+        help="Replace the built-in replacement values of a data type (country, state, county, city, streetNameBase, streetNameType, family or given) with the values in a .yaml, .txt or packed .pool file. Can be given multiple times.",  # noqa: E501
+    )
 
-    parser.add_argument("-v", "--version", action="version", version="%(prog)s 0.3.0")
+    parser.add_argument(
+        "--max-mappings",
+        type=int,
+        metavar="N",
+        help="Keep at most N replacements in memory. The least recently used replacements are moved to a temporary database on disk, which is removed when the run ends, so every value keeps its replacement while memory use stays flat on long runs.",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="K/N",
+        help="Only anonymize the K-th of N shards of the input files. Files are split by a stable hash of their path, so N machines can each run one shard without coordinating. Each shard writes a run manifest and a stats file, which can be merged with the `summarize` subcommand.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=["file", "folder"],
+        default="file",
+        help="Split the input files individually (file), or keep all files in the same folder, like an eICR and its RR, in the same shard (folder).",  # noqa: E501
+    )
+
+    parser.add_argument(
+        "--huge-tree",
+        action="store_true",
+        help="Parse documents nested deeper, or with longer text, than libxml2 allows by default. Only use with trusted input.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--remove-blank-text",
+        action="store_true",
+        help="Drop whitespace-only text between elements while parsing, so pretty printed output is re-indented consistently.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--max-document-size",
+        type=int,
+        metavar="BYTES",
+        help="Fail documents larger than BYTES, after decompression, instead of parsing them.",
+    )
+    parser.add_argument(
+        "--max-nodes",
+        type=int,
+        metavar="N",
+        help="Fail documents with more than N elements while they are parsed.",
+    )
+
+    parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {__version__}")
 
     subparsers = parser.add_subparsers(
-        description="There is currently only one subcommand.", dest="command"
+        description=f"If no subcommand is given, `{DEFAULT_COMMAND}` is used.", dest="command"
+    )
+    subparsers.add_parser(DEFAULT_COMMAND, help="Anonymize the input files.")
+    subparsers.add_parser(
+        "summarize",
+        help="Merge the stats files written by all shards in the input location, a directory, into one batch summary.",  # noqa: E501
+    )
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a service that anonymizes documents sent to it over HTTP. The input location is the address to listen on, HOST:PORT or the path of a Unix socket.",  # noqa: E501
+    )
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep watching the input location, a directory, and anonymize files as they land in it.",  # noqa: E501
+    )
+    scan_parser = subparsers.add_parser(
+        "scan",
+        help="Count the sensitive elements of the input files by CDA type, tag, path and configuration rule, without anonymizing them.",  # noqa: E501
+    )
+    verify_parser = subparsers.add_parser(
+        "verify",
+        help="Check the anonymized versions of the input files, found with the same options they were anonymized with, for sensitive values of the originals that were left in them.",  # noqa: E501
     )
     debug_parser = subparsers.add_parser(
         "debug",
@@ -39,14 +263,64 @@ Only use with sample/test data, never with real sensitive data.""",  # noqa: E50
     )
     parser.add_argument(
         "input_location",
-        help="This can be either a directory or an xml file. If it is a directory the Anonymization tool will attempt to anonymize all XML files in the directory.",  # noqa: E501
+        help="This can be either a directory or an xml file. If it is a directory the Anonymization tool will attempt to anonymize all XML files in the directory. Files compressed with gzip (.xml.gz) or zstd (.xml.zst) are decompressed while they are read. It can also be a zip or tar archive of XML files, or a stream of documents (see --stream).",  # noqa: E501
+    )
+
+    serve_parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="Maximum number of requests being anonymized or waiting for a thread. Further requests are rejected with 503 until one finishes. Defaults to four times the threads.",  # noqa: E501
+    )
+    serve_parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=None,
+        help="Maximum size of a document sent to the service, in bytes. Defaults to 64 MiB.",
+    )
+
+    watch_parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=1.0,
+        help="How long a file must stop changing before it is anonymized, so files that are still being written are not picked up.",  # noqa: E501
+    )
+    watch_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Rescan the directory tree every POLL_INTERVAL seconds instead of using inotify, e.g. for network file systems that do not report changes.",  # noqa: E501
+    )
+
+    scan_parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Save all counts as JSON to PATH.",
+    )
+    scan_parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of the most common tags and paths to print. Defaults to 20.",
+    )
+
+    verify_parser.add_argument(
+        "--min-length",
+        type=int,
+        default=4,
+        help="Only check for sensitive values at least this many characters long, as shorter values are likely to appear by chance.",  # noqa: E501
     )
 
     debug_parser.add_argument(
         "-d",
         "--debug",
         action="store_true",
-        help="Print table showing original and replacement tags. Will show sensitive information.",
+        help="Print every replacement, with the original value, as it is made. Will show sensitive information.",  # noqa: E501
+    )
+    debug_parser.add_argument(
+        "--audit-log",
+        metavar="PATH",
+        help="Write every replacement, with the original value, to a JSON Lines (.jsonl) or CSV (.csv) file as it is made, compressed if the name ends with .gz or .zst. Will contain sensitive information.",  # noqa: E501
     )
     debug_parser.add_argument(
         "-s",
@@ -64,13 +338,40 @@ Only use with sample/test data, never with real sensitive data.""",  # noqa: E50
         help="The same value will always be replaced with the same new value regardless of run or seed." # noqa: E501
     )
 
-    return parser.parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+    return parser.parse_args(_insert_default_command(parser, set(subparsers.choices), argv))
 
 
 def main() -> None:
     """Run the EICR anonymization tool."""
     args = _parse_arguments()
+    if args.command == "summarize":
+        summarize(args.input_location)
+        return
+    if args.command == "serve":
+        from eicr_anonymization.service import serve  # noqa: PLC0415
+
+        serve(args)
+        return
+    if args.command == "watch":
+        from eicr_anonymization.watch import watch  # noqa: PLC0415
+
+        watch(args)
+        return
+    if args.command == "scan":
+        from eicr_anonymization.scan import scan  # noqa: PLC0415
+
+        scan(args)
+        return
+    if args.command == "verify":
+        from eicr_anonymization.verify import verify  # noqa: PLC0415
+
+        if not verify(args):
+            sys.exit(1)
+        return
     print("Starting EICR anonymization...")
+    from eicr_anonymization.anonymize_eicr import anonymize  # noqa: PLC0415
+
     anonymize(args)
 
 
@@ -0,0 +1,201 @@
+"""Parse street address lines into labeled components.
+
+Most street address lines have one of a few simple shapes, like "123 Main St", "PO Box 45" or
+"456 Oak Ave Apt 7". These are recognized by a fast rule-based parser that gives exactly the same
+result as `usaddress.parse`. Everything else is parsed by `usaddress`.
+"""
+
+import re
+import threading
+from collections.abc import Iterable
+
+type Component = tuple[str, str]
+
+# Street types usaddress reliably labels as the type of the street, with their usual abbreviation.
+# Rare types, like "Lght" or "Grove", and rare spellings, like "Boul" or "Highwy", are often
+# labeled as part of the street name instead, so lines with them fall back.
+COMMON_STREET_TYPES = {
+    "avenue": "ave",
+    "boulevard": "blvd",
+    "circle": "cir",
+    "court": "ct",
+    "drive": "dr",
+    "highway": "hwy",
+    "lane": "ln",
+    "parkway": "pkwy",
+    "place": "pl",
+    "road": "rd",
+    "street": "st",
+    "terrace": "ter",
+    "trail": "trl",
+    "way": None,
+}
+DIRECTIONS = frozenset({"n", "s", "e", "w", "ne", "nw", "se", "sw"})
+DIRECTION_WORDS = frozenset(
+    {"north", "south", "east", "west", "northeast", "northwest", "southeast", "southwest"}
+)
+# Directions usaddress reliably labels as following the street. "E" is sometimes read as a unit
+POST_DIRECTIONS = DIRECTIONS - {"e"}
+# Words that usaddress reads as the type of the street when they come before the name, like
+# "County Road 12", or as the name of a place, like "Cloud City"
+PRE_TYPE_WORDS = frozenset({"county", "state", "route", "rte", "us", "interstate"})
+PLACE_WORDS = frozenset({"city"})
+OCCUPANCY_TYPES = frozenset({"apt", "unit", "suite", "ste"})
+USPS_BOX_TYPES = frozenset({"po", "p.o."})
+MAX_STREET_NAME_WORDS = 3
+# A street needs at least a name and a type
+_NAME_AND_TYPE = 2
+_PO_BOX_LENGTH = 3
+
+# usaddress keeps line breaks and tabs as part of the tokens, so only lines without them are simple
+_SINGLE_LINE = re.compile(r"[ \S]*")
+_NUMBER = re.compile(r"\d+")
+_WORD = re.compile(r"[A-Za-z]+")
+_OCCUPANCY_ID = re.compile(r"\d+[A-Za-z]?|[A-Za-z]")
+
+
+class StreetAddressParser:
+    """Parse street address lines, taking a fast path for the most common shapes."""
+
+    def __init__(self, street_types: Iterable[dict]):
+        """Build the street type tables.
+
+        Args:
+            street_types: The street types with their abbreviations, from `street_types.yaml`
+        """
+        # Every street type, which are never accepted as street names by the fast path
+        self.street_types: set[str] = set()
+        for street_type in street_types:
+            words = {street_type["value"].lower()}
+            words.update(
+                abbreviation.lower() for abbreviation in street_type.get("abbreviations", [])
+            )
+            self.street_types.update(words)
+        self.common_street_types = {
+            spelling
+            for value, abbreviation in COMMON_STREET_TYPES.items()
+            for spelling in (value, abbreviation)
+            if spelling is not None
+        }
+
+        self.fast_path_hits = 0
+        self.fallbacks = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lines parsed by the fast path."""
+        total = self.fast_path_hits + self.fallbacks
+        return self.fast_path_hits / total if total else 0
+
+    def report(self) -> str:
+        """Describe how many lines were parsed by the fast path."""
+        total = self.fast_path_hits + self.fallbacks
+        return (
+            f"Street address lines parsed by the fast path: {self.fast_path_hits} of {total} "
+            f"({self.hit_rate:.1%})"
+        )
+
+    def parse(self, value: str) -> list[Component]:
+        """Parse a street address line into labeled components, like `usaddress.parse`.
+
+        Args:
+            value: The street address line
+
+        Returns:
+            Every token of the line with its label
+
+        """
+        components = self.parse_fast(value)
+        with self._stats_lock:
+            if components is None:
+                self.fallbacks += 1
+            else:
+                self.fast_path_hits += 1
+        if components is None:
+            # usaddress loads its model when it is imported, so it is only imported when needed
+            import usaddress  # noqa: PLC0415
+
+            return usaddress.parse(value)
+        return components
+
+    def parse_fast(self, value: str) -> list[Component] | None:
+        """Parse a street address line if it has one of the common shapes.
+
+        Args:
+            value: The street address line
+
+        Returns:
+            Every token of the line with its label, or None if the line needs `usaddress`
+
+        """
+        if not _SINGLE_LINE.fullmatch(value):
+            return None
+        tokens = value.split()
+        lowered = [token.lower() for token in tokens]
+        if len(tokens) == _PO_BOX_LENGTH and lowered[0] in USPS_BOX_TYPES:
+            return _parse_po_box(tokens, lowered)
+        if len(tokens) <= _NAME_AND_TYPE or not _NUMBER.fullmatch(tokens[0]):
+            return None
+        return self._parse_street(tokens, lowered)
+
+    def _parse_street(self, tokens: list[str], lowered: list[str]) -> list[Component] | None:
+        """Parse a line of a number, a street name and type, with optional directions and unit."""
+        start, end = 1, len(tokens)
+        prefix = [(tokens[0], "AddressNumber")]
+        if lowered[start] in DIRECTIONS and end - start > _NAME_AND_TYPE:
+            prefix.append((tokens[start], "StreetNamePreDirectional"))
+            start += 1
+        suffix = []
+        if (
+            end - start >= _NAME_AND_TYPE + 2
+            and lowered[end - 2] in OCCUPANCY_TYPES
+            and _OCCUPANCY_ID.fullmatch(tokens[end - 1])
+        ):
+            suffix = [(tokens[end - 2], "OccupancyType"), (tokens[end - 1], "OccupancyIdentifier")]
+            end -= 2
+        if end - start > _NAME_AND_TYPE and lowered[end - 1] in DIRECTIONS:
+            if lowered[end - 1] not in POST_DIRECTIONS or lowered[end - 2].endswith("."):
+                # usaddress sometimes reads these as a unit
+                return None
+            suffix.insert(0, (tokens[end - 1], "StreetNamePostDirectional"))
+            end -= 1
+
+        street_type = lowered[end - 1].removesuffix(".")
+        if end - start < _NAME_AND_TYPE or street_type not in self.common_street_types:
+            return None
+        names = tokens[start : end - 1]
+        has_pre_directional = len(prefix) > 1
+        if len(names) > (1 if has_pre_directional else MAX_STREET_NAME_WORDS):
+            # usaddress labels longer names after a direction inconsistently
+            return None
+        if lowered[start] in PRE_TYPE_WORDS or not all(
+            self._is_plain_street_name(name) for name in names
+        ):
+            return None
+
+        return [
+            *prefix,
+            *((name, "StreetName") for name in names),
+            (tokens[end - 1], "StreetNamePostType"),
+            *suffix,
+        ]
+
+    def _is_plain_street_name(self, name: str) -> bool:
+        """Check if a word can only be part of a street name, not a type, direction or unit."""
+        lowered = name.lower()
+        return (
+            _WORD.fullmatch(name) is not None
+            and lowered not in self.street_types
+            and lowered not in DIRECTIONS
+            and lowered not in DIRECTION_WORDS
+            and lowered not in OCCUPANCY_TYPES
+            and lowered not in PLACE_WORDS
+        )
+
+
+def _parse_po_box(tokens: list[str], lowered: list[str]) -> list[Component] | None:
+    """Parse a line like "PO Box 45"."""
+    if lowered[1] != "box" or not _NUMBER.fullmatch(tokens[2]):
+        return None
+    return [(tokens[0], "USPSBoxType"), (tokens[1], "USPSBoxType"), (tokens[2], "USPSBoxID")]
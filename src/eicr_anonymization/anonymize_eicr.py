@@ -1,34 +1,150 @@
 """Main module for the EICR anonymization tool."""
 
 import glob
+import hmac
 import logging
 import os
+import shutil
+import sys
+import time
 from argparse import Namespace
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import BinaryIO
 
 from lxml import etree
-from lxml.etree import _Element, _ElementTree
-from tabulate import tabulate
+from lxml.etree import _ElementTree
 
 from eicr_anonymization.anonymizer import Anonymizer, DebugOptions
-from eicr_anonymization.element_parser import Element, Parser
+from eicr_anonymization.audit import AuditLog, open_audit_log
+from eicr_anonymization.element_parser import Element, Findings, Parser
+from eicr_anonymization.file_io import (
+    COMPRESSION_SUFFIXES,
+    Compression,
+    atomic_write,
+    strip_compression_suffix,
+)
+from eicr_anonymization.handlers import HandlerContext, HandlerRegistry, default_handlers
+from eicr_anonymization.manifest import Manifest, hash_file, manifest_file_name, options_hash
+from eicr_anonymization.scheduling import chunk_jobs, estimated_size, largest_first
+from eicr_anonymization.sharding import RunRecorder, select_shard
+from eicr_anonymization.xml_reader import DEFAULT_READ_OPTIONS, ReadOptions, read_xml
 
 logger = logging.getLogger(__name__)
 
 NAMESPACE = "urn:hl7-org:v3"
 NAMESPACES = {"ns": NAMESPACE}
 
+ANONYMIZED_SUFFIX = ".anonymized.xml"
 
-def _delete_old_anonymized_files(input_location: str) -> None:
-    """Remove previously anonymized XML files from the input location.
+KEY_ENVIRONMENT_VARIABLE = "EICR_ANONYMIZATION_KEY"
+
+
+def discover_xml_files(input_location: str, output_dir: str | None = None) -> list[str]:
+    """Find all XML files to anonymize in a directory tree.
+
+    Compressed XML files (`.xml.gz` and `.xml.zst`) are included. Previously anonymized files and
+    anything inside the output directory are skipped so that re-running the tool never anonymizes
+    its own output.
+
+    Args:
+        input_location: Directory to search
+        output_dir: Directory the anonymized files are written to, if different from the input
+
+    Returns:
+        Sorted list of paths to the XML files
+
+    """
+    xml_files = []
+    for suffix in ["", *COMPRESSION_SUFFIXES.values()]:
+        pattern = os.path.join(input_location, "**", f"*.xml{suffix}")
+        xml_files.extend(
+            xml_file
+            for xml_file in glob.glob(pattern, recursive=True)
+            if is_input_file(xml_file, output_dir)
+        )
+    return sorted(xml_files)
+
+
+def is_input_file(path: str, output_dir: str | None = None) -> bool:
+    """Check if a file is an XML file to anonymize, see `discover_xml_files`.
+
+    Hidden files, like the temporary files anonymized files are written to, are not.
+
+    Args:
+        path: Path to the file
+        output_dir: Directory the anonymized files are written to, if different from the input
+
+    Returns:
+        True if the file should be anonymized
+
+    """
+    if os.path.basename(path).startswith("."):
+        return False
+    name = strip_compression_suffix(path)
+    if not name.endswith(".xml") or name.endswith(ANONYMIZED_SUFFIX):
+        return False
+    if output_dir:
+        output_root = os.path.join(os.path.realpath(output_dir), "")
+        return not os.path.realpath(path).startswith(output_root)
+    return True
+
+
+def get_output_path(
+    xml_file: str,
+    input_root: str,
+    output_dir: str | None = None,
+    compression: Compression | None = None,
+) -> str:
+    """Get the path the anonymized version of a file is written to.
+
+    Without an output directory the anonymized file is written next to the original. With an
+    output directory the layout of the input tree is mirrored inside it. The compression extension
+    of the original file is dropped and replaced with that of the output compression, if any.
+
+    Args:
+        xml_file: Path to the original XML file
+        input_root: Directory the input tree starts at
+        output_dir: Directory to write the anonymized files to
+        compression: Compression of the anonymized file
+
+    Returns:
+        Path of the anonymized file
+
+    """
+    output_file = strip_compression_suffix(xml_file)
+    if output_dir is not None:
+        output_file = os.path.join(output_dir, os.path.relpath(output_file, input_root))
+    output_file += ANONYMIZED_SUFFIX
+    if compression is not None:
+        output_file += COMPRESSION_SUFFIXES[compression]
+    return output_file
+
+
+def quarantine_file(xml_file: str, input_root: str, quarantine_dir: str, reason: str) -> str:
+    """Copy a file that could not be anonymized into the quarantine directory.
+
+    The layout of the input tree is mirrored inside the quarantine directory, and the reason the
+    file failed is written next to the copy, to a file with the same name and `.error.txt` added.
 
     Args:
-        input_location: Directory path containing XML files
+        xml_file: Path to the original file
+        input_root: Directory the input tree starts at
+        quarantine_dir: Directory to copy the file to
+        reason: Why the file could not be anonymized
+
+    Returns:
+        Path of the copy
 
     """
-    previous_output_files = glob.glob(os.path.join(input_location, "*.anonymized.xml"))
-    for output_file in previous_output_files:
-        os.remove(output_file)
-        print(f"Deleted previous anonymized file: {output_file}.anonymized.xml")
+    quarantined_file = os.path.join(quarantine_dir, os.path.relpath(xml_file, input_root))
+    with atomic_write(quarantined_file) as f, open(xml_file, "rb") as original:
+        shutil.copyfileobj(original, f)
+    with atomic_write(quarantined_file + ".error.txt") as f:
+        f.write(f"{reason}\n".encode())
+    return quarantined_file
 
 
 def xml_tree_to_str(tree: _ElementTree) -> str:
@@ -41,8 +157,39 @@ def xml_tree_to_str(tree: _ElementTree) -> str:
     return etree.tostring(tree, pretty_print=True, encoding="unicode")
 
 
+def write_xml_tree(
+    tree: _ElementTree,
+    stream: BinaryIO,
+    pretty_print: bool = True,
+    preserve_declaration: bool = False,
+) -> None:
+    """Serialize an XML tree directly to a binary stream.
+
+    Args:
+        tree: XML Element tree to be written
+        stream: Binary stream to write to
+        pretty_print: Re-indent the document. Turning this off keeps the original whitespace
+        preserve_declaration: Write an XML declaration with the encoding and standalone flag of the
+            original document. Otherwise no declaration is written and the output is UTF-8
+    """
+    if preserve_declaration:
+        tree.write(
+            stream,
+            encoding=tree.docinfo.encoding or "UTF-8",
+            xml_declaration=True,
+            standalone=tree.docinfo.standalone,
+            pretty_print=pretty_print,
+        )
+    else:
+        tree.write(stream, encoding="utf-8", xml_declaration=False, pretty_print=pretty_print)
+
+
 def anonymize_eicr_file(
-    xml_file: str, anonymizer: Anonymizer, parser: Parser, show_debug_info: bool = False
+    xml_file: str,
+    anonymizer: Anonymizer,
+    parser: Parser,
+    audit: AuditLog | None = None,
+    read_options: ReadOptions = DEFAULT_READ_OPTIONS,
 ) -> _ElementTree:
     """
     Anonymize a single EICR XML file.
@@ -50,181 +197,474 @@ def anonymize_eicr_file(
     Args:
         xml_file: Path to the XML file to anonymize
         anonymizer: Anonymizes the data
-        debug: Flag to enable debug output
+        parser: Finds the sensitive elements
+        audit: Audit log every replacement is recorded in
+        read_options: How the file is parsed, and the limits it must be within
 
     """
-    # Parse the XML file
+    # Parse the XML file, decompressing it while it is read if it is compressed
     # This will raise an error if the file is empty.
     # Perhaps later we can handle this more gracefully.
-    tree = etree.parse(xml_file, None)
+    tree = read_xml(xml_file, read_options)
+
+    return anonymize_eicr_tree(tree, xml_file, anonymizer, parser, audit)
+
+
+def anonymize_eicr_tree(  # noqa: PLR0913
+    tree: _ElementTree,
+    name: str,
+    anonymizer: Anonymizer,
+    parser: Parser,
+    audit: AuditLog | None = None,
+    *,
+    handlers: HandlerRegistry = default_handlers,
+    verbose: bool = True,
+) -> _ElementTree:
+    """
+    Anonymize a parsed EICR XML document in place.
+
+    Args:
+        tree: Parsed XML document to anonymize
+        name: Name of the document, used in messages and the audit log
+        anonymizer: Anonymizes the data
+        parser: Finds the sensitive elements
+        audit: Audit log every replacement is recorded in, as it is made
+        handlers: Anonymize the sensitive elements, by CDA type and tag
+        verbose: Print how many sensitive elements were anonymized, and how many elements the
+            parser skipped
+
+    """
     root = tree.getroot()
 
     # Get the first element and pass it into th elementProcessor
     first_element = next(root.iter())
 
-    sensitive_elements, safe_words = parser.collect_sensitive_elements_and_safe_words(first_element)
+    found = parser.collect(first_element, Findings())
+    sensitive_elements, safe_words = found.sensitive_elements, found.safe_text
 
-    debug_output: list[tuple[Element, Element | str]] = []
+    # Safe text only applies to the document it was found in
+    document_safe_words = anonymizer.get_safe_words(safe_words)
 
+    context = HandlerContext(anonymizer, safe_words, document_safe_words)
     for element in sensitive_elements:
-        match element.cda_type:
-            case "TS" | "IVL_TS" | "PIVL_TS" | "IVXB_TS" | "SXCM_TS":
-                match = _find_element(root, element.path)
-                match.attrib["value"] = anonymizer.anonymize_TS_value(element)
-                debug_output.append((element, Element(match, "TS")))
-            case "II":
-                match = _find_element(root, element.path)
-                match.attrib["extension"] = anonymizer.anonymize_II_value(element)
-                debug_output.append((element, Element(match, "II")))
-            case "ADXP":
-                match element.name:
-                    case "{urn:hl7-org:v3}city":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "city")
-                        debug_output.append((element, Element(match, "ADXP")))
-                    case "{urn:hl7-org:v3}streetAddressLine":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.anonymize_streetAddressLine_value(element)
-                        debug_output.append((element, Element(match, "ADXP")))
-                    case "{urn:hl7-org:v3}country":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "country")
-                        debug_output.append((element, Element(match, "ADXP")))
-                    case "{urn:hl7-org:v3}county":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "county")
-                        debug_output.append((element, Element(match, "ADXP")))
-                    case "{urn:hl7-org:v3}postalCode":
-                        match = _find_element(root, element.path)
-                        if element.text is not None:
-                            match.text = anonymizer.replace_with_like_chars(
-                                element.text, "postalCode"
-                            )
-                            debug_output.append((element, Element(match, "ADXP")))
-                    case "{urn:hl7-org:v3}state":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "state")
-                        debug_output.append((element, Element(match, "ADXP")))
-                    case _:
-                        match = _find_element(root, element.path)
-                        match.text = "REMOVED"
-                        debug_output.append((element, Element(match, "ADXP")))
-            case "ENXP":
-                match element.name:
-                    case "{urn:hl7-org:v3}given":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "given")
-                        debug_output.append((element, Element(match, "ENXP")))
-                    case "{urn:hl7-org:v3}family":
-                        match = _find_element(root, element.path)
-                        match.text = anonymizer.replace_from_pool(element.text, "family")
-                        debug_output.append((element, Element(match, "ENXP")))
-                    case _:
-                        match = _find_element(root, element.path)
-                        match.text = "REMOVED"
-                        debug_output.append((element, Element(match, "ENXP")))
-            case "EN" | "PN" | "ON":
-                match = _find_element(root, element.path)
-                match.text = anonymizer.anonymize_EN_value(element)
-                debug_output.append((element, Element(match, element.cda_type)))
-            case "xhtml":
-                match = _find_element(root, element.path)
-                anonymizer.anonymize_xhtml(match, safe_words)
-            case "TEL":
-                match = _find_element(root, element.path)
-                value = element.attributes.get("value")
-                if value is not None and not value.startswith("#"):
-                    match.attrib["value"] = anonymizer.anonymize_TEL_value(element)
-                debug_output.append((element, Element(match, "TEL")))
-            case "ED":
-                match = _find_element(root, element.path)
-                match.text = anonymizer.anonymize_text(element.text, "state")
-                debug_output.append((element, Element(match, "ED")))
-            case _:
-                if element.attributes.get("value") is not None:
-                    match = _find_element(root, element.path)
-                    match.attrib["value"] = anonymizer.remove_unknown_text(match.attrib["value"])
-                if element.text is not None and element.text.strip() != "":
-                    match = _find_element(root, element.path)
-                    match.text = anonymizer.remove_unknown_text(match.text)
-
-    print(f"Anonymized {len(sensitive_elements)} sensitive elements in file: {xml_file}")
-    debug_output_table = tabulate(
-        debug_output,
-        headers=("Original", "Replacement"),
-        tablefmt="fancy_outline",
-    )
-
-    if show_debug_info:
-        print(debug_output_table)
+        match = element.xml_element
+        handler = handlers.resolve(element.cda_type, element.name)
+        recorded_type = handler(context, element, match)
+        if audit is not None and recorded_type is not None:
+            audit.record(name, element, Element(match, recorded_type))
+
+    if verbose:
+        # Elements are only skipped in safe subtrees that cannot add anything, of which the
+        # shipped configuration has none, so this is 0 unless a custom configuration adds some
+        print(
+            f"Anonymized {len(sensitive_elements)} sensitive elements, skipped "
+            f"{found.skipped_elements} elements in safe subtrees, in file: {name}"
+        )
 
     return tree
 
 
-def save_anonymized_file(tree: _ElementTree, xml_file: str) -> None:
-    """Write an anonymized XML tree to file with .anonymized appended to original file name.
+def save_anonymized_file(
+    tree: _ElementTree,
+    anonymized_file: str,
+    pretty_print: bool = True,
+    preserve_declaration: bool = False,
+    compression: Compression | None = None,
+) -> None:
+    """Write an anonymized XML tree to file.
+
+    The file is written to a temporary file first and then renamed, so readers never see a
+    partially written file.
 
     Args:
         tree: Anonymized XML tree
-        xml_file: Path to the original XML file that has been anonymized
+        anonymized_file: Path to write the anonymized XML file to
+        pretty_print: Re-indent the document
+        preserve_declaration: Keep the XML declaration and encoding of the original document
+        compression: Compress the anonymized file while it is written
 
     """
-    # Save the anonymized XML file
-    anonymized_file = os.path.join(
-        os.path.dirname(xml_file),
-        f"{os.path.basename(xml_file)}.anonymized.xml",
-    )
-
-    xml_string = xml_tree_to_str(tree)
-
-    with open(anonymized_file, "w", encoding="utf-8") as f:
-        f.write(xml_string)
+    with atomic_write(anonymized_file, compression) as f:
+        write_xml_tree(tree, f, pretty_print, preserve_declaration)
 
 
-def _find_element(root: _Element, path: str):
-    """Find all elements for a given path with the HL7 namespace in an EICR XML file.
+def _find_input_files(input_location: str, output_dir: str | None) -> tuple[str, list[str]]:
+    """Find the files to anonymize for the given input location.
 
     Args:
-        root: Root XML element to search
-        path: XPath query to find elements
+        input_location: Directory or XML file to anonymize
+        output_dir: Directory the anonymized files are written to
 
     Returns:
-        List of matching XML elements
+        The directory the input tree starts at and the XML files to anonymize
 
     """
-    return root.xpath(path, namespaces=NAMESPACES)[0]
+    if os.path.isdir(input_location):
+        xml_files = discover_xml_files(input_location, output_dir)
+        if not xml_files:
+            print(f"No XML files found in directory: {input_location}")
+        else:
+            print(f"Found {len(xml_files)} XML files in directory: {input_location}")
+        return input_location, xml_files
+    elif os.path.isfile(input_location):
+        print(f"Anonymizing file: {input_location}")
+        return os.path.dirname(input_location) or ".", [input_location]
+    else:
+        print(f"Input location is not a file or directory: {input_location}")
+        return "", []
 
 
-def anonymize(args: Namespace) -> None:
-    """Run the EICR anonymization process."""
+def read_key(key_file: str | None) -> bytes | None:
+    """Read the secret key for keyed mode from a file or the `EICR_ANONYMIZATION_KEY` variable."""
+    if key_file is not None:
+        with open(key_file, "rb") as f:
+            return f.read().rstrip(b"\r\n")
+    key = os.environ.get(KEY_ENVIRONMENT_VARIABLE)
+    return key.encode("utf-8") if key else None
+
+
+def _is_archive(input_location: str) -> bool:
+    from eicr_anonymization.bundles import get_archive_format  # noqa: PLC0415
+
+    return os.path.isfile(input_location) and get_archive_format(input_location) is not None
+
+
+def _anonymize_bundle(args: Namespace, anonymizer: Anonymizer) -> None:
+    """Anonymize an archive or multi-document stream given on the command line."""
+    # Imported here, as the bundles module builds on this one
+    from eicr_anonymization.bundles import (  # noqa: PLC0415
+        BundleOptions,
+        anonymize_bundle,
+        get_bundle_output_path,
+    )
+
+    output_path = get_bundle_output_path(args.input_location, args.output_dir)
+    print(f"Anonymizing bundle: {args.input_location}")
+    with _open_audit_log(args) as audit:
+        anonymize_bundle(
+            args.input_location,
+            output_path,
+            anonymizer,
+            Parser(custom_config_path=args.config),
+            BundleOptions.from_args(args, audit),
+        )
+    print(f"Anonymized bundle written to: {output_path}")
+    print(anonymizer.address_parser.report())
+    if audit is not None and args.audit_log is not None:
+        print(f"Recorded {audit.records} replacements in audit log: {args.audit_log}")
+
+
+@contextmanager
+def _open_audit_log(args: Namespace) -> Iterator[AuditLog | None]:
+    """Open the audit log asked for in debug mode, a file or standard output, if any."""
+    if args.command != "debug":
+        yield None
+    elif args.audit_log is not None:
+        with open_audit_log(args.audit_log) as audit:
+            yield audit
+    elif args.debug:
+        yield AuditLog(sys.stdout)
+    else:
+        yield None
+
+
+def create_anonymizer(args: Namespace) -> Anonymizer:
+    """Create an anonymizer with the options given on the command line."""
     debugOptions = None
     if args.command == "debug":
         debugOptions = DebugOptions(args.seed, args.deterministic_functions)
-    anonymizer = Anonymizer(debugOptions)
+    return Anonymizer(
+        debugOptions,
+        read_key(args.key_file),
+        pool_files=dict(args.data_pools or []),
+        max_mappings_in_memory=args.max_mappings,
+    )
+
+
+def anonymize(args: Namespace) -> None:
+    """Run the EICR anonymization process."""
+    if args.workers is not None and args.command == "debug" and (args.audit_log or args.debug):
+        print("The audit log cannot be written by worker processes, use --threads instead")
+        return
+    anonymizer = create_anonymizer(args)
+    if args.stream is not None or _is_archive(args.input_location):
+        _anonymize_bundle(args, anonymizer)
+        return
     parser = Parser(custom_config_path=args.config)
-    if os.path.isdir(args.input_location):
-        _delete_old_anonymized_files(args.input_location)
+    input_root, xml_files = _find_input_files(args.input_location, args.output_dir)
+    if not xml_files:
+        return
 
-        xml_files = glob.glob(os.path.join(args.input_location, "*.xml"))
-        if not xml_files:
-            print(f"No XML files found in directory: {args.input_location}")
-            return
-        print(f"Found {len(xml_files)} XML files in directory: {args.input_location}")
+    recorder = None
+    if args.shard is not None:
+        files_found = len(xml_files)
+        xml_files = select_shard(xml_files, input_root, args.shard, args.shard_by)
+        print(f"Shard {args.shard.index}/{args.shard.count} has {len(xml_files)} of the files")
+        recorder = RunRecorder(
+            args.output_dir or input_root, args.shard, files_found, len(xml_files)
+        )
+
+    start = time.perf_counter()
+    try:
+        with _open_audit_log(args) as audit:
+
+            def anonymize_file(xml_file: str, output_file: str) -> None:
+                anonymize_and_save(args, xml_file, output_file, anonymizer, parser, audit=audit)
+
+            run = _FileRun(args, input_root, parser, recorder)
+            _anonymize_files(args, run, xml_files, anonymize_file)
+        # Worker processes have anonymizers of their own
+        if args.workers is None:
+            print(anonymizer.address_parser.report())
+            if args.max_mappings is not None:
+                print(anonymizer.mappings.report())
+        if audit is not None and args.audit_log is not None:
+            print(f"Recorded {audit.records} replacements in audit log: {args.audit_log}")
+    finally:
+        if recorder is not None:
+            recorder.save(time.perf_counter() - start)
+        anonymizer.mappings.close()
+
+
+def anonymize_and_save(  # noqa: PLR0913
+    args: Namespace,
+    xml_file: str,
+    output_file: str,
+    anonymizer: Anonymizer,
+    parser: Parser,
+    *,
+    audit: AuditLog | None = None,
+) -> None:
+    """Anonymize an XML file and save it with the output options given on the command line."""
+    anonymized_file = anonymize_eicr_file(
+        xml_file, anonymizer, parser, audit, ReadOptions.from_args(args)
+    )
+    save_anonymized_file(
+        anonymized_file,
+        output_file,
+        args.pretty_print,
+        args.preserve_declaration,
+        args.compress,
+    )
+
+
+def output_options_hash(args: Namespace, parser: Parser) -> str:
+    """Hash the configuration with every option given on the command line that changes the output.
+
+    Used in incremental mode, so files are anonymized again when any of them changes. The key is
+    only recorded as a fingerprint derived from it, and pool files by the hash of their contents.
+    """
+    key = read_key(args.key_file)
+    options = {
+        "compress": args.compress,
+        "pretty_print": args.pretty_print,
+        "preserve_declaration": args.preserve_declaration,
+        "remove_blank_text": args.remove_blank_text,
+        "key": None if key is None else hmac.digest(key, b"manifest", "sha256").hex(),
+        "data_pools": {data_type: hash_file(path) for data_type, path in args.data_pools or []},
+        "seed": getattr(args, "seed", None),
+        "deterministic_functions": getattr(args, "deterministic_functions", False),
+    }
+    return options_hash(parser.config_hash, options)
+
+
+def check_unchanged(
+    manifest: Manifest | None, xml_file: str, input_root: str, config_hash: str, output_file: str
+) -> tuple[bool, str | None]:
+    """Check if a file is unchanged since it was last anonymized, also returning its hash."""
+    if manifest is None:
+        return False, None
+    input_hash = hash_file(xml_file)
+    key = os.path.relpath(xml_file, input_root)
+    return manifest.is_up_to_date(key, input_hash, config_hash, output_file), input_hash
+
+
+class AnonymizationFailed(RuntimeError):
+    """Exception raised when a file anonymized in a worker process fails without quarantine."""
+
+    def __init__(self, xml_file: str, reason: str):
+        """Initialize the exception with the file and why it failed."""
+        super().__init__(f"Could not anonymize file {xml_file}: {reason}")
+
+
+class _FileRun:
+    """Skips unchanged files in incremental mode, and records files as they finish.
+
+    A file that fails stops the run, unless there is a quarantine directory to copy it to.
+    """
+
+    def __init__(
+        self, args: Namespace, input_root: str, parser: Parser, recorder: RunRecorder | None = None
+    ):
+        self.args = args
+        self.input_root = input_root
+        self.recorder = recorder
+        self.manifest = None
+        self.config_hash = ""
+        if args.incremental:
+            manifest_dir = args.output_dir or input_root
+            # Every shard keeps its own manifest, so shards sharing a directory never overwrite it
+            suffix = args.shard.suffix if args.shard is not None else ""
+            self.manifest = Manifest(os.path.join(manifest_dir, manifest_file_name(suffix)))
+            self.config_hash = output_options_hash(args, parser)
+        self.input_hashes: dict[str, str | None] = {}
+        self.skipped = 0
+        self.failed = 0
+
+    def jobs(self, xml_files: Iterable[str]) -> Iterator[tuple[str, str]]:
+        """Get the files to anonymize with the paths to save them to, skipping unchanged files."""
+        args = self.args
         for xml_file in xml_files:
-            anonymized_file = anonymize_eicr_file(
-                xml_file, anonymizer, parser, show_debug_info=args.debug
+            output_file = get_output_path(xml_file, self.input_root, args.output_dir, args.compress)
+            unchanged, input_hash = check_unchanged(
+                self.manifest, xml_file, self.input_root, self.config_hash, output_file
             )
-            save_anonymized_file(anonymized_file, xml_file)
-    elif os.path.isfile(args.input_location):
-        # IF the previously anonymized file exists, delete it
-        if os.path.isfile(f"{args.input_location}.anonymized.xml"):
-            os.remove(f"{args.input_location}.anonymized.xml")
-            print(f"Deleted previous anonymized file: {args.input_location}.anonymized.xml")
-        print(f"Anonymizing file: {args.input_location}")
-        anonymized_file = anonymize_eicr_file(
-            args.input_location, anonymizer, parser, show_debug_info=args.debug
-        )
-        save_anonymized_file(anonymized_file, args.input_location)
-    else:
-        print(f"Input location is not a file or directory: {args.input_location}")
-        return
+            if unchanged:
+                self.skipped += 1
+                if self.recorder is not None:
+                    self.recorder.record(xml_file, None)
+                continue
+            self.input_hashes[xml_file] = input_hash
+            yield xml_file, output_file
+
+    def finish(self, xml_file: str, output_file: str, error: Exception | str | None = None) -> None:
+        """Record a file that finished, quarantining it if it failed."""
+        input_hash = self.input_hashes.pop(xml_file)
+        if error is not None:
+            self._quarantine(xml_file, error)
+            return
+        if self.manifest is not None and input_hash is not None:
+            key = os.path.relpath(xml_file, self.input_root)
+            self.manifest.record(key, input_hash, self.config_hash, output_file)
+        if self.recorder is not None:
+            self.recorder.record(xml_file, output_file)
+
+    def _quarantine(self, xml_file: str, error: Exception | str) -> None:
+        """Quarantine a file that could not be anonymized, or raise its error without quarantine."""
+        quarantine_dir = self.args.quarantine_dir
+        if quarantine_dir is None:
+            if isinstance(error, Exception):
+                raise error
+            raise AnonymizationFailed(xml_file, error)
+        reason = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+        quarantine_file(xml_file, self.input_root, quarantine_dir, reason)
+        print(f"Could not anonymize file {xml_file}, quarantined it: {reason}")
+        self.failed += 1
+        if self.recorder is not None:
+            self.recorder.record_failure(xml_file, reason)
+
+    def save(self) -> None:
+        """Save the manifest, so finished files are not anonymized again."""
+        if self.manifest is not None:
+            self.manifest.save()
+
+    def report(self) -> None:
+        """Print how many files were skipped and quarantined."""
+        if self.skipped:
+            print(
+                f"Skipped {self.skipped} files that are unchanged since they were last anonymized"
+            )
+        if self.failed:
+            print(
+                f"Quarantined {self.failed} files that could not be anonymized in: "
+                f"{self.args.quarantine_dir}"
+            )
+
+
+def _run_serially(
+    jobs: Iterable[tuple[str, str]],
+    work: Callable[[str, str], None],
+    finish: Callable[[str, str, Exception | None], None],
+) -> None:
+    """Run jobs one after the other in the current thread, finishing each with its error."""
+    for xml_file, output_file in jobs:
+        try:
+            work(xml_file, output_file)
+        except Exception as e:
+            finish(xml_file, output_file, e)
+        else:
+            finish(xml_file, output_file, None)
+
+
+def _run_in_threads(
+    threads: int,
+    jobs: Iterable[tuple[str, str]],
+    work: Callable[[str, str], None],
+    finish: Callable[[str, str, Exception | None], None],
+) -> None:
+    """Run jobs on a thread pool, finishing them in their original order with their error."""
+
+    def finish_future(job: tuple[Future[None], str, str]) -> None:
+        future, xml_file, output_file = job
+        try:
+            future.result()
+        except Exception as e:
+            finish(xml_file, output_file, e)
+        else:
+            finish(xml_file, output_file, None)
+
+    with ThreadPoolExecutor(threads) as executor:
+        pending: deque[tuple[Future[None], str, str]] = deque()
+        for xml_file, output_file in jobs:
+            pending.append((executor.submit(work, xml_file, output_file), xml_file, output_file))
+            # Keep every thread busy without queueing up the whole input tree
+            if len(pending) >= 2 * threads:
+                finish_future(pending.popleft())
+        while pending:
+            finish_future(pending.popleft())
+
+
+def _run_in_workers(
+    args: Namespace,
+    chunks: Iterable[list[tuple[str, str]]],
+    finish: Callable[[str, str, str | None], None],
+) -> None:
+    """Run chunks of jobs on a `WorkerPool` of processes, finishing jobs as they finish."""
+    # Imported here, as the worker pool builds on this module
+    from eicr_anonymization.worker_pool import PoolLimits, WorkerPool  # noqa: PLC0415
+
+    pool = WorkerPool(args, PoolLimits.from_args(args))
+    for result in pool.run(chunks):
+        finish(result.xml_file, result.output_file, result.error)
+    print(f"Started {pool.workers_started} worker processes")
+
+
+def _anonymize_files(
+    args: Namespace, run: _FileRun, xml_files: list[str], work: Callable[[str, str], None]
+) -> None:
+    """Anonymize XML files and save them, skipping unchanged files in incremental mode.
+
+    With more than one of `args.threads`, files are anonymized by worker threads sharing one
+    anonymizer, so the same values get the same replacements in every file. Results are recorded
+    in the original order. With `args.workers`, files are anonymized by a `WorkerPool` of processes
+    instead, and results are recorded as files finish. Small files are sent to the workers in
+    chunks.
+
+    With the `size` schedule, the largest files are anonymized first, so a huge file does not
+    start last and keep the run going after every other file is done.
+
+    Args:
+        args: Command-line arguments
+        run: Skips unchanged files, and records files as they finish
+        xml_files: Paths of the files to anonymize
+        work: Anonymizes a file and saves it to a path, in the current process
+    """
+    sizes: dict[str, int] = {}
+    if args.schedule == "size":
+        xml_files, sizes = largest_first(xml_files)
+    elif args.workers is not None:
+        # Chunks are made by size whatever order the files are anonymized in
+        sizes = {xml_file: estimated_size(xml_file) for xml_file in xml_files}
+
+    try:
+        jobs = run.jobs(xml_files)
+        if args.workers is not None:
+            _run_in_workers(args, chunk_jobs(jobs, sizes), run.finish)
+        elif args.threads > 1:
+            _run_in_threads(args.threads, jobs, work, run.finish)
+        else:
+            _run_serially(jobs, work, run.finish)
+    finally:
+        # Save progress even if a file fails, so finished files are not anonymized again
+        run.save()
+    run.report()
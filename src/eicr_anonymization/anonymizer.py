@@ -3,38 +3,34 @@
 This module handles logic around replacing data with similar but fake data.
 """
 
-import random
+import copy
+import functools
 import re
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from random import Random
 from string import ascii_lowercase, ascii_uppercase
-from typing import Literal, NotRequired, TypedDict
 
-import usaddress
-import yaml
 from lxml.etree import _Element
 
-from eicr_anonymization.determinism import deterministic
+from eicr_anonymization.address_parser import StreetAddressParser
+from eicr_anonymization.data_pools import (
+    DEFAULT_POOL_FILES,
+    DataPools,
+    load_default_pool,
+    load_safe_words,
+)
+from eicr_anonymization.determinism import current_random, deterministic, keyed_seed
 from eicr_anonymization.element_parser import Element
+from eicr_anonymization.mapping_store import MappingStore
 
 ONE_THIRD = 0.33
 ONE_HALF = 0.5
 TWO_THIRDS = 0.67
 
-
-class ReplacementType(TypedDict):
-    """Type definition for a replacement."""
-
-    value: str
-    abbreviation_only: NotRequired[Literal[True]]
-    abbreviations: NotRequired[list[str]]
-    qualifier: NotRequired[str]
-
-
-def _read_yaml(file_name: str) -> list[ReplacementType]:
-    """Read a YAML file and return its contents as a list of strings."""
-    with open("src/eicr_anonymization/star-wars-data/" + file_name) as file:
-        return yaml.safe_load(file)
+MIN_KEY_LENGTH = 16
 
 
 def _get_leading_trailing_whitespace(value: str) -> tuple[str, str]:
@@ -86,6 +82,12 @@ def _normalize_value(value: str):
     return value.lower()
 
 
+@functools.cache
+def _normalized_safe_words() -> frozenset[str]:
+    """Normalize the safe words of the package, once per process."""
+    return frozenset(_normalize_value(word) for word in load_safe_words())
+
+
 @dataclass
 class DebugOptions:
     """Dataclass for holding options for setting the random seed and making functions deterministic.
@@ -102,77 +104,119 @@ class DebugOptions:
     deterministic_functions: bool = False
 
 
+class KeyTooShort(ValueError):
+    """Exception raised when the key for keyed mode is too short to be secure."""
+
+    def __init__(self):
+        """Initialize the exception with the minimum length of the key."""
+        super().__init__(f"The key must be at least {MIN_KEY_LENGTH} bytes long")
+
+
 class Anonymizer:
-    """Anonymizes the data."""
+    """Anonymizes the data.
+
+    The only state kept between documents are the mappings and the shuffled pools of replacement
+    options, which are safe to share between threads. One anonymizer can therefore anonymize
+    several documents at once, and replace the same values in the same way in all of them.
+    """
 
     def __init__(
         self,
         debugOptions: DebugOptions | None = None,
+        key: bytes | None = None,
+        pool_files: Mapping[str, str] | None = None,
+        max_mappings_in_memory: int | None = None,
     ):
         """Initialize the Anonymizer class.
 
         Args:
             debugOptions: Options for setting the random seed and making functions deterministic.
             Should not be used in production or when real sensitive data is being used.
+            key: Secret key for keyed mode. In keyed mode every replacement, and the time offset,
+            is derived from an HMAC of the original value under the key instead of being stored in
+            a mapping. Anonymizers with the same key replace the same value in the same way,
+            without sharing any state. The key must be kept secret and be at least 16 bytes.
+            pool_files: Custom files of replacement values by data type, like `{"family": path}`.
+            See `data_pools` for the supported formats.
+            max_mappings_in_memory: Maximum number of replacements kept in memory. Beyond that
+            the least recently used ones are moved to disk, see `MappingStore`.
         """
+        if key is not None and len(key) < MIN_KEY_LENGTH:
+            raise KeyTooShort
+        self.key = key
+
+        seed = None
         if debugOptions is None:
             self.is_deterministic = False
         else:
             self.is_deterministic = debugOptions.deterministic_functions
             if debugOptions.deterministic_functions is True and debugOptions.seed is None:
                 self.seed = 1
-                random.seed(self.seed)
+                seed = self.seed
             elif debugOptions.seed is not None:
                 self.seed = debugOptions.seed
-                random.seed(self.seed)
+                seed = self.seed
+        # Every anonymizer has its own generator, so it never depends on or disturbs global state
+        self._random = Random(seed)
+        self._options_lock = threading.Lock()
 
         SECONDS_IN_100_YEARS = int(100 * 60 * 60 * 24 * 365.25)
         # The main offset is a random number of seconds between 0 and 100 years
-        self.time_offset = random.randint(0, SECONDS_IN_100_YEARS)
+        if key is None:
+            self.time_offset = self.random.randint(0, SECONDS_IN_100_YEARS)
+        else:
+            self.time_offset = keyed_seed(key, "time_offset") % (SECONDS_IN_100_YEARS + 1)
 
         self.ASSUMED_ABBR_LEN = 3
         self.NUM_X = 2
 
-        self.data_pools = {
-            "country": _read_yaml("country_names.yaml"),
-            "state": _read_yaml("state_names.yaml"),
-            "county": _read_yaml("county_names.yaml"),
-            "city": _read_yaml("city_names.yaml"),
-            "streetNameBase": _read_yaml("street_names.yaml"),
-            "streetNameType": _read_yaml("street_types.yaml"),
-            "family": _read_yaml("family_names.yaml"),
-            "given": _read_yaml("given_names.yaml"),
-        }
+        # Pools are only loaded when they are first used, and shared with other anonymizers
+        self.data_pools = DataPools(pool_files)
 
         self.available_options = {data_type: [] for data_type in self.data_pools}
+        # Street lines are parsed with the street types of the package, even when the pool of
+        # replacement street types is replaced
+        self.address_parser = StreetAddressParser(
+            load_default_pool(DEFAULT_POOL_FILES["streetNameType"])
+        )
 
-        self.mappings: dict[str, dict[str, str]] = {
-            "II": {},
-            "EN": {},
-            "TEL": {},
-            "country": {},
-            "state": {},
-            "county": {},
-            "city": {},
-            "postalCode": {},
-            "houseNumber": {},
-            "streetNameBase": {},
-            "streetNameType": {},
-            "unitID": {},
-            "AddressNumberSuffix": {},
-            "given": {},
-            "family": {},
-            "USPSBoxGroupID": {},
-            "USPSBoxID": {},
-        }
+        # Replacements by data type, e.g. "II", "EN", "TEL", "city" or "houseNumber"
+        self.mappings = MappingStore(max_mappings_in_memory)
 
         self.safe_words = {
             "",
         }
 
-        self.safe_words.update(
-            {_normalize_value(word["value"]) for word in _read_yaml("safe_words.yaml")}
-        )
+        self.safe_words.update(_normalized_safe_words())
+
+    def new_mapping_scope(self) -> "Anonymizer":
+        """Create an Anonymizer with the same settings and time offset, but no stored mappings.
+
+        Values are only replaced consistently within one mapping scope, so documents that belong
+        together, like an eICR and its RR, should be anonymized with the same scope. Separate
+        scopes do not share any mappings, so they can be used from different threads.
+        """
+        scope = copy.copy(self)
+        scope._options_lock = threading.Lock()
+        scope.available_options = {data_type: [] for data_type in self.data_pools}
+        scope.mappings = self.mappings.new_empty()
+        return scope
+
+    def get_safe_words(self, safe_text: set[str]) -> set[str]:
+        """Get the normalized safe words for one document.
+
+        Args:
+            safe_text: Safe text found in the document by the parser
+
+        Returns:
+            The safe words of the anonymizer together with the safe text of the document
+        """
+        return self.safe_words | {_normalize_value(text) for text in safe_text}
+
+    @property
+    def random(self) -> Random:
+        """The generator of the anonymizer, seeded per call inside deterministic functions."""
+        return current_random(self._random)
 
     @deterministic
     def anonymize_TS_value(self, element: Element):
@@ -218,6 +262,7 @@ class Anonymizer:
         replacement = self._get_mapping(extension, "II")
         if replacement is not None:
             return _match_formatting(extension, replacement)
+        rng = self._rng(extension, "II")
         replacement = ""
         for i, char in enumerate(extension):
             if (
@@ -227,15 +272,15 @@ class Anonymizer:
             ):
                 replacement += "X"
             elif char.isdigit():
-                replacement += str(random.randint(0, 9))
+                replacement += str(rng.randint(0, 9))
             elif char.isalpha() and char.islower():
-                replacement += random.choice(ascii_lowercase)
+                replacement += rng.choice(ascii_lowercase)
             elif char.isalpha() and char.isupper():
-                replacement += random.choice(ascii_uppercase)
+                replacement += rng.choice(ascii_uppercase)
             else:
                 replacement += char
 
-        self._set_mapping(extension, "II", replacement)
+        replacement = self._set_mapping(extension, "II", replacement)
 
         return _match_formatting(extension, replacement)
 
@@ -250,22 +295,24 @@ class Anonymizer:
         if value is None:
             return value
 
-        parsed_address = usaddress.parse(value)
+        parsed_address = self.address_parser.parse(value)
 
         replacement = []
 
         for component, component_type in parsed_address:
             match component_type:
                 case "AddressNumber":
-                    if self._get_mapping(component, "houseNumber"):
-                        replacement.append(
-                            _match_formatting(component, self.mappings["houseNumber"][component])
-                        )
+                    replacement_AddressNumber = self._get_mapping(component, "houseNumber")
+                    if replacement_AddressNumber:
+                        replacement.append(_match_formatting(component, replacement_AddressNumber))
                         continue
+                    rng = self._rng(component, "houseNumber")
                     replacement_AddressNumber = ""
                     for i in str(component):
-                        replacement_AddressNumber += str(random.randint(0, 9)) if i.isdigit() else i
-                    self._set_mapping(component, "houseNumber", replacement_AddressNumber)
+                        replacement_AddressNumber += str(rng.randint(0, 9)) if i.isdigit() else i
+                    replacement_AddressNumber = self._set_mapping(
+                        component, "houseNumber", replacement_AddressNumber
+                    )
                     replacement.append(_match_formatting(component, replacement_AddressNumber))
                 case "AddressNumberPrefix":
                     # a modifier before an address number, e.g. 'Mile', '#'
@@ -343,18 +390,32 @@ class Anonymizer:
 
         return _match_formatting(value, " ".join(replacement))
 
+    def _rng(self, value: str, data_type: str) -> Random:
+        """Get the source of randomness for generating the replacement of a value.
+
+        In keyed mode this is a generator seeded with the HMAC of the normalized value, so the same
+        value always gets the same replacement. Otherwise it is the generator of the anonymizer.
+        """
+        if self.key is None:
+            return self.random
+        return Random(keyed_seed(self.key, data_type, _normalize_value(value)))
+
     def _get_mapping(self, value: str, data_type: str):
         """Get the mapping for a value."""
-        normalized = _normalize_value(value)
-        if normalized in self.mappings[data_type]:
-            return self.mappings[data_type][normalized]
-        else:
+        if self.key is not None:
+            # Keyed replacements are derived from the value itself and never stored
             return None
+        return self.mappings.get(data_type, _normalize_value(value))
 
-    def _set_mapping(self, value: str, data_type: str, replacement: str):
-        """Set the mapping for a value."""
-        normalized = _normalize_value(value)
-        self.mappings[data_type][normalized] = replacement
+    def _set_mapping(self, value: str, data_type: str, replacement: str) -> str:
+        """Set the mapping for a value.
+
+        If another thread mapped the same value first, its replacement is kept and returned, so
+        every document gets the same replacement.
+        """
+        if self.key is not None:
+            return replacement
+        return self.mappings.setdefault(data_type, _normalize_value(value), replacement)
 
     @deterministic
     def replace_from_pool(self, value: str | None, data_type: str):
@@ -366,9 +427,9 @@ class Anonymizer:
         replacement = self._get_mapping(value, data_type)
         if replacement is None:
             # Get a new replacement value
-            replacement = self._get_random_option(data_type)["value"]
+            replacement = self._get_random_option(data_type, self._rng(value, data_type))["value"]
             # Store the mapping for future use
-            self._set_mapping(value, data_type, replacement)
+            replacement = self._set_mapping(value, data_type, replacement)
 
         return _match_formatting(value, replacement)
 
@@ -377,33 +438,41 @@ class Anonymizer:
         """Replace each character in a string with a random character of the same type."""
         replacement = self._get_mapping(value, data_type)
         if replacement is None:
+            rng = self._rng(value, data_type)
             replacement = ""
             for char in str(value):
                 if char.isdigit():
-                    replacement += str(random.randint(0, 9))
+                    replacement += str(rng.randint(0, 9))
                 elif char.isalpha() and char.islower():
-                    replacement += random.choice(ascii_lowercase)
+                    replacement += rng.choice(ascii_lowercase)
                 elif char.isalpha() and char.isupper():
-                    replacement += random.choice(ascii_uppercase)
+                    replacement += rng.choice(ascii_uppercase)
                 else:
                     replacement += char
 
-            self._set_mapping(value, data_type, replacement)
+            replacement = self._set_mapping(value, data_type, replacement)
 
         return _match_formatting(value, replacement)
 
-    def _get_random_option(self, data_type):
+    def _get_random_option(self, data_type: str, rng: Random):
         """Get a random item from the specified data type's available options."""
-        options = self.available_options[data_type]
         pool = self.data_pools[data_type]
+        if self.key is not None:
+            # Choosing without replacement depends on earlier choices, which keyed mode avoids
+            return rng.choice(pool)
 
-        # If options are depleted, refill from the pool and shuffle
-        if not options:
-            options.extend(pool.copy())
-            random.shuffle(options)
+        with self._options_lock:
+            # Indices of the options not used yet, so values are only decoded when they are used
+            indices = self.available_options[data_type]
 
-        # Pop the first item
-        return options.pop(0)
+            # If options are depleted, refill from the pool and shuffle
+            if not indices:
+                indices.extend(range(len(pool)))
+                rng.shuffle(indices)
+                # Options are taken from the end, in the order they were shuffled in
+                indices.reverse()
+
+            return pool[indices.pop()]
 
     @deterministic
     def anonymize_EN_value(self, element: Element):
@@ -413,6 +482,19 @@ class Anonymizer:
         """
         return self._random_corporationName(element.text)
 
+    def _random_locality(self, rng: Random) -> str:
+        """Choose a city, county, state or country name, as if from one list of all of them.
+
+        Only the chosen value is read, so large packed pools are never decoded whole.
+        """
+        pools = [self.data_pools[key] for key in ("city", "county", "state", "country")]
+        index = rng.randrange(sum(len(pool) for pool in pools))
+        for pool in pools:
+            if index < len(pool):
+                return pool[index]["value"]
+            index -= len(pool)
+        raise IndexError(index)
+
     def _random_corporationName(self, value: str | None):
         """Generate a random corporation name."""
         if value is None:
@@ -434,12 +516,6 @@ class Anonymizer:
         ]
         organizationTypes = ["University", "College", "School", "Academy", "Institute"]
 
-        localitys = [
-            item["value"]
-            for key in ["city", "county", "state", "country"]
-            for item in self.data_pools.get(key, [])
-        ]
-
         scopes = [
             "Neighborhood",
             "Neighbourhood",
@@ -448,44 +524,44 @@ class Anonymizer:
 
         conjuctions = ["and", "&", "+"]
 
-        form_choice = random.randint(0, 1)
+        rng = self._rng(value, "EN")
+        form_choice = rng.randint(0, 1)
         replacement = "REMOVED"
         parts = []
         match form_choice:
             case 0:
-                form_choice = random.random()
+                form_choice = rng.random()
                 if form_choice <= ONE_THIRD:
-                    parts.append(f" {random.choice(localitys)} {random.choice(organizationTypes)}")
+                    parts.append(f" {self._random_locality(rng)} {rng.choice(organizationTypes)}")
                 elif form_choice <= TWO_THIRDS:
                     parts.append(
-                        f"{random.choice(organizationTypes)} of {random.choice(localitys)}"
+                        f"{rng.choice(organizationTypes)} of {self._random_locality(rng)}"
                     )
                 else:
-                    parts.append(random.choice(localitys))
+                    parts.append(self._random_locality(rng))
 
-                if random.random() <= ONE_HALF:
-                    parts.append(f"{random.choice(scopes)} {random.choice(facilityTypes)}")
+                if rng.random() <= ONE_HALF:
+                    parts.append(f"{rng.choice(scopes)} {rng.choice(facilityTypes)}")
                 else:
-                    parts.append(random.choice(facilityTypes))
+                    parts.append(rng.choice(facilityTypes))
 
-                if random.random() <= ONE_HALF:
-                    parts.append(f"{random.choice(conjuctions)} {random.choice(facilityTypes)}")
+                if rng.random() <= ONE_HALF:
+                    parts.append(f"{rng.choice(conjuctions)} {rng.choice(facilityTypes)}")
             case 1:
-                if random.random() <= ONE_HALF:
-                    parts.append(random.choice(organizationTypes))
+                if rng.random() <= ONE_HALF:
+                    parts.append(rng.choice(organizationTypes))
 
-                if random.random() <= ONE_HALF:
-                    parts.append(random.choice(scopes))
+                if rng.random() <= ONE_HALF:
+                    parts.append(rng.choice(scopes))
 
-                parts.append(random.choice(facilityTypes))
+                parts.append(rng.choice(facilityTypes))
 
-                if random.random() <= ONE_HALF:
-                    parts.append(f"{random.choice(conjuctions)} {random.choice(facilityTypes)}")
+                if rng.random() <= ONE_HALF:
+                    parts.append(f"{rng.choice(conjuctions)} {rng.choice(facilityTypes)}")
 
-                parts.append(f"of {random.choice(localitys)}")
+                parts.append(f"of {self._random_locality(rng)}")
 
-        replacement = " ".join(parts)
-        self._set_mapping(value, "EN", replacement)
+        replacement = self._set_mapping(value, "EN", " ".join(parts))
         return _match_formatting(value, replacement)
 
     @deterministic
@@ -499,8 +575,9 @@ class Anonymizer:
         if replacement is not None:
             return _match_formatting(value, replacement)
 
+        rng = self._rng(value, "TEL")
         if value.startswith("mailto:"):
-            replacement = self._random_email()
+            replacement = self._random_email(rng)
         elif value.startswith("tel:"):
             replacement = value
             replacement = f"tel:{self.replace_with_like_chars(value[4:], 'TEL')}"
@@ -508,54 +585,65 @@ class Anonymizer:
             replacement = value
             replacement = f"fax:{self.replace_with_like_chars(value[4:], 'TEL')}"
         elif value.startswith("http://"):
-            replacement = self._random_web_address()
+            replacement = self._random_web_address(rng)
         elif value.startswith("https://"):
-            replacement = self._random_web_address("https")
+            replacement = self._random_web_address(rng, "https")
         else:
             replacement = "REMOVED"
 
         return _match_formatting(value, replacement)
 
-    def _random_web_address(self, protocol: str = "http"):
+    def _random_web_address(self, rng: Random, protocol: str = "http"):
         """Generate a random web address."""
-        prefix = "".join(random.choice(ascii_lowercase) for _ in range(random.randint(0, 5)))
+        prefix = "".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(0, 5)))
         if prefix != "":
             prefix += "."
-        suffix = "".join(random.choice("0123456789") for _ in range(random.randint(0, 5)))
+        suffix = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 5)))
         replacement = f"{protocol}://{prefix}example{suffix}.com"
-        if random.random() <= ONE_HALF:
+        if rng.random() <= ONE_HALF:
             replacement += "/" + "".join(
-                random.choice(ascii_lowercase) for _ in range(random.randint(0, 5))
+                rng.choice(ascii_lowercase) for _ in range(rng.randint(0, 5))
             )
-            replacement += random.choice(
+            replacement += rng.choice(
                 ["", ".pdf", ".html", ".xml", ".txt", ".jpg", ".png", ".gif", ".jpeg"]
             )
         return replacement
 
-    def _random_email(self):
+    def _random_email(self, rng: Random):
         """Generate a random email address."""
         domain = "example.com"
 
         name = "mailto:"
 
-        name += "".join(random.choice(ascii_lowercase) for _ in range(random.randint(1, 5)))
-        form_choice = random.random()
+        name += "".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(1, 5)))
+        form_choice = rng.random()
         if form_choice <= ONE_THIRD:
-            name += "".join(random.choice(["", "_", "."]))
-            name += "".join(random.choice("0123456789") for _ in range(random.randint(1, 3)))
+            name += "".join(rng.choice(["", "_", "."]))
+            name += "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 3)))
         elif form_choice <= TWO_THIRDS:
-            name += "".join(random.choice(["", "_", "."]))
-            name += "".join(random.choice(ascii_lowercase) for _ in range(random.randint(1, 3)))
+            name += "".join(rng.choice(["", "_", "."]))
+            name += "".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(1, 3)))
         return f"{name}@{domain}"
 
     @deterministic
-    def anonymize_text(self, value: str | None, data_type: str):
-        """Anonymize text elements."""
+    def anonymize_text(
+        self, value: str | None, data_type: str, safe_words: set[str] | None = None
+    ):
+        """Anonymize text elements.
+
+        Args:
+            value: The text to anonymize
+            data_type: The data type of the text
+            safe_words: Normalized safe words of the document, see `get_safe_words`. Defaults to
+                the safe words of the anonymizer
+        """
+        if safe_words is None:
+            safe_words = self.safe_words
         if (
             value is None
             or value == ""
             or value.isdigit()
-            or _normalize_value(value) in self.safe_words
+            or _normalize_value(value) in safe_words
         ):
             return value
 
@@ -564,11 +652,13 @@ class Anonymizer:
     @deterministic
     def anonymize_xhtml(self, element: _Element, additional_safe_words: set[str] | None = None):
         """Anonymize xhtml elements."""
-        if additional_safe_words is None:
-            additional_safe_words = set()
-
-        self.safe_words.update({_normalize_value(word) for word in additional_safe_words})
+        safe_words = self.safe_words
+        if additional_safe_words:
+            # Safe text of one document only applies to that document
+            safe_words = safe_words | {_normalize_value(word) for word in additional_safe_words}
+        self._anonymize_xhtml(element, safe_words)
 
+    def _anonymize_xhtml(self, element: _Element, safe_words: set[str]):
         text_value = element.text
         if text_value is not None:
             normalized_text_value = _normalize_value(text_value)
@@ -576,7 +666,7 @@ class Anonymizer:
                 normalized_text_value != ""
                 and len(normalized_text_value) > self.ASSUMED_ABBR_LEN
                 and not (
-                    any(normalized_text_value in safe_word for safe_word in self.safe_words)
+                    any(normalized_text_value in safe_word for safe_word in safe_words)
                     or normalized_text_value.isnumeric()
                 )
             ):
@@ -589,21 +679,23 @@ class Anonymizer:
                 normalized_tail_value != ""
                 and len(normalized_tail_value) > self.ASSUMED_ABBR_LEN
                 and not (
-                    any(normalized_tail_value in safe_word for safe_word in self.safe_words)
+                    any(normalized_tail_value in safe_word for safe_word in safe_words)
                     or normalized_tail_value.isnumeric()
                 )
             ):
                 element.tail = _match_formatting(tail_value, "REMOVED")
 
         for child in element:
-            self.anonymize_xhtml(child)
+            self._anonymize_xhtml(child, safe_words)
 
-    def remove_unknown_text(self, text: str):
+    def remove_unknown_text(self, text: str, safe_words: set[str] | None = None):
         """Replace text of unknown data types with "REMOVED".
 
         First check if text is a known value, if not, replace it with "REMOVED".
         """
+        if safe_words is None:
+            safe_words = self.safe_words
         normalized_value = _normalize_value(text)
-        if normalized_value in self.safe_words or normalized_value.isnumeric():
+        if normalized_value in safe_words or normalized_value.isnumeric():
             return text
         return "REMOVED"
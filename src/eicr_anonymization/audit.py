@@ -0,0 +1,101 @@
+"""Stream a record of every replacement to an audit log, to review what was anonymized.
+
+Every record is written as soon as the replacement is made, so the audit log of a large batch
+never has to be held in memory. The log holds the original values, so it is as sensitive as the
+original files.
+
+Audit logs are written as JSON Lines (`.jsonl`) or CSV (`.csv`), and compressed if the file name
+ends with `.gz` or `.zst`.
+"""
+
+import csv
+import io
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Literal, TextIO
+
+from eicr_anonymization.element_parser import Element
+from eicr_anonymization.file_io import open_output, strip_compression_suffix
+
+type AuditFormat = Literal["jsonl", "csv"]
+
+AUDIT_FIELDS = ("file", "line", "path", "type", "tag", "original", "replacement")
+
+
+def get_audit_format(path: str) -> AuditFormat:
+    """Get the format of an audit log from its extension, CSV for `.csv` or else JSON Lines."""
+    if strip_compression_suffix(path).lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def describe_value(element: Element) -> str:
+    """Describe the value of an element, its text or otherwise its attributes."""
+    if element.text is not None and element.text.strip():
+        return element.text.strip()
+    return " ".join(
+        f'{str(name).split("}")[-1]}="{value}"' for name, value in element.attributes.items()
+    )
+
+
+class AuditLog:
+    """Write one record per replacement to a text stream, from any number of threads."""
+
+    def __init__(self, stream: TextIO, audit_format: AuditFormat = "jsonl"):
+        """Initialize the audit log, writing the CSV header if needed.
+
+        Args:
+            stream: Text stream the records are written to
+            audit_format: Write JSON Lines or CSV
+        """
+        self.records = 0
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._csv_writer = None
+        if audit_format == "csv":
+            self._csv_writer = csv.DictWriter(stream, AUDIT_FIELDS)
+            self._csv_writer.writeheader()
+
+    def record(self, file: str, original: Element, replacement: Element) -> None:
+        """Write the record of one replacement.
+
+        Args:
+            file: Name of the document the replacement was made in
+            original: The element before it was anonymized
+            replacement: The element after it was anonymized
+        """
+        record = {
+            "file": file,
+            "line": original.line,
+            "path": original.path,
+            "type": replacement.cda_type,
+            "tag": str(original.name).split("}")[-1],
+            "original": describe_value(original),
+            "replacement": describe_value(replacement),
+        }
+        with self._lock:
+            if self._csv_writer is not None:
+                self._csv_writer.writerow(record)
+            else:
+                self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.records += 1
+
+
+@contextmanager
+def open_audit_log(path: str) -> Iterator[AuditLog]:
+    """Open an audit log file, in the format and compression given by its extension.
+
+    Args:
+        path: Path to the audit log
+
+    Yields:
+        The audit log
+
+    """
+    with (
+        open_output(path) as raw,
+        io.TextIOWrapper(raw, encoding="utf-8", newline="") as stream,
+    ):
+        yield AuditLog(stream, get_audit_format(path))
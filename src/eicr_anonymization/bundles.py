@@ -0,0 +1,435 @@
+"""Anonymize bundles of documents: zip and tar archives, and multi-document streams.
+
+Documents in a bundle are read ahead, anonymized in parallel, and written back to the output bundle
+in their original order. Documents that belong together share one mapping scope, so the same values
+get the same replacements in, for example, an eICR and its RR.
+
+A document that cannot be anonymized stops the run, unless there is a quarantine directory. Then it
+is copied there with the reason it failed, and left out of the output bundle.
+"""
+
+import os
+import re
+import tarfile
+import time
+import zipfile
+from argparse import Namespace
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from io import BytesIO
+from typing import BinaryIO, Literal
+
+from lxml import etree
+
+from eicr_anonymization.anonymize_eicr import anonymize_eicr_tree, write_xml_tree
+from eicr_anonymization.anonymizer import Anonymizer
+from eicr_anonymization.audit import AuditLog
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.file_io import atomic_write
+from eicr_anonymization.xml_reader import DEFAULT_READ_OPTIONS, ReadOptions, parse_xml
+
+type Framing = Literal["newline", "length"]
+
+ARCHIVE_SUFFIXES = {".zip": "zip", ".tar": "tar", ".tar.gz": "tar", ".tgz": "tar"}
+
+# The LOINC document code of RRs, found in the `code` element of the document header
+_RR_DOCUMENT_CODE = "88085-6"
+_HL7_CODE = "{urn:hl7-org:v3}code"
+
+
+class UnknownArchiveFormat(ValueError):
+    """Exception raised when a bundle is neither a known archive nor read as a stream."""
+
+    def __init__(self, path: str):
+        """Initialize the exception with the path of the bundle."""
+        super().__init__(f"Unknown archive format: {path}")
+
+
+class TruncatedStream(EOFError):
+    """Exception raised when a stream ends in the middle of a document."""
+
+    def __init__(self, length: int):
+        """Initialize the exception with the length the document should have had."""
+        super().__init__(f"Stream ended in the middle of a document of {length} bytes")
+
+
+@dataclass
+class BundleOptions:
+    """How the documents of a bundle are read, anonymized and written."""
+
+    # How documents are separated if the bundle is a stream, None for archives
+    framing: Framing | None = None
+    # Number of worker threads
+    threads: int = 1
+    # Maximum number of groups queued at once, defaults to twice the threads
+    read_ahead: int | None = None
+    # Re-indent the anonymized documents
+    pretty_print: bool = True
+    # Keep the XML declaration and encoding of the original documents
+    preserve_declaration: bool = False
+    # How documents are parsed, and the limits they must be within
+    read_options: ReadOptions = DEFAULT_READ_OPTIONS
+    # Directory documents that cannot be anonymized are copied to, instead of stopping the run
+    quarantine_dir: str | None = None
+    # Audit log every replacement is recorded in, as it is made
+    audit: AuditLog | None = None
+
+    @classmethod
+    def from_args(cls, args: Namespace, audit: AuditLog | None = None) -> "BundleOptions":
+        """Get the options given on the command line, with the audit log opened for them."""
+        return cls(
+            framing=args.stream,
+            threads=args.threads,
+            pretty_print=args.pretty_print,
+            preserve_declaration=args.preserve_declaration,
+            read_options=ReadOptions.from_args(args),
+            quarantine_dir=args.quarantine_dir,
+            audit=audit,
+        )
+
+
+@dataclass
+class Document:
+    """A document read from a bundle.
+
+    Args:
+        name: Name of the document in the bundle
+        data: Contents of the document
+        group: Documents with the same group are anonymized with the same mapping scope
+        mtime: Modification time of the archive member, if any
+    """
+
+    name: str
+    data: bytes
+    group: str
+    mtime: float = field(default=0)
+
+
+def get_archive_format(path: str) -> Literal["zip", "tar"] | None:
+    """Get the archive format of a file from its extension, or None if it is not an archive."""
+    for suffix, archive_format in ARCHIVE_SUFFIXES.items():
+        if path.endswith(suffix):
+            return archive_format  # type: ignore[return-value]
+    return None
+
+
+def get_bundle_output_path(path: str, output_dir: str | None = None) -> str:
+    """Get the path the anonymized version of a bundle is written to.
+
+    `.anonymized` is inserted before the extension, e.g. `bundle.tar.gz` is written to
+    `bundle.anonymized.tar.gz`.
+
+    Args:
+        path: Path to the original bundle
+        output_dir: Directory to write the anonymized bundle to, defaults to the directory of the
+            original bundle
+
+    Returns:
+        Path of the anonymized bundle
+
+    """
+    directory, name = os.path.split(path)
+    suffix = next((s for s in ARCHIVE_SUFFIXES if name.endswith(s)), os.path.splitext(name)[1])
+    name = f"{name.removesuffix(suffix)}.anonymized{suffix}"
+    return os.path.join(output_dir if output_dir is not None else directory, name)
+
+
+def _is_xml_member(name: str) -> bool:
+    return name.lower().endswith(".xml")
+
+
+def read_archive(path: str) -> Iterator[Document]:
+    """Read the XML documents from a zip or tar archive.
+
+    Documents in the same directory of the archive are grouped together. Members that are not XML
+    files are skipped, so that no unexamined data ends up in the anonymized archive.
+
+    Args:
+        path: Path to the archive
+
+    Yields:
+        The XML documents, grouped by directory
+
+    """
+    if get_archive_format(path) == "zip":
+        with zipfile.ZipFile(path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            # The central directory is read up front, so members can be ordered by directory
+            members.sort(key=lambda info: (os.path.dirname(info.filename), info.filename))
+            for info in members:
+                if not _is_xml_member(info.filename):
+                    print(f"Skipping non-XML archive member: {info.filename}")
+                    continue
+                yield Document(
+                    info.filename,
+                    archive.read(info),
+                    os.path.dirname(info.filename),
+                    _zip_mtime(info),
+                )
+    else:
+        # Stream the archive, so compressed tar files are never decompressed in full
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                if not _is_xml_member(member.name):
+                    print(f"Skipping non-XML archive member: {member.name}")
+                    continue
+                member_file = archive.extractfile(member)
+                if member_file is None:
+                    continue
+                yield Document(
+                    member.name, member_file.read(), os.path.dirname(member.name), member.mtime
+                )
+
+
+def _zip_mtime(info: zipfile.ZipInfo) -> float:
+    return time.mktime((*info.date_time, 0, 0, -1))
+
+
+def _is_reportability_response(data: bytes) -> bool:
+    """Check if a document is an RR, based on the document code of its root element.
+
+    Only the start of the document is parsed, up to the `code` element of the header. A document
+    that is not well-formed up to there is not an RR.
+    """
+    events = etree.iterparse(
+        BytesIO(data), events=("start",), resolve_entities=False, no_network=True, load_dtd=False
+    )
+    try:
+        for _, element in events:
+            parent = element.getparent()
+            if parent is not None and parent.getparent() is None and element.tag == _HL7_CODE:
+                return element.get("code") == _RR_DOCUMENT_CODE
+    except etree.XMLSyntaxError:
+        return False
+    return False
+
+
+def read_document_stream(stream: BinaryIO, framing: Framing) -> Iterator[Document]:
+    """Read documents from a multi-document stream.
+
+    Two framings are supported:
+    - `newline`: every line holds one document.
+    - `length`: every document is preceded by its length in bytes, in ASCII digits followed by a
+      newline.
+
+    An RR is grouped with the document before it, which is expected to be its eICR. Every other
+    document starts a new group.
+
+    Args:
+        stream: Binary stream to read from
+        framing: How the documents are separated
+
+    Yields:
+        The documents, in the order they appear in the stream
+
+    """
+    group = ""
+    for i, data in enumerate(_read_frames(stream, framing)):
+        if not group or not _is_reportability_response(data):
+            group = f"document-{i:06d}"
+        yield Document(f"document-{i:06d}.xml", data, group)
+
+
+def _read_frames(stream: BinaryIO, framing: Framing) -> Iterator[bytes]:
+    if framing == "newline":
+        for line in stream:
+            if line.strip():
+                yield line.rstrip(b"\r\n")
+        return
+
+    while header := stream.readline():
+        if not header.strip():
+            continue
+        length = int(header)
+        data = stream.read(length)
+        if len(data) != length:
+            raise TruncatedStream(length)
+        yield data
+
+
+def write_document_stream(
+    stream: BinaryIO, framing: Framing, results: Iterable[tuple[Document, bytes]]
+) -> None:
+    """Write anonymized documents to a multi-document stream.
+
+    Newline framing is lossy: line breaks inside a document are replaced with spaces, so it fits on
+    one line. That changes line breaks in text, like in narrative blocks, and documents should not
+    be pretty printed with it. Use length framing to keep documents byte for byte.
+
+    Args:
+        stream: Binary stream to write to
+        framing: How to separate the documents, see `read_document_stream`
+        results: The anonymized documents
+    """
+    for _, data in results:
+        if framing == "newline":
+            stream.write(data.replace(b"\n", b" ").rstrip() + b"\n")
+        else:
+            stream.write(f"{len(data)}\n".encode("ascii"))
+            stream.write(data)
+
+
+def write_archive(
+    stream: BinaryIO, archive_format: str, results: Iterable[tuple[Document, bytes]], path: str
+) -> None:
+    """Write anonymized documents to a zip or tar archive.
+
+    Args:
+        stream: Binary stream to write the archive to
+        archive_format: `zip` or `tar`
+        results: The anonymized documents
+        path: Path of the archive, used to choose the compression of tar archives
+    """
+    if archive_format == "zip":
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+            for document, data in results:
+                info = zipfile.ZipInfo(document.name, time.localtime(document.mtime)[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, data)
+        return
+
+    mode = "w|gz" if path.endswith((".tar.gz", ".tgz")) else "w|"
+    with tarfile.open(fileobj=stream, mode=mode) as archive:
+        for document, data in results:
+            info = tarfile.TarInfo(document.name)
+            info.size = len(data)
+            info.mtime = int(document.mtime)
+            archive.addfile(info, BytesIO(data))
+
+
+def _group_documents(documents: Iterable[Document]) -> Iterator[list[Document]]:
+    """Collect consecutive documents with the same group."""
+    group: list[Document] = []
+    for document in documents:
+        if group and document.group != group[0].group:
+            yield group
+            group = []
+        group.append(document)
+    if group:
+        yield group
+
+
+def quarantine_document(document: Document, quarantine_dir: str, reason: str) -> str:
+    """Write a document that could not be anonymized to the quarantine directory.
+
+    The document is written to its name in the bundle, inside the quarantine directory, and the
+    reason it failed to a file with the same name and `.error.txt` added. Parts of the name that
+    would leave the quarantine directory, like `..`, are dropped.
+
+    Args:
+        document: The original document
+        quarantine_dir: Directory to write the document to
+        reason: Why the document could not be anonymized
+
+    Returns:
+        Path of the copy
+
+    """
+    parts = [part for part in re.split(r"[/\\]", document.name) if part not in {"", ".", ".."}]
+    quarantined_file = os.path.join(quarantine_dir, *parts or ["document.xml"])
+    with atomic_write(quarantined_file) as f:
+        f.write(document.data)
+    with atomic_write(quarantined_file + ".error.txt") as f:
+        f.write(f"{reason}\n".encode())
+    return quarantined_file
+
+
+DEFAULT_BUNDLE_OPTIONS = BundleOptions()
+
+
+def anonymize_documents(
+    documents: Iterable[Document],
+    anonymizer: Anonymizer,
+    parser: Parser,
+    options: BundleOptions = DEFAULT_BUNDLE_OPTIONS,
+) -> Iterator[tuple[Document, bytes]]:
+    """Anonymize documents in parallel, returning them in their original order.
+
+    Each group of documents is anonymized by one worker thread with its own mapping scope. Up to
+    `options.read_ahead` groups are read and queued while earlier groups are still being
+    anonymized. Documents that are quarantined are left out.
+
+    Args:
+        documents: The documents to anonymize
+        anonymizer: Provides the settings for the mapping scope of every group
+        parser: Finds the sensitive elements, shared by all worker threads
+        options: How the documents are anonymized and written
+
+    Yields:
+        Every document with its anonymized contents
+
+    """
+    threads = options.threads
+    read_ahead = options.read_ahead if options.read_ahead is not None else 2 * threads
+
+    def anonymize_document(scope: Anonymizer, document: Document) -> bytes:
+        tree = parse_xml(document.data, document.name, options.read_options)
+        anonymize_eicr_tree(tree, document.name, scope, parser, options.audit)
+        output = BytesIO()
+        write_xml_tree(tree, output, options.pretty_print, options.preserve_declaration)
+        return output.getvalue()
+
+    def anonymize_group(group: list[Document]) -> list[tuple[Document, bytes]]:
+        scope = anonymizer.new_mapping_scope()
+        results = []
+        for document in group:
+            try:
+                results.append((document, anonymize_document(scope, document)))
+            except Exception as e:
+                if options.quarantine_dir is None:
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+                quarantine_document(document, options.quarantine_dir, reason)
+                print(f"Could not anonymize document {document.name}, quarantined it: {reason}")
+        return results
+
+    with ThreadPoolExecutor(threads) as executor:
+        pending: deque[Future[list[tuple[Document, bytes]]]] = deque()
+        for group in _group_documents(documents):
+            pending.append(executor.submit(anonymize_group, group))
+            if len(pending) >= read_ahead:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def anonymize_bundle(
+    input_path: str,
+    output_path: str,
+    anonymizer: Anonymizer,
+    parser: Parser,
+    options: BundleOptions = DEFAULT_BUNDLE_OPTIONS,
+) -> None:
+    """Anonymize an archive or multi-document stream into a new archive or stream.
+
+    The output has the same format as the input and is written atomically.
+
+    Args:
+        input_path: Path to the zip or tar archive, or the multi-document stream
+        output_path: Path to write the anonymized bundle to
+        anonymizer: Provides the settings for the mapping scope of every group
+        parser: Finds the sensitive elements, shared by all worker threads
+        options: How the documents are read, anonymized and written
+    """
+    framing = options.framing
+    if framing is None:
+        archive_format = get_archive_format(input_path)
+        if archive_format is None:
+            raise UnknownArchiveFormat(input_path)
+        results = anonymize_documents(read_archive(input_path), anonymizer, parser, options)
+        with atomic_write(output_path) as f:
+            write_archive(f, archive_format, results, output_path)
+        return
+
+    if framing == "newline":
+        # Line breaks added by pretty printing would break newline framing
+        options = replace(options, pretty_print=False)
+    with open(input_path, "rb") as input_stream, atomic_write(output_path) as f:
+        results = anonymize_documents(
+            read_document_stream(input_stream, framing), anonymizer, parser, options
+        )
+        write_document_stream(f, framing, results)
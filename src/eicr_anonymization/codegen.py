@@ -0,0 +1,251 @@
+"""Generate a Python module with one visitor function per CDA type for a configuration.
+
+The `Parser` otherwise interprets the compiled rules of every type node by node. The generated
+visitors have the rules inlined: child tags, safety flags and attribute policies are constants,
+and every child is dispatched to its visitor with a single dictionary lookup. The visitors find
+exactly the same sensitive elements and safe text as the interpreter.
+
+The module records the hash of the structure and configuration it was generated for, and the
+version of this generator. Parsers only use it when both match, otherwise they fall back to the
+interpreter, so a stale module can never change what is found.
+"""
+
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from pathlib import Path
+
+from eicr_anonymization.element_parser import ChildRule, ParserPlan, TypeRules
+
+# Increase whenever the generated code changes, so modules from older generators are not used
+GENERATOR_VERSION = 1
+
+GENERATED_MODULE = "eicr_anonymization.generated_visitors"
+GENERATED_MODULE_PATH = Path(__file__).with_name("generated_visitors.py")
+
+type Visitor = Callable[..., None]
+
+_HEADER = '''\
+"""Visitors for every CDA type, generated by `tools/visitor_generator.py`. Do not edit.
+
+Generated from `cda_structure.yaml` and the configuration with hash `CONFIG_HASH`. Regenerate
+this module whenever either of them changes.
+"""
+
+CONFIG_HASH = {config_hash!r}
+GENERATOR_VERSION = {generator_version!r}
+
+_XSI_TYPE = "{{http://www.w3.org/2001/XMLSchema-instance}}type"
+
+
+def _skip(element, found, is_safe):
+    found.skip_subtree(element)
+
+
+def _no_attributes(element, found, is_safe):
+    pass
+
+
+def visit_xhtml(element, found, is_safe):
+    found.add_sensitive_element(element, "xhtml")
+
+
+def safe_visit_xhtml(element, found, is_safe):
+    found.add_sensitive_element(element, "xhtml")
+'''
+
+
+def _attributes_function(type_name: str, rules: TypeRules) -> list[str]:
+    attributes = rules.attributes.items()
+    collected = sorted(name for name, (safe, collect) in attributes if safe and collect)
+    sensitive = sorted(name for name, (safe, _) in attributes if not safe)
+    if not collected and not sensitive:
+        return [f"attributes_{type_name} = _no_attributes", ""]
+    lines = [
+        f"_{type_name}_COLLECTED = frozenset({collected!r})",
+        f"_{type_name}_SENSITIVE = frozenset({sensitive!r})",
+        "",
+        "",
+        f"def attributes_{type_name}(element, found, is_safe):",
+        "    for name, value in element.items():",
+        '        name = name[name.rfind("}") + 1:]',
+        f"        if name in _{type_name}_COLLECTED:",
+        "            found.add_safe_text(value)",
+        f"        elif not is_safe and name in _{type_name}_SENSITIVE:",
+        f'            found.add_sensitive_element(element, "{type_name}")',
+        "",
+    ]
+    return lines
+
+
+def _resolve_type_lines(rule: ChildRule) -> list[str]:
+    """Get the lines setting `child_type` to the type of a child that can have several."""
+    return [
+        "    child_type = child.get(_XSI_TYPE)",
+        "    if child_type is None:",
+        f"        child_type = {rule.default_type!r}",
+    ]
+
+
+def _child_function(type_name: str, tag: str, rule: ChildRule) -> tuple[str, list[str]]:
+    """Get the name of the function handling a child, and its definition if it needs one."""
+    single_type = rule.types[0] if len(rule.types) == 1 else None
+    if rule.prune:
+        return "_skip", []
+    inline = rule.has_attributes or rule.subelements is not None
+    if single_type is not None and not inline:
+        return (f"safe_visit_{single_type}" if rule.safe else f"visit_{single_type}"), []
+
+    name = f"_{type_name}__{tag}"
+    lines = ["", "", f"def {name}(child, found, is_safe):"]
+    if single_type is None:
+        lines.extend(_resolve_type_lines(rule))
+        visit_child = "VISITORS[child_type]"
+        child_attributes = "ATTRIBUTES[child_type]"
+    else:
+        visit_child = f"visit_{single_type}"
+        child_attributes = f"attributes_{single_type}"
+    if rule.safe:
+        lines.append(f"    {visit_child}(child, found, True)")
+        return name, lines
+
+    if rule.has_attributes:
+        lines.append(f"    {child_attributes}(child, found, is_safe)")
+    if rule.subelements and rule.subelement_tags:
+        lines.append(f"    for subelement in child.iterchildren{rule.subelement_tags!r}:")
+        lines.append("        subelement_tag = subelement.tag")
+        lines.append('        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]')
+        for index, (sub_tag, (sub_type, sub_safe)) in enumerate(rule.subelements.items()):
+            keyword = "if" if index == 0 else "elif"
+            lines.append(f"        {keyword} subelement_tag == {sub_tag!r}:")
+            # Safe sub-elements are parsed as the type of the child, like the interpreter does
+            if sub_safe:
+                lines.append(f"            {visit_child}(subelement, found, True)")
+            else:
+                lines.append(f"            visit_{sub_type}(subelement, found, False)")
+    lines.append(f"    {visit_child}(child, found, is_safe)")
+    return name, lines
+
+
+def _visit_function(type_name: str, rules: TypeRules) -> list[str]:
+    lines = [
+        f"def visit_{type_name}(element, found, is_safe):",
+        "    text = element.text",
+        '    if text is not None and text.strip() != "":',
+    ]
+    if rules.text_safe:
+        lines.append("        found.add_safe_text(text)")
+    else:
+        lines.extend(
+            [
+                "        if not is_safe:",
+                f'            found.add_sensitive_element(element, "{type_name}")',
+            ]
+        )
+    lines.append(f"    attributes_{type_name}(element, found, is_safe)")
+    if rules.child_tags:
+        lines.extend(
+            [
+                f"    for child in element.iterchildren(*_{type_name}_TAGS):",
+                "        tag = child.tag",
+                f'        _{type_name}_CHILDREN[tag[tag.rfind("}}") + 1:]](child, found, is_safe)',
+            ]
+        )
+    lines.extend(
+        [
+            "",
+            "",
+            f"def safe_visit_{type_name}(element, found, is_safe):",
+            f"    visit_{type_name}(element, found, True)",
+            "",
+        ]
+    )
+    return lines
+
+
+def generate_visitors(plan: ParserPlan) -> str:
+    """Generate the source of the visitor module for a plan.
+
+    Args:
+        plan: The structure and configuration to generate the visitors for
+
+    Returns:
+        The source of the module
+
+    """
+    lines = [
+        _HEADER.format(config_hash=plan.config_hash, generator_version=GENERATOR_VERSION),
+    ]
+    tables = []
+    for type_name, rules in plan.rules.items():
+        if type_name == "xhtml":
+            continue
+        lines.extend(["", ""])
+        lines.extend(_attributes_function(type_name, rules))
+        lines.append("")
+        lines.extend(_visit_function(type_name, rules))
+        if not rules.child_tags:
+            continue
+        tables.append(f"_{type_name}_TAGS = {rules.child_tags!r}")
+        tables.append(f"_{type_name}_CHILDREN = {{")
+        for tag, rule in rules.children.items():
+            function_name, definition = _child_function(type_name, tag, rule)
+            lines.extend(definition)
+            tables.append(f"    {tag!r}: {function_name},")
+        tables.append("}")
+
+    # Types that are referenced but not defined fail when they are used, like in the interpreter
+    for type_name in sorted(_referenced_types(plan) - set(plan.rules) - {"xhtml"}):
+        for prefix in ("visit", "safe_visit"):
+            lines.extend(
+                [
+                    "",
+                    "",
+                    f"def {prefix}_{type_name}(element, found, is_safe):",
+                    f"    raise KeyError({type_name!r})",
+                ]
+            )
+
+    lines.extend(["", "", *tables, ""])
+    lines.append("VISITORS = {")
+    lines.extend(f"    {type_name!r}: visit_{type_name}," for type_name in plan.rules)
+    if "xhtml" not in plan.rules:
+        lines.append('    "xhtml": visit_xhtml,')
+    lines.append("}")
+    lines.append("ATTRIBUTES = {")
+    lines.extend(
+        f"    {type_name!r}: attributes_{type_name},"
+        for type_name in plan.rules
+        if type_name != "xhtml"
+    )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _referenced_types(plan: ParserPlan) -> set[str]:
+    types = set()
+    for rules in plan.rules.values():
+        for rule in rules.children.values():
+            types.update(rule.types)
+            if rule.subelements is not None:
+                types.update(sub_type for sub_type, _ in rule.subelements.values())
+    return types
+
+
+def load_visitors(config_hash: str) -> Mapping[str, Visitor] | None:
+    """Load the generated visitors, if they were generated for the configuration.
+
+    Args:
+        config_hash: Hash of the structure and configuration of the plan
+
+    Returns:
+        The visitor of every type, or None if the module was generated for another configuration
+        or by another version of the generator
+
+    """
+    try:
+        module = import_module(GENERATED_MODULE)
+    except ImportError:
+        return None
+    if config_hash != module.CONFIG_HASH or module.GENERATOR_VERSION != GENERATOR_VERSION:
+        return None
+    return module.VISITORS
@@ -3,13 +3,9 @@
 from collections.abc import Iterable
 from enum import Enum
 
-import yaml
 from pydantic import BaseModel, RootModel, model_validator
 
-with open("src/eicr_anonymization/cda_structure.yaml") as f:
-    structure = yaml.safe_load(f)
-
-    all_types = set(structure.keys())
+from eicr_anonymization.element_parser import load_structure
 
 
 class Sensitivity(Enum):
@@ -57,8 +53,9 @@ class CustomConfig(RootModel):
     @model_validator(mode="after")
     def check_elements(self):
         """Check that all types, attributes, and elements in the configuration are known found in the structure."""
+        structure = load_structure()
         all_in_config = set(self)
-        _check_unknown_items(all_in_config, all_types, "types", "custom configuration")
+        _check_unknown_items(all_in_config, set(structure), "types", "custom configuration")
 
         for type_name, type_config in self.items():
             _check_section_partial(
@@ -122,6 +119,8 @@ class DefaultConfig(CustomConfig):
     @model_validator(mode="after")
     def check_elements(self):
         """Check that all types, attributes, and elements in the configuration are known found in the structure."""
+        structure = load_structure()
+        all_types = set(structure)
         all_in_config = set(self)
         _check_unknown_items(all_in_config, all_types, "types", "default configuration")
         _check_missing_items(all_in_config, all_types, "types", "default configuration")
@@ -0,0 +1,230 @@
+"""Pools of replacement values, loaded lazily and shared by every anonymizer in the process.
+
+The default pools are read from the `star-wars-data` directory of the package with
+`importlib.resources`, so they are found no matter what the working directory is. Any pool can be
+replaced with a custom file:
+- `.yaml` or `.yml`: a list of replacements, in the same format as the default pools.
+- `.txt`: one value per line.
+- `.pool`: the packed format written by `write_packed_pool`. The file is memory-mapped and values
+  are only decoded when they are used, so pools with hundreds of thousands of values load at once.
+"""
+
+import functools
+import mmap
+import os
+import struct
+from argparse import ArgumentTypeError
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Literal, NotRequired, TypedDict, overload
+
+DATA_DIRECTORY = "star-wars-data"
+
+DEFAULT_POOL_FILES = {
+    "country": "country_names.yaml",
+    "state": "state_names.yaml",
+    "county": "county_names.yaml",
+    "city": "city_names.yaml",
+    "streetNameBase": "street_names.yaml",
+    "streetNameType": "street_types.yaml",
+    "family": "family_names.yaml",
+    "given": "given_names.yaml",
+}
+SAFE_WORDS_FILE = "safe_words.yaml"
+
+PACKED_POOL_MAGIC = b"EICRPOOL1\n"
+_COUNT = struct.Struct("<I")
+_RANGE = struct.Struct("<II")
+
+
+class NotAPackedPool(ValueError):
+    """Exception raised when a `.pool` file is not in the packed pool format."""
+
+    def __init__(self, path: str):
+        """Initialize the exception with the path of the file."""
+        super().__init__(f"Not a packed pool file: {path}")
+
+
+class UnknownPoolFormat(ValueError):
+    """Exception raised when a custom pool file has an unknown extension."""
+
+    def __init__(self, path: str):
+        """Initialize the exception with the path of the file."""
+        super().__init__(f"Unknown pool file format: {path}")
+
+
+class UnknownPoolTypes(ValueError):
+    """Exception raised when custom pool files are given for unknown data types."""
+
+    def __init__(self, data_types: Iterable[str]):
+        """Initialize the exception with the unknown data types."""
+        super().__init__(f"Unknown data pool types: {', '.join(sorted(data_types))}")
+
+
+class ReplacementType(TypedDict):
+    """Type definition for a replacement."""
+
+    value: str
+    abbreviation_only: NotRequired[Literal[True]]
+    abbreviations: NotRequired[list[str]]
+    qualifier: NotRequired[str]
+
+
+class PackedPool(Sequence[ReplacementType]):
+    """A memory-mapped pool in the packed format, decoding values only when they are used.
+
+    The format is the magic bytes, the number of values as a little-endian uint32, one uint32
+    offset for the start of every value plus one for the end of the last, and then the UTF-8
+    encoded values back to back.
+    """
+
+    def __init__(self, path: str):
+        """Map a packed pool file into memory.
+
+        Args:
+            path: Path to the packed pool file
+        """
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[: len(PACKED_POOL_MAGIC)] != PACKED_POOL_MAGIC:
+            raise NotAPackedPool(path)
+        (self._count,) = _COUNT.unpack_from(self._data, len(PACKED_POOL_MAGIC))
+        self._offsets_start = len(PACKED_POOL_MAGIC) + _COUNT.size
+        self._values_start = self._offsets_start + _COUNT.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        """Get the number of values in the pool."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> ReplacementType: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[ReplacementType]: ...
+    def __getitem__(self, index: int | slice) -> ReplacementType | list[ReplacementType]:
+        """Get a value of the pool."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start, end = _RANGE.unpack_from(self._data, self._offsets_start + _COUNT.size * index)
+        value = self._data[self._values_start + start : self._values_start + end]
+        return {"value": value.decode("utf-8")}
+
+    def __iter__(self) -> Iterator[ReplacementType]:
+        """Iterate over the values of the pool."""
+        return (self[i] for i in range(self._count))
+
+
+def write_packed_pool(values: Iterable[str], path: str) -> None:
+    """Write values to a file in the packed pool format.
+
+    Args:
+        values: The values of the pool
+        path: Path of the packed pool file
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    with open(path, "wb") as f:
+        f.write(PACKED_POOL_MAGIC)
+        f.write(_COUNT.pack(len(encoded)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.writelines(encoded)
+
+
+def _parse_yaml(text: str) -> tuple[ReplacementType, ...]:
+    # Imported here, so the command line can parse `--data-pool` without loading yaml
+    import yaml  # noqa: PLC0415
+
+    # The C loader is several times faster, but only available if PyYAML was built with libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return tuple(yaml.load(text, Loader=loader))  # noqa: S506
+
+
+@functools.cache
+def load_default_pool(file_name: str) -> tuple[ReplacementType, ...]:
+    """Load a pool from the data directory of the package, once per process."""
+    from importlib import resources  # noqa: PLC0415
+
+    data_file = resources.files("eicr_anonymization").joinpath(DATA_DIRECTORY, file_name)
+    return _parse_yaml(data_file.read_text(encoding="utf-8"))
+
+
+@functools.cache
+def load_pool_file(path: str) -> Sequence[ReplacementType]:
+    """Load a custom pool file, once per process.
+
+    Args:
+        path: Path to a `.yaml`, `.yml`, `.txt` or `.pool` file
+
+    Returns:
+        The replacements in the pool
+
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".pool":
+        return PackedPool(path)
+    with open(path, encoding="utf-8") as f:
+        if extension == ".txt":
+            return tuple({"value": line.strip()} for line in f if line.strip())
+        if extension in {".yaml", ".yml"}:
+            return _parse_yaml(f.read())
+    raise UnknownPoolFormat(path)
+
+
+@functools.cache
+def load_safe_words() -> frozenset[str]:
+    """Load the safe words of the package, as they are written in the file."""
+    return frozenset(word["value"] for word in load_default_pool(SAFE_WORDS_FILE))
+
+
+def parse_pool_file(value: str) -> tuple[str, str]:
+    """Parse a custom pool file given as `TYPE=PATH` on the command line.
+
+    Args:
+        value: Data type and path of the pool file, e.g. `family=surnames.pool`
+
+    Returns:
+        The data type and the path
+
+    """
+    data_type, separator, path = value.partition("=")
+    if not separator or not path:
+        raise ArgumentTypeError(f"Data pool must be given as TYPE=PATH, got: {value}")  # noqa: TRY003
+    if data_type not in DEFAULT_POOL_FILES:
+        raise ArgumentTypeError(  # noqa: TRY003
+            f"Unknown data pool type: {data_type}, expected one of: {', '.join(DEFAULT_POOL_FILES)}"
+        )
+    return data_type, path
+
+
+class DataPools(Mapping[str, Sequence[ReplacementType]]):
+    """The pools of replacement values by data type, each loaded on first use."""
+
+    def __init__(self, pool_files: Mapping[str, str] | None = None):
+        """Initialize the pools.
+
+        Args:
+            pool_files: Custom pool files by data type, replacing the default pools
+        """
+        pool_files = dict(pool_files or {})
+        unknown = set(pool_files) - set(DEFAULT_POOL_FILES)
+        if unknown:
+            raise UnknownPoolTypes(unknown)
+        self.pool_files = pool_files
+
+    def __getitem__(self, data_type: str) -> Sequence[ReplacementType]:
+        """Get the pool of a data type, loading it if it has not been used yet."""
+        if data_type in self.pool_files:
+            return load_pool_file(self.pool_files[data_type])
+        return load_default_pool(DEFAULT_POOL_FILES[data_type])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the data types, without loading their pools."""
+        return iter(DEFAULT_POOL_FILES)
+
+    def __len__(self) -> int:
+        """Get the number of data types."""
+        return len(DEFAULT_POOL_FILES)
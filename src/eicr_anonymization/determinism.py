@@ -1,24 +1,38 @@
 import functools
 import hashlib
+import hmac
 import inspect
 import pickle
 import random
 from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The generator seeded by the innermost deterministic function running in the current thread
+_seeded_random: ContextVar[random.Random | None] = ContextVar("seeded_random", default=None)
 
 
 @contextmanager
 def isolated_random(seed_value):
-    """Context manager that temporarily replaces global random with seeded instance."""
-    global_state = random.getstate()
-    random.seed(seed_value)
+    """Context manager that makes `current_random` return a generator seeded with `seed_value`.
+
+    The generator is only visible to the current thread, so deterministic functions can run in
+    several threads at once without affecting each other.
+    """
+    token = _seeded_random.set(random.Random(seed_value))
     try:
         yield
     finally:
-        random.setstate(global_state)
+        _seeded_random.reset(token)
+
+
+def current_random(default: random.Random) -> random.Random:
+    """Get the generator of the deterministic function that is running, or `default` if none is."""
+    seeded = _seeded_random.get()
+    return default if seeded is None else seeded
 
 
 def deterministic(func):
-    """Make functions deterministic by temporarily setting the random seed based on the functions inputs."""
+    """Make functions deterministic by seeding `current_random` based on the functions inputs."""
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -70,3 +84,21 @@ def hash_params_to_seed(params, global_seed):
             hash_obj.update(str(global_seed).encode())
         seed = int(hash_obj.hexdigest()[:8], 16)
         return seed
+
+
+def keyed_seed(key: bytes, *parts: str) -> int:
+    """
+    Derive a seed from the HMAC-SHA256 of the given parts under a secret key.
+
+    Unlike `hash_params_to_seed`, the seed cannot be reproduced without the key, so it is safe to
+    use for real data as long as the key is kept secret.
+
+    Args:
+        key (bytes): Secret key
+        parts (str): Values identifying what the seed is for, e.g. a data type and a value
+
+    Returns:
+        int: Seed value
+    """
+    message = "\x1f".join(parts).encode("utf-8")
+    return int.from_bytes(hmac.new(key, message, hashlib.sha256).digest(), "big")
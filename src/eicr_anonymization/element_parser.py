@@ -1,9 +1,317 @@
 """Parse for stepping through XML elements of a CDA document to collect sensitive elements and safe text."""  # noqa: E501
 
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from importlib import resources
+from types import MappingProxyType
+from typing import Any
+
 import yaml
 from lxml.etree import _Element
 
-from eicr_anonymization.config import CustomConfig
+
+@functools.cache
+def load_structure() -> dict:
+    """Load the structure of the CDA types from `cda_structure.yaml`, once per process.
+
+    The structure is shared by every parser, so it must not be modified.
+    """
+    structure_file = resources.files("eicr_anonymization").joinpath("cda_structure.yaml")
+    return yaml.safe_load(structure_file.read_text(encoding="utf-8"))
+
+
+@functools.cache
+def _load_default_config_text() -> str:
+    default_config = resources.files("eicr_anonymization").joinpath("configs", "default.yaml")
+    return default_config.read_text(encoding="utf-8")
+
+
+def _freeze(value: Any) -> Any:
+    """Make a copy of a loaded YAML document that cannot be modified."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+# Attribute types whose values are collected as safe text when the attribute is safe
+SAFE_TEXT_ATTRIBUTE_TYPES = ("string", "code")
+
+
+def _tag_patterns(tags: Iterable[str]) -> tuple[str, ...]:
+    """Get the patterns lxml matches an element with any of the tags by, in any namespace."""
+    return tuple(f"{{*}}{tag}" for tag in tags)
+
+
+@dataclass(frozen=True)
+class ChildRule:
+    """How the children with one tag of an element of one type are parsed."""
+
+    types: tuple[str, ...]
+    default_type: str | None
+    safe: bool
+    # Only children defined inline in the structure have their own attributes and sub-elements
+    has_attributes: bool
+    # The type and safety of every sub-element, by tag
+    subelements: Mapping[str, tuple[str, bool]] | None
+    subelement_tags: tuple[str, ...]
+    # A safe child whose subtree can never hold safe text or sensitive elements is not parsed
+    prune: bool = False
+
+    def resolve_type(self, child: _Element) -> str:
+        """Get the type of a child, from its `xsi:type` attribute if it can have several."""
+        if len(self.types) == 1:
+            return self.types[0]
+        type_attribute = child.get(XSI_TYPE)
+        return type_attribute if type_attribute is not None else self.default_type  # type: ignore
+
+
+@dataclass(frozen=True)
+class TypeRules:
+    """How an element of one type is parsed, compiled from the structure and configuration."""
+
+    text_safe: bool
+    # Whether each attribute in the structure is safe, and whether it is then collected as safe text
+    attributes: Mapping[str, tuple[bool, bool]]
+    children: Mapping[str, ChildRule]
+    # Lets lxml skip every other child, like comments and elements outside the structure
+    child_tags: tuple[str, ...]
+
+
+def compile_type_rules(structure: Mapping, config: Mapping) -> Mapping[str, TypeRules]:
+    """Resolve the structure and configuration of every type into the rules the parser follows.
+
+    Args:
+        structure: The CDA structure
+        config: The merged configuration
+
+    Returns:
+        The rules of every type
+
+    """
+    rules = {}
+    for type_name, type_structure in structure.items():
+        type_config = config[type_name]
+        children = {}
+        for tag, child_structure in type_structure["elements"].items():
+            safety = type_config["elements"][tag]
+            subelements = None
+            if "elements" in child_structure:
+                sub_safety = safety["elements"] if isinstance(safety, Mapping) else {}
+                subelements = {
+                    sub_tag: (sub_structure["types"][0], sub_safety.get(sub_tag) == "SAFE")
+                    for sub_tag, sub_structure in child_structure["elements"].items()
+                }
+            children[tag] = ChildRule(
+                types=tuple(child_structure["types"]),
+                default_type=child_structure["default_type"],
+                safe=safety == "SAFE",
+                has_attributes="attributes" in child_structure,
+                subelements=MappingProxyType(subelements) if subelements is not None else None,
+                subelement_tags=_tag_patterns(subelements or ()),
+            )
+        rules[type_name] = TypeRules(
+            text_safe=type_config["text_content"] == "SAFE",
+            attributes=MappingProxyType(
+                {
+                    name: (
+                        type_config["attributes"][name] == "SAFE",
+                        attribute_type in SAFE_TEXT_ATTRIBUTE_TYPES,
+                    )
+                    for name, attribute_type in type_structure["attributes"].items()
+                }
+            ),
+            children=MappingProxyType(children),
+            child_tags=_tag_patterns(children),
+        )
+
+    inert = find_inert_types(rules)
+    for type_name, type_rules in rules.items():
+        children = {
+            tag: replace(child, prune=child.safe and child.types[0] in inert)
+            if len(child.types) == 1
+            else child
+            for tag, child in type_rules.children.items()
+        }
+        rules[type_name] = replace(type_rules, children=MappingProxyType(children))
+    return MappingProxyType(rules)
+
+
+def find_inert_types(rules: Mapping[str, TypeRules]) -> frozenset[str]:
+    """Find the types whose elements, when parsed as safe, can never add anything to the findings.
+
+    A safe element adds nothing if its type has no safe text content, no attributes collected as
+    safe text, and all its children are also of such types and safe. Children that can be of
+    several types, and children that are not safe, are assumed to add something, as their types
+    and safety depend on the document.
+
+    Args:
+        rules: The rules of every type
+
+    Returns:
+        The types whose subtrees can be skipped when they are safe
+
+    """
+    # Start from the types that add something themselves, then add their parents until no more
+    # types are found. The remaining types, including cycles of them, can never add anything.
+    productive = {
+        type_name
+        for type_name, type_rules in rules.items()
+        if type_name == "xhtml"
+        or type_rules.text_safe
+        or any(safe and collected for safe, collected in type_rules.attributes.values())
+    }
+    changed = True
+    while changed:
+        changed = False
+        for type_name, type_rules in rules.items():
+            if type_name in productive:
+                continue
+            if any(
+                not child.safe or len(child.types) != 1 or child.types[0] in productive
+                for child in type_rules.children.values()
+            ):
+                productive.add(type_name)
+                changed = True
+    return frozenset(rules) - productive
+
+
+@dataclass(frozen=True)
+class ParserPlan:
+    """The structure and a validated configuration, ready to be used by parsers.
+
+    Plans cannot be modified, so parsers using the same configuration all share one plan.
+    """
+
+    structure: Mapping[str, Any]
+    config: Mapping[str, Any]
+    # Identifies the combination of structure and configuration, to detect config changes
+    config_hash: str
+    # The structure and configuration of every type, resolved for the parser
+    rules: Mapping[str, TypeRules]
+    # Visitors generated for this configuration, see `codegen`, or None to interpret the rules
+    visitors: Mapping[str, Callable[..., None]] | None = None
+
+
+def compile_config(custom_config: bytes | None = None) -> ParserPlan:
+    """Validate a custom configuration and merge it into the default configuration.
+
+    Args:
+        custom_config: Contents of a custom configuration file, or None for the default
+
+    Returns:
+        The plan for parsers using the configuration
+
+    """
+    structure = load_structure()
+    config = yaml.safe_load(_load_default_config_text())
+
+    if custom_config:
+        # pydantic is slow to import, so it is only loaded when there is a config to validate
+        from eicr_anonymization.config import CustomConfig  # noqa: PLC0415
+
+        new_config = yaml.safe_load(custom_config)
+        CustomConfig(new_config) # Validate the custom config
+        for element in new_config:
+            config[element]["elements"].update(new_config[element]["elements"])
+
+    config_hash = hashlib.sha256(
+        json.dumps([structure, config], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    structure, config = _freeze(structure), _freeze(config)
+    # The generated visitors import this module, so they are only loaded once it is imported
+    from eicr_anonymization.codegen import load_visitors  # noqa: PLC0415
+
+    return ParserPlan(
+        structure,
+        config,
+        config_hash,
+        compile_type_rules(structure, config),
+        load_visitors(config_hash),
+    )
+
+
+DEFAULT_CONFIG_CACHE_SIZE = 64
+
+
+class ConfigRegistry:
+    """Compile every configuration once, keeping the plans of the most recently used ones.
+
+    Configurations are identified by a hash of their contents, so the same configuration is only
+    validated once, even if it is read from different files or sent by different clients.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CONFIG_CACHE_SIZE):
+        """Initialize an empty registry.
+
+        Args:
+            max_size: Number of plans to keep. The least recently used plan is dropped when a
+                new configuration would exceed it.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[str | None, ParserPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, custom_config: bytes | None = None) -> ParserPlan:
+        """Get the plan for a configuration, compiling it if it is not in the registry.
+
+        Args:
+            custom_config: Contents of a custom configuration file, or None for the default
+
+        Returns:
+            The plan for parsers using the configuration
+
+        """
+        key = hashlib.sha256(custom_config).hexdigest() if custom_config else None
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+
+        # Compiled without holding the lock, so other configurations are not held up. Invalid
+        # configurations raise here and are never added.
+        plan = compile_config(custom_config)
+        with self._lock:
+            self.misses += 1
+            plan = self._plans.setdefault(key, plan)
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def load(self, custom_config_path: str | None = None) -> ParserPlan:
+        """Get the plan for a configuration file, compiling it if it is not in the registry.
+
+        Args:
+            custom_config_path: Path of a custom configuration file, or None for the default
+
+        Returns:
+            The plan for parsers using the configuration
+
+        """
+        if not custom_config_path:
+            return self.get()
+        with open(custom_config_path, "rb") as config_file:
+            return self.get(config_file.read())
+
+    def __len__(self) -> int:
+        """Get the number of plans in the registry."""
+        return len(self._plans)
+
+
+# Shared by every parser created from a configuration file
+config_registry = ConfigRegistry()
 
 
 def has_text(element: _Element) -> bool:
@@ -36,6 +344,18 @@ class Element:
         self.text = element.text
         self.path = element.getroottree().getpath(element)
         self.line = element.sourceline
+        # The element in the document, which is anonymized in place
+        self.xml_element = element
+
+    def __getstate__(self) -> dict:
+        """Get the state to pickle, which leaves out the element in the document.
+
+        Deterministic functions are seeded with the pickled arguments, so this keeps their seeds
+        independent of the document the element is in.
+        """
+        state = self.__dict__.copy()
+        del state["xml_element"]
+        return state
 
     def __repr__(self) -> str:
         """Get a string representation of the tag."""
@@ -53,9 +373,35 @@ class Element:
         return repr
 
 
+@dataclass
+class Findings:
+    """The sensitive elements and safe text found while parsing one document."""
+
+    sensitive_elements: list[Element] = field(default_factory=list)
+    safe_text: set[str] = field(default_factory=set)
+    # Elements in safe subtrees that were skipped, as they could not add anything
+    skipped_elements: int = 0
+
+    def add_safe_text(self, text: str):
+        """Add a safe text element to the list."""
+        self.safe_text.add(text)
+
+    def add_sensitive_element(self, element: _Element, cda_type: str):
+        """Add a sensitive element to the list."""
+        self.sensitive_elements.append(Element(element, cda_type))
+
+    def skip_subtree(self, element: _Element):
+        """Count the elements of a subtree that is not parsed."""
+        # Counted by libxml2, without creating a Python object for every element
+        self.skipped_elements += int(element.xpath("count(descendant-or-self::*)"))
+
+
 class Parser:
     """Class for finding sensitive elements in an XML document.
 
+    A parser only holds its configuration, everything found in a document is returned to the
+    caller. One parser can therefore be shared by threads anonymizing different documents.
+
     The parser is driven by several YAML configuration files:
     - `cda_structure.yaml`: Defines the structure of the CDA document.
     - `default.yaml`: Defines, for every element and attribute, wether they should be considered
@@ -65,108 +411,118 @@ class Parser:
     file. With the expectation that the end user will, in future updates, be able to create and use
     their own configuration files, configuration files only need to define the elements and
     attributes that are different from the default configuration.
-    """
 
-    def __init__(self, custom_config_path: str | None = None):
-        """Initialize the Parser with an empty list of sensitive elements."""
-        self.sensitive_elements: list[Element] = []
-        self.safe_text: set[str] = set()
+    Both are compiled into `TypeRules` once per configuration. Children of an element that are
+    not in the structure of its type, like comments, are skipped by lxml without being visited.
+    For the default configuration, the rules are not interpreted but run as the visitors
+    generated from them into `generated_visitors.py`, see `codegen`.
+    """
 
-        with open("src/eicr_anonymization/cda_structure.yaml") as structure_file:
-            self.structure = yaml.safe_load(structure_file)
+    def __init__(self, custom_config_path: str | None = None, plan: ParserPlan | None = None):
+        """Initialize the Parser with the structure and configuration files.
 
-        with open("src/eicr_anonymization/configs/default.yaml") as config_file:
-            self.config = yaml.safe_load(config_file)
+        Args:
+            custom_config_path: Path of a custom configuration file. It is only validated and
+                merged into the default configuration the first time it is used, see
+                `config_registry`.
+            plan: A plan from a `ConfigRegistry`, instead of a configuration file
+        """
+        if plan is None:
+            plan = config_registry.load(custom_config_path)
+        self.plan = plan
+        self.structure = plan.structure
+        self.config = plan.config
+        self.config_hash = plan.config_hash
+        self.rules = plan.rules
+        self.visitors = plan.visitors
+
+    def collect_sensitive_elements_and_safe_words(
+        self, element: _Element
+    ) -> tuple[list[Element], set[str]]:
+        """Find sensitive elements in the XML document.
 
-        if custom_config_path:
-            with open(custom_config_path) as config_file:
-                new_config =  yaml.safe_load(config_file)
-                CustomConfig(new_config) # Validate the custom config
-            for element in new_config:
-                self.config[element]["elements"].update(new_config[element]["elements"])
+        Use `collect` to also get the number of elements that were skipped.
 
-    def add_safe_text(self, text: str):
-        """Add a safe text element to the list."""
-        self.safe_text.add(text)
+        Args:
+            element: The XML element to parse.
 
-    def add_sensitive_element(self, element: _Element, cda_type: str):
-        """Add a sensitive element to the list."""
-        self.sensitive_elements.append(Element(element, cda_type))
+        Returns:
+            The sensitive elements and the safe text found in the document.
+        """
+        found = self.collect(element, Findings())
+        return found.sensitive_elements, found.safe_text
 
-    def collect_sensitive_elements_and_safe_words(self, element: _Element):
-        """Find sensitive elements in the XML document.
+    def collect[F: Findings](self, element: _Element, found: F) -> F:
+        """Parse a document, adding everything found in it to the given findings.
 
         Args:
-            element: The XML element to parse.
+            element: The root element of the document.
+            found: Receives the sensitive elements and safe text, a subclass can collect
+                something else instead.
+
+        Returns:
+            The findings.
         """
-        self.sensitive_elements = []
-        self.safe_text = set()
-        if element.tag == "{urn:hl7-org:v3}ClinicalDocument":
-            self.parse_element(element, "ClinicalDocument")
-        else:
+        if element.tag != "{urn:hl7-org:v3}ClinicalDocument":
             raise ValueError(f"Unknown root element: {element.tag}")
+        if self.visitors is not None:
+            self.visitors["ClinicalDocument"](element, found, False)
+        else:
+            self.parse_element(element, "ClinicalDocument", found)
+        return found
 
-        return self.sensitive_elements, self.safe_text
-
-    def parse_element(self, element: _Element, element_type: str, is_safe: bool = False):
+    def parse_element(
+        self, element: _Element, element_type: str, found: Findings, is_safe: bool = False
+    ):
         # xhtml is a special case where it is always sensitive
         if element_type == "xhtml":
-            self.add_sensitive_element(element, element_type)
+            found.add_sensitive_element(element, element_type)
             return
 
-        children_safety: dict[str, str | dict[str, str]] = self.config[element_type]["elements"]
-        children_types = self.structure[element_type]["elements"]
+        rules = self.rules[element_type]
 
         if has_text(element):
-            if self.config[element_type]["text_content"] == "SAFE":
-                self.add_safe_text(element.text)  # type: ignore
+            if rules.text_safe:
+                found.add_safe_text(element.text)  # type: ignore
             elif not is_safe:
-                self.add_sensitive_element(element, element_type)
+                found.add_sensitive_element(element, element_type)
 
-        self.process_attributes(element, element_type, is_safe)
+        self.process_attributes(element, element_type, found, is_safe)
 
-        for child in element:
-            child_tag = str(child.tag).split("}")[-1]
-            if child_tag not in children_types:
-                continue
-            child_structure = children_types[child_tag]
-            if len(child_structure["types"]) == 1:
-                child_type = child_structure["types"][0]
-            else:
-                type_attribute = child.get("{http://www.w3.org/2001/XMLSchema-instance}type")
-                if type_attribute is not None:
-                    child_type = type_attribute
-                else:
-                    child_type = child_structure["default_type"]
-
-            if children_safety[child_tag] == "SAFE":
-                self.parse_element(child, child_type, True)
+        if not rules.child_tags:
+            return
+        for child in element.iterchildren(*rules.child_tags):
+            child_rule = rules.children[str(child.tag).split("}")[-1]]
+            child_type = child_rule.resolve_type(child)
+
+            if child_rule.prune:
+                found.skip_subtree(child)
+            elif child_rule.safe:
+                self.parse_element(child, child_type, found, True)
             else:
-                if "attributes" in child_structure:
-                    self.process_attributes(child, child_type, is_safe)
-                if "elements" in child_structure:
-                    for subelement in child:
-                        subelement_tag = str(subelement.tag).split("}")[-1]
-                        if subelement_tag not in child_structure["elements"]:
-                            continue
-                        subelement_structure = child_structure["elements"][subelement_tag]
-                        subelement_type = subelement_structure["types"][0]
-                        if children_safety[child_tag]["elements"][subelement_tag] == "SAFE":
-                            self.parse_element(subelement, child_type, True)
+                if child_rule.has_attributes:
+                    self.process_attributes(child, child_type, found, is_safe)
+                if child_rule.subelements is not None and child_rule.subelement_tags:
+                    for subelement in child.iterchildren(*child_rule.subelement_tags):
+                        subelement_type, subelement_safe = child_rule.subelements[
+                            str(subelement.tag).split("}")[-1]
+                        ]
+                        if subelement_safe:
+                            self.parse_element(subelement, child_type, found, True)
                         else:
-                            self.parse_element(subelement, subelement_type)
+                            self.parse_element(subelement, subelement_type, found)
 
-                self.parse_element(child, child_type, is_safe)
+                self.parse_element(child, child_type, found, is_safe)
 
-    def process_attributes(self, element, element_type, is_safe: bool):
-        for attribute in element.items():
-            attribute_name = attribute[0].split("}")[-1]
-            attribute_text = attribute[1]
-            if attribute_name not in self.structure[element_type]["attributes"]:
+    def process_attributes(self, element, element_type, found: Findings, is_safe: bool):
+        attributes = self.rules[element_type].attributes
+        for name, value in element.items():
+            attribute = attributes.get(name.split("}")[-1])
+            if attribute is None:
                 continue  # Skip attributes not defined in the structure
-            attribute_type = self.structure[element_type]["attributes"][attribute_name]
-            if self.config[element_type]["attributes"][attribute_name] == "SAFE":
-                if attribute_type in ["string", "code"]:
-                    self.add_safe_text(attribute_text)
+            safe, collect_text = attribute
+            if safe:
+                if collect_text:
+                    found.add_safe_text(value)
             elif not is_safe:
-                self.add_sensitive_element(element, element_type)
+                found.add_sensitive_element(element, element_type)
@@ -0,0 +1,157 @@
+"""Helpers for reading input files and writing anonymized output files."""
+
+import gzip
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import BinaryIO, Literal
+
+type Compression = Literal["gzip", "zstd"]
+
+COMPRESSION_SUFFIXES: dict[Compression, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+# The umask can only be read by setting it, so read it once while the process is single-threaded.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def get_compression(path: str | os.PathLike) -> Compression | None:
+    """Get the compression of a file from its extension.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The compression format, or None if the file is not compressed
+
+    """
+    path = os.fspath(path)
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def strip_compression_suffix(path: str) -> str:
+    """Remove the compression extension from a path, if it has one."""
+    compression = get_compression(path)
+    if compression is None:
+        return path
+    return path.removesuffix(COMPRESSION_SUFFIXES[compression])
+
+
+class MissingZstandard(ModuleNotFoundError):
+    """Exception raised when zstd compression is used without the zstandard package."""
+
+    def __init__(self):
+        """Initialize the exception with how to install the package."""
+        super().__init__(
+            "zstd compression requires the zstandard package, "
+            "install it with `pip install eicr-anonymization[zstd]`",
+            name="zstandard",
+        )
+
+
+def _import_zstandard():
+    """Import the optional zstandard package."""
+    try:
+        import zstandard  # noqa: PLC0415
+    except ModuleNotFoundError as e:
+        raise MissingZstandard from e
+    return zstandard
+
+
+@contextmanager
+def open_input(path: str | os.PathLike) -> Iterator[BinaryIO]:
+    """Open an input file for reading, decompressing it on the fly if it is compressed.
+
+    Args:
+        path: Path to the file
+
+    Yields:
+        Binary file handle with the uncompressed contents
+
+    """
+    compression = get_compression(path)
+    if compression == "gzip":
+        with gzip.open(path, "rb") as f:
+            yield f  # type: ignore[misc]
+    elif compression == "zstd":
+        zstandard = _import_zstandard()
+        with open(path, "rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as f:
+            yield f
+    else:
+        with open(path, "rb") as f:
+            yield f
+
+
+@contextmanager
+def _compress(stream: BinaryIO, compression: Compression | None, name: str) -> Iterator[BinaryIO]:
+    """Wrap a binary stream so everything written to it is compressed."""
+    if compression == "gzip":
+        with gzip.GzipFile(filename=name, mode="wb", compresslevel=6, fileobj=stream) as f:
+            yield f  # type: ignore[misc]
+    elif compression == "zstd":
+        zstandard = _import_zstandard()
+        with zstandard.ZstdCompressor().stream_writer(stream, closefd=False) as f:
+            yield f
+    else:
+        yield stream
+
+
+@contextmanager
+def open_output(path: str) -> Iterator[BinaryIO]:
+    """Open an output file for writing, compressing it if its extension asks for it.
+
+    Unlike `atomic_write` the contents are written straight to `path`, so a file that is written
+    over a long time, like a log, can be read while it is being written.
+
+    Args:
+        path: Path to the file
+
+    Yields:
+        Binary file handle to write the uncompressed contents to
+
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    name = strip_compression_suffix(os.path.basename(path))
+    with open(path, "wb") as raw, _compress(raw, get_compression(path), name) as f:
+        yield f
+
+
+@contextmanager
+def atomic_write(path: str, compression: Compression | None = None) -> Iterator[BinaryIO]:
+    """Open a temporary file next to `path` and move it into place once it has been written.
+
+    Readers of `path` will only ever see the previous file or the complete new file, never a
+    partially written one. If an exception is raised while writing, the temporary file is removed
+    and `path` is left untouched.
+
+    Args:
+        path: Final location of the file
+        compression: Compress the contents written to the file
+
+    Yields:
+        Binary file handle to write the contents to
+
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    name = strip_compression_suffix(os.path.basename(path))
+    try:
+        # mkstemp creates the file as owner-only, give it the same permissions as a regular open()
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        with (
+            os.fdopen(file_descriptor, "wb") as temp_file,
+            _compress(temp_file, compression, name) as f,
+        ):
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
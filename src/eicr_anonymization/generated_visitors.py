@@ -0,0 +1,4933 @@
+"""Visitors for every CDA type, generated by `tools/visitor_generator.py`. Do not edit.
+
+Generated from `cda_structure.yaml` and the configuration with hash `CONFIG_HASH`. Regenerate
+this module whenever either of them changes.
+"""
+
+CONFIG_HASH = '53bfdf67f4f12bc954970c72efc2186f55bb838671f5a824de28e999c9760163'
+GENERATOR_VERSION = 1
+
+_XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+
+
+def _skip(element, found, is_safe):
+    found.skip_subtree(element)
+
+
+def _no_attributes(element, found, is_safe):
+    pass
+
+
+def visit_xhtml(element, found, is_safe):
+    found.add_sensitive_element(element, "xhtml")
+
+
+def safe_visit_xhtml(element, found, is_safe):
+    found.add_sensitive_element(element, "xhtml")
+
+
+
+_OrganizerComponent_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_OrganizerComponent_SENSITIVE = frozenset([])
+
+
+def attributes_OrganizerComponent(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _OrganizerComponent_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _OrganizerComponent_SENSITIVE:
+            found.add_sensitive_element(element, "OrganizerComponent")
+
+
+def visit_OrganizerComponent(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "OrganizerComponent")
+    attributes_OrganizerComponent(element, found, is_safe)
+    for child in element.iterchildren(*_OrganizerComponent_TAGS):
+        tag = child.tag
+        _OrganizerComponent_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_OrganizerComponent(element, found, is_safe):
+    visit_OrganizerComponent(element, found, True)
+
+
+
+_Informant_COLLECTED = frozenset(['contextControlCode', 'nullFlavor', 'typeCode'])
+_Informant_SENSITIVE = frozenset([])
+
+
+def attributes_Informant(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Informant_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Informant_SENSITIVE:
+            found.add_sensitive_element(element, "Informant")
+
+
+def visit_Informant(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Informant")
+    attributes_Informant(element, found, is_safe)
+    for child in element.iterchildren(*_Informant_TAGS):
+        tag = child.tag
+        _Informant_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Informant(element, found, is_safe):
+    visit_Informant(element, found, True)
+
+
+
+_INT_POS_COLLECTED = frozenset(['nullFlavor'])
+_INT_POS_SENSITIVE = frozenset([])
+
+
+def attributes_INT_POS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _INT_POS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _INT_POS_SENSITIVE:
+            found.add_sensitive_element(element, "INT_POS")
+
+
+def visit_INT_POS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "INT_POS")
+    attributes_INT_POS(element, found, is_safe)
+
+
+def safe_visit_INT_POS(element, found, is_safe):
+    visit_INT_POS(element, found, True)
+
+
+
+_OrganizationPartOf_COLLECTED = frozenset(['classCode'])
+_OrganizationPartOf_SENSITIVE = frozenset([])
+
+
+def attributes_OrganizationPartOf(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _OrganizationPartOf_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _OrganizationPartOf_SENSITIVE:
+            found.add_sensitive_element(element, "OrganizationPartOf")
+
+
+def visit_OrganizationPartOf(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "OrganizationPartOf")
+    attributes_OrganizationPartOf(element, found, is_safe)
+    for child in element.iterchildren(*_OrganizationPartOf_TAGS):
+        tag = child.tag
+        _OrganizationPartOf_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_OrganizationPartOf(element, found, is_safe):
+    visit_OrganizationPartOf(element, found, True)
+
+
+
+_PlayingEntity_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_PlayingEntity_SENSITIVE = frozenset([])
+
+
+def attributes_PlayingEntity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PlayingEntity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PlayingEntity_SENSITIVE:
+            found.add_sensitive_element(element, "PlayingEntity")
+
+
+def visit_PlayingEntity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PlayingEntity")
+    attributes_PlayingEntity(element, found, is_safe)
+    for child in element.iterchildren(*_PlayingEntity_TAGS):
+        tag = child.tag
+        _PlayingEntity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PlayingEntity(element, found, is_safe):
+    visit_PlayingEntity(element, found, True)
+
+
+
+_PQ_COLLECTED = frozenset(['nullFlavor', 'unit'])
+_PQ_SENSITIVE = frozenset([])
+
+
+def attributes_PQ(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PQ_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PQ_SENSITIVE:
+            found.add_sensitive_element(element, "PQ")
+
+
+def visit_PQ(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PQ")
+    attributes_PQ(element, found, is_safe)
+    for child in element.iterchildren(*_PQ_TAGS):
+        tag = child.tag
+        _PQ_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PQ(element, found, is_safe):
+    visit_PQ(element, found, True)
+
+
+
+_AssociatedEntity_COLLECTED = frozenset(['classCode'])
+_AssociatedEntity_SENSITIVE = frozenset([])
+
+
+def attributes_AssociatedEntity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AssociatedEntity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AssociatedEntity_SENSITIVE:
+            found.add_sensitive_element(element, "AssociatedEntity")
+
+
+def visit_AssociatedEntity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AssociatedEntity")
+    attributes_AssociatedEntity(element, found, is_safe)
+    for child in element.iterchildren(*_AssociatedEntity_TAGS):
+        tag = child.tag
+        _AssociatedEntity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AssociatedEntity(element, found, is_safe):
+    visit_AssociatedEntity(element, found, True)
+
+
+
+_CS_COLLECTED = frozenset(['code', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_CS_SENSITIVE = frozenset([])
+
+
+def attributes_CS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CS_SENSITIVE:
+            found.add_sensitive_element(element, "CS")
+
+
+def visit_CS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        found.add_safe_text(text)
+    attributes_CS(element, found, is_safe)
+
+
+def safe_visit_CS(element, found, is_safe):
+    visit_CS(element, found, True)
+
+
+
+_NonXMLBody_COLLECTED = frozenset(['classCode', 'moodCode', 'nullFlavor'])
+_NonXMLBody_SENSITIVE = frozenset([])
+
+
+def attributes_NonXMLBody(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _NonXMLBody_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _NonXMLBody_SENSITIVE:
+            found.add_sensitive_element(element, "NonXMLBody")
+
+
+def visit_NonXMLBody(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "NonXMLBody")
+    attributes_NonXMLBody(element, found, is_safe)
+    for child in element.iterchildren(*_NonXMLBody_TAGS):
+        tag = child.tag
+        _NonXMLBody_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_NonXMLBody(element, found, is_safe):
+    visit_NonXMLBody(element, found, True)
+
+
+
+_BL_COLLECTED = frozenset(['nullFlavor'])
+_BL_SENSITIVE = frozenset([])
+
+
+def attributes_BL(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _BL_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _BL_SENSITIVE:
+            found.add_sensitive_element(element, "BL")
+
+
+def visit_BL(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        found.add_safe_text(text)
+    attributes_BL(element, found, is_safe)
+
+
+def safe_visit_BL(element, found, is_safe):
+    visit_BL(element, found, True)
+
+
+
+_InFulfillmentOf_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_InFulfillmentOf_SENSITIVE = frozenset([])
+
+
+def attributes_InFulfillmentOf(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _InFulfillmentOf_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _InFulfillmentOf_SENSITIVE:
+            found.add_sensitive_element(element, "InFulfillmentOf")
+
+
+def visit_InFulfillmentOf(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "InFulfillmentOf")
+    attributes_InFulfillmentOf(element, found, is_safe)
+    for child in element.iterchildren(*_InFulfillmentOf_TAGS):
+        tag = child.tag
+        _InFulfillmentOf_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_InFulfillmentOf(element, found, is_safe):
+    visit_InFulfillmentOf(element, found, True)
+
+
+
+_ParticipantRole_COLLECTED = frozenset(['classCode'])
+_ParticipantRole_SENSITIVE = frozenset([])
+
+
+def attributes_ParticipantRole(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ParticipantRole_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ParticipantRole_SENSITIVE:
+            found.add_sensitive_element(element, "ParticipantRole")
+
+
+def visit_ParticipantRole(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ParticipantRole")
+    attributes_ParticipantRole(element, found, is_safe)
+    for child in element.iterchildren(*_ParticipantRole_TAGS):
+        tag = child.tag
+        _ParticipantRole_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ParticipantRole(element, found, is_safe):
+    visit_ParticipantRole(element, found, True)
+
+
+
+_Organizer_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Organizer_SENSITIVE = frozenset([])
+
+
+def attributes_Organizer(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Organizer_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Organizer_SENSITIVE:
+            found.add_sensitive_element(element, "Organizer")
+
+
+def visit_Organizer(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Organizer")
+    attributes_Organizer(element, found, is_safe)
+    for child in element.iterchildren(*_Organizer_TAGS):
+        tag = child.tag
+        _Organizer_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Organizer(element, found, is_safe):
+    visit_Organizer(element, found, True)
+
+
+
+_EIVL_TS_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_EIVL_TS_SENSITIVE = frozenset([])
+
+
+def attributes_EIVL_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _EIVL_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _EIVL_TS_SENSITIVE:
+            found.add_sensitive_element(element, "EIVL_TS")
+
+
+def visit_EIVL_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "EIVL_TS")
+    attributes_EIVL_TS(element, found, is_safe)
+    for child in element.iterchildren(*_EIVL_TS_TAGS):
+        tag = child.tag
+        _EIVL_TS_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_EIVL_TS(element, found, is_safe):
+    visit_EIVL_TS(element, found, True)
+
+
+
+_Encounter_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Encounter_SENSITIVE = frozenset([])
+
+
+def attributes_Encounter(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Encounter_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Encounter_SENSITIVE:
+            found.add_sensitive_element(element, "Encounter")
+
+
+def visit_Encounter(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Encounter")
+    attributes_Encounter(element, found, is_safe)
+    for child in element.iterchildren(*_Encounter_TAGS):
+        tag = child.tag
+        _Encounter_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Encounter(element, found, is_safe):
+    visit_Encounter(element, found, True)
+
+
+
+_IVL_TS_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_IVL_TS_SENSITIVE = frozenset(['value'])
+
+
+def attributes_IVL_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVL_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVL_TS_SENSITIVE:
+            found.add_sensitive_element(element, "IVL_TS")
+
+
+def visit_IVL_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVL_TS")
+    attributes_IVL_TS(element, found, is_safe)
+    for child in element.iterchildren(*_IVL_TS_TAGS):
+        tag = child.tag
+        _IVL_TS_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IVL_TS(element, found, is_safe):
+    visit_IVL_TS(element, found, True)
+
+
+
+_RelatedEntity_COLLECTED = frozenset(['classCode'])
+_RelatedEntity_SENSITIVE = frozenset([])
+
+
+def attributes_RelatedEntity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RelatedEntity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RelatedEntity_SENSITIVE:
+            found.add_sensitive_element(element, "RelatedEntity")
+
+
+def visit_RelatedEntity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RelatedEntity")
+    attributes_RelatedEntity(element, found, is_safe)
+    for child in element.iterchildren(*_RelatedEntity_TAGS):
+        tag = child.tag
+        _RelatedEntity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RelatedEntity(element, found, is_safe):
+    visit_RelatedEntity(element, found, True)
+
+
+
+_Participant1_COLLECTED = frozenset(['contextControlCode', 'nullFlavor', 'typeCode'])
+_Participant1_SENSITIVE = frozenset([])
+
+
+def attributes_Participant1(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Participant1_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Participant1_SENSITIVE:
+            found.add_sensitive_element(element, "Participant1")
+
+
+def visit_Participant1(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Participant1")
+    attributes_Participant1(element, found, is_safe)
+    for child in element.iterchildren(*_Participant1_TAGS):
+        tag = child.tag
+        _Participant1_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Participant1(element, found, is_safe):
+    visit_Participant1(element, found, True)
+
+
+
+_IntendedRecipient_COLLECTED = frozenset(['classCode'])
+_IntendedRecipient_SENSITIVE = frozenset([])
+
+
+def attributes_IntendedRecipient(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IntendedRecipient_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IntendedRecipient_SENSITIVE:
+            found.add_sensitive_element(element, "IntendedRecipient")
+
+
+def visit_IntendedRecipient(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IntendedRecipient")
+    attributes_IntendedRecipient(element, found, is_safe)
+    for child in element.iterchildren(*_IntendedRecipient_TAGS):
+        tag = child.tag
+        _IntendedRecipient_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IntendedRecipient(element, found, is_safe):
+    visit_IntendedRecipient(element, found, True)
+
+
+
+_PatientRole_COLLECTED = frozenset(['classCode'])
+_PatientRole_SENSITIVE = frozenset([])
+
+
+def attributes_PatientRole(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PatientRole_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PatientRole_SENSITIVE:
+            found.add_sensitive_element(element, "PatientRole")
+
+
+def visit_PatientRole(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PatientRole")
+    attributes_PatientRole(element, found, is_safe)
+    for child in element.iterchildren(*_PatientRole_TAGS):
+        tag = child.tag
+        _PatientRole_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PatientRole(element, found, is_safe):
+    visit_PatientRole(element, found, True)
+
+
+
+_SC_COLLECTED = frozenset(['code', 'codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'language', 'mediaType', 'nullFlavor', 'representation'])
+_SC_SENSITIVE = frozenset([])
+
+
+def attributes_SC(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SC_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SC_SENSITIVE:
+            found.add_sensitive_element(element, "SC")
+
+
+def visit_SC(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SC")
+    attributes_SC(element, found, is_safe)
+
+
+def safe_visit_SC(element, found, is_safe):
+    visit_SC(element, found, True)
+
+
+
+_CR_COLLECTED = frozenset(['nullFlavor'])
+_CR_SENSITIVE = frozenset(['inverted'])
+
+
+def attributes_CR(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CR_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CR_SENSITIVE:
+            found.add_sensitive_element(element, "CR")
+
+
+def visit_CR(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CR")
+    attributes_CR(element, found, is_safe)
+    for child in element.iterchildren(*_CR_TAGS):
+        tag = child.tag
+        _CR_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CR(element, found, is_safe):
+    visit_CR(element, found, True)
+
+
+
+_Section_COLLECTED = frozenset(['classCode', 'moodCode', 'nullFlavor'])
+_Section_SENSITIVE = frozenset(['ID'])
+
+
+def attributes_Section(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Section_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Section_SENSITIVE:
+            found.add_sensitive_element(element, "Section")
+
+
+def visit_Section(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Section")
+    attributes_Section(element, found, is_safe)
+    for child in element.iterchildren(*_Section_TAGS):
+        tag = child.tag
+        _Section_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Section(element, found, is_safe):
+    visit_Section(element, found, True)
+
+
+
+def _Section__component(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}section'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'section':
+            visit_Section(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_Place_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_Place_SENSITIVE = frozenset([])
+
+
+def attributes_Place(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Place_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Place_SENSITIVE:
+            found.add_sensitive_element(element, "Place")
+
+
+def visit_Place(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Place")
+    attributes_Place(element, found, is_safe)
+    for child in element.iterchildren(*_Place_TAGS):
+        tag = child.tag
+        _Place_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Place(element, found, is_safe):
+    visit_Place(element, found, True)
+
+
+
+_II_COLLECTED = frozenset(['assigningAuthorityName', 'nullFlavor', 'root'])
+_II_SENSITIVE = frozenset(['extension'])
+
+
+def attributes_II(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _II_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _II_SENSITIVE:
+            found.add_sensitive_element(element, "II")
+
+
+def visit_II(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "II")
+    attributes_II(element, found, is_safe)
+
+
+def safe_visit_II(element, found, is_safe):
+    visit_II(element, found, True)
+
+
+
+_Performer1_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Performer1_SENSITIVE = frozenset([])
+
+
+def attributes_Performer1(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Performer1_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Performer1_SENSITIVE:
+            found.add_sensitive_element(element, "Performer1")
+
+
+def visit_Performer1(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Performer1")
+    attributes_Performer1(element, found, is_safe)
+    for child in element.iterchildren(*_Performer1_TAGS):
+        tag = child.tag
+        _Performer1_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Performer1(element, found, is_safe):
+    visit_Performer1(element, found, True)
+
+
+
+_Author_COLLECTED = frozenset(['contextControlCode', 'nullFlavor', 'typeCode'])
+_Author_SENSITIVE = frozenset([])
+
+
+def attributes_Author(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Author_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Author_SENSITIVE:
+            found.add_sensitive_element(element, "Author")
+
+
+def visit_Author(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Author")
+    attributes_Author(element, found, is_safe)
+    for child in element.iterchildren(*_Author_TAGS):
+        tag = child.tag
+        _Author_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Author(element, found, is_safe):
+    visit_Author(element, found, True)
+
+
+
+_Act_COLLECTED = frozenset(['classCode', 'moodCode', 'nullFlavor'])
+_Act_SENSITIVE = frozenset([])
+
+
+def attributes_Act(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Act_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Act_SENSITIVE:
+            found.add_sensitive_element(element, "Act")
+
+
+def visit_Act(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Act")
+    attributes_Act(element, found, is_safe)
+    for child in element.iterchildren(*_Act_TAGS):
+        tag = child.tag
+        _Act_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Act(element, found, is_safe):
+    visit_Act(element, found, True)
+
+
+
+_HealthCareFacility_COLLECTED = frozenset(['classCode'])
+_HealthCareFacility_SENSITIVE = frozenset([])
+
+
+def attributes_HealthCareFacility(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _HealthCareFacility_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _HealthCareFacility_SENSITIVE:
+            found.add_sensitive_element(element, "HealthCareFacility")
+
+
+def visit_HealthCareFacility(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "HealthCareFacility")
+    attributes_HealthCareFacility(element, found, is_safe)
+    for child in element.iterchildren(*_HealthCareFacility_TAGS):
+        tag = child.tag
+        _HealthCareFacility_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_HealthCareFacility(element, found, is_safe):
+    visit_HealthCareFacility(element, found, True)
+
+
+
+_Custodian_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Custodian_SENSITIVE = frozenset([])
+
+
+def attributes_Custodian(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Custodian_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Custodian_SENSITIVE:
+            found.add_sensitive_element(element, "Custodian")
+
+
+def visit_Custodian(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Custodian")
+    attributes_Custodian(element, found, is_safe)
+    for child in element.iterchildren(*_Custodian_TAGS):
+        tag = child.tag
+        _Custodian_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Custodian(element, found, is_safe):
+    visit_Custodian(element, found, True)
+
+
+
+_PN_COLLECTED = frozenset(['nullFlavor', 'use'])
+_PN_SENSITIVE = frozenset([])
+
+
+def attributes_PN(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PN_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PN_SENSITIVE:
+            found.add_sensitive_element(element, "PN")
+
+
+def visit_PN(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PN")
+    attributes_PN(element, found, is_safe)
+    for child in element.iterchildren(*_PN_TAGS):
+        tag = child.tag
+        _PN_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PN(element, found, is_safe):
+    visit_PN(element, found, True)
+
+
+
+_Birthplace_COLLECTED = frozenset(['classCode'])
+_Birthplace_SENSITIVE = frozenset([])
+
+
+def attributes_Birthplace(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Birthplace_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Birthplace_SENSITIVE:
+            found.add_sensitive_element(element, "Birthplace")
+
+
+def visit_Birthplace(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Birthplace")
+    attributes_Birthplace(element, found, is_safe)
+    for child in element.iterchildren(*_Birthplace_TAGS):
+        tag = child.tag
+        _Birthplace_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Birthplace(element, found, is_safe):
+    visit_Birthplace(element, found, True)
+
+
+
+_Organization_COLLECTED = frozenset(['classCode', 'determinerCode', 'nullFlavor'])
+_Organization_SENSITIVE = frozenset([])
+
+
+def attributes_Organization(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Organization_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Organization_SENSITIVE:
+            found.add_sensitive_element(element, "Organization")
+
+
+def visit_Organization(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Organization")
+    attributes_Organization(element, found, is_safe)
+    for child in element.iterchildren(*_Organization_TAGS):
+        tag = child.tag
+        _Organization_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Organization(element, found, is_safe):
+    visit_Organization(element, found, True)
+
+
+
+_MO_COLLECTED = frozenset(['nullFlavor'])
+_MO_SENSITIVE = frozenset([])
+
+
+def attributes_MO(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _MO_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _MO_SENSITIVE:
+            found.add_sensitive_element(element, "MO")
+
+
+def visit_MO(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "MO")
+    attributes_MO(element, found, is_safe)
+    for child in element.iterchildren(*_MO_TAGS):
+        tag = child.tag
+        _MO_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_MO(element, found, is_safe):
+    visit_MO(element, found, True)
+
+
+
+attributes_LanguageCommunication = _no_attributes
+
+
+def visit_LanguageCommunication(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "LanguageCommunication")
+    attributes_LanguageCommunication(element, found, is_safe)
+    for child in element.iterchildren(*_LanguageCommunication_TAGS):
+        tag = child.tag
+        _LanguageCommunication_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_LanguageCommunication(element, found, is_safe):
+    visit_LanguageCommunication(element, found, True)
+
+
+
+_AssignedAuthor_COLLECTED = frozenset(['classCode'])
+_AssignedAuthor_SENSITIVE = frozenset([])
+
+
+def attributes_AssignedAuthor(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AssignedAuthor_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AssignedAuthor_SENSITIVE:
+            found.add_sensitive_element(element, "AssignedAuthor")
+
+
+def visit_AssignedAuthor(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AssignedAuthor")
+    attributes_AssignedAuthor(element, found, is_safe)
+    for child in element.iterchildren(*_AssignedAuthor_TAGS):
+        tag = child.tag
+        _AssignedAuthor_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AssignedAuthor(element, found, is_safe):
+    visit_AssignedAuthor(element, found, True)
+
+
+
+_ADXP_COLLECTED = frozenset(['language', 'mediaType', 'nullFlavor', 'partType', 'representation'])
+_ADXP_SENSITIVE = frozenset([])
+
+
+def attributes_ADXP(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ADXP_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ADXP_SENSITIVE:
+            found.add_sensitive_element(element, "ADXP")
+
+
+def visit_ADXP(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ADXP")
+    attributes_ADXP(element, found, is_safe)
+
+
+def safe_visit_ADXP(element, found, is_safe):
+    visit_ADXP(element, found, True)
+
+
+
+_ObservationMedia_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ObservationMedia_SENSITIVE = frozenset(['ID'])
+
+
+def attributes_ObservationMedia(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ObservationMedia_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ObservationMedia_SENSITIVE:
+            found.add_sensitive_element(element, "ObservationMedia")
+
+
+def visit_ObservationMedia(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ObservationMedia")
+    attributes_ObservationMedia(element, found, is_safe)
+    for child in element.iterchildren(*_ObservationMedia_TAGS):
+        tag = child.tag
+        _ObservationMedia_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ObservationMedia(element, found, is_safe):
+    visit_ObservationMedia(element, found, True)
+
+
+
+_ComponentOf_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_ComponentOf_SENSITIVE = frozenset([])
+
+
+def attributes_ComponentOf(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ComponentOf_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ComponentOf_SENSITIVE:
+            found.add_sensitive_element(element, "ComponentOf")
+
+
+def visit_ComponentOf(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ComponentOf")
+    attributes_ComponentOf(element, found, is_safe)
+    for child in element.iterchildren(*_ComponentOf_TAGS):
+        tag = child.tag
+        _ComponentOf_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ComponentOf(element, found, is_safe):
+    visit_ComponentOf(element, found, True)
+
+
+
+_SpecimenRole_COLLECTED = frozenset(['classCode'])
+_SpecimenRole_SENSITIVE = frozenset([])
+
+
+def attributes_SpecimenRole(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SpecimenRole_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SpecimenRole_SENSITIVE:
+            found.add_sensitive_element(element, "SpecimenRole")
+
+
+def visit_SpecimenRole(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SpecimenRole")
+    attributes_SpecimenRole(element, found, is_safe)
+    for child in element.iterchildren(*_SpecimenRole_TAGS):
+        tag = child.tag
+        _SpecimenRole_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_SpecimenRole(element, found, is_safe):
+    visit_SpecimenRole(element, found, True)
+
+
+
+_RelatedDocument_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_RelatedDocument_SENSITIVE = frozenset([])
+
+
+def attributes_RelatedDocument(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RelatedDocument_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RelatedDocument_SENSITIVE:
+            found.add_sensitive_element(element, "RelatedDocument")
+
+
+def visit_RelatedDocument(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RelatedDocument")
+    attributes_RelatedDocument(element, found, is_safe)
+    for child in element.iterchildren(*_RelatedDocument_TAGS):
+        tag = child.tag
+        _RelatedDocument_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RelatedDocument(element, found, is_safe):
+    visit_RelatedDocument(element, found, True)
+
+
+
+_IVXB_PQ_COLLECTED = frozenset(['nullFlavor'])
+_IVXB_PQ_SENSITIVE = frozenset(['inclusive', 'unit', 'value'])
+
+
+def attributes_IVXB_PQ(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVXB_PQ_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVXB_PQ_SENSITIVE:
+            found.add_sensitive_element(element, "IVXB_PQ")
+
+
+def visit_IVXB_PQ(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVXB_PQ")
+    attributes_IVXB_PQ(element, found, is_safe)
+    for child in element.iterchildren(*_IVXB_PQ_TAGS):
+        tag = child.tag
+        _IVXB_PQ_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IVXB_PQ(element, found, is_safe):
+    visit_IVXB_PQ(element, found, True)
+
+
+
+_Order_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Order_SENSITIVE = frozenset([])
+
+
+def attributes_Order(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Order_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Order_SENSITIVE:
+            found.add_sensitive_element(element, "Order")
+
+
+def visit_Order(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Order")
+    attributes_Order(element, found, is_safe)
+    for child in element.iterchildren(*_Order_TAGS):
+        tag = child.tag
+        _Order_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Order(element, found, is_safe):
+    visit_Order(element, found, True)
+
+
+
+_LegalAuthenticator_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_LegalAuthenticator_SENSITIVE = frozenset(['contextControlCode'])
+
+
+def attributes_LegalAuthenticator(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _LegalAuthenticator_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _LegalAuthenticator_SENSITIVE:
+            found.add_sensitive_element(element, "LegalAuthenticator")
+
+
+def visit_LegalAuthenticator(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "LegalAuthenticator")
+    attributes_LegalAuthenticator(element, found, is_safe)
+    for child in element.iterchildren(*_LegalAuthenticator_TAGS):
+        tag = child.tag
+        _LegalAuthenticator_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_LegalAuthenticator(element, found, is_safe):
+    visit_LegalAuthenticator(element, found, True)
+
+
+
+_LabeledDrug_COLLECTED = frozenset(['classCode', 'determinerCode', 'nullFlavor'])
+_LabeledDrug_SENSITIVE = frozenset([])
+
+
+def attributes_LabeledDrug(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _LabeledDrug_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _LabeledDrug_SENSITIVE:
+            found.add_sensitive_element(element, "LabeledDrug")
+
+
+def visit_LabeledDrug(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "LabeledDrug")
+    attributes_LabeledDrug(element, found, is_safe)
+    for child in element.iterchildren(*_LabeledDrug_TAGS):
+        tag = child.tag
+        _LabeledDrug_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_LabeledDrug(element, found, is_safe):
+    visit_LabeledDrug(element, found, True)
+
+
+
+_ON_COLLECTED = frozenset(['nullFlavor', 'use'])
+_ON_SENSITIVE = frozenset([])
+
+
+def attributes_ON(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ON_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ON_SENSITIVE:
+            found.add_sensitive_element(element, "ON")
+
+
+def visit_ON(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ON")
+    attributes_ON(element, found, is_safe)
+    for child in element.iterchildren(*_ON_TAGS):
+        tag = child.tag
+        _ON_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ON(element, found, is_safe):
+    visit_ON(element, found, True)
+
+
+
+_ParentDocument_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ParentDocument_SENSITIVE = frozenset([])
+
+
+def attributes_ParentDocument(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ParentDocument_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ParentDocument_SENSITIVE:
+            found.add_sensitive_element(element, "ParentDocument")
+
+
+def visit_ParentDocument(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ParentDocument")
+    attributes_ParentDocument(element, found, is_safe)
+    for child in element.iterchildren(*_ParentDocument_TAGS):
+        tag = child.tag
+        _ParentDocument_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ParentDocument(element, found, is_safe):
+    visit_ParentDocument(element, found, True)
+
+
+
+_RecordTarget_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_RecordTarget_SENSITIVE = frozenset(['contextControlCode'])
+
+
+def attributes_RecordTarget(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RecordTarget_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RecordTarget_SENSITIVE:
+            found.add_sensitive_element(element, "RecordTarget")
+
+
+def visit_RecordTarget(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RecordTarget")
+    attributes_RecordTarget(element, found, is_safe)
+    for child in element.iterchildren(*_RecordTarget_TAGS):
+        tag = child.tag
+        _RecordTarget_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RecordTarget(element, found, is_safe):
+    visit_RecordTarget(element, found, True)
+
+
+
+_TN_COLLECTED = frozenset(['nullFlavor', 'use'])
+_TN_SENSITIVE = frozenset([])
+
+
+def attributes_TN(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _TN_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _TN_SENSITIVE:
+            found.add_sensitive_element(element, "TN")
+
+
+def visit_TN(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "TN")
+    attributes_TN(element, found, is_safe)
+    for child in element.iterchildren(*_TN_TAGS):
+        tag = child.tag
+        _TN_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_TN(element, found, is_safe):
+    visit_TN(element, found, True)
+
+
+
+_SubjectPerson_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_SubjectPerson_SENSITIVE = frozenset([])
+
+
+def attributes_SubjectPerson(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SubjectPerson_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SubjectPerson_SENSITIVE:
+            found.add_sensitive_element(element, "SubjectPerson")
+
+
+def visit_SubjectPerson(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SubjectPerson")
+    attributes_SubjectPerson(element, found, is_safe)
+    for child in element.iterchildren(*_SubjectPerson_TAGS):
+        tag = child.tag
+        _SubjectPerson_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_SubjectPerson(element, found, is_safe):
+    visit_SubjectPerson(element, found, True)
+
+
+
+_StructuredBody_COLLECTED = frozenset(['classCode', 'moodCode', 'nullFlavor'])
+_StructuredBody_SENSITIVE = frozenset([])
+
+
+def attributes_StructuredBody(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _StructuredBody_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _StructuredBody_SENSITIVE:
+            found.add_sensitive_element(element, "StructuredBody")
+
+
+def visit_StructuredBody(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "StructuredBody")
+    attributes_StructuredBody(element, found, is_safe)
+    for child in element.iterchildren(*_StructuredBody_TAGS):
+        tag = child.tag
+        _StructuredBody_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_StructuredBody(element, found, is_safe):
+    visit_StructuredBody(element, found, True)
+
+
+
+def _StructuredBody__component(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}section'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'section':
+            visit_Section(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_PQR_COLLECTED = frozenset(['codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_PQR_SENSITIVE = frozenset(['code', 'value'])
+
+
+def attributes_PQR(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PQR_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PQR_SENSITIVE:
+            found.add_sensitive_element(element, "PQR")
+
+
+def visit_PQR(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PQR")
+    attributes_PQR(element, found, is_safe)
+    for child in element.iterchildren(*_PQR_TAGS):
+        tag = child.tag
+        _PQR_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PQR(element, found, is_safe):
+    visit_PQR(element, found, True)
+
+
+
+_RegionOfInterest_COLLECTED = frozenset(['classCode', 'moodCode'])
+_RegionOfInterest_SENSITIVE = frozenset(['ID'])
+
+
+def attributes_RegionOfInterest(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RegionOfInterest_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RegionOfInterest_SENSITIVE:
+            found.add_sensitive_element(element, "RegionOfInterest")
+
+
+def visit_RegionOfInterest(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RegionOfInterest")
+    attributes_RegionOfInterest(element, found, is_safe)
+    for child in element.iterchildren(*_RegionOfInterest_TAGS):
+        tag = child.tag
+        _RegionOfInterest_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RegionOfInterest(element, found, is_safe):
+    visit_RegionOfInterest(element, found, True)
+
+
+
+_Patient_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_Patient_SENSITIVE = frozenset([])
+
+
+def attributes_Patient(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Patient_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Patient_SENSITIVE:
+            found.add_sensitive_element(element, "Patient")
+
+
+def visit_Patient(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Patient")
+    attributes_Patient(element, found, is_safe)
+    for child in element.iterchildren(*_Patient_TAGS):
+        tag = child.tag
+        _Patient_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Patient(element, found, is_safe):
+    visit_Patient(element, found, True)
+
+
+
+_RTO_PQ_PQ_COLLECTED = frozenset(['nullFlavor'])
+_RTO_PQ_PQ_SENSITIVE = frozenset([])
+
+
+def attributes_RTO_PQ_PQ(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RTO_PQ_PQ_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RTO_PQ_PQ_SENSITIVE:
+            found.add_sensitive_element(element, "RTO_PQ_PQ")
+
+
+def visit_RTO_PQ_PQ(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RTO_PQ_PQ")
+    attributes_RTO_PQ_PQ(element, found, is_safe)
+    for child in element.iterchildren(*_RTO_PQ_PQ_TAGS):
+        tag = child.tag
+        _RTO_PQ_PQ_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RTO_PQ_PQ(element, found, is_safe):
+    visit_RTO_PQ_PQ(element, found, True)
+
+
+
+_AlternateIdentification_COLLECTED = frozenset(['classCode'])
+_AlternateIdentification_SENSITIVE = frozenset([])
+
+
+def attributes_AlternateIdentification(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AlternateIdentification_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AlternateIdentification_SENSITIVE:
+            found.add_sensitive_element(element, "AlternateIdentification")
+
+
+def visit_AlternateIdentification(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AlternateIdentification")
+    attributes_AlternateIdentification(element, found, is_safe)
+    for child in element.iterchildren(*_AlternateIdentification_TAGS):
+        tag = child.tag
+        _AlternateIdentification_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AlternateIdentification(element, found, is_safe):
+    visit_AlternateIdentification(element, found, True)
+
+
+
+_ClinicalDocument_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ClinicalDocument_SENSITIVE = frozenset([])
+
+
+def attributes_ClinicalDocument(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ClinicalDocument_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ClinicalDocument_SENSITIVE:
+            found.add_sensitive_element(element, "ClinicalDocument")
+
+
+def visit_ClinicalDocument(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ClinicalDocument")
+    attributes_ClinicalDocument(element, found, is_safe)
+    for child in element.iterchildren(*_ClinicalDocument_TAGS):
+        tag = child.tag
+        _ClinicalDocument_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ClinicalDocument(element, found, is_safe):
+    visit_ClinicalDocument(element, found, True)
+
+
+
+_Specimen_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Specimen_SENSITIVE = frozenset([])
+
+
+def attributes_Specimen(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Specimen_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Specimen_SENSITIVE:
+            found.add_sensitive_element(element, "Specimen")
+
+
+def visit_Specimen(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Specimen")
+    attributes_Specimen(element, found, is_safe)
+    for child in element.iterchildren(*_Specimen_TAGS):
+        tag = child.tag
+        _Specimen_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Specimen(element, found, is_safe):
+    visit_Specimen(element, found, True)
+
+
+
+_INT_COLLECTED = frozenset(['nullFlavor'])
+_INT_SENSITIVE = frozenset(['value'])
+
+
+def attributes_INT(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _INT_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _INT_SENSITIVE:
+            found.add_sensitive_element(element, "INT")
+
+
+def visit_INT(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "INT")
+    attributes_INT(element, found, is_safe)
+
+
+def safe_visit_INT(element, found, is_safe):
+    visit_INT(element, found, True)
+
+
+
+_SXCM_TS_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_SXCM_TS_SENSITIVE = frozenset(['value'])
+
+
+def attributes_SXCM_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SXCM_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SXCM_TS_SENSITIVE:
+            found.add_sensitive_element(element, "SXCM_TS")
+
+
+def visit_SXCM_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SXCM_TS")
+    attributes_SXCM_TS(element, found, is_safe)
+
+
+def safe_visit_SXCM_TS(element, found, is_safe):
+    visit_SXCM_TS(element, found, True)
+
+
+
+_Entry_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Entry_SENSITIVE = frozenset([])
+
+
+def attributes_Entry(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Entry_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Entry_SENSITIVE:
+            found.add_sensitive_element(element, "Entry")
+
+
+def visit_Entry(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Entry")
+    attributes_Entry(element, found, is_safe)
+    for child in element.iterchildren(*_Entry_TAGS):
+        tag = child.tag
+        _Entry_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Entry(element, found, is_safe):
+    visit_Entry(element, found, True)
+
+
+
+_DocumentationOf_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_DocumentationOf_SENSITIVE = frozenset([])
+
+
+def attributes_DocumentationOf(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _DocumentationOf_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _DocumentationOf_SENSITIVE:
+            found.add_sensitive_element(element, "DocumentationOf")
+
+
+def visit_DocumentationOf(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "DocumentationOf")
+    attributes_DocumentationOf(element, found, is_safe)
+    for child in element.iterchildren(*_DocumentationOf_TAGS):
+        tag = child.tag
+        _DocumentationOf_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_DocumentationOf(element, found, is_safe):
+    visit_DocumentationOf(element, found, True)
+
+
+
+_SubstanceAdministration_COLLECTED = frozenset(['classCode', 'moodCode'])
+_SubstanceAdministration_SENSITIVE = frozenset([])
+
+
+def attributes_SubstanceAdministration(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SubstanceAdministration_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SubstanceAdministration_SENSITIVE:
+            found.add_sensitive_element(element, "SubstanceAdministration")
+
+
+def visit_SubstanceAdministration(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SubstanceAdministration")
+    attributes_SubstanceAdministration(element, found, is_safe)
+    for child in element.iterchildren(*_SubstanceAdministration_TAGS):
+        tag = child.tag
+        _SubstanceAdministration_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_SubstanceAdministration(element, found, is_safe):
+    visit_SubstanceAdministration(element, found, True)
+
+
+
+def _SubstanceAdministration__effectiveTime(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = 'SXCM_TS'
+    VISITORS[child_type](child, found, is_safe)
+
+
+def _SubstanceAdministration__consumable(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}manufacturedProduct'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'manufacturedProduct':
+            visit_ManufacturedProduct(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_InfrastructureRoot_COLLECTED = frozenset(['nullFlavor'])
+_InfrastructureRoot_SENSITIVE = frozenset([])
+
+
+def attributes_InfrastructureRoot(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _InfrastructureRoot_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _InfrastructureRoot_SENSITIVE:
+            found.add_sensitive_element(element, "InfrastructureRoot")
+
+
+def visit_InfrastructureRoot(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "InfrastructureRoot")
+    attributes_InfrastructureRoot(element, found, is_safe)
+    for child in element.iterchildren(*_InfrastructureRoot_TAGS):
+        tag = child.tag
+        _InfrastructureRoot_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_InfrastructureRoot(element, found, is_safe):
+    visit_InfrastructureRoot(element, found, True)
+
+
+
+_SXPR_TS_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_SXPR_TS_SENSITIVE = frozenset(['value'])
+
+
+def attributes_SXPR_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _SXPR_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _SXPR_TS_SENSITIVE:
+            found.add_sensitive_element(element, "SXPR_TS")
+
+
+def visit_SXPR_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "SXPR_TS")
+    attributes_SXPR_TS(element, found, is_safe)
+    for child in element.iterchildren(*_SXPR_TS_TAGS):
+        tag = child.tag
+        _SXPR_TS_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_SXPR_TS(element, found, is_safe):
+    visit_SXPR_TS(element, found, True)
+
+
+
+def _SXPR_TS__comp(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = None
+    VISITORS[child_type](child, found, is_safe)
+
+
+_Criterion_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Criterion_SENSITIVE = frozenset([])
+
+
+def attributes_Criterion(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Criterion_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Criterion_SENSITIVE:
+            found.add_sensitive_element(element, "Criterion")
+
+
+def visit_Criterion(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Criterion")
+    attributes_Criterion(element, found, is_safe)
+    for child in element.iterchildren(*_Criterion_TAGS):
+        tag = child.tag
+        _Criterion_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Criterion(element, found, is_safe):
+    visit_Criterion(element, found, True)
+
+
+
+def _Criterion__value(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = None
+    VISITORS[child_type](child, found, is_safe)
+
+
+_ObservationRange_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ObservationRange_SENSITIVE = frozenset([])
+
+
+def attributes_ObservationRange(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ObservationRange_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ObservationRange_SENSITIVE:
+            found.add_sensitive_element(element, "ObservationRange")
+
+
+def visit_ObservationRange(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ObservationRange")
+    attributes_ObservationRange(element, found, is_safe)
+    for child in element.iterchildren(*_ObservationRange_TAGS):
+        tag = child.tag
+        _ObservationRange_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ObservationRange(element, found, is_safe):
+    visit_ObservationRange(element, found, True)
+
+
+
+def _ObservationRange__value(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = None
+    VISITORS[child_type](child, found, True)
+
+
+_ManufacturedProduct_COLLECTED = frozenset(['classCode'])
+_ManufacturedProduct_SENSITIVE = frozenset([])
+
+
+def attributes_ManufacturedProduct(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ManufacturedProduct_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ManufacturedProduct_SENSITIVE:
+            found.add_sensitive_element(element, "ManufacturedProduct")
+
+
+def visit_ManufacturedProduct(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ManufacturedProduct")
+    attributes_ManufacturedProduct(element, found, is_safe)
+    for child in element.iterchildren(*_ManufacturedProduct_TAGS):
+        tag = child.tag
+        _ManufacturedProduct_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ManufacturedProduct(element, found, is_safe):
+    visit_ManufacturedProduct(element, found, True)
+
+
+
+_Entity_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_Entity_SENSITIVE = frozenset([])
+
+
+def attributes_Entity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Entity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Entity_SENSITIVE:
+            found.add_sensitive_element(element, "Entity")
+
+
+def visit_Entity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Entity")
+    attributes_Entity(element, found, is_safe)
+    for child in element.iterchildren(*_Entity_TAGS):
+        tag = child.tag
+        _Entity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Entity(element, found, is_safe):
+    visit_Entity(element, found, True)
+
+
+
+_IVXB_TS_COLLECTED = frozenset(['nullFlavor'])
+_IVXB_TS_SENSITIVE = frozenset(['inclusive', 'value'])
+
+
+def attributes_IVXB_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVXB_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVXB_TS_SENSITIVE:
+            found.add_sensitive_element(element, "IVXB_TS")
+
+
+def visit_IVXB_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVXB_TS")
+    attributes_IVXB_TS(element, found, is_safe)
+
+
+def safe_visit_IVXB_TS(element, found, is_safe):
+    visit_IVXB_TS(element, found, True)
+
+
+
+_EncompassingEncounter_COLLECTED = frozenset(['classCode', 'moodCode'])
+_EncompassingEncounter_SENSITIVE = frozenset([])
+
+
+def attributes_EncompassingEncounter(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _EncompassingEncounter_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _EncompassingEncounter_SENSITIVE:
+            found.add_sensitive_element(element, "EncompassingEncounter")
+
+
+def visit_EncompassingEncounter(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "EncompassingEncounter")
+    attributes_EncompassingEncounter(element, found, is_safe)
+    for child in element.iterchildren(*_EncompassingEncounter_TAGS):
+        tag = child.tag
+        _EncompassingEncounter_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_EncompassingEncounter(element, found, is_safe):
+    visit_EncompassingEncounter(element, found, True)
+
+
+
+def _EncompassingEncounter__responsibleParty(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}assignedEntity'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'assignedEntity':
+            visit_AssignedEntity(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+def _EncompassingEncounter__location(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}healthCareFacility'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'healthCareFacility':
+            visit_HealthCareFacility(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_Supply_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Supply_SENSITIVE = frozenset([])
+
+
+def attributes_Supply(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Supply_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Supply_SENSITIVE:
+            found.add_sensitive_element(element, "Supply")
+
+
+def visit_Supply(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Supply")
+    attributes_Supply(element, found, is_safe)
+    for child in element.iterchildren(*_Supply_TAGS):
+        tag = child.tag
+        _Supply_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Supply(element, found, is_safe):
+    visit_Supply(element, found, True)
+
+
+
+def _Supply__effectiveTime(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = 'SXCM_TS'
+    VISITORS[child_type](child, found, is_safe)
+
+
+def _Supply__product(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}manufacturedProduct'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'manufacturedProduct':
+            visit_ManufacturedProduct(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_EN_COLLECTED = frozenset(['nullFlavor', 'use'])
+_EN_SENSITIVE = frozenset([])
+
+
+def attributes_EN(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _EN_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _EN_SENSITIVE:
+            found.add_sensitive_element(element, "EN")
+
+
+def visit_EN(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "EN")
+    attributes_EN(element, found, is_safe)
+    for child in element.iterchildren(*_EN_TAGS):
+        tag = child.tag
+        _EN_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_EN(element, found, is_safe):
+    visit_EN(element, found, True)
+
+
+
+_IVXB_INT_COLLECTED = frozenset(['nullFlavor'])
+_IVXB_INT_SENSITIVE = frozenset(['inclusive', 'value'])
+
+
+def attributes_IVXB_INT(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVXB_INT_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVXB_INT_SENSITIVE:
+            found.add_sensitive_element(element, "IVXB_INT")
+
+
+def visit_IVXB_INT(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVXB_INT")
+    attributes_IVXB_INT(element, found, is_safe)
+
+
+def safe_visit_IVXB_INT(element, found, is_safe):
+    visit_IVXB_INT(element, found, True)
+
+
+
+_CV_COLLECTED = frozenset(['codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_CV_SENSITIVE = frozenset(['code'])
+
+
+def attributes_CV(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CV_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CV_SENSITIVE:
+            found.add_sensitive_element(element, "CV")
+
+
+def visit_CV(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CV")
+    attributes_CV(element, found, is_safe)
+    for child in element.iterchildren(*_CV_TAGS):
+        tag = child.tag
+        _CV_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CV(element, found, is_safe):
+    visit_CV(element, found, True)
+
+
+
+_ExternalAct_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ExternalAct_SENSITIVE = frozenset([])
+
+
+def attributes_ExternalAct(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ExternalAct_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ExternalAct_SENSITIVE:
+            found.add_sensitive_element(element, "ExternalAct")
+
+
+def visit_ExternalAct(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ExternalAct")
+    attributes_ExternalAct(element, found, is_safe)
+    for child in element.iterchildren(*_ExternalAct_TAGS):
+        tag = child.tag
+        _ExternalAct_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ExternalAct(element, found, is_safe):
+    visit_ExternalAct(element, found, True)
+
+
+
+_CO_COLLECTED = frozenset(['codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_CO_SENSITIVE = frozenset(['code'])
+
+
+def attributes_CO(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CO_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CO_SENSITIVE:
+            found.add_sensitive_element(element, "CO")
+
+
+def visit_CO(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CO")
+    attributes_CO(element, found, is_safe)
+    for child in element.iterchildren(*_CO_TAGS):
+        tag = child.tag
+        _CO_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CO(element, found, is_safe):
+    visit_CO(element, found, True)
+
+
+
+_AssignedCustodian_COLLECTED = frozenset(['classCode'])
+_AssignedCustodian_SENSITIVE = frozenset([])
+
+
+def attributes_AssignedCustodian(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AssignedCustodian_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AssignedCustodian_SENSITIVE:
+            found.add_sensitive_element(element, "AssignedCustodian")
+
+
+def visit_AssignedCustodian(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AssignedCustodian")
+    attributes_AssignedCustodian(element, found, is_safe)
+    for child in element.iterchildren(*_AssignedCustodian_TAGS):
+        tag = child.tag
+        _AssignedCustodian_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AssignedCustodian(element, found, is_safe):
+    visit_AssignedCustodian(element, found, True)
+
+
+
+_InformationRecipient_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_InformationRecipient_SENSITIVE = frozenset([])
+
+
+def attributes_InformationRecipient(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _InformationRecipient_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _InformationRecipient_SENSITIVE:
+            found.add_sensitive_element(element, "InformationRecipient")
+
+
+def visit_InformationRecipient(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "InformationRecipient")
+    attributes_InformationRecipient(element, found, is_safe)
+    for child in element.iterchildren(*_InformationRecipient_TAGS):
+        tag = child.tag
+        _InformationRecipient_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_InformationRecipient(element, found, is_safe):
+    visit_InformationRecipient(element, found, True)
+
+
+
+_Subject_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Subject_SENSITIVE = frozenset(['contextControlCode'])
+
+
+def attributes_Subject(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Subject_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Subject_SENSITIVE:
+            found.add_sensitive_element(element, "Subject")
+
+
+def visit_Subject(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Subject")
+    attributes_Subject(element, found, is_safe)
+    for child in element.iterchildren(*_Subject_TAGS):
+        tag = child.tag
+        _Subject_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Subject(element, found, is_safe):
+    visit_Subject(element, found, True)
+
+
+
+_Material_COLLECTED = frozenset(['classCode', 'determinerCode', 'nullFlavor'])
+_Material_SENSITIVE = frozenset([])
+
+
+def attributes_Material(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Material_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Material_SENSITIVE:
+            found.add_sensitive_element(element, "Material")
+
+
+def visit_Material(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Material")
+    attributes_Material(element, found, is_safe)
+    for child in element.iterchildren(*_Material_TAGS):
+        tag = child.tag
+        _Material_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Material(element, found, is_safe):
+    visit_Material(element, found, True)
+
+
+
+_Guardian_COLLECTED = frozenset(['classCode'])
+_Guardian_SENSITIVE = frozenset([])
+
+
+def attributes_Guardian(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Guardian_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Guardian_SENSITIVE:
+            found.add_sensitive_element(element, "Guardian")
+
+
+def visit_Guardian(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Guardian")
+    attributes_Guardian(element, found, is_safe)
+    for child in element.iterchildren(*_Guardian_TAGS):
+        tag = child.tag
+        _Guardian_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Guardian(element, found, is_safe):
+    visit_Guardian(element, found, True)
+
+
+
+_EncounterParticipant_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_EncounterParticipant_SENSITIVE = frozenset([])
+
+
+def attributes_EncounterParticipant(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _EncounterParticipant_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _EncounterParticipant_SENSITIVE:
+            found.add_sensitive_element(element, "EncounterParticipant")
+
+
+def visit_EncounterParticipant(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "EncounterParticipant")
+    attributes_EncounterParticipant(element, found, is_safe)
+    for child in element.iterchildren(*_EncounterParticipant_TAGS):
+        tag = child.tag
+        _EncounterParticipant_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_EncounterParticipant(element, found, is_safe):
+    visit_EncounterParticipant(element, found, True)
+
+
+
+_DataEnterer_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_DataEnterer_SENSITIVE = frozenset(['contextControlCode'])
+
+
+def attributes_DataEnterer(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _DataEnterer_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _DataEnterer_SENSITIVE:
+            found.add_sensitive_element(element, "DataEnterer")
+
+
+def visit_DataEnterer(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "DataEnterer")
+    attributes_DataEnterer(element, found, is_safe)
+    for child in element.iterchildren(*_DataEnterer_TAGS):
+        tag = child.tag
+        _DataEnterer_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_DataEnterer(element, found, is_safe):
+    visit_DataEnterer(element, found, True)
+
+
+
+_ANY_COLLECTED = frozenset(['nullFlavor'])
+_ANY_SENSITIVE = frozenset([])
+
+
+def attributes_ANY(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ANY_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ANY_SENSITIVE:
+            found.add_sensitive_element(element, "ANY")
+
+
+def visit_ANY(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ANY")
+    attributes_ANY(element, found, is_safe)
+
+
+def safe_visit_ANY(element, found, is_safe):
+    visit_ANY(element, found, True)
+
+
+
+_Authorization_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Authorization_SENSITIVE = frozenset([])
+
+
+def attributes_Authorization(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Authorization_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Authorization_SENSITIVE:
+            found.add_sensitive_element(element, "Authorization")
+
+
+def visit_Authorization(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Authorization")
+    attributes_Authorization(element, found, is_safe)
+    for child in element.iterchildren(*_Authorization_TAGS):
+        tag = child.tag
+        _Authorization_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Authorization(element, found, is_safe):
+    visit_Authorization(element, found, True)
+
+
+
+_Precondition_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Precondition_SENSITIVE = frozenset([])
+
+
+def attributes_Precondition(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Precondition_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Precondition_SENSITIVE:
+            found.add_sensitive_element(element, "Precondition")
+
+
+def visit_Precondition(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Precondition")
+    attributes_Precondition(element, found, is_safe)
+    for child in element.iterchildren(*_Precondition_TAGS):
+        tag = child.tag
+        _Precondition_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Precondition(element, found, is_safe):
+    visit_Precondition(element, found, True)
+
+
+
+_Reference_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Reference_SENSITIVE = frozenset([])
+
+
+def attributes_Reference(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Reference_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Reference_SENSITIVE:
+            found.add_sensitive_element(element, "Reference")
+
+
+def visit_Reference(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Reference")
+    attributes_Reference(element, found, is_safe)
+    for child in element.iterchildren(*_Reference_TAGS):
+        tag = child.tag
+        _Reference_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Reference(element, found, is_safe):
+    visit_Reference(element, found, True)
+
+
+
+_ServiceEvent_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ServiceEvent_SENSITIVE = frozenset([])
+
+
+def attributes_ServiceEvent(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ServiceEvent_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ServiceEvent_SENSITIVE:
+            found.add_sensitive_element(element, "ServiceEvent")
+
+
+def visit_ServiceEvent(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ServiceEvent")
+    attributes_ServiceEvent(element, found, is_safe)
+    for child in element.iterchildren(*_ServiceEvent_TAGS):
+        tag = child.tag
+        _ServiceEvent_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ServiceEvent(element, found, is_safe):
+    visit_ServiceEvent(element, found, True)
+
+
+
+_Component_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Component_SENSITIVE = frozenset([])
+
+
+def attributes_Component(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Component_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Component_SENSITIVE:
+            found.add_sensitive_element(element, "Component")
+
+
+def visit_Component(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Component")
+    attributes_Component(element, found, is_safe)
+    for child in element.iterchildren(*_Component_TAGS):
+        tag = child.tag
+        _Component_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Component(element, found, is_safe):
+    visit_Component(element, found, True)
+
+
+
+_IdentifiedBy_COLLECTED = frozenset(['typeCode'])
+_IdentifiedBy_SENSITIVE = frozenset([])
+
+
+def attributes_IdentifiedBy(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IdentifiedBy_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IdentifiedBy_SENSITIVE:
+            found.add_sensitive_element(element, "IdentifiedBy")
+
+
+def visit_IdentifiedBy(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IdentifiedBy")
+    attributes_IdentifiedBy(element, found, is_safe)
+    for child in element.iterchildren(*_IdentifiedBy_TAGS):
+        tag = child.tag
+        _IdentifiedBy_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IdentifiedBy(element, found, is_safe):
+    visit_IdentifiedBy(element, found, True)
+
+
+
+_ExternalObservation_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ExternalObservation_SENSITIVE = frozenset([])
+
+
+def attributes_ExternalObservation(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ExternalObservation_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ExternalObservation_SENSITIVE:
+            found.add_sensitive_element(element, "ExternalObservation")
+
+
+def visit_ExternalObservation(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ExternalObservation")
+    attributes_ExternalObservation(element, found, is_safe)
+    for child in element.iterchildren(*_ExternalObservation_TAGS):
+        tag = child.tag
+        _ExternalObservation_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ExternalObservation(element, found, is_safe):
+    visit_ExternalObservation(element, found, True)
+
+
+
+_ENXP_COLLECTED = frozenset(['language', 'mediaType', 'nullFlavor', 'partType', 'representation'])
+_ENXP_SENSITIVE = frozenset(['qualifier'])
+
+
+def attributes_ENXP(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ENXP_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ENXP_SENSITIVE:
+            found.add_sensitive_element(element, "ENXP")
+
+
+def visit_ENXP(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ENXP")
+    attributes_ENXP(element, found, is_safe)
+
+
+def safe_visit_ENXP(element, found, is_safe):
+    visit_ENXP(element, found, True)
+
+
+
+_Performer2_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Performer2_SENSITIVE = frozenset([])
+
+
+def attributes_Performer2(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Performer2_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Performer2_SENSITIVE:
+            found.add_sensitive_element(element, "Performer2")
+
+
+def visit_Performer2(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Performer2")
+    attributes_Performer2(element, found, is_safe)
+    for child in element.iterchildren(*_Performer2_TAGS):
+        tag = child.tag
+        _Performer2_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Performer2(element, found, is_safe):
+    visit_Performer2(element, found, True)
+
+
+
+_CD_COLLECTED = frozenset(['codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_CD_SENSITIVE = frozenset(['code'])
+
+
+def attributes_CD(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CD_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CD_SENSITIVE:
+            found.add_sensitive_element(element, "CD")
+
+
+def visit_CD(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CD")
+    attributes_CD(element, found, is_safe)
+    for child in element.iterchildren(*_CD_TAGS):
+        tag = child.tag
+        _CD_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CD(element, found, is_safe):
+    visit_CD(element, found, True)
+
+
+
+_REAL_COLLECTED = frozenset(['nullFlavor'])
+_REAL_SENSITIVE = frozenset(['value'])
+
+
+def attributes_REAL(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _REAL_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _REAL_SENSITIVE:
+            found.add_sensitive_element(element, "REAL")
+
+
+def visit_REAL(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "REAL")
+    attributes_REAL(element, found, is_safe)
+
+
+def safe_visit_REAL(element, found, is_safe):
+    visit_REAL(element, found, True)
+
+
+
+_TEL_COLLECTED = frozenset(['nullFlavor', 'use'])
+_TEL_SENSITIVE = frozenset(['value'])
+
+
+def attributes_TEL(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _TEL_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _TEL_SENSITIVE:
+            found.add_sensitive_element(element, "TEL")
+
+
+def visit_TEL(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "TEL")
+    attributes_TEL(element, found, is_safe)
+    for child in element.iterchildren(*_TEL_TAGS):
+        tag = child.tag
+        _TEL_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_TEL(element, found, is_safe):
+    visit_TEL(element, found, True)
+
+
+
+def _TEL__useablePeriod(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = 'SXPR_TS'
+    VISITORS[child_type](child, found, is_safe)
+
+
+_AD_COLLECTED = frozenset(['use'])
+_AD_SENSITIVE = frozenset([])
+
+
+def attributes_AD(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AD_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AD_SENSITIVE:
+            found.add_sensitive_element(element, "AD")
+
+
+def visit_AD(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AD")
+    attributes_AD(element, found, is_safe)
+    for child in element.iterchildren(*_AD_TAGS):
+        tag = child.tag
+        _AD_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AD(element, found, is_safe):
+    visit_AD(element, found, True)
+
+
+
+def _AD__useablePeriod(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = 'SXPR_TS'
+    VISITORS[child_type](child, found, is_safe)
+
+
+_IVL_PQ_COLLECTED = frozenset(['nullFlavor', 'operator', 'unit'])
+_IVL_PQ_SENSITIVE = frozenset([])
+
+
+def attributes_IVL_PQ(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVL_PQ_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVL_PQ_SENSITIVE:
+            found.add_sensitive_element(element, "IVL_PQ")
+
+
+def visit_IVL_PQ(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVL_PQ")
+    attributes_IVL_PQ(element, found, is_safe)
+    for child in element.iterchildren(*_IVL_PQ_TAGS):
+        tag = child.tag
+        _IVL_PQ_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IVL_PQ(element, found, is_safe):
+    visit_IVL_PQ(element, found, True)
+
+
+
+_Participant2_COLLECTED = frozenset(['contextControlCode', 'nullFlavor', 'typeCode'])
+_Participant2_SENSITIVE = frozenset([])
+
+
+def attributes_Participant2(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Participant2_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Participant2_SENSITIVE:
+            found.add_sensitive_element(element, "Participant2")
+
+
+def visit_Participant2(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Participant2")
+    attributes_Participant2(element, found, is_safe)
+    for child in element.iterchildren(*_Participant2_TAGS):
+        tag = child.tag
+        _Participant2_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Participant2(element, found, is_safe):
+    visit_Participant2(element, found, True)
+
+
+
+_ExternalProcedure_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ExternalProcedure_SENSITIVE = frozenset([])
+
+
+def attributes_ExternalProcedure(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ExternalProcedure_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ExternalProcedure_SENSITIVE:
+            found.add_sensitive_element(element, "ExternalProcedure")
+
+
+def visit_ExternalProcedure(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ExternalProcedure")
+    attributes_ExternalProcedure(element, found, is_safe)
+    for child in element.iterchildren(*_ExternalProcedure_TAGS):
+        tag = child.tag
+        _ExternalProcedure_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ExternalProcedure(element, found, is_safe):
+    visit_ExternalProcedure(element, found, True)
+
+
+
+_Person_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_Person_SENSITIVE = frozenset([])
+
+
+def attributes_Person(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Person_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Person_SENSITIVE:
+            found.add_sensitive_element(element, "Person")
+
+
+def visit_Person(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Person")
+    attributes_Person(element, found, is_safe)
+    for child in element.iterchildren(*_Person_TAGS):
+        tag = child.tag
+        _Person_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Person(element, found, is_safe):
+    visit_Person(element, found, True)
+
+
+
+_RelatedSubject_COLLECTED = frozenset(['classCode'])
+_RelatedSubject_SENSITIVE = frozenset([])
+
+
+def attributes_RelatedSubject(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _RelatedSubject_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _RelatedSubject_SENSITIVE:
+            found.add_sensitive_element(element, "RelatedSubject")
+
+
+def visit_RelatedSubject(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "RelatedSubject")
+    attributes_RelatedSubject(element, found, is_safe)
+    for child in element.iterchildren(*_RelatedSubject_TAGS):
+        tag = child.tag
+        _RelatedSubject_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_RelatedSubject(element, found, is_safe):
+    visit_RelatedSubject(element, found, True)
+
+
+
+_MaintainedEntity_COLLECTED = frozenset(['classCode'])
+_MaintainedEntity_SENSITIVE = frozenset([])
+
+
+def attributes_MaintainedEntity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _MaintainedEntity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _MaintainedEntity_SENSITIVE:
+            found.add_sensitive_element(element, "MaintainedEntity")
+
+
+def visit_MaintainedEntity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "MaintainedEntity")
+    attributes_MaintainedEntity(element, found, is_safe)
+    for child in element.iterchildren(*_MaintainedEntity_TAGS):
+        tag = child.tag
+        _MaintainedEntity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_MaintainedEntity(element, found, is_safe):
+    visit_MaintainedEntity(element, found, True)
+
+
+
+_PIVL_TS_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_PIVL_TS_SENSITIVE = frozenset(['alignment'])
+
+
+def attributes_PIVL_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _PIVL_TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _PIVL_TS_SENSITIVE:
+            found.add_sensitive_element(element, "PIVL_TS")
+
+
+def visit_PIVL_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "PIVL_TS")
+    attributes_PIVL_TS(element, found, is_safe)
+    for child in element.iterchildren(*_PIVL_TS_TAGS):
+        tag = child.tag
+        _PIVL_TS_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_PIVL_TS(element, found, is_safe):
+    visit_PIVL_TS(element, found, True)
+
+
+
+_ExternalDocument_COLLECTED = frozenset(['classCode', 'moodCode'])
+_ExternalDocument_SENSITIVE = frozenset([])
+
+
+def attributes_ExternalDocument(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ExternalDocument_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ExternalDocument_SENSITIVE:
+            found.add_sensitive_element(element, "ExternalDocument")
+
+
+def visit_ExternalDocument(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ExternalDocument")
+    attributes_ExternalDocument(element, found, is_safe)
+    for child in element.iterchildren(*_ExternalDocument_TAGS):
+        tag = child.tag
+        _ExternalDocument_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ExternalDocument(element, found, is_safe):
+    visit_ExternalDocument(element, found, True)
+
+
+
+_Device_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_Device_SENSITIVE = frozenset([])
+
+
+def attributes_Device(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Device_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Device_SENSITIVE:
+            found.add_sensitive_element(element, "Device")
+
+
+def visit_Device(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Device")
+    attributes_Device(element, found, is_safe)
+    for child in element.iterchildren(*_Device_TAGS):
+        tag = child.tag
+        _Device_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Device(element, found, is_safe):
+    visit_Device(element, found, True)
+
+
+
+_Consent_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Consent_SENSITIVE = frozenset([])
+
+
+def attributes_Consent(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Consent_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Consent_SENSITIVE:
+            found.add_sensitive_element(element, "Consent")
+
+
+def visit_Consent(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Consent")
+    attributes_Consent(element, found, is_safe)
+    for child in element.iterchildren(*_Consent_TAGS):
+        tag = child.tag
+        _Consent_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Consent(element, found, is_safe):
+    visit_Consent(element, found, True)
+
+
+
+_ED_COLLECTED = frozenset(['charset', 'language', 'mediaType', 'nullFlavor', 'representation'])
+_ED_SENSITIVE = frozenset(['compression', 'integrityCheck', 'integrityCheckAlgorithm'])
+
+
+def attributes_ED(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ED_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ED_SENSITIVE:
+            found.add_sensitive_element(element, "ED")
+
+
+def visit_ED(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ED")
+    attributes_ED(element, found, is_safe)
+    for child in element.iterchildren(*_ED_TAGS):
+        tag = child.tag
+        _ED_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_ED(element, found, is_safe):
+    visit_ED(element, found, True)
+
+
+
+_IVL_INT_COLLECTED = frozenset(['nullFlavor', 'operator'])
+_IVL_INT_SENSITIVE = frozenset(['value'])
+
+
+def attributes_IVL_INT(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _IVL_INT_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _IVL_INT_SENSITIVE:
+            found.add_sensitive_element(element, "IVL_INT")
+
+
+def visit_IVL_INT(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "IVL_INT")
+    attributes_IVL_INT(element, found, is_safe)
+    for child in element.iterchildren(*_IVL_INT_TAGS):
+        tag = child.tag
+        _IVL_INT_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_IVL_INT(element, found, is_safe):
+    visit_IVL_INT(element, found, True)
+
+
+
+_AuthoringDevice_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_AuthoringDevice_SENSITIVE = frozenset([])
+
+
+def attributes_AuthoringDevice(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AuthoringDevice_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AuthoringDevice_SENSITIVE:
+            found.add_sensitive_element(element, "AuthoringDevice")
+
+
+def visit_AuthoringDevice(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AuthoringDevice")
+    attributes_AuthoringDevice(element, found, is_safe)
+    for child in element.iterchildren(*_AuthoringDevice_TAGS):
+        tag = child.tag
+        _AuthoringDevice_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AuthoringDevice(element, found, is_safe):
+    visit_AuthoringDevice(element, found, True)
+
+
+
+_ST_COLLECTED = frozenset(['language', 'mediaType', 'nullFlavor', 'representation'])
+_ST_SENSITIVE = frozenset([])
+
+
+def attributes_ST(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _ST_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _ST_SENSITIVE:
+            found.add_sensitive_element(element, "ST")
+
+
+def visit_ST(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "ST")
+    attributes_ST(element, found, is_safe)
+
+
+def safe_visit_ST(element, found, is_safe):
+    visit_ST(element, found, True)
+
+
+
+_TS_COLLECTED = frozenset(['nullFlavor'])
+_TS_SENSITIVE = frozenset(['value'])
+
+
+def attributes_TS(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _TS_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _TS_SENSITIVE:
+            found.add_sensitive_element(element, "TS")
+
+
+def visit_TS(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "TS")
+    attributes_TS(element, found, is_safe)
+
+
+def safe_visit_TS(element, found, is_safe):
+    visit_TS(element, found, True)
+
+
+
+_CE_COLLECTED = frozenset(['codeSystem', 'codeSystemName', 'codeSystemVersion', 'displayName', 'nullFlavor', 'valueSet', 'valueSetVersion'])
+_CE_SENSITIVE = frozenset(['code'])
+
+
+def attributes_CE(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CE_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CE_SENSITIVE:
+            found.add_sensitive_element(element, "CE")
+
+
+def visit_CE(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CE")
+    attributes_CE(element, found, is_safe)
+    for child in element.iterchildren(*_CE_TAGS):
+        tag = child.tag
+        _CE_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CE(element, found, is_safe):
+    visit_CE(element, found, True)
+
+
+
+_QTY_COLLECTED = frozenset(['nullFlavor'])
+_QTY_SENSITIVE = frozenset([])
+
+
+def attributes_QTY(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _QTY_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _QTY_SENSITIVE:
+            found.add_sensitive_element(element, "QTY")
+
+
+def visit_QTY(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        found.add_safe_text(text)
+    attributes_QTY(element, found, is_safe)
+
+
+def safe_visit_QTY(element, found, is_safe):
+    visit_QTY(element, found, True)
+
+
+
+_Observation_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Observation_SENSITIVE = frozenset([])
+
+
+def attributes_Observation(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Observation_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Observation_SENSITIVE:
+            found.add_sensitive_element(element, "Observation")
+
+
+def visit_Observation(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Observation")
+    attributes_Observation(element, found, is_safe)
+    for child in element.iterchildren(*_Observation_TAGS):
+        tag = child.tag
+        _Observation_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Observation(element, found, is_safe):
+    visit_Observation(element, found, True)
+
+
+
+def _Observation__value(child, found, is_safe):
+    child_type = child.get(_XSI_TYPE)
+    if child_type is None:
+        child_type = None
+    VISITORS[child_type](child, found, is_safe)
+
+
+def _Observation__referenceRange(child, found, is_safe):
+    attributes_InfrastructureRoot(child, found, is_safe)
+    for subelement in child.iterchildren('{*}realmCode', '{*}typeId', '{*}templateId', '{*}observationRange'):
+        subelement_tag = subelement.tag
+        subelement_tag = subelement_tag[subelement_tag.rfind("}") + 1:]
+        if subelement_tag == 'realmCode':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'typeId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'templateId':
+            visit_InfrastructureRoot(subelement, found, True)
+        elif subelement_tag == 'observationRange':
+            visit_ObservationRange(subelement, found, False)
+    visit_InfrastructureRoot(child, found, is_safe)
+
+
+_AssignedEntity_COLLECTED = frozenset(['classCode'])
+_AssignedEntity_SENSITIVE = frozenset([])
+
+
+def attributes_AssignedEntity(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _AssignedEntity_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _AssignedEntity_SENSITIVE:
+            found.add_sensitive_element(element, "AssignedEntity")
+
+
+def visit_AssignedEntity(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "AssignedEntity")
+    attributes_AssignedEntity(element, found, is_safe)
+    for child in element.iterchildren(*_AssignedEntity_TAGS):
+        tag = child.tag
+        _AssignedEntity_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_AssignedEntity(element, found, is_safe):
+    visit_AssignedEntity(element, found, True)
+
+
+
+_Procedure_COLLECTED = frozenset(['classCode', 'moodCode'])
+_Procedure_SENSITIVE = frozenset([])
+
+
+def attributes_Procedure(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Procedure_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Procedure_SENSITIVE:
+            found.add_sensitive_element(element, "Procedure")
+
+
+def visit_Procedure(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Procedure")
+    attributes_Procedure(element, found, is_safe)
+    for child in element.iterchildren(*_Procedure_TAGS):
+        tag = child.tag
+        _Procedure_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Procedure(element, found, is_safe):
+    visit_Procedure(element, found, True)
+
+
+
+_Authenticator_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_Authenticator_SENSITIVE = frozenset([])
+
+
+def attributes_Authenticator(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _Authenticator_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _Authenticator_SENSITIVE:
+            found.add_sensitive_element(element, "Authenticator")
+
+
+def visit_Authenticator(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "Authenticator")
+    attributes_Authenticator(element, found, is_safe)
+    for child in element.iterchildren(*_Authenticator_TAGS):
+        tag = child.tag
+        _Authenticator_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_Authenticator(element, found, is_safe):
+    visit_Authenticator(element, found, True)
+
+
+
+_EntryRelationship_COLLECTED = frozenset(['nullFlavor', 'typeCode'])
+_EntryRelationship_SENSITIVE = frozenset([])
+
+
+def attributes_EntryRelationship(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _EntryRelationship_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _EntryRelationship_SENSITIVE:
+            found.add_sensitive_element(element, "EntryRelationship")
+
+
+def visit_EntryRelationship(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "EntryRelationship")
+    attributes_EntryRelationship(element, found, is_safe)
+    for child in element.iterchildren(*_EntryRelationship_TAGS):
+        tag = child.tag
+        _EntryRelationship_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_EntryRelationship(element, found, is_safe):
+    visit_EntryRelationship(element, found, True)
+
+
+
+_CustodianOrganization_COLLECTED = frozenset(['classCode', 'determinerCode'])
+_CustodianOrganization_SENSITIVE = frozenset([])
+
+
+def attributes_CustodianOrganization(element, found, is_safe):
+    for name, value in element.items():
+        name = name[name.rfind("}") + 1:]
+        if name in _CustodianOrganization_COLLECTED:
+            found.add_safe_text(value)
+        elif not is_safe and name in _CustodianOrganization_SENSITIVE:
+            found.add_sensitive_element(element, "CustodianOrganization")
+
+
+def visit_CustodianOrganization(element, found, is_safe):
+    text = element.text
+    if text is not None and text.strip() != "":
+        if not is_safe:
+            found.add_sensitive_element(element, "CustodianOrganization")
+    attributes_CustodianOrganization(element, found, is_safe)
+    for child in element.iterchildren(*_CustodianOrganization_TAGS):
+        tag = child.tag
+        _CustodianOrganization_CHILDREN[tag[tag.rfind("}") + 1:]](child, found, is_safe)
+
+
+def safe_visit_CustodianOrganization(element, found, is_safe):
+    visit_CustodianOrganization(element, found, True)
+
+
+
+def visit_code(element, found, is_safe):
+    raise KeyError('code')
+
+
+def safe_visit_code(element, found, is_safe):
+    raise KeyError('code')
+
+
+def visit_decimal(element, found, is_safe):
+    raise KeyError('decimal')
+
+
+def safe_visit_decimal(element, found, is_safe):
+    raise KeyError('decimal')
+
+
+_OrganizerComponent_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}sequenceNumber', '{*}priorityNumber', '{*}seperatableInd', '{*}act', '{*}encounter', '{*}observation', '{*}observationMedia', '{*}organizer', '{*}procedure', '{*}regionOfInterest', '{*}substanceAdministration', '{*}supply')
+_OrganizerComponent_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'sequenceNumber': safe_visit_INT,
+    'priorityNumber': safe_visit_INT,
+    'seperatableInd': safe_visit_BL,
+    'act': visit_Act,
+    'encounter': visit_Encounter,
+    'observation': visit_Observation,
+    'observationMedia': visit_ObservationMedia,
+    'organizer': visit_Organizer,
+    'procedure': visit_Procedure,
+    'regionOfInterest': visit_RegionOfInterest,
+    'substanceAdministration': visit_SubstanceAdministration,
+    'supply': visit_Supply,
+}
+_Informant_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}assignedEntity', '{*}relatedEntity')
+_Informant_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'assignedEntity': visit_AssignedEntity,
+    'relatedEntity': visit_RelatedEntity,
+}
+_OrganizationPartOf_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}statusCode', '{*}effectiveTime', '{*}wholeOrganization')
+_OrganizationPartOf_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': safe_visit_CE,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'wholeOrganization': visit_Organization,
+}
+_PlayingEntity_TAGS = ('{*}templateId', '{*}code', '{*}quantity', '{*}name', '{*}birthTime', '{*}desc')
+_PlayingEntity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': safe_visit_CE,
+    'quantity': safe_visit_PQ,
+    'name': visit_PN,
+    'birthTime': visit_TS,
+    'desc': visit_ED,
+}
+_PQ_TAGS = ('{*}translation',)
+_PQ_CHILDREN = {
+    'translation': visit_PQR,
+}
+_AssociatedEntity_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}addr', '{*}telecom', '{*}associatedPerson', '{*}scopingOrganization')
+_AssociatedEntity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': safe_visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'associatedPerson': visit_Person,
+    'scopingOrganization': visit_Organization,
+}
+_NonXMLBody_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}text', '{*}confidentialityCode', '{*}languageCode')
+_NonXMLBody_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'text': visit_ED,
+    'confidentialityCode': safe_visit_CE,
+    'languageCode': safe_visit_CS,
+}
+_InFulfillmentOf_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}order')
+_InFulfillmentOf_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'order': visit_Order,
+}
+_ParticipantRole_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}addr', '{*}telecom', '{*}playingDevice', '{*}playingEntity', '{*}scopingEntity')
+_ParticipantRole_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'playingDevice': visit_Device,
+    'playingEntity': visit_PlayingEntity,
+    'scopingEntity': visit_Entity,
+}
+_Organizer_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}statusCode', '{*}effectiveTime', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}reference', '{*}precondition', '{*}component')
+_Organizer_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': safe_visit_CD,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+    'component': visit_OrganizerComponent,
+}
+_EIVL_TS_TAGS = ('{*}event', '{*}offset')
+_EIVL_TS_CHILDREN = {
+    'event': safe_visit_CE,
+    'offset': visit_IVL_PQ,
+}
+_Encounter_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}dischargeDispositionCode', '{*}priorityCode', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_Encounter_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': safe_visit_II,
+    'code': safe_visit_CD,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'dischargeDispositionCode': safe_visit_CE,
+    'priorityCode': safe_visit_CE,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_IVL_TS_TAGS = ('{*}low', '{*}center', '{*}width', '{*}high')
+_IVL_TS_CHILDREN = {
+    'low': visit_IVXB_TS,
+    'center': visit_TS,
+    'width': visit_PQ,
+    'high': visit_IVXB_TS,
+}
+_RelatedEntity_TAGS = ('{*}templateId', '{*}code', '{*}addr', '{*}telecom', '{*}effectiveTime', '{*}relatedPerson')
+_RelatedEntity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': safe_visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'effectiveTime': visit_IVL_TS,
+    'relatedPerson': visit_Person,
+}
+_Participant1_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}functionCode', '{*}time', '{*}associatedEntity')
+_Participant1_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'functionCode': safe_visit_CE,
+    'time': visit_IVL_TS,
+    'associatedEntity': visit_AssociatedEntity,
+}
+_IntendedRecipient_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}addr', '{*}telecom', '{*}informationRecipient', '{*}receivedOrganization')
+_IntendedRecipient_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'informationRecipient': visit_Person,
+    'receivedOrganization': visit_Organization,
+}
+_PatientRole_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}addr', '{*}telecom', '{*}patient', '{*}providerOrganization')
+_PatientRole_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'patient': visit_Patient,
+    'providerOrganization': visit_Organization,
+}
+_CR_TAGS = ('{*}name', '{*}value')
+_CR_CHILDREN = {
+    'name': visit_CV,
+    'value': visit_CD,
+}
+_Section_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}title', '{*}text', '{*}confidentialityCode', '{*}languageCode', '{*}subject', '{*}author', '{*}informant', '{*}entry', '{*}component')
+_Section_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'title': safe_visit_ST,
+    'text': visit_xhtml,
+    'confidentialityCode': safe_visit_CE,
+    'languageCode': safe_visit_CS,
+    'subject': visit_Subject,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'entry': visit_Entry,
+    'component': _Section__component,
+}
+_Place_TAGS = ('{*}templateId', '{*}name', '{*}addr')
+_Place_CHILDREN = {
+    'templateId': safe_visit_II,
+    'name': visit_EN,
+    'addr': visit_AD,
+}
+_Performer1_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}functionCode', '{*}time', '{*}assignedEntity')
+_Performer1_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'functionCode': safe_visit_CE,
+    'time': visit_IVL_TS,
+    'assignedEntity': visit_AssignedEntity,
+}
+_Author_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}functionCode', '{*}time', '{*}assignedAuthor')
+_Author_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'functionCode': visit_CE,
+    'time': visit_TS,
+    'assignedAuthor': visit_AssignedAuthor,
+}
+_Act_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}priorityCode', '{*}languageCode', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_Act_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'priorityCode': visit_CE,
+    'languageCode': safe_visit_CS,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_HealthCareFacility_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}location', '{*}serviceProviderOrganization')
+_HealthCareFacility_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': visit_CE,
+    'location': visit_Place,
+    'serviceProviderOrganization': visit_Organization,
+}
+_Custodian_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}assignedCustodian')
+_Custodian_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'assignedCustodian': visit_AssignedCustodian,
+}
+_PN_TAGS = ('{*}delimiter', '{*}family', '{*}given', '{*}prefix', '{*}suffix', '{*}validTime')
+_PN_CHILDREN = {
+    'delimiter': safe_visit_ENXP,
+    'family': visit_ENXP,
+    'given': visit_ENXP,
+    'prefix': safe_visit_ENXP,
+    'suffix': safe_visit_ENXP,
+    'validTime': visit_IVL_TS,
+}
+_Birthplace_TAGS = ('{*}templateId', '{*}place')
+_Birthplace_CHILDREN = {
+    'templateId': safe_visit_II,
+    'place': visit_Place,
+}
+_Organization_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}name', '{*}telecom', '{*}addr', '{*}standardIndustryClassCode', '{*}asOrganizationPartOf')
+_Organization_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'name': visit_ON,
+    'telecom': visit_TEL,
+    'addr': visit_AD,
+    'standardIndustryClassCode': safe_visit_CE,
+    'asOrganizationPartOf': visit_OrganizationPartOf,
+}
+_MO_TAGS = ('{*}currency', '{*}value')
+_MO_CHILDREN = {
+    'currency': safe_visit_CS,
+    'value': safe_visit_decimal,
+}
+_LanguageCommunication_TAGS = ('{*}templateId', '{*}languageCode', '{*}modeCode', '{*}proficiencyLevelCode', '{*}preferenceInd')
+_LanguageCommunication_CHILDREN = {
+    'templateId': safe_visit_II,
+    'languageCode': safe_visit_CS,
+    'modeCode': safe_visit_CE,
+    'proficiencyLevelCode': safe_visit_CE,
+    'preferenceInd': safe_visit_BL,
+}
+_AssignedAuthor_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}addr', '{*}telecom', '{*}assignedPerson', '{*}assignedAuthoringDevice', '{*}representedOrganization')
+_AssignedAuthor_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'assignedPerson': visit_Person,
+    'assignedAuthoringDevice': visit_AuthoringDevice,
+    'representedOrganization': visit_Organization,
+}
+_ObservationMedia_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}languageCode', '{*}value', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_ObservationMedia_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'languageCode': safe_visit_CS,
+    'value': visit_ED,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_ComponentOf_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}encompassingEncounter')
+_ComponentOf_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'encompassingEncounter': visit_EncompassingEncounter,
+}
+_SpecimenRole_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}specimenPlayingEntity')
+_SpecimenRole_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'specimenPlayingEntity': visit_PlayingEntity,
+}
+_RelatedDocument_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}parentDocument')
+_RelatedDocument_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'parentDocument': visit_ParentDocument,
+}
+_IVXB_PQ_TAGS = ('{*}translation',)
+_IVXB_PQ_CHILDREN = {
+    'translation': visit_PQR,
+}
+_Order_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}priorityCode')
+_Order_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'priorityCode': visit_CE,
+}
+_LegalAuthenticator_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}time', '{*}signatureCode', '{*}signatureText', '{*}assignedEntity')
+_LegalAuthenticator_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'time': visit_TS,
+    'signatureCode': visit_CS,
+    'signatureText': visit_ED,
+    'assignedEntity': visit_AssignedEntity,
+}
+_LabeledDrug_TAGS = ('{*}templateId', '{*}code', '{*}name')
+_LabeledDrug_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CE,
+    'name': visit_EN,
+}
+_ON_TAGS = ('{*}delimiter', '{*}prefix', '{*}suffix', '{*}validTime')
+_ON_CHILDREN = {
+    'delimiter': safe_visit_ENXP,
+    'prefix': safe_visit_ENXP,
+    'suffix': safe_visit_ENXP,
+    'validTime': visit_IVL_TS,
+}
+_ParentDocument_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}text', '{*}setId', '{*}versionNumber')
+_ParentDocument_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'setId': safe_visit_II,
+    'versionNumber': safe_visit_INT,
+}
+_RecordTarget_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}patientRole')
+_RecordTarget_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'patientRole': visit_PatientRole,
+}
+_TN_TAGS = ('{*}validTime',)
+_TN_CHILDREN = {
+    'validTime': visit_IVL_TS,
+}
+_SubjectPerson_TAGS = ('{*}templateId', '{*}name', '{*}desc', '{*}administrativeGenderCode', '{*}birthTime', '{*}deceasedInd', '{*}deceasedTime')
+_SubjectPerson_CHILDREN = {
+    'templateId': safe_visit_II,
+    'name': visit_PN,
+    'desc': visit_ED,
+    'administrativeGenderCode': visit_CE,
+    'birthTime': visit_TS,
+    'deceasedInd': visit_BL,
+    'deceasedTime': visit_TS,
+}
+_StructuredBody_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}confidentialityCode', '{*}languageCode', '{*}component')
+_StructuredBody_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'confidentialityCode': safe_visit_CE,
+    'languageCode': safe_visit_CS,
+    'component': _StructuredBody__component,
+}
+_PQR_TAGS = ('{*}originalText',)
+_PQR_CHILDREN = {
+    'originalText': visit_ED,
+}
+_RegionOfInterest_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}value', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_RegionOfInterest_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CS,
+    'value': visit_INT,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_Patient_TAGS = ('{*}templateId', '{*}id', '{*}name', '{*}desc', '{*}administrativeGenderCode', '{*}birthTime', '{*}deceasedInd', '{*}deceasedTime', '{*}multipleBirthInd', '{*}multipleBirthOrderNumber', '{*}maritalStatusCode', '{*}religiousAffiliationCode', '{*}raceCode', '{*}ethnicGroupCode', '{*}guardian', '{*}birthplace', '{*}languageCommunication')
+_Patient_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'name': visit_PN,
+    'desc': visit_ED,
+    'administrativeGenderCode': visit_CE,
+    'birthTime': visit_TS,
+    'deceasedInd': visit_BL,
+    'deceasedTime': visit_TS,
+    'multipleBirthInd': visit_BL,
+    'multipleBirthOrderNumber': visit_INT_POS,
+    'maritalStatusCode': safe_visit_CE,
+    'religiousAffiliationCode': visit_CE,
+    'raceCode': visit_CE,
+    'ethnicGroupCode': visit_CE,
+    'guardian': visit_Guardian,
+    'birthplace': visit_Birthplace,
+    'languageCommunication': visit_LanguageCommunication,
+}
+_RTO_PQ_PQ_TAGS = ('{*}numerator', '{*}denominator')
+_RTO_PQ_PQ_CHILDREN = {
+    'numerator': visit_PQ,
+    'denominator': visit_PQ,
+}
+_AlternateIdentification_TAGS = ('{*}id', '{*}code', '{*}statusCode', '{*}effectiveTime')
+_AlternateIdentification_CHILDREN = {
+    'id': visit_II,
+    'code': visit_CD,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+}
+_ClinicalDocument_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}title', '{*}effectiveTime', '{*}confidentialityCode', '{*}languageCode', '{*}setId', '{*}versionNumber', '{*}copyTime', '{*}recordTarget', '{*}author', '{*}dataEnterer', '{*}informant', '{*}custodian', '{*}informationRecipient', '{*}legalAuthenticator', '{*}authenticator', '{*}participant', '{*}inFulfillmentOf', '{*}documentationOf', '{*}relatedDocument', '{*}authorization', '{*}componentOf', '{*}component')
+_ClinicalDocument_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': safe_visit_II,
+    'code': visit_CE,
+    'title': safe_visit_ST,
+    'effectiveTime': visit_TS,
+    'confidentialityCode': safe_visit_CE,
+    'languageCode': safe_visit_CS,
+    'setId': safe_visit_II,
+    'versionNumber': safe_visit_INT,
+    'copyTime': visit_TS,
+    'recordTarget': visit_RecordTarget,
+    'author': visit_Author,
+    'dataEnterer': visit_DataEnterer,
+    'informant': visit_Informant,
+    'custodian': visit_Custodian,
+    'informationRecipient': visit_InformationRecipient,
+    'legalAuthenticator': visit_LegalAuthenticator,
+    'authenticator': visit_Authenticator,
+    'participant': visit_Participant1,
+    'inFulfillmentOf': visit_InFulfillmentOf,
+    'documentationOf': visit_DocumentationOf,
+    'relatedDocument': visit_RelatedDocument,
+    'authorization': visit_Authorization,
+    'componentOf': visit_ComponentOf,
+    'component': visit_Component,
+}
+_Specimen_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}specimenRole')
+_Specimen_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'specimenRole': visit_SpecimenRole,
+}
+_Entry_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}act', '{*}encounter', '{*}observation', '{*}observationMedia', '{*}organizer', '{*}procedure', '{*}regionOfInterest', '{*}substanceAdministration', '{*}supply')
+_Entry_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'act': visit_Act,
+    'encounter': visit_Encounter,
+    'observation': visit_Observation,
+    'observationMedia': visit_ObservationMedia,
+    'organizer': visit_Organizer,
+    'procedure': visit_Procedure,
+    'regionOfInterest': visit_RegionOfInterest,
+    'substanceAdministration': visit_SubstanceAdministration,
+    'supply': visit_Supply,
+}
+_DocumentationOf_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}serviceEvent')
+_DocumentationOf_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'serviceEvent': visit_ServiceEvent,
+}
+_SubstanceAdministration_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}priorityCode', '{*}repeatNumber', '{*}routeCode', '{*}approachSiteCode', '{*}doseQuantity', '{*}rateQuantity', '{*}maxDoseQuantity', '{*}administrationUnitCode', '{*}consumable', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_SubstanceAdministration_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': _SubstanceAdministration__effectiveTime,
+    'priorityCode': visit_CE,
+    'repeatNumber': visit_IVL_INT,
+    'routeCode': visit_CE,
+    'approachSiteCode': visit_CD,
+    'doseQuantity': visit_IVL_PQ,
+    'rateQuantity': visit_IVL_PQ,
+    'maxDoseQuantity': visit_RTO_PQ_PQ,
+    'administrationUnitCode': visit_CE,
+    'consumable': _SubstanceAdministration__consumable,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_InfrastructureRoot_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId')
+_InfrastructureRoot_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+}
+_SXPR_TS_TAGS = ('{*}comp',)
+_SXPR_TS_CHILDREN = {
+    'comp': _SXPR_TS__comp,
+}
+_Criterion_TAGS = ('{*}templateId', '{*}code', '{*}text', '{*}value')
+_Criterion_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'value': _Criterion__value,
+}
+_ObservationRange_TAGS = ('{*}templateId', '{*}code', '{*}text', '{*}value', '{*}interpretationCode')
+_ObservationRange_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'value': _ObservationRange__value,
+    'interpretationCode': visit_CE,
+}
+_ManufacturedProduct_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}manufacturedLabeledDrug', '{*}manufacturedMaterial', '{*}manufacturerOrganization')
+_ManufacturedProduct_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'manufacturedLabeledDrug': visit_LabeledDrug,
+    'manufacturedMaterial': visit_Material,
+    'manufacturerOrganization': visit_Organization,
+}
+_Entity_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}desc')
+_Entity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'desc': visit_ED,
+}
+_EncompassingEncounter_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}effectiveTime', '{*}admissionReferralSourceCode', '{*}dischargeDispositionCode', '{*}responsibleParty', '{*}encounterParticipant', '{*}location')
+_EncompassingEncounter_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'effectiveTime': visit_IVL_TS,
+    'admissionReferralSourceCode': visit_CE,
+    'dischargeDispositionCode': visit_CE,
+    'responsibleParty': _EncompassingEncounter__responsibleParty,
+    'encounterParticipant': visit_EncounterParticipant,
+    'location': _EncompassingEncounter__location,
+}
+_Supply_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}priorityCode', '{*}repeatNumber', '{*}independentInd', '{*}quantity', '{*}expectedUseTime', '{*}product', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_Supply_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': _Supply__effectiveTime,
+    'priorityCode': visit_CE,
+    'repeatNumber': visit_IVL_INT,
+    'independentInd': visit_BL,
+    'quantity': visit_PQ,
+    'expectedUseTime': visit_IVL_TS,
+    'product': _Supply__product,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_EN_TAGS = ('{*}delimiter', '{*}family', '{*}given', '{*}prefix', '{*}suffix', '{*}validTime')
+_EN_CHILDREN = {
+    'delimiter': safe_visit_ENXP,
+    'family': visit_ENXP,
+    'given': visit_ENXP,
+    'prefix': safe_visit_ENXP,
+    'suffix': safe_visit_ENXP,
+    'validTime': visit_IVL_TS,
+}
+_CV_TAGS = ('{*}originalText',)
+_CV_CHILDREN = {
+    'originalText': visit_ED,
+}
+_ExternalAct_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}text')
+_ExternalAct_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+}
+_CO_TAGS = ('{*}originalText',)
+_CO_CHILDREN = {
+    'originalText': visit_ED,
+}
+_AssignedCustodian_TAGS = ('{*}templateId', '{*}representedCustodianOrganization')
+_AssignedCustodian_CHILDREN = {
+    'templateId': safe_visit_II,
+    'representedCustodianOrganization': visit_CustodianOrganization,
+}
+_InformationRecipient_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}intendedRecipient')
+_InformationRecipient_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'intendedRecipient': visit_IntendedRecipient,
+}
+_Subject_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}awarenessCode', '{*}relatedSubject')
+_Subject_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'awarenessCode': visit_CE,
+    'relatedSubject': visit_RelatedSubject,
+}
+_Material_TAGS = ('{*}templateId', '{*}code', '{*}name', '{*}lotNumberText')
+_Material_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CE,
+    'name': visit_EN,
+    'lotNumberText': visit_ST,
+}
+_Guardian_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}addr', '{*}telecom', '{*}guardianPerson', '{*}guardianOrganization')
+_Guardian_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'guardianPerson': visit_Person,
+    'guardianOrganization': visit_Organization,
+}
+_EncounterParticipant_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}time', '{*}assignedEntity')
+_EncounterParticipant_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'time': visit_IVL_TS,
+    'assignedEntity': visit_AssignedEntity,
+}
+_DataEnterer_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}time', '{*}assignedEntity')
+_DataEnterer_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'time': visit_TS,
+    'assignedEntity': visit_AssignedEntity,
+}
+_Authorization_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}consent')
+_Authorization_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'consent': visit_Consent,
+}
+_Precondition_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}criterion')
+_Precondition_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'criterion': visit_Criterion,
+}
+_Reference_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}seperatableInd', '{*}externalAct', '{*}externalObservation', '{*}externalProcedure', '{*}externalDocument')
+_Reference_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'seperatableInd': visit_BL,
+    'externalAct': visit_ExternalAct,
+    'externalObservation': visit_ExternalObservation,
+    'externalProcedure': visit_ExternalProcedure,
+    'externalDocument': visit_ExternalDocument,
+}
+_ServiceEvent_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}effectiveTime', '{*}performer')
+_ServiceEvent_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'effectiveTime': visit_IVL_TS,
+    'performer': visit_Performer1,
+}
+_Component_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}nonXMLBody', '{*}structuredBody')
+_Component_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'nonXMLBody': visit_NonXMLBody,
+    'structuredBody': visit_StructuredBody,
+}
+_IdentifiedBy_TAGS = ('{*}alternateIdentification',)
+_IdentifiedBy_CHILDREN = {
+    'alternateIdentification': visit_AlternateIdentification,
+}
+_ExternalObservation_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}text')
+_ExternalObservation_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+}
+_Performer2_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}functionCode', '{*}time', '{*}modeCode', '{*}assignedEntity')
+_Performer2_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'functionCode': visit_CE,
+    'time': visit_IVL_TS,
+    'modeCode': visit_CE,
+    'assignedEntity': visit_AssignedEntity,
+}
+_CD_TAGS = ('{*}originalText', '{*}qualifier', '{*}translation')
+_CD_CHILDREN = {
+    'originalText': visit_ED,
+    'qualifier': visit_CR,
+    'translation': visit_CD,
+}
+_TEL_TAGS = ('{*}useablePeriod',)
+_TEL_CHILDREN = {
+    'useablePeriod': _TEL__useablePeriod,
+}
+_AD_TAGS = ('{*}nullFlavor', '{*}delimiter', '{*}country', '{*}state', '{*}county', '{*}city', '{*}postalCode', '{*}streetAddressLine', '{*}houseNumber', '{*}houseNumberNumeric', '{*}direction', '{*}streetName', '{*}streetNameBase', '{*}streetNameType', '{*}additionalLocator', '{*}unitID', '{*}unitType', '{*}careOf', '{*}censusTract', '{*}deliveryAddressLine', '{*}deliveryInstallationType', '{*}deliveryInstallationArea', '{*}deliveryInstallationQualifier', '{*}deliveryMode', '{*}deliveryModeIdentifier', '{*}buildingNumberSuffix', '{*}postBox', '{*}precinct', '{*}useablePeriod')
+_AD_CHILDREN = {
+    'nullFlavor': safe_visit_code,
+    'delimiter': safe_visit_ADXP,
+    'country': visit_ADXP,
+    'state': visit_ADXP,
+    'county': visit_ADXP,
+    'city': visit_ADXP,
+    'postalCode': visit_ADXP,
+    'streetAddressLine': visit_ADXP,
+    'houseNumber': visit_ADXP,
+    'houseNumberNumeric': visit_ADXP,
+    'direction': visit_ADXP,
+    'streetName': visit_ADXP,
+    'streetNameBase': visit_ADXP,
+    'streetNameType': visit_ADXP,
+    'additionalLocator': visit_ADXP,
+    'unitID': visit_ADXP,
+    'unitType': visit_ADXP,
+    'careOf': visit_ADXP,
+    'censusTract': visit_ADXP,
+    'deliveryAddressLine': visit_ADXP,
+    'deliveryInstallationType': visit_ADXP,
+    'deliveryInstallationArea': visit_ADXP,
+    'deliveryInstallationQualifier': visit_ADXP,
+    'deliveryMode': visit_ADXP,
+    'deliveryModeIdentifier': visit_ADXP,
+    'buildingNumberSuffix': safe_visit_ADXP,
+    'postBox': visit_ADXP,
+    'precinct': visit_ADXP,
+    'useablePeriod': _AD__useablePeriod,
+}
+_IVL_PQ_TAGS = ('{*}low', '{*}center', '{*}width', '{*}high')
+_IVL_PQ_CHILDREN = {
+    'low': visit_IVXB_PQ,
+    'center': visit_PQ,
+    'width': visit_PQ,
+    'high': visit_IVXB_PQ,
+}
+_Participant2_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}functionCode', '{*}time', '{*}awarenessCode', '{*}participantRole')
+_Participant2_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'functionCode': visit_CE,
+    'time': visit_IVL_TS,
+    'awarenessCode': visit_CE,
+    'participantRole': visit_ParticipantRole,
+}
+_ExternalProcedure_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}text')
+_ExternalProcedure_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+}
+_Person_TAGS = ('{*}templateId', '{*}name', '{*}asPatientRelationship')
+_Person_CHILDREN = {
+    'templateId': safe_visit_II,
+    'name': visit_PN,
+    'asPatientRelationship': visit_CE,
+}
+_RelatedSubject_TAGS = ('{*}templateId', '{*}code', '{*}addr', '{*}telecom', '{*}subject')
+_RelatedSubject_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'subject': visit_SubjectPerson,
+}
+_MaintainedEntity_TAGS = ('{*}templateId', '{*}effectiveTime', '{*}maintainingPerson')
+_MaintainedEntity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'effectiveTime': visit_IVL_TS,
+    'maintainingPerson': visit_Person,
+}
+_PIVL_TS_TAGS = ('{*}phase', '{*}period')
+_PIVL_TS_CHILDREN = {
+    'phase': visit_IVL_TS,
+    'period': safe_visit_PQ,
+}
+_ExternalDocument_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}text', '{*}setId', '{*}versionNumber')
+_ExternalDocument_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CD,
+    'text': visit_ED,
+    'setId': safe_visit_II,
+    'versionNumber': safe_visit_INT,
+}
+_Device_TAGS = ('{*}templateId', '{*}code', '{*}manufacturerModelName', '{*}softwareName')
+_Device_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CE,
+    'manufacturerModelName': visit_SC,
+    'softwareName': visit_SC,
+}
+_Consent_TAGS = ('{*}templateId', '{*}id', '{*}code', '{*}statusCode')
+_Consent_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'code': visit_CE,
+    'statusCode': safe_visit_CS,
+}
+_ED_TAGS = ('{*}reference', '{*}thumbnail')
+_ED_CHILDREN = {
+    'reference': visit_TEL,
+    'thumbnail': visit_ED,
+}
+_IVL_INT_TAGS = ('{*}low', '{*}center', '{*}width', '{*}high')
+_IVL_INT_CHILDREN = {
+    'low': visit_IVXB_INT,
+    'center': visit_INT,
+    'width': visit_INT,
+    'high': visit_IVXB_INT,
+}
+_AuthoringDevice_TAGS = ('{*}templateId', '{*}code', '{*}manufacturerModelName', '{*}softwareName', '{*}asMaintainedEntity')
+_AuthoringDevice_CHILDREN = {
+    'templateId': safe_visit_II,
+    'code': visit_CE,
+    'manufacturerModelName': visit_SC,
+    'softwareName': visit_SC,
+    'asMaintainedEntity': visit_MaintainedEntity,
+}
+_CE_TAGS = ('{*}originalText', '{*}translation')
+_CE_CHILDREN = {
+    'originalText': visit_ED,
+    'translation': visit_CD,
+}
+_Observation_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}derivationExpr', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}priorityCode', '{*}repeatNumber', '{*}languageCode', '{*}value', '{*}interpretationCode', '{*}methodCode', '{*}targetSiteCode', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition', '{*}referenceRange')
+_Observation_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': safe_visit_II,
+    'code': safe_visit_CD,
+    'derivationExpr': safe_visit_ST,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'priorityCode': safe_visit_CE,
+    'repeatNumber': safe_visit_IVL_INT,
+    'languageCode': safe_visit_CS,
+    'value': _Observation__value,
+    'interpretationCode': safe_visit_CE,
+    'methodCode': safe_visit_CE,
+    'targetSiteCode': safe_visit_CD,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+    'referenceRange': _Observation__referenceRange,
+}
+_AssignedEntity_TAGS = ('{*}templateId', '{*}id', '{*}identifiedBy', '{*}code', '{*}addr', '{*}telecom', '{*}assignedPerson', '{*}representedOrganization')
+_AssignedEntity_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'identifiedBy': visit_IdentifiedBy,
+    'code': safe_visit_CE,
+    'addr': visit_AD,
+    'telecom': visit_TEL,
+    'assignedPerson': visit_Person,
+    'representedOrganization': visit_Organization,
+}
+_Procedure_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}id', '{*}code', '{*}text', '{*}statusCode', '{*}effectiveTime', '{*}priorityCode', '{*}languageCode', '{*}methodCode', '{*}approachSiteCode', '{*}targetSiteCode', '{*}subject', '{*}specimen', '{*}performer', '{*}author', '{*}informant', '{*}participant', '{*}entryRelationship', '{*}reference', '{*}precondition')
+_Procedure_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'id': safe_visit_II,
+    'code': safe_visit_CD,
+    'text': visit_ED,
+    'statusCode': safe_visit_CS,
+    'effectiveTime': visit_IVL_TS,
+    'priorityCode': safe_visit_CE,
+    'languageCode': safe_visit_CS,
+    'methodCode': visit_CE,
+    'approachSiteCode': safe_visit_CD,
+    'targetSiteCode': safe_visit_CD,
+    'subject': visit_Subject,
+    'specimen': visit_Specimen,
+    'performer': visit_Performer2,
+    'author': visit_Author,
+    'informant': visit_Informant,
+    'participant': visit_Participant2,
+    'entryRelationship': visit_EntryRelationship,
+    'reference': visit_Reference,
+    'precondition': visit_Precondition,
+}
+_Authenticator_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}time', '{*}signatureCode', '{*}signatureText', '{*}assignedEntity')
+_Authenticator_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'time': visit_TS,
+    'signatureCode': safe_visit_CS,
+    'signatureText': visit_ED,
+    'assignedEntity': visit_AssignedEntity,
+}
+_EntryRelationship_TAGS = ('{*}realmCode', '{*}typeId', '{*}templateId', '{*}sequenceNumber', '{*}seperatableInd', '{*}act', '{*}encounter', '{*}observation', '{*}observationMedia', '{*}organizer', '{*}procedure', '{*}regionOfInterest', '{*}substanceAdministration', '{*}supply')
+_EntryRelationship_CHILDREN = {
+    'realmCode': safe_visit_CS,
+    'typeId': safe_visit_II,
+    'templateId': safe_visit_II,
+    'sequenceNumber': safe_visit_INT,
+    'seperatableInd': safe_visit_BL,
+    'act': visit_Act,
+    'encounter': visit_Encounter,
+    'observation': visit_Observation,
+    'observationMedia': visit_ObservationMedia,
+    'organizer': visit_Organizer,
+    'procedure': visit_Procedure,
+    'regionOfInterest': visit_RegionOfInterest,
+    'substanceAdministration': visit_SubstanceAdministration,
+    'supply': visit_Supply,
+}
+_CustodianOrganization_TAGS = ('{*}templateId', '{*}id', '{*}name', '{*}telecom', '{*}addr')
+_CustodianOrganization_CHILDREN = {
+    'templateId': safe_visit_II,
+    'id': visit_II,
+    'name': visit_ON,
+    'telecom': visit_TEL,
+    'addr': visit_AD,
+}
+
+VISITORS = {
+    'OrganizerComponent': visit_OrganizerComponent,
+    'Informant': visit_Informant,
+    'INT_POS': visit_INT_POS,
+    'OrganizationPartOf': visit_OrganizationPartOf,
+    'PlayingEntity': visit_PlayingEntity,
+    'PQ': visit_PQ,
+    'AssociatedEntity': visit_AssociatedEntity,
+    'CS': visit_CS,
+    'NonXMLBody': visit_NonXMLBody,
+    'BL': visit_BL,
+    'InFulfillmentOf': visit_InFulfillmentOf,
+    'ParticipantRole': visit_ParticipantRole,
+    'Organizer': visit_Organizer,
+    'EIVL_TS': visit_EIVL_TS,
+    'Encounter': visit_Encounter,
+    'IVL_TS': visit_IVL_TS,
+    'RelatedEntity': visit_RelatedEntity,
+    'Participant1': visit_Participant1,
+    'IntendedRecipient': visit_IntendedRecipient,
+    'PatientRole': visit_PatientRole,
+    'SC': visit_SC,
+    'CR': visit_CR,
+    'Section': visit_Section,
+    'Place': visit_Place,
+    'II': visit_II,
+    'Performer1': visit_Performer1,
+    'Author': visit_Author,
+    'Act': visit_Act,
+    'HealthCareFacility': visit_HealthCareFacility,
+    'Custodian': visit_Custodian,
+    'PN': visit_PN,
+    'Birthplace': visit_Birthplace,
+    'Organization': visit_Organization,
+    'MO': visit_MO,
+    'LanguageCommunication': visit_LanguageCommunication,
+    'AssignedAuthor': visit_AssignedAuthor,
+    'ADXP': visit_ADXP,
+    'ObservationMedia': visit_ObservationMedia,
+    'ComponentOf': visit_ComponentOf,
+    'SpecimenRole': visit_SpecimenRole,
+    'RelatedDocument': visit_RelatedDocument,
+    'IVXB_PQ': visit_IVXB_PQ,
+    'Order': visit_Order,
+    'LegalAuthenticator': visit_LegalAuthenticator,
+    'LabeledDrug': visit_LabeledDrug,
+    'ON': visit_ON,
+    'ParentDocument': visit_ParentDocument,
+    'RecordTarget': visit_RecordTarget,
+    'TN': visit_TN,
+    'SubjectPerson': visit_SubjectPerson,
+    'StructuredBody': visit_StructuredBody,
+    'PQR': visit_PQR,
+    'RegionOfInterest': visit_RegionOfInterest,
+    'Patient': visit_Patient,
+    'RTO_PQ_PQ': visit_RTO_PQ_PQ,
+    'AlternateIdentification': visit_AlternateIdentification,
+    'ClinicalDocument': visit_ClinicalDocument,
+    'Specimen': visit_Specimen,
+    'INT': visit_INT,
+    'SXCM_TS': visit_SXCM_TS,
+    'Entry': visit_Entry,
+    'DocumentationOf': visit_DocumentationOf,
+    'SubstanceAdministration': visit_SubstanceAdministration,
+    'InfrastructureRoot': visit_InfrastructureRoot,
+    'SXPR_TS': visit_SXPR_TS,
+    'Criterion': visit_Criterion,
+    'ObservationRange': visit_ObservationRange,
+    'ManufacturedProduct': visit_ManufacturedProduct,
+    'Entity': visit_Entity,
+    'IVXB_TS': visit_IVXB_TS,
+    'EncompassingEncounter': visit_EncompassingEncounter,
+    'Supply': visit_Supply,
+    'EN': visit_EN,
+    'IVXB_INT': visit_IVXB_INT,
+    'CV': visit_CV,
+    'ExternalAct': visit_ExternalAct,
+    'CO': visit_CO,
+    'AssignedCustodian': visit_AssignedCustodian,
+    'InformationRecipient': visit_InformationRecipient,
+    'Subject': visit_Subject,
+    'Material': visit_Material,
+    'Guardian': visit_Guardian,
+    'EncounterParticipant': visit_EncounterParticipant,
+    'DataEnterer': visit_DataEnterer,
+    'ANY': visit_ANY,
+    'Authorization': visit_Authorization,
+    'Precondition': visit_Precondition,
+    'Reference': visit_Reference,
+    'ServiceEvent': visit_ServiceEvent,
+    'Component': visit_Component,
+    'IdentifiedBy': visit_IdentifiedBy,
+    'ExternalObservation': visit_ExternalObservation,
+    'ENXP': visit_ENXP,
+    'Performer2': visit_Performer2,
+    'CD': visit_CD,
+    'REAL': visit_REAL,
+    'TEL': visit_TEL,
+    'AD': visit_AD,
+    'IVL_PQ': visit_IVL_PQ,
+    'Participant2': visit_Participant2,
+    'ExternalProcedure': visit_ExternalProcedure,
+    'Person': visit_Person,
+    'RelatedSubject': visit_RelatedSubject,
+    'MaintainedEntity': visit_MaintainedEntity,
+    'PIVL_TS': visit_PIVL_TS,
+    'ExternalDocument': visit_ExternalDocument,
+    'Device': visit_Device,
+    'Consent': visit_Consent,
+    'ED': visit_ED,
+    'IVL_INT': visit_IVL_INT,
+    'AuthoringDevice': visit_AuthoringDevice,
+    'ST': visit_ST,
+    'TS': visit_TS,
+    'CE': visit_CE,
+    'QTY': visit_QTY,
+    'Observation': visit_Observation,
+    'AssignedEntity': visit_AssignedEntity,
+    'Procedure': visit_Procedure,
+    'Authenticator': visit_Authenticator,
+    'EntryRelationship': visit_EntryRelationship,
+    'CustodianOrganization': visit_CustodianOrganization,
+    "xhtml": visit_xhtml,
+}
+ATTRIBUTES = {
+    'OrganizerComponent': attributes_OrganizerComponent,
+    'Informant': attributes_Informant,
+    'INT_POS': attributes_INT_POS,
+    'OrganizationPartOf': attributes_OrganizationPartOf,
+    'PlayingEntity': attributes_PlayingEntity,
+    'PQ': attributes_PQ,
+    'AssociatedEntity': attributes_AssociatedEntity,
+    'CS': attributes_CS,
+    'NonXMLBody': attributes_NonXMLBody,
+    'BL': attributes_BL,
+    'InFulfillmentOf': attributes_InFulfillmentOf,
+    'ParticipantRole': attributes_ParticipantRole,
+    'Organizer': attributes_Organizer,
+    'EIVL_TS': attributes_EIVL_TS,
+    'Encounter': attributes_Encounter,
+    'IVL_TS': attributes_IVL_TS,
+    'RelatedEntity': attributes_RelatedEntity,
+    'Participant1': attributes_Participant1,
+    'IntendedRecipient': attributes_IntendedRecipient,
+    'PatientRole': attributes_PatientRole,
+    'SC': attributes_SC,
+    'CR': attributes_CR,
+    'Section': attributes_Section,
+    'Place': attributes_Place,
+    'II': attributes_II,
+    'Performer1': attributes_Performer1,
+    'Author': attributes_Author,
+    'Act': attributes_Act,
+    'HealthCareFacility': attributes_HealthCareFacility,
+    'Custodian': attributes_Custodian,
+    'PN': attributes_PN,
+    'Birthplace': attributes_Birthplace,
+    'Organization': attributes_Organization,
+    'MO': attributes_MO,
+    'LanguageCommunication': attributes_LanguageCommunication,
+    'AssignedAuthor': attributes_AssignedAuthor,
+    'ADXP': attributes_ADXP,
+    'ObservationMedia': attributes_ObservationMedia,
+    'ComponentOf': attributes_ComponentOf,
+    'SpecimenRole': attributes_SpecimenRole,
+    'RelatedDocument': attributes_RelatedDocument,
+    'IVXB_PQ': attributes_IVXB_PQ,
+    'Order': attributes_Order,
+    'LegalAuthenticator': attributes_LegalAuthenticator,
+    'LabeledDrug': attributes_LabeledDrug,
+    'ON': attributes_ON,
+    'ParentDocument': attributes_ParentDocument,
+    'RecordTarget': attributes_RecordTarget,
+    'TN': attributes_TN,
+    'SubjectPerson': attributes_SubjectPerson,
+    'StructuredBody': attributes_StructuredBody,
+    'PQR': attributes_PQR,
+    'RegionOfInterest': attributes_RegionOfInterest,
+    'Patient': attributes_Patient,
+    'RTO_PQ_PQ': attributes_RTO_PQ_PQ,
+    'AlternateIdentification': attributes_AlternateIdentification,
+    'ClinicalDocument': attributes_ClinicalDocument,
+    'Specimen': attributes_Specimen,
+    'INT': attributes_INT,
+    'SXCM_TS': attributes_SXCM_TS,
+    'Entry': attributes_Entry,
+    'DocumentationOf': attributes_DocumentationOf,
+    'SubstanceAdministration': attributes_SubstanceAdministration,
+    'InfrastructureRoot': attributes_InfrastructureRoot,
+    'SXPR_TS': attributes_SXPR_TS,
+    'Criterion': attributes_Criterion,
+    'ObservationRange': attributes_ObservationRange,
+    'ManufacturedProduct': attributes_ManufacturedProduct,
+    'Entity': attributes_Entity,
+    'IVXB_TS': attributes_IVXB_TS,
+    'EncompassingEncounter': attributes_EncompassingEncounter,
+    'Supply': attributes_Supply,
+    'EN': attributes_EN,
+    'IVXB_INT': attributes_IVXB_INT,
+    'CV': attributes_CV,
+    'ExternalAct': attributes_ExternalAct,
+    'CO': attributes_CO,
+    'AssignedCustodian': attributes_AssignedCustodian,
+    'InformationRecipient': attributes_InformationRecipient,
+    'Subject': attributes_Subject,
+    'Material': attributes_Material,
+    'Guardian': attributes_Guardian,
+    'EncounterParticipant': attributes_EncounterParticipant,
+    'DataEnterer': attributes_DataEnterer,
+    'ANY': attributes_ANY,
+    'Authorization': attributes_Authorization,
+    'Precondition': attributes_Precondition,
+    'Reference': attributes_Reference,
+    'ServiceEvent': attributes_ServiceEvent,
+    'Component': attributes_Component,
+    'IdentifiedBy': attributes_IdentifiedBy,
+    'ExternalObservation': attributes_ExternalObservation,
+    'ENXP': attributes_ENXP,
+    'Performer2': attributes_Performer2,
+    'CD': attributes_CD,
+    'REAL': attributes_REAL,
+    'TEL': attributes_TEL,
+    'AD': attributes_AD,
+    'IVL_PQ': attributes_IVL_PQ,
+    'Participant2': attributes_Participant2,
+    'ExternalProcedure': attributes_ExternalProcedure,
+    'Person': attributes_Person,
+    'RelatedSubject': attributes_RelatedSubject,
+    'MaintainedEntity': attributes_MaintainedEntity,
+    'PIVL_TS': attributes_PIVL_TS,
+    'ExternalDocument': attributes_ExternalDocument,
+    'Device': attributes_Device,
+    'Consent': attributes_Consent,
+    'ED': attributes_ED,
+    'IVL_INT': attributes_IVL_INT,
+    'AuthoringDevice': attributes_AuthoringDevice,
+    'ST': attributes_ST,
+    'TS': attributes_TS,
+    'CE': attributes_CE,
+    'QTY': attributes_QTY,
+    'Observation': attributes_Observation,
+    'AssignedEntity': attributes_AssignedEntity,
+    'Procedure': attributes_Procedure,
+    'Authenticator': attributes_Authenticator,
+    'EntryRelationship': attributes_EntryRelationship,
+    'CustodianOrganization': attributes_CustodianOrganization,
+}
@@ -0,0 +1,210 @@
+"""Handlers that anonymize sensitive elements, looked up by CDA type and tag.
+
+Every sensitive element found by the `Parser` is anonymized by the handler registered for its CDA
+type and tag, or else for its CDA type, or else by the default handler. The handler an element
+resolves to is cached, so anonymizing an element costs one dictionary lookup to find its handler.
+
+Handlers for custom types can be added without changing how documents are anonymized:
+
+    @default_handlers.register("MY_TYPE")
+    def anonymize_my_type(context, element, match):
+        match.text = context.anonymizer.remove_unknown_text(match.text)
+        return "MY_TYPE"
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from lxml.etree import _Element
+
+from eicr_anonymization.anonymizer import Anonymizer
+from eicr_anonymization.element_parser import Element
+
+HL7_NAMESPACE_PREFIX = "{urn:hl7-org:v3}"
+
+
+@dataclass(frozen=True)
+class HandlerContext:
+    """What handlers need to anonymize the elements of one document."""
+
+    anonymizer: Anonymizer
+    # Safe text found in the document, as collected by the parser
+    safe_text: set[str]
+    # Safe words of the anonymizer and of the document, normalized
+    document_safe_words: set[str]
+
+
+# A handler anonymizes the element in the document (`match`) that the parser found as `element`.
+# It returns the CDA type to record the replacement under in the audit log, or None if nothing
+# should be recorded.
+type Handler = Callable[[HandlerContext, Element, _Element], str | None]
+
+
+class HandlerRegistry:
+    """Handlers by CDA type and tag, with a default handler for everything else."""
+
+    def __init__(self, default: Handler):
+        """Initialize a registry with only a default handler.
+
+        Args:
+            default: Handler of elements without a more specific handler
+        """
+        self.default = default
+        self._handlers: dict[tuple[str, str | None], Handler] = {}
+        self._resolved: dict[tuple[str, str], Handler] = {}
+
+    def register(self, cda_type: str, tag: str | None = None) -> Callable[[Handler], Handler]:
+        """Register a handler for a CDA type, or only for elements of the type with a given tag.
+
+        Args:
+            cda_type: CDA type handled, like `ADXP`
+            tag: Tag handled, like `city`. Tags without a namespace are in the HL7 namespace.
+
+        Returns:
+            A decorator registering the handler, which returns it unchanged
+
+        """
+
+        def decorator(handler: Handler) -> Handler:
+            self._handlers[(cda_type, tag)] = handler
+            self._resolved.clear()
+            return handler
+
+        return decorator
+
+    def copy(self) -> "HandlerRegistry":
+        """Copy the registry, to register other handlers without changing this one."""
+        registry = HandlerRegistry(self.default)
+        registry._handlers.update(self._handlers)
+        return registry
+
+    def resolve(self, cda_type: str, name: str) -> Handler:
+        """Get the handler of an element.
+
+        Args:
+            cda_type: CDA type of the element
+            name: Tag of the element, with its namespace
+
+        Returns:
+            The handler of the CDA type and tag, otherwise of the CDA type, otherwise the default
+
+        """
+        key = (cda_type, name)
+        handler = self._resolved.get(key)
+        if handler is None:
+            tag = name.removeprefix(HL7_NAMESPACE_PREFIX)
+            handler = (
+                self._handlers.get((cda_type, tag))
+                or self._handlers.get((cda_type, None))
+                or self.default
+            )
+            self._resolved[key] = handler
+        return handler
+
+
+def anonymize_unknown(context: HandlerContext, element: Element, match: _Element) -> str | None:
+    """Remove the value and text of elements of types without a handler, unless they are safe."""
+    changed = False
+    if element.attributes.get("value") is not None:
+        match.attrib["value"] = context.anonymizer.remove_unknown_text(
+            match.attrib["value"], context.document_safe_words
+        )
+        changed = True
+    if element.text is not None and element.text.strip() != "":
+        match.text = context.anonymizer.remove_unknown_text(match.text, context.document_safe_words)
+        changed = True
+    return element.cda_type if changed else None
+
+
+default_handlers = HandlerRegistry(anonymize_unknown)
+
+
+def _register_pool(cda_type: str, tag: str, data_type: str) -> None:
+    def replace_from_pool(context: HandlerContext, element: Element, match: _Element) -> str:
+        match.text = context.anonymizer.replace_from_pool(element.text, data_type)
+        return cda_type
+
+    default_handlers.register(cda_type, tag)(replace_from_pool)
+
+
+for _tag in ("city", "country", "county", "state"):
+    _register_pool("ADXP", _tag, _tag)
+for _tag in ("given", "family"):
+    _register_pool("ENXP", _tag, _tag)
+
+
+@default_handlers.register("TS")
+@default_handlers.register("IVL_TS")
+@default_handlers.register("PIVL_TS")
+@default_handlers.register("IVXB_TS")
+@default_handlers.register("SXCM_TS")
+def anonymize_ts(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Shift the date of a timestamp."""
+    match.attrib["value"] = context.anonymizer.anonymize_TS_value(element)
+    return "TS"
+
+
+@default_handlers.register("II")
+def anonymize_ii(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Replace the extension of an identifier."""
+    match.attrib["extension"] = context.anonymizer.anonymize_II_value(element)
+    return "II"
+
+
+@default_handlers.register("ADXP", "streetAddressLine")
+def anonymize_street_address_line(
+    context: HandlerContext, element: Element, match: _Element
+) -> str:
+    """Replace a street address line."""
+    match.text = context.anonymizer.anonymize_streetAddressLine_value(element)
+    return "ADXP"
+
+
+@default_handlers.register("ADXP", "postalCode")
+def anonymize_postal_code(context: HandlerContext, element: Element, match: _Element) -> str | None:
+    """Replace every character of a postal code with one of the same kind."""
+    if element.text is None:
+        return None
+    match.text = context.anonymizer.replace_with_like_chars(element.text, "postalCode")
+    return "ADXP"
+
+
+@default_handlers.register("ADXP")
+@default_handlers.register("ENXP")
+def remove_part(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Remove address and name parts without a more specific handler."""
+    match.text = "REMOVED"
+    return element.cda_type
+
+
+@default_handlers.register("EN")
+@default_handlers.register("PN")
+@default_handlers.register("ON")
+def anonymize_en(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Replace a name."""
+    match.text = context.anonymizer.anonymize_EN_value(element)
+    return element.cda_type
+
+
+@default_handlers.register("xhtml")
+def anonymize_xhtml(context: HandlerContext, element: Element, match: _Element) -> None:
+    """Anonymize the narrative text of a section, which is not recorded in the audit log."""
+    context.anonymizer.anonymize_xhtml(match, context.safe_text)
+
+
+@default_handlers.register("TEL")
+def anonymize_tel(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Replace a telecom value, but not references to the narrative like `#phone_1`."""
+    value = element.attributes.get("value")
+    if value is not None and not value.startswith("#"):
+        match.attrib["value"] = context.anonymizer.anonymize_TEL_value(element)
+    return "TEL"
+
+
+@default_handlers.register("ED")
+def anonymize_ed(context: HandlerContext, element: Element, match: _Element) -> str:
+    """Anonymize free text, keeping safe words."""
+    match.text = context.anonymizer.anonymize_text(
+        element.text, "state", context.document_safe_words
+    )
+    return "ED"
@@ -0,0 +1,124 @@
+"""Manifest of previously anonymized files, used to skip files that have not changed."""
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from typing import TypedDict
+
+from eicr_anonymization import __version__
+from eicr_anonymization.file_io import atomic_write
+
+MANIFEST_FILE_NAME = ".eicr_anonymization_manifest.json"
+
+
+def manifest_file_name(suffix: str = "") -> str:
+    """Get the file name of the manifest, with a suffix to keep the manifests of shards apart."""
+    return MANIFEST_FILE_NAME.replace(".json", f"{suffix}.json")
+
+
+class ManifestEntry(TypedDict):
+    """Record of how an input file was anonymized."""
+
+    input_hash: str
+    config_hash: str
+    version: str
+    output: str
+
+
+def hash_file(path: str) -> str:
+    """Get the SHA-256 hash of a file's contents.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def options_hash(config_hash: str, options: Mapping[str, object]) -> str:
+    """Combine the hash of the configuration with the options that change the anonymized files.
+
+    Args:
+        config_hash: Hash of the configuration
+        options: Options that change the output, which must be JSON serializable
+
+    Returns:
+        Hex digest of the configuration and the options
+
+    """
+    data = json.dumps({"config": config_hash, **options}, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """Manifest of input files and the outputs they were anonymized to.
+
+    An input file is considered up to date if its contents, the configuration and options, the
+    version of the tool and the path of its output are all unchanged since it was last anonymized,
+    and its output still exists.
+    """
+
+    def __init__(self, path: str):
+        """Load the manifest from `path`, starting with an empty manifest if it does not exist.
+
+        Args:
+            path: Path to the manifest file
+        """
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = {}
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)["files"]
+
+    def _relative_path(self, output: str) -> str:
+        return os.path.relpath(output, os.path.dirname(self.path))
+
+    def is_up_to_date(self, key: str, input_hash: str, config_hash: str, output: str) -> bool:
+        """Check if an input file has already been anonymized with the current configuration.
+
+        Args:
+            key: Identifier of the input file, relative to the input directory
+            input_hash: Hash of the input file contents
+            config_hash: Hash of the configuration and the options that change the output, see
+                `options_hash`
+            output: Path the anonymized file would be written to
+
+        Returns:
+            True if the input file does not need to be anonymized again
+
+        """
+        entry = self.entries.get(key)
+        return (
+            entry is not None
+            and entry["input_hash"] == input_hash
+            and entry["config_hash"] == config_hash
+            and entry["version"] == __version__
+            and entry["output"] == self._relative_path(output)
+            and os.path.isfile(output)
+        )
+
+    def record(self, key: str, input_hash: str, config_hash: str, output: str) -> None:
+        """Record that an input file has been anonymized.
+
+        Args:
+            key: Identifier of the input file, relative to the input directory
+            input_hash: Hash of the input file contents
+            config_hash: Hash of the configuration and the options that change the output
+            output: Path of the anonymized file
+        """
+        self.entries[key] = {
+            "input_hash": input_hash,
+            "config_hash": config_hash,
+            "version": __version__,
+            "output": self._relative_path(output),
+        }
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        with atomic_write(self.path) as f:
+            f.write(json.dumps({"files": self.entries}, indent=2, sort_keys=True).encode("utf-8"))
@@ -0,0 +1,172 @@
+"""Store the replacements of values, keeping memory use bounded on long runs.
+
+Replacements are kept in memory (the hot tier) up to a limit. Beyond that the least recently used
+replacements are moved to a SQLite database in a temporary file (the cold tier), and moved back
+into memory when they are used again. Every value keeps its replacement, however long the run is,
+while memory use stays flat.
+
+The cold tier holds original values, so it is as sensitive as the original files. It is only
+readable by the current user and is removed when the store is closed or garbage collected.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+
+# Evicting a tenth of the hot tier at once keeps the writes to the cold tier batched
+EVICTION_FRACTION = 10
+
+
+class HotTierTooSmall(ValueError):
+    """Exception raised when the hot tier would not keep any replacement in memory."""
+
+    def __init__(self, max_in_memory: int):
+        """Initialize the exception with the requested size of the hot tier."""
+        super().__init__(
+            f"At least one replacement must be kept in memory, got a limit of {max_in_memory}"
+        )
+
+
+def _remove_cold_tier(connection: sqlite3.Connection, path: str) -> None:
+    connection.close()
+    os.remove(path)
+
+
+class MappingStore:
+    """Replacements of values by data type, with a bounded hot tier and an unbounded cold tier."""
+
+    def __init__(self, max_in_memory: int | None = None, directory: str | None = None):
+        """Initialize an empty store.
+
+        Args:
+            max_in_memory: Maximum number of replacements kept in memory, unbounded if None
+            directory: Directory of the cold tier, the temporary directory by default
+        """
+        if max_in_memory is not None and max_in_memory < 1:
+            raise HotTierTooSmall(max_in_memory)
+        self.max_in_memory = max_in_memory
+        self.directory = directory
+        self.hot_hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+        self._hot: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._cold: sqlite3.Connection | None = None
+        self._cold_size = 0
+        self._lock = threading.Lock()
+
+    def new_empty(self) -> "MappingStore":
+        """Create an empty store with the same limits."""
+        return MappingStore(self.max_in_memory, self.directory)
+
+    def get(self, data_type: str, value: str) -> str | None:
+        """Get the replacement of a value, or None if it has none yet."""
+        key = (data_type, value)
+        with self._lock:
+            replacement = self._hot.get(key)
+            if replacement is not None:
+                self._hot.move_to_end(key)
+                self.hot_hits += 1
+                return replacement
+            replacement = self._get_cold(key)
+            if replacement is None:
+                self.misses += 1
+                return None
+            self.cold_hits += 1
+            self._move_to_hot(key, replacement)
+            return replacement
+
+    def setdefault(self, data_type: str, value: str, replacement: str) -> str:
+        """Store the replacement of a value, unless it already has one.
+
+        Returns:
+            The replacement of the value, which is the existing one if there is one
+
+        """
+        key = (data_type, value)
+        with self._lock:
+            existing = self._hot.get(key)
+            if existing is None:
+                existing = self._get_cold(key)
+            if existing is not None:
+                return existing
+            self._add_hot(key, replacement)
+            return replacement
+
+    def _get_cold(self, key: tuple[str, str]) -> str | None:
+        if self._cold is None:
+            return None
+        row = self._cold.execute(
+            "SELECT replacement FROM mappings WHERE data_type = ? AND value = ?", key
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _move_to_hot(self, key: tuple[str, str], replacement: str) -> None:
+        # Every value is in exactly one of the tiers
+        if self._cold is not None:
+            self._cold.execute("DELETE FROM mappings WHERE data_type = ? AND value = ?", key)
+            self._cold_size -= 1
+        self._add_hot(key, replacement)
+
+    def _add_hot(self, key: tuple[str, str], replacement: str) -> None:
+        self._hot[key] = replacement
+        if self.max_in_memory is None or len(self._hot) <= self.max_in_memory:
+            return
+        evict = len(self._hot) - self.max_in_memory + self.max_in_memory // EVICTION_FRACTION
+        evicted = []
+        for _ in range(evict):
+            (data_type, value), evicted_replacement = self._hot.popitem(last=False)
+            evicted.append((data_type, value, evicted_replacement))
+        self._open_cold().executemany("INSERT INTO mappings VALUES (?, ?, ?)", evicted)
+        self._cold_size += len(evicted)
+
+    def _open_cold(self) -> sqlite3.Connection:
+        if self._cold is not None:
+            return self._cold
+        file_descriptor, path = tempfile.mkstemp(
+            prefix=".eicr_anonymization_mappings.", suffix=".sqlite", dir=self.directory
+        )
+        os.close(file_descriptor)
+        self._cold = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # The database only lives as long as the store, so it does not need to survive a crash
+        self._cold.execute("PRAGMA journal_mode = OFF")
+        self._cold.execute("PRAGMA synchronous = OFF")
+        self._cold.execute(
+            "CREATE TABLE mappings (data_type TEXT, value TEXT, replacement TEXT NOT NULL, "
+            "PRIMARY KEY (data_type, value)) WITHOUT ROWID"
+        )
+        self._finalizer = weakref.finalize(self, _remove_cold_tier, self._cold, path)
+        return self._cold
+
+    def close(self) -> None:
+        """Remove the cold tier, and every replacement in it."""
+        with self._lock:
+            if self._cold is not None:
+                self._finalizer()
+                self._cold = None
+                self._cold_size = 0
+
+    @property
+    def in_memory(self) -> int:
+        """Number of replacements in the hot tier."""
+        return len(self._hot)
+
+    @property
+    def on_disk(self) -> int:
+        """Number of replacements in the cold tier."""
+        return self._cold_size
+
+    def __len__(self) -> int:
+        """Get the number of values with a replacement."""
+        return self.in_memory + self.on_disk
+
+    def report(self) -> str:
+        """Describe the size of both tiers and how many lookups each of them answered."""
+        lookups = self.hot_hits + self.cold_hits + self.misses or 1
+        return (
+            f"Replacements in memory: {self.in_memory}, on disk: {self.on_disk}. "
+            f"Lookups answered from memory: {self.hot_hits / lookups:.1%}, "
+            f"from disk: {self.cold_hits / lookups:.1%}, new values: {self.misses / lookups:.1%}"
+        )
@@ -0,0 +1,221 @@
+"""Count the sensitive elements of documents without anonymizing them.
+
+Scanning only runs the `Parser`: nothing is replaced and nothing is written, so a large set of
+documents, like the first batch of a new sender, can be profiled at parse speed. The counts show
+how many sensitive elements there are of every CDA type, tag and path, and which rules of the
+configuration made them sensitive.
+"""
+
+import json
+import os
+from argparse import Namespace
+from collections import Counter, deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from lxml import etree
+from lxml.etree import _Element
+
+from eicr_anonymization.anonymize_eicr import discover_xml_files
+from eicr_anonymization.element_parser import Findings, Parser, has_text
+from eicr_anonymization.file_io import atomic_write
+from eicr_anonymization.xml_reader import DEFAULT_READ_OPTIONS, ReadOptions, read_xml
+
+
+def path_pattern(element: _Element) -> str:
+    """Get the path of an element by tag names, without positions, like `recordTarget/.../family`.
+
+    The same field of different documents, or of different entries of one document, has the same
+    pattern.
+    """
+    tags = [str(ancestor.tag).split("}")[-1] for ancestor in element.iterancestors()]
+    tags.reverse()
+    tags.append(str(element.tag).split("}")[-1])
+    return "/".join(tags)
+
+
+def fired_rules(element: _Element, cda_type: str, config: Mapping, structure: Mapping) -> list[str]:
+    """Get the rules of the configuration that made an element sensitive.
+
+    A rule is named after the CDA type and the part of it that is sensitive, like `ENXP text` or
+    `II @extension`.
+    """
+    if cda_type == "xhtml":
+        return ["xhtml"]
+    type_config = config[cda_type]
+    rules = []
+    if has_text(element) and type_config["text_content"] != "SAFE":
+        rules.append(f"{cda_type} text")
+    attributes = structure[cda_type]["attributes"]
+    for name in element.keys():  # noqa: SIM118
+        attribute = str(name).split("}")[-1]
+        if attribute in attributes and type_config["attributes"][attribute] != "SAFE":
+            rules.append(f"{cda_type} @{attribute}")
+    return rules
+
+
+@dataclass
+class ScanReport:
+    """Counts of the sensitive elements of one document, or of many once merged."""
+
+    files: int = 0
+    failed_files: int = 0
+    sensitive_elements: int = 0
+    # Elements in safe subtrees the parser skipped, as they could not hold anything to count
+    skipped_elements: int = 0
+    # The skipped elements of every scanned file, by path
+    skipped_by_file: dict[str, int] = field(default_factory=dict)
+    by_type: Counter[str] = field(default_factory=Counter)
+    by_tag: Counter[str] = field(default_factory=Counter)
+    by_path: Counter[str] = field(default_factory=Counter)
+    by_rule: Counter[str] = field(default_factory=Counter)
+
+    def merge(self, other: "ScanReport") -> None:
+        """Add the counts of another report to this one."""
+        self.files += other.files
+        self.failed_files += other.failed_files
+        self.sensitive_elements += other.sensitive_elements
+        self.skipped_elements += other.skipped_elements
+        self.skipped_by_file.update(other.skipped_by_file)
+        self.by_type.update(other.by_type)
+        self.by_tag.update(other.by_tag)
+        self.by_path.update(other.by_path)
+        self.by_rule.update(other.by_rule)
+
+    def to_dict(self) -> dict:
+        """Get the report as a dictionary, with every count sorted from most to least common."""
+        return {
+            "files": self.files,
+            "failed_files": self.failed_files,
+            "sensitive_elements": self.sensitive_elements,
+            "skipped_elements": self.skipped_elements,
+            "skipped_elements_by_file": self.skipped_by_file,
+            "by_type": dict(self.by_type.most_common()),
+            "by_tag": dict(self.by_tag.most_common()),
+            "by_path": dict(self.by_path.most_common()),
+            "by_rule": dict(self.by_rule.most_common()),
+        }
+
+
+class ScanFindings(Findings):
+    """Counts sensitive elements as the parser finds them, instead of collecting them."""
+
+    def __init__(self, parser: Parser):
+        """Start counting the sensitive elements of one document found by the parser."""
+        super().__init__()
+        self.parser = parser
+        self.report = ScanReport()
+        # The parser finds an element once for every sensitive attribute, it is only counted once
+        self._seen: set[_Element] = set()
+
+    def add_safe_text(self, text: str):
+        """Ignore safe text, it is not counted."""
+
+    def add_sensitive_element(self, element: _Element, cda_type: str):
+        """Count a sensitive element."""
+        if element in self._seen:
+            return
+        self._seen.add(element)
+        report = self.report
+        report.sensitive_elements += 1
+        report.by_type[cda_type] += 1
+        report.by_tag[str(element.tag).split("}")[-1]] += 1
+        report.by_path[path_pattern(element)] += 1
+        report.by_rule.update(
+            fired_rules(element, cda_type, self.parser.config, self.parser.structure)
+        )
+
+
+def scan_file(
+    xml_file: str, parser: Parser, read_options: ReadOptions = DEFAULT_READ_OPTIONS
+) -> ScanReport:
+    """Count the sensitive elements of one document.
+
+    Documents that cannot be parsed, or are beyond the limits of `read_options`, are counted as
+    failed instead of stopping the scan.
+
+    Args:
+        xml_file: Path to the document
+        parser: Finds the sensitive elements
+        read_options: How the document is parsed, and the limits it must be within
+
+    Returns:
+        The counts of the document
+
+    """
+    try:
+        tree = read_xml(xml_file, read_options)
+        found = parser.collect(tree.getroot(), ScanFindings(parser))
+    except (etree.XMLSyntaxError, ValueError) as e:
+        print(f"Could not scan file {xml_file}: {e}")
+        return ScanReport(failed_files=1)
+    found.report.files = 1
+    found.report.skipped_elements = found.skipped_elements
+    found.report.skipped_by_file[xml_file] = found.skipped_elements
+    return found.report
+
+
+def _print_counts(title: str, counts: Counter[str], top: int | None = None) -> None:
+    print(f"{title}:")
+    for name, count in counts.most_common(top):
+        print(f"  {count:>10}  {name}")
+    if top is not None and len(counts) > top:
+        print(f"  ... {len(counts) - top} more")
+
+
+def scan(args: Namespace) -> ScanReport:
+    """Count the sensitive elements of the input files and print the counts.
+
+    Files are scanned by `args.threads` worker threads. The full counts are saved as JSON to
+    `args.report` if it is given, the printed tags and paths are limited to the `args.top` most
+    common.
+
+    Returns:
+        The counts of all files
+
+    """
+    input_location = args.input_location
+    if os.path.isdir(input_location):
+        xml_files = discover_xml_files(input_location)
+    elif os.path.isfile(input_location):
+        xml_files = [input_location]
+    else:
+        print(f"Input location is not a file or directory: {input_location}")
+        return ScanReport()
+    print(f"Scanning {len(xml_files)} XML files")
+
+    parser = Parser(custom_config_path=args.config)
+    read_options = ReadOptions.from_args(args)
+    total = ScanReport()
+    with ThreadPoolExecutor(args.threads) as executor:
+        pending: deque[Future[ScanReport]] = deque()
+        for xml_file in xml_files:
+            pending.append(executor.submit(scan_file, xml_file, parser, read_options))
+            # Merge as files finish, without holding every report in memory
+            while len(pending) > 2 * args.threads or (pending and pending[0].done()):
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+
+    print(
+        f"Scanned {total.files} files, {total.failed_files} could not be scanned, "
+        f"found {total.sensitive_elements} sensitive elements"
+    )
+    if total.files:
+        print(
+            f"Elements in safe subtrees skipped by the parser: {total.skipped_elements} "
+            f"({total.skipped_elements / total.files:.1f} per file)"
+        )
+        if args.config is None:
+            # Every safe subtree of the shipped configuration can hold safe text
+            print("  The shipped configuration has no subtrees to skip, so this is always 0")
+    _print_counts("By CDA type", total.by_type)
+    _print_counts("By configuration rule", total.by_rule)
+    _print_counts("By tag", total.by_tag, args.top)
+    _print_counts("By path", total.by_path, args.top)
+    if args.report is not None:
+        with atomic_write(args.report) as f:
+            f.write(json.dumps(total.to_dict(), indent=2).encode("utf-8"))
+        print(f"Saved the scan report to: {args.report}")
+    return total
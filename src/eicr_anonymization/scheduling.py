@@ -0,0 +1,121 @@
+"""Order files so the largest are anonymized first, and group small files into chunks.
+
+Anonymizing a file takes time roughly in proportion to its size, and sizes range from kilobytes
+for an RR to hundreds of megabytes for an eICR. If a huge file is started last, the run waits for
+it alone while every other worker is idle. Started first, it is anonymized while the other workers
+get through the small files, so every worker finishes at about the same time.
+
+Compressed files are ordered by their uncompressed size, which gzip and zstd record in the file,
+as that is what the time to anonymize them depends on.
+"""
+
+import os
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+
+from eicr_anonymization.file_io import get_compression
+
+# Small files are sent to worker processes in chunks of up to this many bytes, and of up to
+# MAX_CHUNK_FILES files
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+MAX_CHUNK_FILES = 64
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _gzip_size(path: str, size: int) -> int | None:
+    """Read the uncompressed size from the trailer of a gzip file.
+
+    The trailer holds the size modulo 4 GiB, so it is only used when it is plausible.
+    """
+    with open(path, "rb") as f:
+        f.seek(-4, os.SEEK_END)
+        (uncompressed,) = struct.unpack("<I", f.read(4))
+    return uncompressed if uncompressed >= size else None
+
+
+def _zstd_size(path: str) -> int | None:
+    """Read the uncompressed size from the frame header of a zstd file, if it is recorded."""
+    with open(path, "rb") as f:
+        header = f.read(18)
+    if not header.startswith(_ZSTD_MAGIC):
+        return None
+    try:
+        import zstandard  # noqa: PLC0415
+    except ModuleNotFoundError:
+        return None
+    content_size = zstandard.get_frame_parameters(header).content_size
+    return content_size if content_size != zstandard.CONTENTSIZE_UNKNOWN else None
+
+
+def estimated_size(path: str) -> int:
+    """Estimate the uncompressed size of a file in bytes, without decompressing it.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The uncompressed size if the file records it, otherwise the size of the file
+
+    """
+    size = os.path.getsize(path)
+    try:
+        match get_compression(path):
+            case "gzip" if size >= 18:  # noqa: PLR2004
+                return _gzip_size(path, size) or size
+            case "zstd":
+                return _zstd_size(path) or size
+    except (OSError, ValueError, struct.error):
+        pass
+    return size
+
+
+def largest_first(xml_files: Iterable[str]) -> tuple[list[str], dict[str, int]]:
+    """Order files from the largest to the smallest, by their estimated uncompressed size.
+
+    Files of the same size keep their order, so the order is the same in every run.
+
+    Args:
+        xml_files: Paths to the files
+
+    Returns:
+        The ordered files, and the estimated size of every file
+
+    """
+    sizes = {xml_file: estimated_size(xml_file) for xml_file in xml_files}
+    return sorted(sizes, key=lambda xml_file: -sizes[xml_file]), sizes
+
+
+def chunk_jobs[J: tuple[str, str]](
+    jobs: Iterable[J],
+    sizes: Mapping[str, int],
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_files: int = MAX_CHUNK_FILES,
+) -> Iterator[list[J]]:
+    """Group consecutive small files into chunks, large files are chunks of their own.
+
+    A chunk is closed as soon as the next file would take it over `chunk_bytes`, so the size of
+    the chunks follows the size of the files: files larger than `chunk_bytes` are sent alone and
+    the smallest files are sent up to `max_files` at a time.
+
+    Args:
+        jobs: Paths of the files, with the paths to save them to
+        sizes: Estimated size of every file, files without one count as `chunk_bytes`
+        chunk_bytes: Maximum size of a chunk of several files
+        max_files: Maximum number of files in a chunk
+
+    Yields:
+        The chunks, with the files in their original order
+
+    """
+    chunk: list[J] = []
+    chunk_size = 0
+    for job in jobs:
+        size = sizes.get(job[0], chunk_bytes)
+        if chunk and (chunk_size + size > chunk_bytes or len(chunk) >= max_files):
+            yield chunk
+            chunk, chunk_size = [], 0
+        chunk.append(job)
+        chunk_size += size
+    if chunk:
+        yield chunk
@@ -0,0 +1,350 @@
+"""Long-running anonymization service with a local HTTP API.
+
+The configuration files are loaded and the `Parser` and `Anonymizer` are created once, when the
+service starts, instead of for every document. Requests are accepted by an asyncio front end and
+anonymized on a pool of worker threads.
+
+Endpoints:
+- `POST /anonymize`: anonymize the eICR or RR in the request body and return it.
+- `GET /health`: check the service is up.
+- `GET /metrics`: counters of the requests handled so far, as JSON.
+
+Every request is anonymized in its own mapping scope, so requests never share replacements. Use
+keyed mode to replace the same values in the same way across requests.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from io import BytesIO
+
+from lxml import etree
+
+from eicr_anonymization.anonymize_eicr import (
+    anonymize_eicr_tree,
+    create_anonymizer,
+    write_xml_tree,
+)
+from eicr_anonymization.anonymizer import Anonymizer
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.xml_reader import DEFAULT_READ_OPTIONS, ReadOptions, parse_xml
+
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+MAX_HEADER_LINES = 100
+
+type Address = tuple[str, int] | str
+
+
+@dataclass
+class ServiceMetrics:
+    """Counters of the requests handled by the service."""
+
+    requests: int = 0
+    in_flight: int = 0
+    rejected: int = 0
+    failed: int = 0
+    documents_anonymized: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    anonymize_seconds: float = 0
+
+
+@dataclass(frozen=True)
+class ServiceOptions:
+    """How many requests the service takes on, and how it writes the anonymized documents."""
+
+    # Number of worker threads anonymizing documents
+    workers: int = 1
+    # Maximum number of requests being anonymized or waiting for a worker. Further requests are
+    # rejected with `503 Service Unavailable` until one finishes. Defaults to four times the workers
+    max_pending: int | None = None
+    # Maximum size of a request body in bytes, defaults to 64 MiB
+    max_body_size: int | None = None
+    # Re-indent the anonymized documents
+    pretty_print: bool = True
+    # Keep the XML declaration and encoding of the original documents
+    preserve_declaration: bool = False
+    # How documents are parsed, and the limits they must be within
+    read_options: ReadOptions = DEFAULT_READ_OPTIONS
+
+    @classmethod
+    def from_args(cls, args: Namespace) -> "ServiceOptions":
+        """Get the options given on the command line."""
+        return cls(
+            args.threads,
+            args.max_pending,
+            args.max_body_size,
+            args.pretty_print,
+            args.preserve_declaration,
+            ReadOptions.from_args(args),
+        )
+
+
+DEFAULT_SERVICE_OPTIONS = ServiceOptions()
+
+
+class _RequestError(Exception):
+    """A request that is answered with an error status."""
+
+    def __init__(self, status: HTTPStatus, message: str | None = None):
+        """Initialize the error with the status to answer with and an optional message."""
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+def parse_address(address: str) -> Address:
+    """Parse the address to listen on.
+
+    Args:
+        address: `HOST:PORT`, or the path of a Unix socket
+
+    Returns:
+        The host and port, or the socket path
+
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit() and os.sep not in address:
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+class AnonymizationService:
+    """Serve anonymize requests with a `Parser` and `Anonymizer` that are loaded once."""
+
+    def __init__(
+        self,
+        anonymizer: Anonymizer,
+        parser: Parser,
+        options: ServiceOptions = DEFAULT_SERVICE_OPTIONS,
+    ):
+        """Initialize the service.
+
+        Args:
+            anonymizer: Provides the settings for the mapping scope of every request
+            parser: Finds the sensitive elements, shared by all workers
+            options: Number of workers, limits on requests, and how documents are written
+        """
+        self.anonymizer = anonymizer
+        self.parser = parser
+        self.workers = options.workers
+        self.max_pending = (
+            4 * options.workers if options.max_pending is None else options.max_pending
+        )
+        self.max_body_size = (
+            DEFAULT_MAX_BODY_SIZE if options.max_body_size is None else options.max_body_size
+        )
+        self.pretty_print = options.pretty_print
+        self.preserve_declaration = options.preserve_declaration
+        self.read_options = options.read_options
+        self.metrics = ServiceMetrics()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def anonymize_document(self, data: bytes) -> bytes:
+        """Anonymize one document in its own mapping scope.
+
+        Args:
+            data: The eICR or RR to anonymize
+
+        Returns:
+            The anonymized document
+
+        """
+        tree = parse_xml(data, "request", self.read_options)
+        # A line per request would only be noise in the log of the service
+        anonymize_eicr_tree(
+            tree, "request", self.anonymizer.new_mapping_scope(), self.parser, verbose=False
+        )
+        output = BytesIO()
+        write_xml_tree(tree, output, self.pretty_print, self.preserve_declaration)
+        return output.getvalue()
+
+    async def start(self, address: Address) -> asyncio.Server:
+        """Start listening for requests.
+
+        Args:
+            address: Host and port to listen on, or the path of a Unix socket
+
+        Returns:
+            The running server
+
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers)
+        if isinstance(address, str):
+            return await asyncio.start_unix_server(self._handle_connection, path=address)
+        host, port = address
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    def close(self) -> None:
+        """Stop the worker threads once the requests they are working on are finished."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                keep_alive = await self._handle_request(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Answer one request on a connection, returning whether the connection stays open."""
+        try:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                return False
+            self.metrics.requests += 1
+            method, path, version = request_line.decode("latin-1").split()
+            headers = await self._read_headers(reader)
+        except _RequestError as e:
+            await self._respond(writer, e.status, e.message.encode("utf-8"), False)
+            return False
+        except ValueError:
+            # Also raised for lines longer than the limit of the stream reader
+            await self._respond(writer, HTTPStatus.BAD_REQUEST, b"Malformed request", False)
+            return False
+
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "") != "close"
+        try:
+            status, body, content_type = await self._route(method, path, headers, reader)
+        except _RequestError as e:
+            if e.status == HTTPStatus.INTERNAL_SERVER_ERROR:
+                self.metrics.failed += 1
+            # The body may not have been read, so the connection cannot be reused
+            await self._respond(writer, e.status, e.message.encode("utf-8"), False)
+            return False
+        await self._respond(writer, status, body, keep_alive, content_type)
+        return keep_alive
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str]:
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                return headers
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise _RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+    async def _route(
+        self, method: str, path: str, headers: dict[str, str], reader: asyncio.StreamReader
+    ) -> tuple[HTTPStatus, bytes, str]:
+        path = path.split("?", maxsplit=1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, b'{"status": "ok"}', "application/json"
+        if path == "/metrics":
+            if method != "GET":
+                raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED)
+            address_parser = self.anonymizer.address_parser
+            metrics = {
+                **asdict(self.metrics),
+                "max_pending": self.max_pending,
+                "address_fast_path_hits": address_parser.fast_path_hits,
+                "address_fallbacks": address_parser.fallbacks,
+            }
+            return HTTPStatus.OK, json.dumps(metrics).encode("utf-8"), "application/json"
+        if path == "/anonymize":
+            if method != "POST":
+                raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, await self._anonymize_request(headers, reader), "application/xml"
+        raise _RequestError(HTTPStatus.NOT_FOUND)
+
+    async def _anonymize_request(
+        self, headers: dict[str, str], reader: asyncio.StreamReader
+    ) -> bytes:
+        if "content-length" not in headers:
+            raise _RequestError(HTTPStatus.LENGTH_REQUIRED)
+        try:
+            length = int(headers["content-length"])
+        except ValueError as e:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from e
+        if length > self.max_body_size:
+            raise _RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        # Reject requests the workers cannot keep up with, instead of queueing them without bound
+        if self.metrics.in_flight >= self.max_pending:
+            self.metrics.rejected += 1
+            raise _RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many pending requests")
+
+        self.metrics.in_flight += 1
+        try:
+            data = await reader.readexactly(length)
+            self.metrics.bytes_received += length
+            start = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            try:
+                output = await loop.run_in_executor(self._executor, self.anonymize_document, data)
+            except (etree.XMLSyntaxError, ValueError) as e:
+                raise _RequestError(HTTPStatus.BAD_REQUEST, f"Invalid document: {e}") from e
+            except Exception as e:
+                raise _RequestError(HTTPStatus.INTERNAL_SERVER_ERROR) from e
+            finally:
+                self.metrics.anonymize_seconds += time.perf_counter() - start
+        finally:
+            self.metrics.in_flight -= 1
+        self.metrics.documents_anonymized += 1
+        self.metrics.bytes_sent += len(output)
+        return output
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes,
+        keep_alive: bool,
+        content_type: str = "text/plain; charset=utf-8",
+    ) -> None:
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+async def _serve_forever(service: AnonymizationService, address: Address) -> None:
+    server = await service.start(address)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop.set)
+    print(f"Listening on {address if isinstance(address, str) else ':'.join(map(str, address))}")
+    async with server:
+        await stop.wait()
+    print("Shutting down")
+
+
+def serve(args: Namespace) -> None:
+    """Run the anonymization service until it is interrupted."""
+    service = AnonymizationService(
+        create_anonymizer(args),
+        Parser(custom_config_path=args.config),
+        ServiceOptions.from_args(args),
+    )
+    address = parse_address(args.input_location)
+    try:
+        asyncio.run(_serve_forever(service, address))
+    finally:
+        service.close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.remove(address)
@@ -0,0 +1,208 @@
+"""Split the input files of a batch across machines and merge the results of each shard.
+
+Files are assigned to shards by a stable hash of their path, so every machine can work out its own
+files from the same input tree without a coordinator. Each shard writes a run manifest, listing the
+files it anonymized, and a stats file, which can be merged into one summary of the whole batch.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from argparse import ArgumentTypeError
+from dataclasses import asdict, dataclass, field
+from typing import Literal
+
+from eicr_anonymization.file_io import atomic_write
+
+type ShardBy = Literal["file", "folder"]
+
+RUN_MANIFEST_PREFIX = ".eicr_anonymization_run"
+STATS_PREFIX = ".eicr_anonymization_stats"
+SUMMARY_FILE_NAME = "eicr_anonymization_summary.json"
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `count` shards, numbered from 1."""
+
+    index: int
+    count: int
+
+    @property
+    def suffix(self) -> str:
+        """Suffix added to the names of files written by this shard."""
+        return f".shard-{self.index}-of-{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard given as `K/N` on the command line.
+
+    Args:
+        value: Shard number and number of shards, e.g. `2/8`
+
+    Returns:
+        The parsed shard
+
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as e:
+        raise ArgumentTypeError(f"Shard must be given as K/N, got: {value}") from e  # noqa: TRY003
+    if not 1 <= index <= count:
+        raise ArgumentTypeError(  # noqa: TRY003
+            f"Shard number must be between 1 and {count}, got: {index}"
+        )
+    return Shard(index, count)
+
+
+def _group_key(xml_file: str, input_root: str, shard_by: ShardBy) -> str:
+    relative_path = os.path.relpath(xml_file, input_root)
+    if shard_by == "folder":
+        return os.path.dirname(relative_path)
+    return relative_path
+
+
+def shard_of(xml_file: str, input_root: str, count: int, shard_by: ShardBy = "file") -> int:
+    """Get the shard, numbered from 1, that a file belongs to.
+
+    The shard only depends on the path of the file relative to the input directory, so it is the
+    same on every machine and in every run.
+
+    Args:
+        xml_file: Path to the file
+        input_root: Directory the input tree starts at
+        count: Number of shards
+        shard_by: `folder` keeps all files in the same folder, like an eICR and its RR, in the same
+            shard. `file` spreads files individually
+
+    Returns:
+        The shard number
+
+    """
+    key = _group_key(xml_file, input_root, shard_by).replace(os.sep, "/")
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def select_shard(
+    xml_files: list[str], input_root: str, shard: Shard, shard_by: ShardBy = "file"
+) -> list[str]:
+    """Keep only the files that belong to a shard."""
+    return [
+        xml_file
+        for xml_file in xml_files
+        if shard_of(xml_file, input_root, shard.count, shard_by) == shard.index
+    ]
+
+
+@dataclass
+class RunStats:
+    """Statistics of one run, or of a whole batch once the shards are merged."""
+
+    shards: list[str] = field(default_factory=list)
+    files_found: int = 0
+    files_selected: int = 0
+    files_anonymized: int = 0
+    files_skipped: int = 0
+    files_failed: int = 0
+    input_bytes: int = 0
+    elapsed_seconds: float = 0
+
+
+class RunRecorder:
+    """Record the files anonymized by one shard and write its run manifest and stats files."""
+
+    def __init__(self, directory: str, shard: Shard, files_found: int, files_selected: int):
+        """Start recording a run.
+
+        Args:
+            directory: Directory to write the run manifest and stats files to
+            shard: The shard being run
+            files_found: Number of files found in the whole input tree
+            files_selected: Number of files that belong to this shard
+        """
+        self.directory = directory
+        self.shard = shard
+        self.files: list[dict[str, str]] = []
+        self.stats = RunStats(
+            shards=[f"{shard.index}/{shard.count}"],
+            files_found=files_found,
+            files_selected=files_selected,
+        )
+
+    def record(self, xml_file: str, output_file: str | None) -> None:
+        """Record a file as anonymized, or as skipped if there is no output file."""
+        if output_file is None:
+            self.stats.files_skipped += 1
+            self.files.append({"input": xml_file, "status": "skipped"})
+            return
+        self.stats.files_anonymized += 1
+        self.stats.input_bytes += os.path.getsize(xml_file)
+        self.files.append({"input": xml_file, "output": output_file, "status": "anonymized"})
+
+    def record_failure(self, xml_file: str, reason: str) -> None:
+        """Record a file that could not be anonymized and was quarantined."""
+        self.stats.files_failed += 1
+        self.files.append({"input": xml_file, "status": "failed", "reason": reason})
+
+    def save(self, elapsed_seconds: float) -> None:
+        """Write the run manifest and stats files of the shard."""
+        self.stats.elapsed_seconds = elapsed_seconds
+        manifest_name = f"{RUN_MANIFEST_PREFIX}{self.shard.suffix}.json"
+        with atomic_write(os.path.join(self.directory, manifest_name)) as f:
+            f.write(json.dumps({"files": self.files}, indent=2).encode("utf-8"))
+        stats_path = os.path.join(self.directory, f"{STATS_PREFIX}{self.shard.suffix}.json")
+        with atomic_write(stats_path) as f:
+            f.write(json.dumps(asdict(self.stats), indent=2).encode("utf-8"))
+
+
+def merge_run_stats(directory: str) -> RunStats:
+    """Merge the stats files of all shards in a directory into one summary.
+
+    The number of files found is the same for every shard, so it is taken from the first. The
+    elapsed time is that of the slowest shard, as the shards run in parallel.
+
+    Args:
+        directory: Directory the shards wrote their stats files to
+
+    Returns:
+        Stats of the whole batch
+
+    """
+    summary = RunStats()
+    for stats_path in sorted(glob.glob(os.path.join(directory, f"{STATS_PREFIX}.shard-*.json"))):
+        with open(stats_path, encoding="utf-8") as f:
+            stats = RunStats(**json.load(f))
+        summary.shards.extend(stats.shards)
+        summary.files_found = max(summary.files_found, stats.files_found)
+        summary.files_selected += stats.files_selected
+        summary.files_anonymized += stats.files_anonymized
+        summary.files_skipped += stats.files_skipped
+        summary.files_failed += stats.files_failed
+        summary.input_bytes += stats.input_bytes
+        summary.elapsed_seconds = max(summary.elapsed_seconds, stats.elapsed_seconds)
+    return summary
+
+
+def summarize(directory: str) -> None:
+    """Merge the stats of all shards in a directory, then print and save the batch summary."""
+    summary = merge_run_stats(directory)
+    if not summary.shards:
+        print(f"No shard stats files found in directory: {directory}")
+        return
+
+    counts = {int(shard.split("/")[1]) for shard in summary.shards}
+    if len(counts) > 1:
+        print(f"WARNING: Stats files are from runs with different numbers of shards: {counts}")
+    else:
+        (count,) = counts
+        found = {int(shard.split("/")[0]) for shard in summary.shards}
+        missing = sorted(set(range(1, count + 1)) - found)
+        if missing:
+            print(f"WARNING: Missing stats for shards: {', '.join(map(str, missing))}")
+
+    with atomic_write(os.path.join(directory, SUMMARY_FILE_NAME)) as f:
+        f.write(json.dumps(asdict(summary), indent=2).encode("utf-8"))
+    for name, value in asdict(summary).items():
+        print(f"{name}: {value}")
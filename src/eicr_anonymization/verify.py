@@ -0,0 +1,265 @@
+"""Check anonymized files for original values that were left in them.
+
+The sensitive values of every original file are collected with the `Parser`, the same way they
+are found for anonymization. All of them are compiled into one regular expression, shaped like a
+trie so values with a common prefix share their branches, and the anonymized file is scanned for
+them in a single pass. Files are verified in parallel.
+"""
+
+import os
+import re
+from argparse import Namespace
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from eicr_anonymization.anonymize_eicr import discover_xml_files, get_output_path
+from eicr_anonymization.element_parser import Element, Parser
+from eicr_anonymization.file_io import open_input
+from eicr_anonymization.xml_reader import DEFAULT_READ_OPTIONS, ReadOptions, read_xml
+
+# Shorter values, like "F" or "12", are too likely to appear by chance
+DEFAULT_MIN_LENGTH = 4
+# Longer values are only searched for by their start, which is enough to find them
+MAX_PATTERN_LENGTH = 200
+# Attributes holding sensitive values. Others, like the root OID of an identifier, are kept
+SENSITIVE_ATTRIBUTES = ("value", "extension")
+
+
+@dataclass
+class Leak:
+    """An original value found in an anonymized file."""
+
+    value: str
+    line: int
+
+
+@dataclass
+class VerifyReport:
+    """The result of verifying one anonymized file."""
+
+    original_file: str
+    output_file: str
+    values_checked: int = 0
+    missing: bool = False
+    # The original could not be parsed, or is beyond the limits it is read with
+    unreadable: bool = False
+    error: str | None = None
+    leaks: list[Leak] = field(default_factory=list)
+
+
+def original_values(element: Element) -> list[str]:
+    """Get the values of a sensitive element that must not be in the anonymized file.
+
+    Whitespace in the values is normalized to single spaces, as it may be reflowed when the
+    anonymized file is written.
+    """
+    values = [element.text] if element.text and element.cda_type != "xhtml" else []
+    values.extend(
+        value
+        for name, value in element.attributes.items()
+        if str(name).split("}")[-1] in SENSITIVE_ATTRIBUTES
+        # References to the narrative, like "#Weight_2", are kept on purpose
+        and not value.startswith("#")
+    )
+    return [" ".join(value.split()) for value in values]
+
+
+def collect_original_values(
+    tree: etree._ElementTree, parser: Parser, min_length: int = DEFAULT_MIN_LENGTH
+) -> set[str]:
+    """Collect the sensitive values of a document that must not be in the anonymized file.
+
+    Values that are also safe text of the document, like a word that is both part of a name and
+    of a code display name, are left out, as they are expected to be kept.
+
+    Args:
+        tree: The original document
+        parser: Finds the sensitive elements
+        min_length: Values shorter than this are left out
+
+    Returns:
+        The sensitive values, with their whitespace normalized
+
+    """
+    sensitive_elements, safe_text = parser.collect_sensitive_elements_and_safe_words(tree.getroot())
+    safe = {" ".join(text.split()).lower() for text in safe_text}
+    return {
+        value
+        for element in sensitive_elements
+        for value in original_values(element)
+        if len(value) >= min_length and value.lower() not in safe
+    }
+
+
+def _trie_to_regex(node: dict) -> str:
+    ends_here = "" in node
+    branches = [
+        (r"\s+" if char == " " else re.escape(char)) + _trie_to_regex(child)
+        for char, child in node.items()
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+
+def build_matcher(values: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile values into one case-insensitive pattern matching any of them as a whole word.
+
+    Spaces in the values match any run of whitespace. Words that are tag or attribute names, like
+    "city" in `<city>`, are not matched, so a value is only found in text, attribute values and
+    comments.
+
+    Args:
+        values: Values to match
+
+    Returns:
+        The pattern, or None if there are no values
+
+    """
+    trie: dict = {}
+    for value in values:
+        node = trie
+        for char in value[:MAX_PATTERN_LENGTH].lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    if not trie:
+        return None
+    return re.compile(rf"(?<![\w<])(?<!</)(?:{_trie_to_regex(trie)})(?![\w=])", re.IGNORECASE)
+
+
+def _xml_forms(value: str) -> set[str]:
+    """Get the ways a value can be written in a serialized XML document."""
+    return {value, escape(value), escape(value, {'"': "&quot;"})}
+
+
+def find_leaks(text: str, matcher: re.Pattern[str]) -> list[Leak]:
+    """Find every match of the original values in the text of an anonymized file."""
+    leaks = []
+    line, position = 1, 0
+    for match in matcher.finditer(text):
+        line += text.count("\n", position, match.start())
+        position = match.start()
+        leaks.append(Leak(match.group(), line))
+    return leaks
+
+
+def verify_file(
+    original_file: str,
+    output_file: str,
+    parser: Parser,
+    min_length: int = DEFAULT_MIN_LENGTH,
+    read_options: ReadOptions = DEFAULT_READ_OPTIONS,
+) -> VerifyReport:
+    """Check an anonymized file for the sensitive values of its original.
+
+    Args:
+        original_file: Path to the original file
+        output_file: Path to the anonymized file
+        parser: Finds the sensitive elements
+        min_length: Values shorter than this are not checked
+        read_options: How the original file is parsed, and the limits it must be within
+
+    Returns:
+        The values of the original found in the anonymized file. Originals that cannot be parsed,
+        or are beyond the limits of `read_options`, are reported as unreadable instead of stopping
+        the run.
+
+    """
+    report = VerifyReport(original_file, output_file)
+    if not os.path.exists(output_file):
+        report.missing = True
+        return report
+    try:
+        tree = read_xml(original_file, read_options)
+    except (etree.XMLSyntaxError, ValueError) as e:
+        report.unreadable = True
+        report.error = str(e)
+        return report
+    values = collect_original_values(tree, parser, min_length)
+    report.values_checked = len(values)
+    matcher = build_matcher(form for value in values for form in _xml_forms(value))
+    if matcher is None:
+        return report
+    with open_input(output_file) as f:
+        text = f.read().decode("utf-8", errors="replace")
+    report.leaks = find_leaks(text, matcher)
+    return report
+
+
+@dataclass
+class _VerifyTotals:
+    """Counts of the files that failed verification, printing every failure as it is added."""
+
+    leaked: int = 0
+    missing: int = 0
+    unreadable: int = 0
+
+    def add(self, result: VerifyReport) -> None:
+        if result.missing:
+            self.missing += 1
+            print(f"MISSING {result.output_file}")
+        elif result.unreadable:
+            self.unreadable += 1
+            print(f"UNREADABLE {result.original_file}: {result.error}")
+        elif result.leaks:
+            self.leaked += 1
+            for leak in result.leaks:
+                print(f"LEAK {result.output_file}:{leak.line}: {leak.value}")
+
+
+def verify(args: Namespace) -> bool:
+    """Verify the anonymized versions of the input files, printing every residual value.
+
+    The anonymized files are looked for where the `anonymize` subcommand with the same options
+    writes them.
+
+    Returns:
+        True if no original values were found, every anonymized file exists and every original
+        could be read
+
+    """
+    input_location = args.input_location
+    if os.path.isdir(input_location):
+        input_root = input_location
+        xml_files = discover_xml_files(input_location, args.output_dir)
+    elif os.path.isfile(input_location):
+        input_root = os.path.dirname(input_location) or "."
+        xml_files = [input_location]
+    else:
+        print(f"Input location is not a file or directory: {input_location}")
+        return False
+    print(f"Verifying the anonymized versions of {len(xml_files)} XML files")
+
+    parser = Parser(custom_config_path=args.config)
+    read_options = ReadOptions.from_args(args)
+    totals = _VerifyTotals()
+
+    with ThreadPoolExecutor(args.threads) as executor:
+        pending: deque[Future[VerifyReport]] = deque()
+        for xml_file in xml_files:
+            output_file = get_output_path(xml_file, input_root, args.output_dir, args.compress)
+            pending.append(
+                executor.submit(
+                    verify_file, xml_file, output_file, parser, args.min_length, read_options
+                )
+            )
+            # Report in input order, without holding every result in memory
+            while len(pending) > 2 * args.threads or (pending and pending[0].done()):
+                totals.add(pending.popleft().result())
+        while pending:
+            totals.add(pending.popleft().result())
+
+    print(
+        f"Verified {len(xml_files)} files: {totals.leaked} with original values left in them, "
+        f"{totals.missing} without an anonymized file, {totals.unreadable} with an original that "
+        "could not be read"
+    )
+    return totals.leaked == 0 and totals.missing == 0 and totals.unreadable == 0
@@ -0,0 +1,477 @@
+"""Watch an input directory and anonymize files as they land in it.
+
+New and changed files are found with inotify on Linux, or by rescanning the directory tree on
+other platforms. A file is only anonymized once it has stopped changing for a while, so files that
+are still being written are never picked up half way.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import signal
+import struct
+import threading
+import time
+from argparse import Namespace
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from eicr_anonymization.anonymize_eicr import (
+    anonymize_and_save,
+    check_unchanged,
+    create_anonymizer,
+    get_output_path,
+    is_input_file,
+    output_options_hash,
+    quarantine_file,
+)
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.manifest import Manifest, manifest_file_name
+
+# inotify event flags, see inotify(7)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+MANIFEST_SAVE_INTERVAL = 5.0
+# Number of processed files whose signature is remembered, to skip events that change nothing
+MAX_REMEMBERED_FILES = 100_000
+
+type FileSignature = tuple[int, int]
+
+
+def _signature(path: str) -> FileSignature | None:
+    """Get the size and modification time of a file, or None if it does not exist any more."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _is_excluded(directory: str, exclude: str | None) -> bool:
+    if exclude is None:
+        return False
+    return os.path.realpath(directory) == os.path.realpath(exclude)
+
+
+@dataclass(frozen=True)
+class WatchOptions:
+    """How a directory tree is watched, and how many files are processed at once."""
+
+    # Directory the anonymized files are written to, ignored if inside the tree
+    output_dir: str | None = None
+    # Number of worker threads
+    threads: int = 1
+    # How long a file must stop changing before it is processed
+    settle_seconds: float = 1.0
+    # Poll for changes with this many seconds between scans instead of inotify
+    poll_interval: float | None = None
+
+    @classmethod
+    def from_args(cls, args: Namespace) -> "WatchOptions":
+        """Get the options given on the command line."""
+        return cls(args.output_dir, args.threads, args.settle_seconds, args.poll_interval)
+
+
+DEFAULT_WATCH_OPTIONS = WatchOptions()
+
+
+class PollingWatcher:
+    """Find changed files by rescanning a directory tree at a fixed interval.
+
+    Files that were removed since the last scan are reported as changed as well.
+    """
+
+    def __init__(self, root: str, exclude: str | None = None, interval: float = 2.0):
+        """Initialize the watcher, treating every file already in the tree as changed.
+
+        Args:
+            root: Directory tree to watch
+            exclude: Directory inside the tree to ignore, like the output directory
+            interval: Seconds between two scans
+        """
+        self.root = root
+        self.exclude = exclude
+        self.interval = interval
+        self._signatures: dict[str, FileSignature] = {}
+        self._next_scan = 0.0
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to `timeout` seconds for the next scan and return the files that changed."""
+        wait = self._next_scan - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(wait, 0))
+        self._next_scan = time.monotonic() + self.interval
+
+        signatures = {}
+        for directory, subdirectories, files in os.walk(self.root):
+            subdirectories[:] = [
+                name
+                for name in subdirectories
+                if not _is_excluded(os.path.join(directory, name), self.exclude)
+            ]
+            for name in files:
+                path = os.path.join(directory, name)
+                signature = _signature(path)
+                if signature is not None:
+                    signatures[path] = signature
+        changed = {
+            path
+            for path, signature in signatures.items()
+            if self._signatures.get(path) != signature
+        }
+        changed.update(self._signatures.keys() - signatures.keys())
+        self._signatures = signatures
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+class InotifyWatcher:
+    """Find changed files with inotify, watching every directory of a tree.
+
+    Files that are removed or moved away are reported as changed as well.
+    """
+
+    def __init__(self, root: str, exclude: str | None = None):
+        """Start watching a directory tree.
+
+        Files already in the tree are reported as changed by the first call to `poll`.
+
+        Args:
+            root: Directory tree to watch
+            exclude: Directory inside the tree to ignore, like the output directory
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        self.exclude = exclude
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS))
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._directories: dict[int, str] = {}
+        self._changed = self._watch_tree(root)
+
+    def _watch_tree(self, root: str) -> set[str]:
+        """Watch a directory and everything below it, returning the files already in it.
+
+        Directories that are removed before they are watched are skipped.
+        """
+        files = set()
+        for directory, subdirectories, names in os.walk(root):
+            subdirectories[:] = [
+                name
+                for name in subdirectories
+                if not _is_excluded(os.path.join(directory, name), self.exclude)
+            ]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error in {errno.ENOENT, errno.ENOTDIR}:
+                    subdirectories.clear()
+                    continue
+                raise OSError(error, os.strerror(error), directory)
+            self._directories[wd] = directory
+            # Files can land before the watch is added, so report everything already there
+            files.update(os.path.join(directory, name) for name in names)
+        return files
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to `timeout` seconds for events and return the files that changed."""
+        changed, self._changed = self._changed, set()
+        if changed:
+            timeout = 0
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            changed.update(self._handle_event(wd, mask, name))
+        return changed
+
+    def _handle_event(self, wd: int, mask: int, name: bytes) -> Iterable[str]:
+        """Get the files an event tells have changed, watching directories that were added."""
+        if mask & _IN_Q_OVERFLOW:
+            # Events were dropped, so fall back to everything in the tree
+            return [
+                path
+                for directory in set(self._directories.values())
+                for path in _files_in(directory)
+            ]
+        if mask & _IN_IGNORED:
+            # The directory was removed, so its watch is gone
+            self._directories.pop(wd, None)
+            return []
+        directory = self._directories.get(wd)
+        if directory is None or not name:
+            return []
+        path = os.path.join(directory, os.fsdecode(name))
+        if not mask & _IN_ISDIR:
+            return [path]
+        if mask & (_IN_CREATE | _IN_MOVED_TO) and not _is_excluded(path, self.exclude):
+            return self._watch_tree(path)
+        return []
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+
+def _files_in(directory: str) -> list[str]:
+    """Get the files in a directory, none if the directory has been removed."""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def create_watcher(
+    root: str, exclude: str | None = None, poll_interval: float | None = None
+) -> InotifyWatcher | PollingWatcher:
+    """Create an inotify watcher, or a polling watcher if inotify is not available or not wanted.
+
+    Args:
+        root: Directory tree to watch
+        exclude: Directory inside the tree to ignore, like the output directory
+        poll_interval: Always poll, with this many seconds between scans
+
+    Returns:
+        The watcher
+
+    """
+    if poll_interval is None:
+        try:
+            return InotifyWatcher(root, exclude)
+        except OSError as e:
+            print(f"inotify is not available ({e}), polling for changes instead")
+            poll_interval = 2.0
+    return PollingWatcher(root, exclude, poll_interval)
+
+
+class _ProcessedFiles:
+    """The signatures of the files processed last, so events that change nothing are skipped."""
+
+    def __init__(self, max_files: int = MAX_REMEMBERED_FILES):
+        self.max_files = max_files
+        self._signatures: OrderedDict[str, FileSignature | None] = OrderedDict()
+
+    def is_changed(self, path: str, signature: FileSignature | None) -> bool:
+        """Check if a file changed since it was processed, remembering it if it did."""
+        if self._signatures.get(path) == signature:
+            return False
+        self._signatures[path] = signature
+        self._signatures.move_to_end(path)
+        if len(self._signatures) > self.max_files:
+            self._signatures.popitem(last=False)
+        return True
+
+    def forget(self, path: str) -> None:
+        """Forget a file that was removed."""
+        self._signatures.pop(path, None)
+
+
+class Debouncer:
+    """Hold back files until they have stopped changing."""
+
+    def __init__(self, settle_seconds: float = 1.0):
+        """Initialize the debouncer.
+
+        Args:
+            settle_seconds: How long the size and modification time of a file must stay the same
+                before it is considered completely written
+        """
+        self.settle_seconds = settle_seconds
+        self._pending: dict[str, tuple[float, FileSignature | None]] = {}
+
+    def touch(self, path: str, now: float | None = None) -> None:
+        """Record that a file has changed."""
+        now = time.monotonic() if now is None else now
+        self._pending[path] = (now, _signature(path))
+
+    def ready(self, now: float | None = None) -> list[str]:
+        """Get the files that have not changed for the settle time, and stop tracking them."""
+        now = time.monotonic() if now is None else now
+        ready = []
+        for path, (changed_at, signature) in list(self._pending.items()):
+            if now - changed_at < self.settle_seconds:
+                continue
+            current = _signature(path)
+            if current is None:
+                # Removed before it settled, like a temporary file that was renamed
+                del self._pending[path]
+            elif current != signature:
+                # Changed without an event being seen, e.g. by a writer on another machine
+                self._pending[path] = (now, current)
+            else:
+                del self._pending[path]
+                ready.append(path)
+        return sorted(ready)
+
+    def __len__(self) -> int:
+        """Get the number of files held back."""
+        return len(self._pending)
+
+
+def watch_directory(
+    input_root: str,
+    process: Callable[[str], None],
+    options: WatchOptions = DEFAULT_WATCH_OPTIONS,
+    stop: threading.Event | None = None,
+) -> None:
+    """Process XML files as they land in a directory tree, until `stop` is set.
+
+    The signatures of the files processed last are remembered, so a file is not processed again
+    for an event that did not change it. Removed files are forgotten.
+
+    Args:
+        input_root: Directory tree to watch
+        process: Called with the path of every new or changed XML file, on a worker thread
+        options: Which directory to ignore, the number of worker threads, and how to find changes
+        stop: Set to stop watching, once the files being processed are finished
+    """
+    stop = threading.Event() if stop is None else stop
+    output_dir = options.output_dir
+    settle_seconds = options.settle_seconds
+    watcher = create_watcher(input_root, output_dir, options.poll_interval)
+    debouncer = Debouncer(settle_seconds)
+    processed = _ProcessedFiles()
+    running: dict[str, Future[None]] = {}
+
+    def report(xml_file: str, future: Future[None]) -> None:
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to anonymize {xml_file}: {error!r}")
+
+    try:
+        with ThreadPoolExecutor(options.threads) as executor:
+            while not stop.is_set():
+                for path in watcher.poll(min(settle_seconds, 0.5)):
+                    if not is_input_file(path, output_dir):
+                        continue
+                    if _signature(path) is None:
+                        processed.forget(path)
+                    else:
+                        debouncer.touch(path)
+                for xml_file in debouncer.ready():
+                    signature = _signature(xml_file)
+                    if xml_file in running:
+                        # Changed while being processed, so check it again once it is finished
+                        debouncer.touch(xml_file)
+                        continue
+                    if not processed.is_changed(xml_file, signature):
+                        continue
+                    future = executor.submit(process, xml_file)
+                    future.add_done_callback(lambda f, path=xml_file: report(path, f))
+                    running[xml_file] = future
+                running = {path: f for path, f in running.items() if not f.done()}
+    finally:
+        watcher.close()
+
+
+class _FileProcessor:
+    """Anonymize the files that land, keeping the manifest of incremental mode up to date."""
+
+    def __init__(self, args: Namespace, input_root: str):
+        self.args = args
+        self.input_root = input_root
+        self.anonymizer = create_anonymizer(args)
+        self.parser = Parser(custom_config_path=args.config)
+        self.manifest = None
+        self.config_hash = ""
+        if args.incremental:
+            manifest_dir = args.output_dir or input_root
+            self.manifest = Manifest(os.path.join(manifest_dir, manifest_file_name()))
+            self.config_hash = output_options_hash(args, self.parser)
+        self._manifest_lock = threading.Lock()
+        self._last_save = time.monotonic()
+
+    def __call__(self, xml_file: str) -> None:
+        """Anonymize a file unless it is unchanged, quarantining it if it fails and can be."""
+        args = self.args
+        output_file = get_output_path(xml_file, self.input_root, args.output_dir, args.compress)
+        unchanged, input_hash = check_unchanged(
+            self.manifest, xml_file, self.input_root, self.config_hash, output_file
+        )
+        if unchanged:
+            return
+        try:
+            anonymize_and_save(args, xml_file, output_file, self.anonymizer, self.parser)
+        except Exception as e:
+            if args.quarantine_dir is None:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+            quarantine_file(xml_file, self.input_root, args.quarantine_dir, reason)
+            print(f"Could not anonymize file {xml_file}, quarantined it: {reason}")
+            return
+        if self.manifest is None or input_hash is None:
+            return
+        # The manifest is saved every few seconds, so a crash only loses the latest files
+        with self._manifest_lock:
+            key = os.path.relpath(xml_file, self.input_root)
+            self.manifest.record(key, input_hash, self.config_hash, output_file)
+            if time.monotonic() - self._last_save >= MANIFEST_SAVE_INTERVAL:
+                self.manifest.save()
+                self._last_save = time.monotonic()
+
+    def close(self) -> None:
+        """Save the manifest and release the replacements."""
+        if self.manifest is not None:
+            with self._manifest_lock:
+                self.manifest.save()
+        if self.args.max_mappings is not None:
+            print(self.anonymizer.mappings.report())
+        self.anonymizer.mappings.close()
+
+
+def watch(args: Namespace) -> None:
+    """Anonymize files as they land in the input directory, until interrupted."""
+    input_root = args.input_location
+    if not os.path.isdir(input_root):
+        print(f"The input location must be a directory to watch: {input_root}")
+        return
+    if args.workers is not None:
+        print("Files are anonymized by --threads threads when watching, --workers is not supported")
+        return
+    processor = _FileProcessor(args, input_root)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    print(f"Watching directory: {input_root}")
+    try:
+        watch_directory(input_root, processor, WatchOptions.from_args(args), stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        processor.close()
+    print("Stopped watching")
@@ -0,0 +1,307 @@
+"""Anonymize files in worker processes that are replaced when they hang, grow or get old.
+
+A pathological document, like one with a giant narrative, can make anonymizing it take very long
+or use a lot of memory. With threads it stalls the whole run, as threads cannot be stopped. Here
+every file is anonymized by a worker process, one file at a time, and the pool:
+- kills a worker that takes longer than the timeout on one file, or that uses more memory than
+  the cap, and starts a new one;
+- replaces a worker after a number of files, so memory that is never given back to the system
+  does not add up over a long batch.
+
+Files that fail are reported back instead of stopping the pool, so the caller can quarantine
+them and go on with the next files.
+
+Every worker has its own `Anonymizer`, so without keyed mode the same value can get different
+replacements in files anonymized by different workers.
+"""
+
+import multiprocessing
+import os
+import time
+from argparse import Namespace
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+
+# How often running files are checked against the timeout and the memory cap, in seconds
+POLL_INTERVAL = 0.2
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class InvalidPoolLimit(ValueError):
+    """Exception raised when a limit of a pool would keep it from anonymizing any file."""
+
+    def __init__(self, name: str, value: float):
+        """Initialize the exception with the limit and its value."""
+        super().__init__(f"{name} of a worker pool must be at least 1, got: {value}")
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """How many worker processes there are, and when they are replaced."""
+
+    workers: int
+    # Maximum time a worker may take to anonymize one file, in seconds
+    file_timeout: float | None = None
+    # Maximum resident memory of a worker, in bytes
+    max_worker_memory: int | None = None
+    # Number of files a worker anonymizes before it is replaced
+    max_files_per_worker: int | None = None
+
+    def __post_init__(self):
+        """Check that the pool can anonymize files at all."""
+        for name in ("workers", "max_files_per_worker"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise InvalidPoolLimit(name, value)
+
+    @classmethod
+    def from_args(cls, args: Namespace) -> "PoolLimits":
+        """Get the limits given on the command line."""
+        max_memory = args.max_worker_memory
+        return cls(
+            args.workers,
+            args.file_timeout,
+            None if max_memory is None else max_memory * 1024 * 1024,
+            args.max_files_per_worker,
+        )
+
+
+@dataclass
+class FileResult:
+    """The outcome of anonymizing one file in a worker."""
+
+    xml_file: str
+    output_file: str
+    # Why the file could not be anonymized, None if it was
+    error: str | None = None
+
+
+def resident_memory(pid: int) -> int | None:
+    """Get the resident memory of a process in bytes, or None where it cannot be read."""
+    try:
+        with open(f"/proc/{pid}/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _worker_main(connection: Connection, args: Namespace) -> None:
+    """Anonymize the chunks of files sent over the connection until None is sent.
+
+    The result of every file is sent back as soon as it is anonymized.
+    """
+    # Imported here, as this module is imported by `anonymize_eicr`
+    from eicr_anonymization.anonymize_eicr import (  # noqa: PLC0415
+        anonymize_and_save,
+        create_anonymizer,
+    )
+    from eicr_anonymization.element_parser import Parser  # noqa: PLC0415
+
+    anonymizer = create_anonymizer(args)
+    parser = Parser(custom_config_path=args.config)
+    try:
+        while (chunk := connection.recv()) is not None:
+            for xml_file, output_file in chunk:
+                try:
+                    anonymize_and_save(args, xml_file, output_file, anonymizer, parser)
+                except Exception as e:
+                    connection.send(f"{type(e).__name__}: {e}")
+                else:
+                    connection.send(None)
+    finally:
+        anonymizer.mappings.close()
+
+
+class _Worker:
+    """A worker process and the chunk of files it is anonymizing."""
+
+    def __init__(self, args: Namespace):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process: BaseProcess = multiprocessing.Process(
+            target=_worker_main, args=(child_connection, args), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.files = 0
+        # The file being anonymized first, then the rest of the chunk
+        self.chunk: deque[tuple[str, str]] = deque()
+        self.started = 0.0
+
+    def send(self, chunk: list[tuple[str, str]]) -> None:
+        self.chunk.extend(chunk)
+        self.started = time.monotonic()
+        self.connection.send(chunk)
+
+    def finish_file(self) -> tuple[str, str]:
+        """Take the file being anonymized off the chunk, and start timing the next one."""
+        self.files += 1
+        self.started = time.monotonic()
+        return self.chunk.popleft()
+
+    def stop(self) -> None:
+        """Let the worker finish and exit."""
+        with suppress(OSError):
+            self.connection.send(None)
+        self.process.join(5)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class WorkerPool:
+    """Worker processes anonymizing files one at a time, within the limits of `PoolLimits`."""
+
+    def __init__(self, args: Namespace, limits: PoolLimits):
+        """Initialize the pool, the workers are started once files are anonymized.
+
+        Args:
+            args: Command-line arguments the workers anonymize and save files with
+            limits: Number of workers, and when they are replaced
+        """
+        self.args = args
+        self.limits = limits
+        self.workers_started = 0
+
+    def _start_worker(self) -> _Worker:
+        self.workers_started += 1
+        return _Worker(self.args)
+
+    def _send(
+        self,
+        worker: _Worker,
+        chunk: list[tuple[str, str]],
+        returned: deque[list[tuple[str, str]]],
+    ) -> None:
+        """Send a chunk to a worker, up to the number of files it may still anonymize.
+
+        The rest of the chunk is sent to the next free worker, as this one is replaced after its
+        last file.
+        """
+        max_files = self.limits.max_files_per_worker
+        if max_files is not None and len(chunk) > max_files - worker.files:
+            remaining = max_files - worker.files
+            returned.appendleft(chunk[remaining:])
+            chunk = chunk[:remaining]
+        worker.send(chunk)
+
+    def _is_worn_out(self, worker: _Worker) -> bool:
+        limits = self.limits
+        if limits.max_files_per_worker is not None and worker.files >= limits.max_files_per_worker:
+            return True
+        if limits.max_worker_memory is not None:
+            memory = resident_memory(worker.process.pid or 0)
+            return memory is not None and memory > limits.max_worker_memory
+        return False
+
+    def _check_limits(self, worker: _Worker, now: float) -> str | None:
+        """Get why a busy worker must be stopped, or None if it is within the limits."""
+        limits = self.limits
+        if limits.file_timeout is not None and now - worker.started > limits.file_timeout:
+            return f"Timed out after {limits.file_timeout:g} seconds"
+        if limits.max_worker_memory is not None:
+            memory = resident_memory(worker.process.pid or 0)
+            if memory is not None and memory > limits.max_worker_memory:
+                return f"Used {memory // (1024 * 1024)} MiB of memory"
+        return None
+
+    def run(self, chunks: Iterable[list[tuple[str, str]]]) -> Iterator[FileResult]:
+        """Anonymize files, yielding the result of every file as it finishes.
+
+        Every chunk is sent to one worker at once, which saves a round trip per file when files
+        are small, see `scheduling.chunk_jobs`. If a worker is killed, the files it had not started
+        yet are sent to another worker.
+
+        Args:
+            chunks: Paths of the files to anonymize, with the paths to save them to
+
+        Yields:
+            The result of every file, in the order they finish
+
+        """
+        chunks = iter(chunks)
+        returned: deque[list[tuple[str, str]]] = deque()
+        idle = [self._start_worker() for _ in range(self.limits.workers)]
+        busy: dict[Connection, _Worker] = {}
+        try:
+            while True:
+                while idle and (chunk := returned.popleft() if returned else next(chunks, None)):
+                    worker = idle.pop()
+                    self._send(worker, chunk, returned)
+                    busy[worker.connection] = worker
+                if not busy:
+                    return
+
+                results = [
+                    self._receive(busy[connection], busy, idle, returned)  # type: ignore[index]
+                    for connection in wait(list(busy), POLL_INTERVAL)
+                ]
+
+                now = time.monotonic()
+                for worker in list(busy.values()):
+                    # Files finished since the wait are not held against the worker
+                    while busy.get(worker.connection) is worker and worker.connection.poll():
+                        results.append(self._receive(worker, busy, idle, returned))
+                    if busy.get(worker.connection) is not worker:
+                        continue
+                    reason = self._check_limits(worker, now)
+                    if reason is not None:
+                        results.append(FileResult(*worker.finish_file(), reason))
+                        self._replace(worker, busy, idle, returned)
+
+                yield from results
+        finally:
+            for worker in idle:
+                worker.stop()
+            for worker in busy.values():
+                worker.kill()
+
+    def _receive(
+        self,
+        worker: _Worker,
+        busy: dict[Connection, _Worker],
+        idle: list[_Worker],
+        returned: deque[list[tuple[str, str]]],
+    ) -> FileResult:
+        """Receive the result of the file a worker finished, freeing it once its chunk is done."""
+        try:
+            error = worker.connection.recv()
+        except (EOFError, OSError):
+            # The worker died, like when it is killed by the system for lack of memory
+            worker.process.join(1)
+            result = FileResult(
+                *worker.finish_file(), f"Worker exited with code {worker.process.exitcode}"
+            )
+            self._replace(worker, busy, idle, returned)
+            return result
+        result = FileResult(*worker.finish_file(), error)
+        if not worker.chunk:
+            del busy[worker.connection]
+            if self._is_worn_out(worker):
+                worker.stop()
+                idle.append(self._start_worker())
+            else:
+                idle.append(worker)
+        return result
+
+    def _replace(
+        self,
+        worker: _Worker,
+        busy: dict[Connection, _Worker],
+        idle: list[_Worker],
+        returned: deque[list[tuple[str, str]]],
+    ) -> None:
+        """Kill a busy worker and start another, sending the files it had not started to others."""
+        del busy[worker.connection]
+        worker.kill()
+        if worker.chunk:
+            returned.append(list(worker.chunk))
+        idle.append(self._start_worker())
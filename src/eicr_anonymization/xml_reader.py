@@ -0,0 +1,205 @@
+"""Read XML documents with a hardened lxml parser that is reused across documents.
+
+Every thread keeps one `XMLParser` per set of options, instead of configuring a parser for every
+document. lxml parsers must not be shared between threads, so each worker thread gets its own.
+
+The parsers never resolve entities, load DTDs or access the network, so a document cannot pull in
+other files or expand entities into huge text. libxml2's limits on the depth of the tree and the
+size of text nodes stay on unless `huge_tree` is asked for, so adversarial nesting fails at once.
+Documents can also be limited in size and in number of elements, so pathological inputs fail
+fast with a `DocumentTooLargeError` instead of stalling a worker. Both limits are checked while the
+document is read, before the rest of it is parsed.
+"""
+
+import os
+import threading
+from argparse import Namespace
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO
+
+from lxml import etree
+from lxml.etree import _ElementTree
+
+from eicr_anonymization.file_io import get_compression, open_input
+
+
+class DocumentTooLargeError(ValueError):
+    """A document is larger than the limits it is read with."""
+
+    def __init__(self, name: str, unit: str, maximum: int, size: int | None = None):
+        """Initialize the exception with the limit the document is over.
+
+        Args:
+            name: Name of the document
+            unit: What the limit counts, "bytes" or "elements"
+            maximum: The limit
+            size: Size of the document in the unit, None if it was not read to the end
+        """
+        self.name = name
+        self.unit = unit
+        self.maximum = maximum
+        self.size = size
+        if size is None:
+            super().__init__(f"{name} has more than the maximum of {maximum} {unit}")
+        else:
+            super().__init__(f"{name} has {size} {unit}, more than the maximum of {maximum} {unit}")
+
+
+@dataclass(frozen=True)
+class ReadOptions:
+    """How documents are parsed, and the limits they must be within."""
+
+    # Lift libxml2's limits on the depth of the tree and the size of text nodes
+    huge_tree: bool = False
+    # Drop whitespace-only text between elements, so pretty printing can re-indent all of it
+    remove_blank_text: bool = False
+    # Maximum size of a document in bytes, after decompression
+    max_size: int | None = None
+    # Maximum number of elements in a document
+    max_nodes: int | None = None
+
+    @classmethod
+    def from_args(cls, args: Namespace) -> "ReadOptions":
+        """Get the options given on the command line."""
+        return cls(args.huge_tree, args.remove_blank_text, args.max_document_size, args.max_nodes)
+
+
+DEFAULT_READ_OPTIONS = ReadOptions()
+
+_local = threading.local()
+# Bytes fed to the parser at once when elements are counted while parsing
+_CHUNK_SIZE = 64 * 1024
+
+
+def get_xml_parser(options: ReadOptions = DEFAULT_READ_OPTIONS) -> etree.XMLParser:
+    """Get the parser of the current thread for the options, creating it the first time.
+
+    Args:
+        options: How documents are parsed
+
+    Returns:
+        The parser, which must only be used by the current thread
+
+    """
+    parsers: dict[ReadOptions, etree.XMLParser] | None = getattr(_local, "parsers", None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    parser = parsers.get(options)
+    if parser is None:
+        parser = parsers[options] = etree.XMLParser(
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=options.huge_tree,
+            remove_blank_text=options.remove_blank_text,
+            # IDs are never looked up, so there is no need to index them
+            collect_ids=False,
+        )
+    return parser
+
+
+class _LimitedReader:
+    """Reads a stream for lxml, failing as soon as more than a maximum size has been read."""
+
+    def __init__(self, stream: BinaryIO, max_size: int, name: str):
+        self.stream = stream
+        self.max_size = max_size
+        self.name = name
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise DocumentTooLargeError(self.name, "bytes", self.max_size)
+        return data
+
+
+def _parse_counting_nodes(
+    stream: BinaryIO, options: ReadOptions, max_nodes: int, name: str
+) -> _ElementTree:
+    """Parse a document in chunks, failing as soon as it has more than `max_nodes` elements.
+
+    Elements are counted as they are parsed, so the rest of a document over the limit is never read
+    or built. The pull parser this needs is created for every document.
+    """
+    parser = etree.XMLPullParser(
+        events=("start",),
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        huge_tree=options.huge_tree,
+        remove_blank_text=options.remove_blank_text,
+        collect_ids=False,
+    )
+    nodes = 0
+
+    def count_nodes() -> None:
+        nonlocal nodes
+        for _ in parser.read_events():
+            nodes += 1
+            if nodes > max_nodes:
+                raise DocumentTooLargeError(name, "elements", max_nodes)
+
+    while chunk := stream.read(_CHUNK_SIZE):
+        parser.feed(chunk)
+        count_nodes()
+    root = parser.close()
+    count_nodes()
+    return root.getroottree()
+
+
+def read_xml(path: str, options: ReadOptions = DEFAULT_READ_OPTIONS) -> _ElementTree:
+    """Parse an XML file, decompressing it while it is read if it is compressed.
+
+    Args:
+        path: Path to the file
+        options: How the file is parsed, and the limits it must be within
+
+    Returns:
+        The parsed document
+
+    Raises:
+        DocumentTooLargeError: The file is larger than the limits
+        etree.XMLSyntaxError: The file is not well-formed XML, or is beyond libxml2's limits
+
+    """
+    compressed = get_compression(path) is not None
+    if options.max_size is not None and not compressed:
+        size = os.path.getsize(path)
+        if size > options.max_size:
+            raise DocumentTooLargeError(path, "bytes", options.max_size, size)
+    if not compressed and options.max_nodes is None:
+        # lxml reads files by name without going through Python, which is faster
+        return etree.parse(path, get_xml_parser(options))
+    with open_input(path) as f:
+        stream = f if options.max_size is None else _LimitedReader(f, options.max_size, path)
+        if options.max_nodes is not None:
+            return _parse_counting_nodes(stream, options, options.max_nodes, path)
+        return etree.parse(stream, get_xml_parser(options))
+
+
+def parse_xml(
+    data: bytes, name: str = "document", options: ReadOptions = DEFAULT_READ_OPTIONS
+) -> _ElementTree:
+    """Parse an XML document held in memory.
+
+    Args:
+        data: The document
+        name: Name of the document, used in errors
+        options: How the document is parsed, and the limits it must be within
+
+    Returns:
+        The parsed document
+
+    Raises:
+        DocumentTooLargeError: The document is larger than the limits
+        etree.XMLSyntaxError: The document is not well-formed XML, or is beyond libxml2's limits
+
+    """
+    if options.max_size is not None and len(data) > options.max_size:
+        raise DocumentTooLargeError(name, "bytes", options.max_size, len(data))
+    if options.max_nodes is not None:
+        return _parse_counting_nodes(BytesIO(data), options, options.max_nodes, name)
+    return etree.parse(BytesIO(data), get_xml_parser(options))
@@ -0,0 +1,116 @@
+"""Unit tests for the street address parser."""
+
+import random
+
+import pytest
+import usaddress
+
+from eicr_anonymization.address_parser import StreetAddressParser
+from eicr_anonymization.data_pools import load_default_pool
+
+# Pools the names of generated streets are drawn from, like the anonymizer does
+NAME_POOLS = [
+    "street_names.yaml",
+    "numeric_street_names.yaml",
+    "city_names.yaml",
+    "county_names.yaml",
+    "state_names.yaml",
+]
+COMMON_TYPES = ["St", "Ave", "Rd", "Dr", "Blvd", "Ln", "Ct", "Way", "Pl", "Street", "Drive"]
+
+
+@pytest.fixture(scope="module")
+def street_types():
+    """Street types as used by the anonymizer."""
+    return load_default_pool("street_types.yaml")
+
+
+@pytest.fixture(scope="module")
+def street_names():
+    """Names from the pools replacement street and city names are drawn from."""
+    return [entry["value"] for pool in NAME_POOLS for entry in load_default_pool(pool)]
+
+
+def _chance(rng: random.Random, probability: float) -> bool:
+    return rng.random() < probability
+
+
+def _random_address(rng: random.Random, street_types: list[dict], street_names: list[str]) -> str:
+    """Generate a street address line, mostly of the common shapes but with every street type."""
+    if _chance(rng, 0.1):
+        box_type = rng.choice(["PO", "P.O.", "po", "Box"])
+        return f"{box_type} {rng.choice(['Box', 'BOX'])} {rng.randint(1, 9999)}"
+
+    all_types = [
+        word
+        for street_type in street_types
+        for word in [street_type["value"], *street_type.get("abbreviations", [])]
+    ]
+    parts = [str(rng.randint(1, 99999))]
+    if _chance(rng, 0.15):
+        parts.append(rng.choice(["N", "S", "E", "W", "NE", "SW", "North", "East"]))
+    parts.append(rng.choice(street_names))
+    if _chance(rng, 0.3):
+        parts.append(rng.choice(street_names))
+    street_type = rng.choice(COMMON_TYPES) if _chance(rng, 0.5) else rng.choice(all_types)
+    parts.append(street_type + ("." if _chance(rng, 0.15) else ""))
+    if _chance(rng, 0.15):
+        parts.append(rng.choice(["N", "S", "E", "W", "NW", "SE"]))
+    if _chance(rng, 0.25):
+        parts += [rng.choice(["Apt", "Unit", "Suite", "Ste", "#"]), rng.choice(["12", "B", "4C"])]
+    separator = "\n    " if _chance(rng, 0.05) else " "
+    address = separator.join(parts)
+    return address.upper() if _chance(rng, 0.3) else address
+
+
+def test_fast_path_matches_usaddress(street_types, street_names):
+    """Test that every line taken by the fast path is parsed exactly like usaddress does."""
+    parser = StreetAddressParser(street_types)
+    rng = random.Random(0)
+
+    for _ in range(20000):
+        address = _random_address(rng, street_types, street_names)
+        components = parser.parse_fast(address)
+        if components is not None:
+            assert components == usaddress.parse(address), address
+
+
+def test_fast_path_hit_rate(street_types):
+    """Test that most lines of the common shapes are taken by the fast path."""
+    parser = StreetAddressParser(street_types)
+
+    for address in [
+        "123 Main St",
+        "PO Box 45",
+        "456 Oak Ave Apt 7",
+        "12 N Main St",
+        "12 Main St NW",
+        "77 Martin Luther King Blvd",
+        "5 ELM STREET SUITE 200",
+        "9 Broadway",
+        "1 Main St, Apt 7",
+    ]:
+        assert parser.parse(address) == usaddress.parse(address)
+
+    assert parser.fast_path_hits == 7  # noqa: PLR2004
+    assert parser.fallbacks == 2  # noqa: PLR2004
+    assert parser.report() == "Street address lines parsed by the fast path: 7 of 9 (77.8%)"
+
+
+def test_ambiguous_lines_fall_back(street_types):
+    """Test that lines usaddress labels differently from their shape are left to usaddress."""
+    parser = StreetAddressParser(street_types)
+
+    for address in [
+        "123 Park Ave",  # Street name that is also a street type
+        "61 South Way",  # Direction that usaddress reads as the street name
+        "37 Birch Grove",  # Rare street type
+        "7777 Health Authority\n Drive",  # usaddress keeps line breaks in the tokens
+        "45974 County Ter",  # Words usaddress reads as the type of the street when first
+        "11894 STATE AV.",
+        "36465 Refinery Cloud City Boul.",  # Name of a place, and a rare spelling of a type
+        "23007 Old Highwy W",
+        "42383 Republica Boulevard. W",  # Direction after a type with a period
+        "12 Main St E",  # "E" that usaddress sometimes reads as a unit
+    ]:
+        assert parser.parse_fast(address) is None, address
@@ -1,8 +1,21 @@
 """Unit tests for the eicr_anonymization module."""
+
+import gzip
+import shutil
+from io import BytesIO
+
 import pytest
 from lxml import etree
 
-from eicr_anonymization.anonymize_eicr import anonymize_eicr_file
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import (
+    anonymize,
+    anonymize_eicr_file,
+    discover_xml_files,
+    get_output_path,
+    write_xml_tree,
+    xml_tree_to_str,
+)
 from eicr_anonymization.anonymizer import Anonymizer
 from eicr_anonymization.element_parser import Parser
 
@@ -17,3 +30,128 @@ def test_anonymize_eicr_file_empty_file():
     xml_file = "tests/unit/test_data/empty.xml"
     with pytest.raises(etree.XMLSyntaxError):
         anonymize_eicr_file(xml_file, anonymizer, parser)
+
+
+def test_discover_xml_files_skips_outputs(tmp_path):
+    """Test that previously anonymized files and the output directory are not discovered."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "output").mkdir()
+    for file_name in [
+        "eicr.xml",
+        "eicr.xml.anonymized.xml",
+        "archived.xml.gz",
+        "archived.xml.anonymized.xml.gz",
+        "nested/rr.xml",
+        "output/eicr.xml",
+        "notes.txt",
+    ]:
+        (tmp_path / file_name).write_text("<ClinicalDocument/>")
+
+    xml_files = discover_xml_files(str(tmp_path), str(tmp_path / "output"))
+
+    assert xml_files == [
+        str(tmp_path / "archived.xml.gz"),
+        str(tmp_path / "eicr.xml"),
+        str(tmp_path / "nested" / "rr.xml"),
+    ]
+
+
+def test_get_output_path_mirrors_input_tree():
+    """Test that the output directory mirrors the layout of the input directory."""
+    assert get_output_path("in/a/eicr.xml", "in") == "in/a/eicr.xml.anonymized.xml"
+    assert get_output_path("in/a/eicr.xml", "in", "out") == "out/a/eicr.xml.anonymized.xml"
+
+
+def test_get_output_path_compression():
+    """Test that the compression extension of the output follows the output compression."""
+    assert get_output_path("in/eicr.xml.gz", "in") == "in/eicr.xml.anonymized.xml"
+    assert get_output_path("in/eicr.xml", "in", "out", "zstd") == "out/eicr.xml.anonymized.xml.zst"
+
+
+def test_anonymize_eicr_file_compressed(tmp_path):
+    """Test that a gzip compressed file is decompressed while it is read."""
+    xml_file = tmp_path / "CDA_RR.xml.gz"
+    with open("tests/test_data/yoda-zika-v1-positive/CDA_RR.xml", "rb") as f:
+        xml_file.write_bytes(gzip.compress(f.read()))
+
+    tree = anonymize_eicr_file(str(xml_file), Anonymizer(), Parser())
+
+    assert tree.getroot().tag == "{urn:hl7-org:v3}ClinicalDocument"
+
+
+def test_anonymize_eicr_file_reports_skipped_elements(capsys):
+    """Test that the skipped elements of a file are printed, none with the shipped config."""
+    xml_file = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+    anonymize_eicr_file(xml_file, Anonymizer(), Parser())
+
+    assert f"skipped 0 elements in safe subtrees, in file: {xml_file}" in capsys.readouterr().out
+
+
+def test_write_xml_tree_matches_string_output():
+    """Test that writing to a binary stream produces the same document as `xml_tree_to_str`."""
+    tree = etree.parse("tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml", None)
+    stream = BytesIO()
+
+    write_xml_tree(tree, stream)
+
+    assert stream.getvalue() == xml_tree_to_str(tree).encode("utf-8")
+
+
+def test_write_xml_tree_preserve_declaration():
+    """Test that the original XML declaration and encoding are kept."""
+    tree = etree.ElementTree(
+        etree.fromstring(
+            '<?xml version="1.0" encoding="ISO-8859-1" standalone="yes"?>\n<a>\xe9</a>'.encode(
+                "iso-8859-1"
+            )
+        )
+    )
+    stream = BytesIO()
+
+    write_xml_tree(tree, stream, pretty_print=False, preserve_declaration=True)
+
+    assert stream.getvalue() == (
+        b"<?xml version='1.0' encoding='ISO-8859-1' standalone='yes'?>\n<a>\xe9</a>"
+    )
+
+
+def test_anonymize_threads_match_single_thread(tmp_path):
+    """Test that anonymizing files with a thread pool gives the same output as a single thread."""
+    key_file = tmp_path / "secret.key"
+    key_file.write_bytes(b"0123456789abcdef")
+    outputs = {}
+    for threads in ("1", "4"):
+        input_dir = tmp_path / f"input-{threads}"
+        # Only the RR, the eICR has a time that cannot be parsed and is replaced relative to now
+        for copy in range(6):
+            (input_dir / str(copy)).mkdir(parents=True)
+            shutil.copy("tests/test_data/yoda-zika-v1-positive/CDA_RR.xml", input_dir / str(copy))
+        output_dir = tmp_path / f"output-{threads}"
+
+        anonymize(
+            _parse_arguments(
+                ["-t", threads, "-k", str(key_file), "-o", str(output_dir), str(input_dir)]
+            )
+        )
+
+        outputs[threads] = {
+            path.relative_to(output_dir): path.read_bytes() for path in output_dir.rglob("*.xml")
+        }
+
+    assert len(outputs["1"]) == 6  # noqa: PLR2004
+    assert outputs["1"] == outputs["4"]
+
+
+def test_parser_keeps_no_document_state():
+    """Test that collecting from one document does not affect the results of the next."""
+    parser = Parser()
+    eicr = etree.parse("tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml", None).getroot()
+    rr = etree.parse("tests/test_data/yoda-zika-v1-positive/CDA_RR.xml", None).getroot()
+
+    sensitive_elements, safe_text = parser.collect_sensitive_elements_and_safe_words(eicr)
+    parser.collect_sensitive_elements_and_safe_words(rr)
+    again = parser.collect_sensitive_elements_and_safe_words(eicr)
+
+    assert [repr(e) for e in sensitive_elements] == [repr(e) for e in again[0]]
+    assert safe_text == again[1]
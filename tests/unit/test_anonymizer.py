@@ -144,3 +144,56 @@ def test_anonymize_streetAddressLine_USPSBoxID_value():
     assert len(anonymized_po_box_number) == len(po_box_number), (
         "PO Box number should have the same number of digits"
     )
+
+
+class TestKeyedMode:
+    """Unit tests for keyed mode."""
+
+    KEY = b"0123456789abcdef"
+
+    def _anonymize_all(self, anonymizer: Anonymizer) -> list[str | None]:
+        """Anonymize one value of every keyed data type."""
+        _id = etree.Element("id", attrib={"extension": "A12345678"})
+        _telecom = etree.Element("telecom", attrib={"value": "mailto:someone@example.org"})
+        _address = etree.Element("streetAddressLine")
+        _address.text = "123 Main St"
+        _organization = etree.Element("name")
+        _organization.text = "General Hospital"
+        return [
+            anonymizer.anonymize_II_value(Element(_id, "II")),
+            anonymizer.anonymize_TEL_value(Element(_telecom, "TEL")),
+            anonymizer.anonymize_streetAddressLine_value(Element(_address, "ADXP")),
+            anonymizer.anonymize_EN_value(Element(_organization, "ON")),
+            anonymizer.replace_from_pool("Skywalker", "family"),
+            anonymizer.replace_with_like_chars("12345", "postalCode"),
+            str(anonymizer.time_offset),
+        ]
+
+    def test_same_key_same_replacements(self):
+        """Test that independent anonymizers with the same key agree on every replacement."""
+        first = Anonymizer(key=self.KEY)
+        # Consume the global random generator between the two, which keyed mode must not use
+        random.random()
+        second = Anonymizer(key=self.KEY)
+
+        assert self._anonymize_all(first) == self._anonymize_all(second)
+
+    def test_different_key_different_replacements(self):
+        """Test that a different key gives different replacements."""
+        first = self._anonymize_all(Anonymizer(key=self.KEY))
+        second = self._anonymize_all(Anonymizer(key=b"fedcba9876543210"))
+
+        assert all(a != b for a, b in zip(first, second, strict=True))
+
+    def test_consistent_across_formatting_without_mappings(self):
+        """Test that values that only differ in formatting get the same replacement."""
+        anonymizer = Anonymizer(key=self.KEY)
+
+        replacement = anonymizer.replace_from_pool("Skywalker", "family")
+        assert replacement.upper() == anonymizer.replace_from_pool("SKYWALKER", "family")
+        assert len(anonymizer.mappings) == 0, "Keyed mode should not store any mappings"
+
+    def test_short_key(self):
+        """Test that short keys are rejected."""
+        with pytest.raises(ValueError, match="at least 16 bytes"):
+            Anonymizer(key=b"short")
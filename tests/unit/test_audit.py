@@ -0,0 +1,56 @@
+"""Unit tests for the audit module."""
+
+import csv
+import gzip
+import json
+import shutil
+from io import StringIO
+
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import anonymize, anonymize_eicr_file
+from eicr_anonymization.anonymizer import Anonymizer, DebugOptions
+from eicr_anonymization.audit import AUDIT_FIELDS, AuditLog, get_audit_format
+from eicr_anonymization.element_parser import Parser
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def test_records_are_streamed_as_replacements_are_made():
+    """Test that every replacement is written as a JSON line with its location and values."""
+    stream = StringIO()
+    audit = AuditLog(stream)
+
+    anonymize_eicr_file(RR_FILE, Anonymizer(DebugOptions(seed=1)), Parser(), audit)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == audit.records > 0
+    assert all(tuple(record) == AUDIT_FIELDS for record in records)
+    family = next(record for record in records if record["tag"] == "family")
+    assert family["file"] == RR_FILE
+    assert family["type"] == "ENXP"
+    assert family["path"].startswith("/*/")
+    assert family["original"] != family["replacement"]
+
+
+def test_audit_log_file(tmp_path):
+    """Test that debug mode writes a compressed CSV audit log when asked to."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(RR_FILE, input_dir)
+    audit_path = tmp_path / "audit.csv.gz"
+
+    anonymize(_parse_arguments(["debug", "--audit-log", str(audit_path), str(input_dir)]))
+
+    with gzip.open(audit_path, "rt", newline="") as f:
+        records = list(csv.DictReader(f))
+    assert records
+    assert tuple(records[0]) == AUDIT_FIELDS
+    assert {record["file"] for record in records} == {str(input_dir / "CDA_RR.xml")}
+
+
+def test_get_audit_format():
+    """Test that the format of the audit log is taken from its extension."""
+    assert get_audit_format("audit.csv") == "csv"
+    assert get_audit_format("audit.CSV.zst") == "csv"
+    assert get_audit_format("audit.jsonl.gz") == "jsonl"
+    assert get_audit_format("audit.log") == "jsonl"
@@ -0,0 +1,163 @@
+"""Unit tests for anonymizing archives and multi-document streams."""
+
+import json
+import tarfile
+import zipfile
+from io import BytesIO, StringIO
+
+import pytest
+
+from eicr_anonymization.anonymizer import Anonymizer
+from eicr_anonymization.audit import AuditLog
+from eicr_anonymization.bundles import (
+    BundleOptions,
+    anonymize_bundle,
+    get_bundle_output_path,
+    read_document_stream,
+    write_document_stream,
+)
+from eicr_anonymization.element_parser import Parser
+
+EICR = "tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml"
+RR = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_get_bundle_output_path():
+    """Test that `.anonymized` is inserted before the archive extension."""
+    assert get_bundle_output_path("in/bundle.tar.gz") == "in/bundle.anonymized.tar.gz"
+    assert get_bundle_output_path("in/bundle.zip", "out") == "out/bundle.anonymized.zip"
+
+
+@pytest.mark.parametrize("framing", ["newline", "length"])
+def test_document_stream_round_trip(framing):
+    """Test that documents survive being written to and read from a stream."""
+    documents = [b"<a>1</a>", b"<b>\n2</b>" if framing == "length" else b"<b>2</b>"]
+    stream = BytesIO()
+    write_document_stream(stream, framing, [(None, data) for data in documents])
+
+    stream.seek(0)
+    assert [document.data for document in read_document_stream(stream, framing)] == documents
+
+
+def test_document_stream_groups_rr_with_eicr():
+    """Test that an RR shares the mapping scope of the eICR before it."""
+    documents = [_read(EICR), _read(RR), _read(EICR)]
+    stream = BytesIO()
+    write_document_stream(stream, "length", [(None, data) for data in documents])
+
+    stream.seek(0)
+    groups = [document.group for document in read_document_stream(stream, "length")]
+
+    assert groups[0] == groups[1]
+    assert groups[2] != groups[1]
+
+
+@pytest.mark.parametrize(
+    ("code", "is_rr"),
+    [
+        ('<code code="88085-6" codeSystem="2.16.840.1.113883.6.1"/>', True),
+        ("<code codeSystem='2.16.840.1.113883.6.1' code='88085-6'/>", True),
+        ('<code codeSystem="2.16.840.1.113883.6.1" code="55751-2"/>', False),
+        ('<component><code code="88085-6"/></component>', False),
+    ],
+)
+def test_rr_is_found_by_document_code(code, is_rr):
+    """Test that documents are told apart by the code of the header, however it is written."""
+    data = f'<ClinicalDocument xmlns="urn:hl7-org:v3">{code}</ClinicalDocument>'.encode()
+    documents = [_read(EICR), data]
+    stream = BytesIO()
+    write_document_stream(stream, "length", [(None, document) for document in documents])
+
+    stream.seek(0)
+    groups = [document.group for document in read_document_stream(stream, "length")]
+
+    assert (groups[0] == groups[1]) is is_rr
+
+
+def test_anonymize_zip_archive(tmp_path):
+    """Test that the anonymized archive keeps the XML members in their original order."""
+    input_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(input_path, "w") as archive:
+        for folder in ["a", "b"]:
+            archive.write(EICR, f"{folder}/CDA_eICR.xml")
+            archive.write(RR, f"{folder}/CDA_RR.xml")
+        archive.writestr("b/notes.txt", "not an eICR")
+    output_path = tmp_path / "bundle.anonymized.zip"
+
+    anonymize_bundle(
+        str(input_path), str(output_path), Anonymizer(), Parser(), BundleOptions(threads=2)
+    )
+
+    with zipfile.ZipFile(output_path) as archive:
+        assert archive.namelist() == [
+            "a/CDA_RR.xml",
+            "a/CDA_eICR.xml",
+            "b/CDA_RR.xml",
+            "b/CDA_eICR.xml",
+        ]
+        assert archive.read("a/CDA_eICR.xml") != _read(EICR)
+
+
+def test_anonymize_tar_archive(tmp_path):
+    """Test that a compressed tar archive is anonymized into a compressed tar archive."""
+    input_path = tmp_path / "bundle.tar.gz"
+    with tarfile.open(input_path, "w:gz") as archive:
+        archive.add(EICR, "a/CDA_eICR.xml")
+        archive.add(RR, "a/CDA_RR.xml")
+    output_path = tmp_path / "bundle.anonymized.tar.gz"
+
+    anonymize_bundle(str(input_path), str(output_path), Anonymizer(), Parser())
+
+    with tarfile.open(output_path, "r:gz") as archive:
+        assert archive.getnames() == ["a/CDA_eICR.xml", "a/CDA_RR.xml"]
+
+
+def test_failed_members_are_quarantined(tmp_path):
+    """Test that a member that cannot be anonymized is quarantined and left out of the archive."""
+    input_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(input_path, "w") as archive:
+        archive.write(RR, "a/CDA_RR.xml")
+        archive.writestr("../b/CDA_RR.xml", "<ClinicalDocument>")
+    output_path = tmp_path / "bundle.anonymized.zip"
+    quarantine_dir = tmp_path / "quarantine"
+
+    anonymize_bundle(
+        str(input_path),
+        str(output_path),
+        Anonymizer(),
+        Parser(),
+        BundleOptions(quarantine_dir=str(quarantine_dir)),
+    )
+
+    with zipfile.ZipFile(output_path) as archive:
+        assert archive.namelist() == ["a/CDA_RR.xml"]
+    # The member is kept inside the quarantine directory
+    assert (quarantine_dir / "b" / "CDA_RR.xml").read_bytes() == b"<ClinicalDocument>"
+    reason = (quarantine_dir / "b" / "CDA_RR.xml.error.txt").read_text()
+    assert reason.startswith("XMLSyntaxError")
+
+
+def test_bundle_replacements_are_audited(tmp_path):
+    """Test that replacements made in the documents of a bundle are written to the audit log."""
+    input_path = tmp_path / "bundle.tar"
+    with tarfile.open(input_path, "w") as archive:
+        archive.add(RR, "a/CDA_RR.xml")
+    stream = StringIO()
+    audit = AuditLog(stream)
+
+    anonymize_bundle(
+        str(input_path),
+        str(tmp_path / "bundle.anonymized.tar"),
+        Anonymizer(),
+        Parser(),
+        BundleOptions(audit=audit),
+    )
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == audit.records > 0
+    assert {record["file"] for record in records} == {"a/CDA_RR.xml"}
@@ -0,0 +1,71 @@
+"""Unit tests for the generated visitors."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from eicr_anonymization.codegen import GENERATED_MODULE_PATH, generate_visitors
+from eicr_anonymization.element_parser import (
+    Findings,
+    Parser,
+    ParserPlan,
+    compile_config,
+    compile_type_rules,
+    load_structure,
+)
+
+
+def _findings(parser: Parser, root: etree._Element) -> tuple[list, set[str], int]:
+    found = parser.collect(root, Findings())
+    return (
+        [(e.path, e.cda_type) for e in found.sensitive_elements],
+        found.safe_text,
+        found.skipped_elements,
+    )
+
+
+def test_generated_visitors_are_up_to_date():
+    """Test that the generated module matches the structure and default configuration.
+
+    Regenerate it with `python tools/visitor_generator.py` if this fails.
+    """
+    assert GENERATED_MODULE_PATH.read_text(encoding="utf-8") == generate_visitors(compile_config())
+
+
+def test_visitors_are_only_used_for_their_configuration():
+    """Test that parsers with another configuration interpret the rules instead."""
+    assert compile_config().visitors is not None
+    custom_plan = compile_config(b"ClinicalDocument:\n  elements:\n    effectiveTime: SAFE\n")
+    assert custom_plan.visitors is None
+
+
+@pytest.mark.parametrize("xml_file", sorted(Path("tests/test_data").rglob("*.xml")))
+def test_visitors_match_interpreter(xml_file):
+    """Test that the generated visitors find the same as the interpreted rules."""
+    plan = compile_config()
+    root = etree.parse(xml_file, None).getroot()
+    root.append(etree.Element("{urn:hl7-org:v3}notInTheStructure"))
+    root.append(etree.Comment("comment"))
+
+    assert _findings(Parser(plan=plan), root) == _findings(
+        Parser(plan=replace(plan, visitors=None)), root
+    )
+
+
+def test_visitors_skip_inert_subtrees():
+    """Test that visitors generated for a configuration with inert types skip their subtrees."""
+    default_plan = compile_config()
+    config = {type_name: dict(rules) for type_name, rules in default_plan.config.items()}
+    config["II"]["attributes"] = dict.fromkeys(config["II"]["attributes"])
+    plan = ParserPlan(
+        default_plan.structure, config, "test", compile_type_rules(load_structure(), config)
+    )
+    namespace: dict = {}
+    exec(compile(generate_visitors(plan), "<generated>", "exec"), namespace)  # noqa: S102
+    root = etree.parse("tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml", None).getroot()
+
+    generated = _findings(Parser(plan=replace(plan, visitors=namespace["VISITORS"])), root)
+    assert generated[2] > 0
+    assert generated == _findings(Parser(plan=plan), root)
@@ -0,0 +1,123 @@
+"""Unit tests for the data pools module."""
+
+from argparse import ArgumentTypeError
+from unittest.mock import patch
+
+import pytest
+
+from eicr_anonymization.anonymizer import Anonymizer, DebugOptions
+from eicr_anonymization.data_pools import (
+    DataPools,
+    PackedPool,
+    load_default_pool,
+    load_pool_file,
+    parse_pool_file,
+    write_packed_pool,
+)
+
+
+def test_packed_pool_round_trip(tmp_path):
+    """Test that a packed pool gives back the values it was written with."""
+    values = ["Skywalker", "Organa", "", "Ñuñez", "李"]
+    path = tmp_path / "names.pool"
+    write_packed_pool(values, str(path))
+
+    pool = PackedPool(str(path))
+
+    assert len(pool) == len(values)
+    assert [replacement["value"] for replacement in pool] == values
+    assert pool[-1] == {"value": "李"}
+    assert pool[1:3] == [{"value": "Organa"}, {"value": ""}]
+    with pytest.raises(IndexError):
+        pool[len(values)]
+
+
+def test_packed_pool_rejects_other_files(tmp_path):
+    """Test that files in another format are not read as packed pools."""
+    path = tmp_path / "names.pool"
+    path.write_text("Skywalker\nOrgana\n")
+
+    with pytest.raises(ValueError, match="Not a packed pool file"):
+        PackedPool(str(path))
+
+
+def test_default_pools_do_not_depend_on_working_directory(tmp_path, monkeypatch):
+    """Test that the built-in pools are found from any working directory."""
+    load_default_pool.cache_clear()
+    monkeypatch.chdir(tmp_path)
+
+    assert len(DataPools()["family"]) > 0
+
+
+def test_pools_are_loaded_on_first_use():
+    """Test that creating an anonymizer only loads the pools it needs."""
+    with patch(
+        "eicr_anonymization.data_pools.load_default_pool", wraps=load_default_pool
+    ) as load_pool:
+        anonymizer = Anonymizer()
+        loaded = {call.args[0] for call in load_pool.call_args_list}
+        # The address parser reads the street types of the package, not the pool of replacements
+        assert "street_types.yaml" not in loaded
+        assert "family_names.yaml" not in loaded
+
+        anonymizer._get_random_option("family", anonymizer.random)
+        assert load_pool.call_args_list[-1].args == ("family_names.yaml",)
+
+
+def test_custom_pool_files(tmp_path):
+    """Test that custom pools replace the built-in ones."""
+    text_pool = tmp_path / "given.txt"
+    text_pool.write_text("Rey\n\nFinn\n")
+    packed_pool = tmp_path / "family.pool"
+    write_packed_pool(["Palpatine"], str(packed_pool))
+
+    anonymizer = Anonymizer(
+        DebugOptions(seed=1),
+        pool_files={"given": str(text_pool), "family": str(packed_pool)},
+    )
+
+    assert list(load_pool_file(str(text_pool))) == [{"value": "Rey"}, {"value": "Finn"}]
+    assert anonymizer._get_random_option("given", anonymizer.random)["value"] in {"Rey", "Finn"}
+    assert anonymizer._get_random_option("family", anonymizer.random) == {"value": "Palpatine"}
+
+
+def test_packed_pools_are_not_decoded_whole(tmp_path):
+    """Test that choosing a value from a packed pool only reads that value."""
+    packed_pool = tmp_path / "city.pool"
+    write_packed_pool([f"City {i}" for i in range(1000)], str(packed_pool))
+    anonymizer = Anonymizer(DebugOptions(seed=1), pool_files={"city": str(packed_pool)})
+
+    with patch.object(PackedPool, "__iter__", side_effect=AssertionError("decoded whole")):
+        for name in ("Jedi Temple Clinic", "Mos Eisley Cantina", "Rebel Alliance Hospital"):
+            assert anonymizer._random_corporationName(name) != name
+        assert anonymizer._get_random_option("city", anonymizer.random)["value"].startswith("City")
+
+
+def test_street_type_pool_does_not_change_parsing(tmp_path):
+    """Test that a custom pool of street types only changes the replacements."""
+    street_types = tmp_path / "street_types.txt"
+    street_types.write_text("Hyperlane\n")
+
+    anonymizer = Anonymizer(pool_files={"streetNameType": str(street_types)})
+
+    assert anonymizer.address_parser.parse_fast("123 Main St") is not None
+    assert anonymizer._get_random_option("streetNameType", anonymizer.random) == {
+        "value": "Hyperlane"
+    }
+
+
+def test_unknown_pools_are_rejected(tmp_path):
+    """Test that pools are only accepted for known data types and formats."""
+    with pytest.raises(ValueError, match="Unknown data pool types: planet"):
+        DataPools({"planet": "planets.txt"})
+    with pytest.raises(ArgumentTypeError):
+        parse_pool_file("planet=planets.txt")
+    with pytest.raises(ArgumentTypeError):
+        parse_pool_file("family")
+
+    csv_pool = tmp_path / "family.csv"
+    csv_pool.write_text("Skywalker\n")
+    with pytest.raises(ValueError, match="Unknown pool file format"):
+        load_pool_file(str(csv_pool))
+
+    assert parse_pool_file("family=a=b.txt") == ("family", "a=b.txt")
@@ -5,6 +5,7 @@ import random
 from lxml import etree
 
 from eicr_anonymization.anonymizer import deterministic
+from eicr_anonymization.determinism import current_random
 
 
 class TestAnonymizer:
@@ -14,11 +15,12 @@ class TestAnonymizer:
         """Initialize the test class with an option for deterministic functions."""
         self.is_deterministic = deterministic_functions
         self.seed =seed
+        self.random = random.Random()
 
     @deterministic
     def random_method(self, param1, param2="default"):
         """Return a random integer between 1 and 1000."""
-        return random.randint(1, 1000)
+        return current_random(self.random).randint(1, 1000)
 
 
 class TestDeterministicDecorator:
@@ -104,3 +106,15 @@ class TestDeterministicDecorator:
 
         # Assert
         assert result1 != result2, "Same parameters should produce same results"
+
+    def test_global_random_untouched(self):
+        """Test that deterministic functions neither use nor change the global random state."""
+        # Arrange
+        obj = TestAnonymizer(deterministic_functions=True)
+        state = random.getstate()
+
+        # Act
+        obj.random_method("test", "value")
+
+        # Assert
+        assert random.getstate() == state, "Global random state should not change"
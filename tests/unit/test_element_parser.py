@@ -0,0 +1,199 @@
+"""Unit tests for the element parser."""
+
+from itertools import product
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from eicr_anonymization.config import UnknownItem
+from eicr_anonymization.element_parser import (
+    ConfigRegistry,
+    Findings,
+    Parser,
+    ParserPlan,
+    compile_config,
+    compile_type_rules,
+    find_inert_types,
+    has_text,
+    load_structure,
+)
+
+CUSTOM_CONFIG = b"""
+ClinicalDocument:
+  elements:
+    effectiveTime: SAFE
+"""
+
+
+def test_registry_compiles_each_config_once(tmp_path):
+    """Test that the same config is only compiled once, even from a different file."""
+    first_path = tmp_path / "first.yaml"
+    first_path.write_bytes(CUSTOM_CONFIG)
+    second_path = tmp_path / "second.yaml"
+    second_path.write_bytes(CUSTOM_CONFIG)
+    registry = ConfigRegistry()
+
+    plan = registry.load(str(first_path))
+
+    assert registry.load(str(second_path)) is plan
+    assert registry.get(CUSTOM_CONFIG) is plan
+    assert registry.misses == 1
+    assert registry.hits == 2  # noqa: PLR2004
+    assert registry.get() is not plan
+    assert plan.config["ClinicalDocument"]["elements"]["effectiveTime"] == "SAFE"
+
+
+def test_registry_evicts_least_recently_used():
+    """Test that the registry only keeps the most recently used plans."""
+    registry = ConfigRegistry(max_size=2)
+    configs = [
+        CUSTOM_CONFIG,
+        CUSTOM_CONFIG.replace(b"effectiveTime", b"title"),
+        CUSTOM_CONFIG.replace(b"effectiveTime", b"id"),
+    ]
+
+    first_plan = registry.get(configs[0])
+    registry.get(configs[1])
+    registry.get(configs[0])
+    registry.get(configs[2])
+
+    assert len(registry) == 2  # noqa: PLR2004
+    assert registry.get(configs[0]) is first_plan
+    assert registry.misses == 3  # noqa: PLR2004
+    registry.get(configs[1])
+    assert registry.misses == 4  # noqa: PLR2004
+
+
+def test_invalid_configs_are_not_registered():
+    """Test that a config failing validation raises every time it is used."""
+    registry = ConfigRegistry()
+    invalid_config = b"NotAType:\n  elements: {}\n"
+
+    for _ in range(2):
+        with pytest.raises(UnknownItem):
+            registry.get(invalid_config)
+    assert len(registry) == 0
+
+
+def test_plans_cannot_be_modified():
+    """Test that a plan shared by parsers cannot be changed through one of them."""
+    parser = Parser(plan=compile_config(CUSTOM_CONFIG))
+
+    with pytest.raises(TypeError):
+        parser.config["ClinicalDocument"]["elements"]["effectiveTime"] = None  # type: ignore
+    with pytest.raises(TypeError):
+        parser.structure["ClinicalDocument"]["elements"] = {}  # type: ignore
+
+
+def _reference_parse_element(parser, element, element_type, found, is_safe=False):  # noqa: C901, PLR0912
+    """Find sensitive elements by interpreting the structure and configuration node by node.
+
+    This is how the parser worked before its rules were compiled, kept to check that they
+    find exactly the same elements and safe text.
+    """
+    if element_type == "xhtml":
+        found.add_sensitive_element(element, element_type)
+        return
+    children_safety = parser.config[element_type]["elements"]
+    children_types = parser.structure[element_type]["elements"]
+    if has_text(element):
+        if parser.config[element_type]["text_content"] == "SAFE":
+            found.add_safe_text(element.text)
+        elif not is_safe:
+            found.add_sensitive_element(element, element_type)
+    _reference_process_attributes(parser, element, element_type, found, is_safe)
+    for child in element:
+        child_tag = str(child.tag).split("}")[-1]
+        if child_tag not in children_types:
+            continue
+        child_structure = children_types[child_tag]
+        if len(child_structure["types"]) == 1:
+            child_type = child_structure["types"][0]
+        else:
+            type_attribute = child.get("{http://www.w3.org/2001/XMLSchema-instance}type")
+            if type_attribute is not None:
+                child_type = type_attribute
+            else:
+                child_type = child_structure["default_type"]
+        if children_safety[child_tag] == "SAFE":
+            _reference_parse_element(parser, child, child_type, found, True)
+        else:
+            if "attributes" in child_structure:
+                _reference_process_attributes(parser, child, child_type, found, is_safe)
+            if "elements" in child_structure:
+                for subelement in child:
+                    subelement_tag = str(subelement.tag).split("}")[-1]
+                    if subelement_tag not in child_structure["elements"]:
+                        continue
+                    subelement_type = child_structure["elements"][subelement_tag]["types"][0]
+                    if children_safety[child_tag]["elements"][subelement_tag] == "SAFE":
+                        _reference_parse_element(parser, subelement, child_type, found, True)
+                    else:
+                        _reference_parse_element(parser, subelement, subelement_type, found)
+            _reference_parse_element(parser, child, child_type, found, is_safe)
+
+
+def _reference_process_attributes(parser, element, element_type, found, is_safe):
+    for attribute_name, attribute_text in element.items():
+        attribute_name = attribute_name.split("}")[-1]  # noqa: PLW2901
+        if attribute_name not in parser.structure[element_type]["attributes"]:
+            continue
+        attribute_type = parser.structure[element_type]["attributes"][attribute_name]
+        if parser.config[element_type]["attributes"][attribute_name] == "SAFE":
+            if attribute_type in ["string", "code"]:
+                found.add_safe_text(attribute_text)
+        elif not is_safe:
+            found.add_sensitive_element(element, element_type)
+
+
+@pytest.mark.parametrize(
+    ("xml_file", "config_file"),
+    list(
+        product(
+            sorted(Path("tests/test_data").rglob("*.xml")),
+            [None, *sorted(Path("config_examples").glob("*.yaml"))],
+        )
+    ),
+)
+def test_compiled_rules_match_reference(xml_file, config_file):
+    """Test that the parser finds the same elements, in the same order, as the reference."""
+    parser = Parser(config_file)
+    root = etree.parse(xml_file, None).getroot()
+    # Elements outside the structure and comments must be skipped the same way
+    root.append(etree.Element("{urn:hl7-org:v3}notInTheStructure"))
+    root.append(etree.Comment("comment"))
+
+    sensitive_elements, safe_text = parser.collect_sensitive_elements_and_safe_words(root)
+    expected = Findings()
+    _reference_parse_element(parser, root, "ClinicalDocument", expected)
+
+    assert [(e.path, e.cda_type) for e in sensitive_elements] == [
+        (e.path, e.cda_type) for e in expected.sensitive_elements
+    ]
+    assert safe_text == expected.safe_text
+
+
+def test_inert_safe_subtrees_are_skipped():
+    """Test that safe subtrees that cannot add anything are skipped without changing findings."""
+    default_plan = compile_config()
+    config = {type_name: dict(rules) for type_name, rules in default_plan.config.items()}
+    # Identifiers without safe attributes can never add safe text
+    config["II"]["attributes"] = dict.fromkeys(config["II"]["attributes"])
+    plan = ParserPlan(
+        default_plan.structure, config, "test", compile_type_rules(load_structure(), config)
+    )
+    parser = Parser(plan=plan)
+    root = etree.parse("tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml", None).getroot()
+
+    found = parser.collect(root, Findings())
+    expected = Findings()
+    _reference_parse_element(parser, root, "ClinicalDocument", expected)
+
+    assert find_inert_types(plan.rules) == {"II"}
+    assert not find_inert_types(default_plan.rules)
+    assert found.skipped_elements > 0
+    assert [e.path for e in found.sensitive_elements] == [
+        e.path for e in expected.sensitive_elements
+    ]
+    assert found.safe_text == expected.safe_text
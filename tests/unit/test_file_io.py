@@ -0,0 +1,55 @@
+"""Unit tests for the file_io module."""
+
+import pytest
+
+from eicr_anonymization.file_io import (
+    COMPRESSION_SUFFIXES,
+    atomic_write,
+    get_compression,
+    open_input,
+)
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    """Test that the file is only replaced once it has been completely written."""
+    path = tmp_path / "out" / "file.xml"
+
+    with atomic_write(str(path)) as f:
+        f.write(b"<new/>")
+        assert not path.exists(), "The file should not be visible until it is complete"
+
+    assert path.read_bytes() == b"<new/>"
+    assert list(path.parent.iterdir()) == [path], "No temporary files should be left behind"
+
+
+def test_atomic_write_keeps_old_file_on_error(tmp_path):
+    """Test that a failed write leaves the previous file untouched."""
+    path = tmp_path / "file.xml"
+    path.write_bytes(b"<old/>")
+
+    def write_partial_file():
+        with atomic_write(str(path)) as f:
+            f.write(b"<partial")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_partial_file()
+
+    assert path.read_bytes() == b"<old/>"
+    assert list(tmp_path.iterdir()) == [path], "No temporary files should be left behind"
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compressed_round_trip(tmp_path, compression):
+    """Test that compressed output can be read back as an input."""
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    path = tmp_path / f"file.xml{COMPRESSION_SUFFIXES[compression]}"
+
+    with atomic_write(str(path), compression) as f:
+        f.write(b"<ClinicalDocument/>")
+
+    assert get_compression(path) == compression
+    assert path.read_bytes() != b"<ClinicalDocument/>", "The file should be compressed"
+    with open_input(path) as f:
+        assert f.read() == b"<ClinicalDocument/>"
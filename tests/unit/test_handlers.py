@@ -0,0 +1,47 @@
+"""Unit tests for the handlers module."""
+
+from lxml import etree
+
+from eicr_anonymization.anonymize_eicr import anonymize_eicr_tree
+from eicr_anonymization.anonymizer import Anonymizer, DebugOptions
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.handlers import (
+    anonymize_ts,
+    anonymize_unknown,
+    default_handlers,
+    remove_part,
+)
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def test_resolve_prefers_the_most_specific_handler():
+    """Test that handlers are looked up by type and tag, then by type, then the default."""
+    city = default_handlers.resolve("ADXP", "{urn:hl7-org:v3}city")
+
+    assert city is not remove_part
+    assert default_handlers.resolve("ADXP", "{urn:hl7-org:v3}precinct") is remove_part
+    assert default_handlers.resolve("IVL_TS", "{urn:hl7-org:v3}low") is anonymize_ts
+    assert default_handlers.resolve("CE", "{urn:hl7-org:v3}code") is anonymize_unknown
+    # Tags of other namespaces only match handlers registered with their namespace
+    assert default_handlers.resolve("ADXP", "{urn:other}city") is remove_part
+    assert default_handlers.resolve("ADXP", "{urn:hl7-org:v3}city") is city
+
+
+def test_custom_handlers():
+    """Test that a copied registry can override handlers without changing the default one."""
+    handlers = default_handlers.copy()
+    replaced = []
+
+    @handlers.register("ENXP", "family")
+    def keep_family(context, element, match):
+        replaced.append(match.text)
+
+    tree = etree.parse(RR_FILE, None)
+    anonymize_eicr_tree(
+        tree, RR_FILE, Anonymizer(DebugOptions(seed=1)), Parser(), handlers=handlers
+    )
+
+    assert "Yoda" in replaced
+    assert "Yoda" in [family.text for family in tree.iter("{urn:hl7-org:v3}family")]
+    assert default_handlers.resolve("ENXP", "{urn:hl7-org:v3}family") is not keep_family
@@ -0,0 +1,65 @@
+"""Unit tests for the command-line interface."""
+
+import subprocess
+import sys
+
+import pytest
+
+from eicr_anonymization.__main__ import _parse_arguments
+
+
+def test_parse_arguments_default_command():
+    """Test that the `anonymize` subcommand is used when no subcommand is given."""
+    args = _parse_arguments(["-c", "config.yaml", "-o", "out", "eicrs"])
+
+    assert args.command == "anonymize"
+    assert args.config == "config.yaml"
+    assert args.output_dir == "out"
+    assert args.input_location == "eicrs"
+
+
+def test_parse_arguments_debug_command():
+    """Test that an explicit subcommand is kept."""
+    args = _parse_arguments(["debug", "-s", "1", "eicrs"])
+
+    assert args.command == "debug"
+    assert args.seed == 1
+    assert args.input_location == "eicrs"
+
+
+@pytest.mark.parametrize("threads", ["0", "-2", "two"])
+def test_threads_must_be_positive(threads, capsys):
+    """Test that a number of threads that would run nothing is rejected."""
+    with pytest.raises(SystemExit):
+        _parse_arguments(["-t", threads, "eicrs"])
+
+    assert "--threads" in capsys.readouterr().err
+
+
+# Run in a fresh interpreter, as the test session has already imported everything
+_IMPORTED_MODULES_SCRIPT = """
+import sys
+
+from eicr_anonymization.__main__ import main
+
+sys.argv = ["anonymize_eicr", *sys.argv[1:]]
+try:
+    main()
+except SystemExit:
+    pass
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.parametrize("arguments", [["--version"], ["--help"], ["serve", "--help"]])
+def test_startup_does_not_import_heavy_modules(arguments):
+    """Test that `--help` and `--version` do not wait for slow imports."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _IMPORTED_MODULES_SCRIPT, *arguments],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {name.split(".")[0] for name in result.stdout.splitlines()[-1].split()}
+
+    assert imported.isdisjoint({"lxml", "pydantic", "yaml", "usaddress"})
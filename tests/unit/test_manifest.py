@@ -0,0 +1,65 @@
+"""Unit tests for the manifest used by incremental mode."""
+
+import shutil
+
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import anonymize
+from eicr_anonymization.manifest import Manifest, hash_file
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def test_manifest_up_to_date(tmp_path):
+    """Test that a recorded file is only up to date while nothing about it changes."""
+    input_file = tmp_path / "eicr.xml"
+    input_file.write_text("<ClinicalDocument/>")
+    output_file = tmp_path / "eicr.xml.anonymized.xml"
+    output_file.write_text("<ClinicalDocument/>")
+    output = str(output_file)
+    input_hash = hash_file(str(input_file))
+
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    assert not manifest.is_up_to_date("eicr.xml", input_hash, "config", output)
+
+    manifest.record("eicr.xml", input_hash, "config", output)
+    manifest.save()
+
+    reloaded = Manifest(str(tmp_path / "manifest.json"))
+    assert reloaded.is_up_to_date("eicr.xml", input_hash, "config", output)
+    assert not reloaded.is_up_to_date("eicr.xml", input_hash, "new config", output), (
+        "A config change should invalidate the output"
+    )
+    assert not reloaded.is_up_to_date("eicr.xml", input_hash, "config", output + ".gz"), (
+        "A different output path should invalidate the output"
+    )
+
+    input_file.write_text("<ClinicalDocument><id/></ClinicalDocument>")
+    new_hash = hash_file(str(input_file))
+    assert not reloaded.is_up_to_date("eicr.xml", new_hash, "config", output), (
+        "A changed input file should invalidate the output"
+    )
+
+    output_file.unlink()
+    assert not reloaded.is_up_to_date("eicr.xml", input_hash, "config", output), (
+        "A missing output file should not be considered up to date"
+    )
+
+
+def test_incremental_run_with_other_compression(tmp_path, capsys):
+    """Test that files are anonymized again when the compression of the output changes."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(RR_FILE, input_dir / "CDA_RR.xml")
+    output_dir = tmp_path / "output"
+
+    def run(*options):
+        anonymize(_parse_arguments(["-i", "-o", str(output_dir), *options, str(input_dir)]))
+        return capsys.readouterr().out
+
+    run()
+    assert "Skipped 1 files" in run(), "An unchanged file should be skipped"
+
+    assert "Skipped" not in run("--compress", "gzip")
+    assert (output_dir / "CDA_RR.xml.anonymized.xml.gz").exists()
+    assert "Skipped 1 files" in run("--compress", "gzip")
+    assert "Skipped" not in run("--no-pretty-print"), "Other output options should count too"
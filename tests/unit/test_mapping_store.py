@@ -0,0 +1,60 @@
+"""Unit tests for the mapping store."""
+
+import os
+
+import pytest
+
+from eicr_anonymization.anonymizer import Anonymizer, DebugOptions
+from eicr_anonymization.mapping_store import MappingStore
+
+
+def test_evicted_replacements_are_kept_on_disk(tmp_path):
+    """Test that replacements moved out of memory are still found, and moved back."""
+    store = MappingStore(max_in_memory=10, directory=str(tmp_path))
+    for i in range(100):
+        assert store.setdefault("II", f"value-{i}", f"replacement-{i}") == f"replacement-{i}"
+
+    assert store.in_memory <= 10  # noqa: PLR2004
+    assert len(store) == 100  # noqa: PLR2004
+    assert store.get("II", "value-0") == "replacement-0"
+    assert store.setdefault("II", "value-1", "other") == "replacement-1"
+    assert store.get("TEL", "value-0") is None
+    assert len(store) == 100  # noqa: PLR2004
+    assert (store.hot_hits, store.cold_hits, store.misses) == (0, 1, 1)
+
+    store.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_unbounded_store_stays_in_memory(tmp_path):
+    """Test that without a limit nothing is written to disk."""
+    store = MappingStore(directory=str(tmp_path))
+    for i in range(100):
+        store.setdefault("II", f"value-{i}", f"replacement-{i}")
+
+    assert store.get("II", "value-5") == "replacement-5"
+    assert store.on_disk == 0
+    assert os.listdir(tmp_path) == []
+    assert store.report() == (
+        "Replacements in memory: 100, on disk: 0. Lookups answered from memory: 100.0%, "
+        "from disk: 0.0%, new values: 0.0%"
+    )
+
+
+def test_bounded_anonymizer_is_consistent():
+    """Test that a bounded anonymizer replaces values like an unbounded one."""
+    values = [f"Skywalker{i % 40}" for i in range(200)]
+    unbounded = Anonymizer(DebugOptions(seed=7))
+    bounded = Anonymizer(DebugOptions(seed=7), max_mappings_in_memory=5)
+
+    expected = [unbounded.replace_with_like_chars(value, "family") for value in values]
+
+    assert [bounded.replace_with_like_chars(value, "family") for value in values] == expected
+    assert bounded.mappings.in_memory <= 5  # noqa: PLR2004
+    assert bounded.mappings.cold_hits > 0
+
+
+def test_invalid_limit():
+    """Test that at least one replacement must be kept in memory."""
+    with pytest.raises(ValueError, match="At least one"):
+        MappingStore(max_in_memory=0)
@@ -0,0 +1,47 @@
+"""Unit tests for the scan module."""
+
+import json
+import shutil
+
+from lxml import etree
+
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.scan import scan, scan_file
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def test_scan_counts_every_sensitive_element_once():
+    """Test that the scan counts the same elements the anonymizer replaces."""
+    parser = Parser()
+    sensitive_elements, _ = parser.collect_sensitive_elements_and_safe_words(
+        etree.parse(RR_FILE, None).getroot()
+    )
+
+    report = scan_file(RR_FILE, parser)
+
+    assert report.files == 1
+    assert report.sensitive_elements == len({element.path for element in sensitive_elements})
+    assert report.by_type["ENXP"] == sum(
+        element.cda_type == "ENXP" for element in {e.path: e for e in sensitive_elements}.values()
+    )
+    assert report.by_rule["ENXP text"] > 0
+    assert report.by_path["ClinicalDocument/recordTarget/patientRole/patient/name/family"] == 1
+
+
+def test_scan_report(tmp_path):
+    """Test that the counts of all files are merged and saved, and broken files are counted."""
+    (tmp_path / "broken.xml").write_text("<ClinicalDocument")
+    (tmp_path / "eicrs").mkdir()
+    shutil.copy(RR_FILE, tmp_path / "eicrs")
+    report_path = tmp_path / "scan.json"
+
+    total = scan(_parse_arguments(["-t", "2", "scan", "--report", str(report_path), str(tmp_path)]))
+
+    assert (total.files, total.failed_files) == (1, 1)
+    saved = json.loads(report_path.read_text())
+    assert saved["sensitive_elements"] == total.sensitive_elements
+    assert list(saved["by_type"].values()) == sorted(saved["by_type"].values(), reverse=True)
+    # Nothing can be skipped with the shipped configuration
+    assert saved["skipped_elements_by_file"] == {str(tmp_path / "eicrs" / "CDA_RR.xml"): 0}
@@ -0,0 +1,64 @@
+"""Unit tests for the scheduling module."""
+
+import gzip
+
+import pytest
+
+from eicr_anonymization import anonymize_eicr
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import anonymize
+from eicr_anonymization.scheduling import chunk_jobs, estimated_size, largest_first
+
+
+def test_largest_first(tmp_path):
+    """Test that files are ordered by uncompressed size, keeping the order of equal sizes."""
+    large = b"<a>" + b"1" * 10_000 + b"</a>"
+    files = {
+        "small.xml": b"<a/>",
+        "same-1.xml": b"<a>12</a>",
+        "same-2.xml": b"<b>12</b>",
+        "large.xml.gz": gzip.compress(large),
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+    paths = [str(tmp_path / name) for name in files]
+
+    ordered, sizes = largest_first(paths)
+
+    assert [path.rsplit("/", 1)[1] for path in ordered] == [
+        "large.xml.gz",
+        "same-1.xml",
+        "same-2.xml",
+        "small.xml",
+    ]
+    assert sizes[str(tmp_path / "large.xml.gz")] == len(large)
+    assert estimated_size(str(tmp_path / "small.xml")) == len(files["small.xml"])
+
+
+def test_chunk_jobs():
+    """Test that small files are grouped up to the chunk size, and large files are sent alone."""
+    sizes = {"large": 2000, "medium": 600, "small-1": 300, "small-2": 300, "small-3": 300}
+    jobs = [(name, f"{name}.out") for name in sizes]
+
+    chunks = chunk_jobs(jobs, sizes, chunk_bytes=1000, max_files=2)
+
+    assert [[name for name, _ in chunk] for chunk in chunks] == [
+        ["large"],
+        ["medium", "small-1"],
+        ["small-2", "small-3"],
+    ]
+
+
+@pytest.mark.parametrize("schedule", ["size", "input"])
+def test_small_files_are_chunked_with_every_schedule(tmp_path, monkeypatch, schedule):
+    """Test that small files are sent to the workers together, whatever order they are in."""
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.xml").write_bytes(b"<ClinicalDocument/>")
+    sent = []
+    monkeypatch.setattr(
+        anonymize_eicr, "_run_in_workers", lambda args, chunks, finish: sent.extend(chunks)
+    )
+
+    anonymize(_parse_arguments(["-w", "2", "--schedule", schedule, str(tmp_path)]))
+
+    assert [len(chunk) for chunk in sent] == [3]
@@ -0,0 +1,157 @@
+"""Unit tests for the anonymization service."""
+
+import asyncio
+import json
+import threading
+
+from eicr_anonymization.anonymizer import Anonymizer
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.service import (
+    MAX_HEADER_LINES,
+    AnonymizationService,
+    ServiceOptions,
+    parse_address,
+)
+
+RR_PATH = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+async def _request(
+    address, method: str, path: str, body: bytes = b""
+) -> tuple[int, dict[str, str], bytes]:
+    """Send one HTTP request to the service and return the status, headers and body."""
+    request = (
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    )
+    return await _exchange(address, request.encode("latin-1") + body)
+
+
+async def _exchange(address, data: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Send raw bytes to the service and return the status, headers and body of the response."""
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.lower().split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, response_body
+
+
+def _run_with_service(service: AnonymizationService, test, address=("127.0.0.1", 0)):
+    """Start the service, run a test coroutine against its address, and stop the service."""
+
+    async def run():
+        server = await service.start(address)
+        bound = address if isinstance(address, str) else server.sockets[0].getsockname()[:2]
+        async with server:
+            return await test(bound)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        service.close()
+
+
+def test_parse_address():
+    """Test that addresses are parsed as a host and port, or as a socket path."""
+    assert parse_address("127.0.0.1:8080") == ("127.0.0.1", 8080)
+    assert parse_address(":8080") == ("127.0.0.1", 8080)
+    assert parse_address("/run/eicr.sock") == "/run/eicr.sock"
+
+
+def test_anonymize_request(capsys):
+    """Test that a document sent to the service is returned anonymized, without printing."""
+    service = AnonymizationService(Anonymizer(), Parser(), ServiceOptions(workers=2))
+    with open(RR_PATH, "rb") as f:
+        document = f.read()
+
+    async def test(address):
+        return await _request(address, "POST", "/anonymize", document)
+
+    status, headers, body = _run_with_service(service, test)
+
+    assert status == 200  # noqa: PLR2004
+    assert headers["content-type"] == "application/xml"
+    assert b"ClinicalDocument" in body
+    assert b"Zika" in body
+    assert b"Yoda" not in body
+    assert service.metrics.documents_anonymized == 1
+    assert "Anonymized" not in capsys.readouterr().out
+
+
+def test_invalid_document():
+    """Test that a document that is not XML is rejected with a client error."""
+    service = AnonymizationService(Anonymizer(), Parser())
+
+    async def test(address):
+        return await _request(address, "POST", "/anonymize", b"not xml")
+
+    status, _, _ = _run_with_service(service, test)
+
+    assert status == 400  # noqa: PLR2004
+
+
+def test_malformed_requests():
+    """Test that requests that cannot be read are answered with a client error."""
+    service = AnonymizationService(Anonymizer(), Parser())
+
+    async def test(address):
+        headers = "".join(f"X-Header-{i}: {i}\r\n" for i in range(MAX_HEADER_LINES + 1))
+        too_many_headers = await _exchange(address, f"GET /health HTTP/1.1\r\n{headers}".encode())
+        long_line = await _exchange(address, b"GET /" + b"a" * 100_000 + b" HTTP/1.1\r\n\r\n")
+        return too_many_headers, long_line
+
+    too_many_headers, long_line = _run_with_service(service, test)
+
+    assert too_many_headers[0] == 431  # noqa: PLR2004
+    assert long_line[0] == 400  # noqa: PLR2004
+
+
+def test_health_and_metrics_over_unix_socket(tmp_path):
+    """Test the health and metrics endpoints over a Unix socket."""
+    service = AnonymizationService(Anonymizer(), Parser())
+
+    async def test(address):
+        health = await _request(address, "GET", "/health")
+        metrics = await _request(address, "GET", "/metrics")
+        missing = await _request(address, "GET", "/missing")
+        return health, metrics, missing
+
+    health, metrics, missing = _run_with_service(service, test, str(tmp_path / "eicr.sock"))
+
+    assert health[0] == 200  # noqa: PLR2004
+    assert json.loads(health[2]) == {"status": "ok"}
+    assert json.loads(metrics[2])["requests"] == 2  # noqa: PLR2004
+    assert missing[0] == 404  # noqa: PLR2004
+
+
+def test_backpressure():
+    """Test that requests beyond the pending limit are rejected until a worker is free."""
+    release = threading.Event()
+
+    class BlockingService(AnonymizationService):
+        def anonymize_document(self, data: bytes) -> bytes:
+            release.wait()
+            return data
+
+    service = BlockingService(Anonymizer(), Parser(), ServiceOptions(workers=1, max_pending=1))
+
+    async def test(address):
+        first = asyncio.create_task(_request(address, "POST", "/anonymize", b"<a/>"))
+        while service.metrics.in_flight == 0:
+            await asyncio.sleep(0.01)
+        rejected = await _request(address, "POST", "/anonymize", b"<a/>")
+        release.set()
+        return await first, rejected
+
+    first, rejected = _run_with_service(service, test)
+
+    assert first[0] == 200  # noqa: PLR2004
+    assert rejected[0] == 503  # noqa: PLR2004
+    assert rejected[1]["retry-after"] == "1"
+    assert service.metrics.rejected == 1
@@ -0,0 +1,58 @@
+"""Unit tests for splitting input files across shards."""
+
+from argparse import ArgumentTypeError
+
+import pytest
+
+from eicr_anonymization.sharding import (
+    RunRecorder,
+    Shard,
+    merge_run_stats,
+    parse_shard,
+    select_shard,
+    shard_of,
+)
+
+FILES = [f"in/folder{i // 2}/{name}.xml" for i, name in enumerate(["eicr", "rr"] * 20)]
+
+
+def test_parse_shard():
+    """Test that shards are parsed from `K/N` and validated."""
+    assert parse_shard("2/8") == Shard(2, 8)
+    for value in ["0/8", "9/8", "2", "a/b"]:
+        with pytest.raises(ArgumentTypeError):
+            parse_shard(value)
+
+
+def test_select_shard_partitions_files():
+    """Test that every file belongs to exactly one shard."""
+    shards = [select_shard(FILES, "in", Shard(index, 3)) for index in range(1, 4)]
+
+    assert sorted(xml_file for shard in shards for xml_file in shard) == sorted(FILES)
+    assert all(shards), "40 files should not all end up in the same shard"
+
+
+def test_shard_by_folder_keeps_folders_together():
+    """Test that files in the same folder always end up in the same shard."""
+    for eicr, rr in zip(FILES[::2], FILES[1::2], strict=True):
+        assert shard_of(eicr, "in", 5, "folder") == shard_of(rr, "in", 5, "folder")
+
+
+def test_merge_run_stats(tmp_path):
+    """Test that the stats of every shard are merged into one summary."""
+    for index, anonymized in [(1, 2), (2, 3)]:
+        recorder = RunRecorder(str(tmp_path), Shard(index, 2), files_found=5, files_selected=3)
+        for i in range(anonymized):
+            xml_file = tmp_path / f"{index}-{i}.xml"
+            xml_file.write_text("<ClinicalDocument/>")
+            recorder.record(str(xml_file), f"{xml_file}.anonymized.xml")
+        recorder.record("skipped.xml", None)
+        recorder.save(elapsed_seconds=index)
+
+    summary = merge_run_stats(str(tmp_path))
+
+    assert summary.shards == ["1/2", "2/2"]
+    assert summary.files_found == 5  # noqa: PLR2004
+    assert summary.files_anonymized == 5  # noqa: PLR2004
+    assert summary.files_skipped == 2  # noqa: PLR2004
+    assert summary.elapsed_seconds == 2  # noqa: PLR2004
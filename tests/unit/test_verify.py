@@ -0,0 +1,71 @@
+"""Unit tests for the verify module."""
+
+import shutil
+
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import anonymize
+from eicr_anonymization.element_parser import Parser
+from eicr_anonymization.verify import build_matcher, find_leaks, verify, verify_file
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def test_matcher_finds_values_in_text_only():
+    """Test that values are found as whole words in text, but not in tag or attribute names."""
+    matcher = build_matcher(["Hanna City", "City", "Yoda", "value"])
+    text = '<city>Hanna\n  city</city>\n<name value="x">Yodas YODA</name>'
+
+    leaks = find_leaks(text, matcher)
+
+    assert [(leak.value, leak.line) for leak in leaks] == [("Hanna\n  city", 1), ("YODA", 3)]
+    assert build_matcher([]) is None
+
+
+def test_original_values_are_found(tmp_path):
+    """Test that an unanonymized copy leaks its values and the anonymized file does not."""
+    parser = Parser()
+    copy = verify_file(RR_FILE, RR_FILE, parser)
+    assert copy.values_checked > 0
+    assert "Yoda" in {leak.value for leak in copy.leaks}
+
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(RR_FILE, input_dir)
+    anonymize(_parse_arguments(["-o", str(tmp_path / "output"), str(input_dir)]))
+
+    anonymized = verify_file(
+        str(input_dir / "CDA_RR.xml"),
+        str(tmp_path / "output" / "CDA_RR.xml.anonymized.xml"),
+        parser,
+    )
+    assert not anonymized.missing
+    leaked = {leak.value for leak in anonymized.leaks}
+    assert "Yoda" not in leaked
+    assert "Minch" not in leaked
+    # Comments are not anonymized
+    assert "yoda" in leaked
+
+
+def test_verify_reports_missing_outputs(tmp_path, capsys):
+    """Test that input files without an anonymized file fail verification."""
+    shutil.copy(RR_FILE, tmp_path)
+
+    assert not verify(_parse_arguments(["verify", str(tmp_path)]))
+    assert "MISSING" in capsys.readouterr().out
+
+
+def test_verify_reports_unreadable_originals(tmp_path, capsys):
+    """Test that an original that cannot be parsed fails verification without stopping it."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(RR_FILE, input_dir / "good.xml")
+    (input_dir / "bad.xml").write_text("<bad")
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    for name in ("good", "bad"):
+        shutil.copy(RR_FILE, output_dir / f"{name}.xml.anonymized.xml")
+
+    assert not verify(_parse_arguments(["-o", str(output_dir), "verify", str(input_dir)]))
+    output = capsys.readouterr().out
+    assert f"UNREADABLE {input_dir / 'bad.xml'}" in output
+    assert "1 with an original that could not be read" in output
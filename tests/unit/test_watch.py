@@ -0,0 +1,142 @@
+"""Unit tests for the watch module."""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from eicr_anonymization.watch import (
+    _IN_Q_OVERFLOW,
+    Debouncer,
+    InotifyWatcher,
+    PollingWatcher,
+    WatchOptions,
+    watch_directory,
+)
+
+
+def test_debouncer_waits_for_file_to_settle(tmp_path):
+    """Test that a file is only ready once it has not changed for the settle time."""
+    path = tmp_path / "eicr.xml"
+    path.write_text("<a>")
+    debouncer = Debouncer(settle_seconds=1.0)
+
+    debouncer.touch(str(path), now=0)
+    assert debouncer.ready(now=0.5) == []
+
+    # Still being written, so it is held back for another settle time
+    path.write_text("<a></a>")
+    assert debouncer.ready(now=1.0) == []
+    assert debouncer.ready(now=1.5) == []
+    assert debouncer.ready(now=2.0) == [str(path)]
+    assert len(debouncer) == 0
+
+
+def test_debouncer_drops_removed_files(tmp_path):
+    """Test that files removed before they settle are never ready."""
+    path = tmp_path / "eicr.xml"
+    path.write_text("<a/>")
+    debouncer = Debouncer(settle_seconds=1.0)
+
+    debouncer.touch(str(path), now=0)
+    path.unlink()
+
+    assert debouncer.ready(now=1.0) == []
+    assert len(debouncer) == 0
+
+
+def test_polling_watcher_reports_changes(tmp_path):
+    """Test that the polling watcher reports existing files once, then only changed files."""
+    (tmp_path / "old.xml").write_text("<a/>")
+    (tmp_path / "out").mkdir()
+    watcher = PollingWatcher(str(tmp_path), exclude=str(tmp_path / "out"), interval=0)
+
+    assert watcher.poll(0) == {str(tmp_path / "old.xml")}
+
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "new.xml").write_text("<a/>")
+    (tmp_path / "out" / "ignored.xml").write_text("<a/>")
+
+    assert watcher.poll(0) == {str(tmp_path / "new" / "new.xml")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher_reports_changes(tmp_path):
+    """Test that the inotify watcher reports existing files, new files and files in new folders."""
+    (tmp_path / "old.xml").write_text("<a/>")
+    watcher = InotifyWatcher(str(tmp_path))
+    try:
+        assert watcher.poll(0) == {str(tmp_path / "old.xml")}
+
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "new.xml").write_text("<a/>")
+        (tmp_path / "other.xml").write_text("<a/>")
+
+        changed = set()
+        deadline = time.monotonic() + 5
+        while len(changed) < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            changed |= watcher.poll(0.1)
+    finally:
+        watcher.close()
+
+    assert changed == {str(tmp_path / "new" / "new.xml"), str(tmp_path / "other.xml")}
+
+
+def test_polling_watcher_reports_removed_files(tmp_path):
+    """Test that the polling watcher reports files that were removed, so they can be forgotten."""
+    (tmp_path / "old.xml").write_text("<a/>")
+    watcher = PollingWatcher(str(tmp_path), interval=0)
+    watcher.poll(0)
+
+    (tmp_path / "old.xml").unlink()
+
+    assert watcher.poll(0) == {str(tmp_path / "old.xml")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_overflow_skips_removed_directories(tmp_path):
+    """Test that rescanning the tree after dropped events skips directories that were removed."""
+    (tmp_path / "gone").mkdir()
+    (tmp_path / "kept.xml").write_text("<a/>")
+    watcher = InotifyWatcher(str(tmp_path))
+    try:
+        watcher.poll(0)
+        (tmp_path / "gone").rmdir()
+
+        # Rescanned before the event removing the watch of the directory is read
+        changed = watcher._handle_event(0, _IN_Q_OVERFLOW, b"")
+    finally:
+        watcher.close()
+
+    assert set(changed) == {str(tmp_path / "kept.xml")}
+
+
+@pytest.mark.parametrize("poll_interval", [None, 0.1])
+def test_watch_directory_processes_new_files(tmp_path, poll_interval):
+    """Test that files landing in the watched directory are processed once they are written."""
+    (tmp_path / "old.xml").write_text("<a/>")
+    processed = []
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch_directory,
+        args=(str(tmp_path), processed.append),
+        kwargs={
+            "options": WatchOptions(settle_seconds=0.2, poll_interval=poll_interval),
+            "stop": stop,
+        },
+    )
+    thread.start()
+    try:
+        (tmp_path / "new.xml").write_text("<a/>")
+        (tmp_path / "new.xml.anonymized.xml").write_text("<a/>")
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        deadline = time.monotonic() + 5
+        while len(processed) < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.05)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert sorted(processed) == [str(tmp_path / "new.xml"), str(tmp_path / "old.xml")]
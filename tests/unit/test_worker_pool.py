@@ -0,0 +1,138 @@
+"""Unit tests for the worker_pool module."""
+
+import multiprocessing
+import shutil
+import time
+
+import pytest
+
+from eicr_anonymization import anonymize_eicr
+from eicr_anonymization.__main__ import _parse_arguments
+from eicr_anonymization.anonymize_eicr import anonymize
+from eicr_anonymization.worker_pool import PoolLimits, WorkerPool
+
+RR_FILE = "tests/test_data/yoda-zika-v1-positive/CDA_RR.xml"
+
+
+def _copy_rr(directory, names):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        shutil.copy(RR_FILE, directory / name)
+
+
+def test_workers_are_recycled(tmp_path):
+    """Test that every worker is replaced after its maximum number of files."""
+    _copy_rr(tmp_path, ["a.xml", "b.xml", "c.xml"])
+    args = _parse_arguments([str(tmp_path)])
+    pool = WorkerPool(args, PoolLimits(workers=2, max_files_per_worker=1))
+
+    jobs = [(str(tmp_path / f"{name}.xml"), str(tmp_path / f"{name}.out")) for name in "abc"]
+    results = list(pool.run([job] for job in jobs))
+
+    assert sorted(result.xml_file for result in results) == [job[0] for job in jobs]
+    assert all(result.error is None for result in results)
+    assert all((tmp_path / f"{name}.out").exists() for name in "abc")
+    # Two to start with, and one for every finished file
+    assert pool.workers_started == 2 + len(jobs)
+
+
+def test_chunks_are_split_at_the_file_limit(tmp_path):
+    """Test that a worker never anonymizes more files than its limit, even in one chunk."""
+    _copy_rr(tmp_path, ["a.xml", "b.xml", "c.xml"])
+    pool = WorkerPool(
+        _parse_arguments([str(tmp_path)]), PoolLimits(workers=1, max_files_per_worker=1)
+    )
+
+    jobs = [(str(tmp_path / f"{name}.xml"), str(tmp_path / f"{name}.out")) for name in "abc"]
+    results = list(pool.run([jobs]))
+
+    assert [result.xml_file for result in results] == [job[0] for job in jobs]
+    assert all(result.error is None for result in results)
+    # One worker for every file, and the one replacing the last
+    assert pool.workers_started == len(jobs) + 1
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="Workers only see the patched function when they are forked",
+)
+def test_file_timeout(tmp_path, monkeypatch):
+    """Test that a worker stuck on a file is killed, and the rest of its chunk is anonymized."""
+    _copy_rr(tmp_path, ["slow.xml", "fast.xml"])
+    anonymize_and_save = anonymize_eicr.anonymize_and_save
+
+    def stall_on_slow_files(args, xml_file, *rest):
+        if "slow" in xml_file:
+            time.sleep(60)
+        anonymize_and_save(args, xml_file, *rest)
+
+    monkeypatch.setattr(anonymize_eicr, "anonymize_and_save", stall_on_slow_files)
+    pool = WorkerPool(_parse_arguments([str(tmp_path)]), PoolLimits(workers=1, file_timeout=2))
+
+    start = time.monotonic()
+    results = {
+        result.xml_file: result.error
+        for result in pool.run(
+            # The rest of the chunk is anonymized by the worker replacing the one that was killed
+            [
+                [
+                    (str(tmp_path / f"{name}.xml"), str(tmp_path / f"{name}.out"))
+                    for name in ("slow", "fast")
+                ]
+            ]
+        )
+    }
+
+    assert time.monotonic() - start < 30  # noqa: PLR2004
+    assert results[str(tmp_path / "slow.xml")] == "Timed out after 2 seconds"
+    assert results[str(tmp_path / "fast.xml")] is None
+
+
+@pytest.mark.parametrize(
+    "options",
+    [["-w", "0"], ["-w", "-1"], ["--max-files-per-worker", "0"], ["--file-timeout", "0"]],
+)
+def test_limits_must_be_positive(options, capsys):
+    """Test that limits that would keep the workers from anonymizing anything are rejected."""
+    with pytest.raises(SystemExit):
+        _parse_arguments([*options, "eicrs"])
+
+    assert options[0] in capsys.readouterr().err
+
+
+def test_pool_needs_a_worker():
+    """Test that a pool without workers is rejected instead of silently doing nothing."""
+    with pytest.raises(ValueError, match="workers of a worker pool"):
+        PoolLimits(workers=0)
+    with pytest.raises(ValueError, match="max_files_per_worker"):
+        PoolLimits(workers=1, max_files_per_worker=0)
+
+
+@pytest.mark.parametrize("options", [["-t", "2"], ["-w", "2"]])
+def test_failed_files_are_quarantined(tmp_path, options):
+    """Test that files that cannot be anonymized are quarantined and do not stop the run."""
+    input_dir = tmp_path / "input"
+    _copy_rr(input_dir / "good", ["CDA_RR.xml"])
+    (input_dir / "bad").mkdir()
+    (input_dir / "bad" / "CDA_RR.xml").write_bytes(b"<ClinicalDocument>")
+    output_dir = tmp_path / "output"
+    quarantine_dir = tmp_path / "quarantine"
+
+    anonymize(
+        _parse_arguments(
+            [
+                *options,
+                "-o",
+                str(output_dir),
+                "--quarantine-dir",
+                str(quarantine_dir),
+                str(input_dir),
+            ]
+        )
+    )
+
+    assert (output_dir / "good" / "CDA_RR.xml.anonymized.xml").exists()
+    assert not (output_dir / "bad").exists()
+    assert (quarantine_dir / "bad" / "CDA_RR.xml").read_bytes() == b"<ClinicalDocument>"
+    reason = (quarantine_dir / "bad" / "CDA_RR.xml.error.txt").read_text()
+    assert reason.startswith("XMLSyntaxError")
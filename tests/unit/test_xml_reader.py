@@ -0,0 +1,89 @@
+"""Unit tests for the xml_reader module."""
+
+import gzip
+import threading
+
+import pytest
+from lxml import etree
+
+from eicr_anonymization.xml_reader import (
+    DocumentTooLargeError,
+    ReadOptions,
+    get_xml_parser,
+    parse_xml,
+    read_xml,
+)
+
+DOCUMENT = b"<ClinicalDocument><id/><id/><id/></ClinicalDocument>"
+
+
+def test_parser_is_reused_per_thread_and_options():
+    """Test that a thread gets the same parser for the same options, and other threads do not."""
+    parser = get_xml_parser()
+    other_threads = []
+    thread = threading.Thread(target=lambda: other_threads.append(get_xml_parser()))
+    thread.start()
+    thread.join()
+
+    assert get_xml_parser() is parser
+    assert get_xml_parser(ReadOptions(remove_blank_text=True)) is not parser
+    assert other_threads[0] is not parser
+
+
+def test_entities_are_not_resolved():
+    """Test that entities are kept as references instead of being expanded."""
+    tree = parse_xml(b'<!DOCTYPE a [<!ENTITY e "expanded">]><a>&e;</a>')
+
+    assert "expanded" not in "".join(tree.getroot().itertext())
+
+
+def test_deep_nesting_needs_huge_tree():
+    """Test that adversarial nesting fails unless huge trees are asked for."""
+    data = b"<a>" * 300 + b"</a>" * 300
+
+    with pytest.raises(etree.XMLSyntaxError):
+        parse_xml(data)
+    assert parse_xml(data, options=ReadOptions(huge_tree=True)).getroot().tag == "a"
+
+
+@pytest.mark.parametrize("file_name", ["document.xml", "document.xml.gz"])
+def test_max_size(tmp_path, file_name):
+    """Test that files over the maximum size fail, also when they are compressed."""
+    path = tmp_path / file_name
+    path.write_bytes(gzip.compress(DOCUMENT) if file_name.endswith(".gz") else DOCUMENT)
+
+    assert read_xml(str(path), ReadOptions(max_size=len(DOCUMENT))).getroot() is not None
+    with pytest.raises(DocumentTooLargeError):
+        read_xml(str(path), ReadOptions(max_size=len(DOCUMENT) - 1))
+
+
+def test_max_nodes():
+    """Test that documents with more elements than the maximum fail."""
+    assert parse_xml(DOCUMENT, options=ReadOptions(max_nodes=4)).getroot() is not None
+    with pytest.raises(DocumentTooLargeError, match="maximum of 3 elements"):
+        parse_xml(DOCUMENT, options=ReadOptions(max_nodes=3))
+
+
+@pytest.mark.parametrize("file_name", ["document.xml", "document.xml.gz"])
+def test_max_nodes_fails_while_parsing(tmp_path, file_name):
+    """Test that documents over the maximum elements fail before the rest of them is parsed."""
+    # Never closed, so parsing it to the end would fail with a syntax error instead
+    data = b"<ClinicalDocument>" + b"<id/>" * 100_000
+    path = tmp_path / file_name
+    path.write_bytes(gzip.compress(data) if file_name.endswith(".gz") else data)
+
+    with pytest.raises(DocumentTooLargeError):
+        read_xml(str(path), ReadOptions(max_nodes=10))
+    with pytest.raises(etree.XMLSyntaxError):
+        read_xml(str(path))
+
+
+def test_max_nodes_parses_the_same_tree():
+    """Test that counting elements while parsing builds the same tree as the shared parser."""
+    with open("tests/test_data/yoda-zika-v1-positive/CDA_eICR.xml", "rb") as f:
+        data = f.read()
+
+    tree = parse_xml(data, options=ReadOptions(remove_blank_text=True))
+    counted = parse_xml(data, options=ReadOptions(remove_blank_text=True, max_nodes=100_000))
+
+    assert etree.tostring(counted) == etree.tostring(tree)
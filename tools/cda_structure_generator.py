@@ -161,3 +161,4 @@ if __name__ == "__main__":
 
     with open("src/eicr_anonymization/cda_structure.yaml", "w") as file:
         yaml.dump(data_types, file, sort_keys=False)
+    print("Regenerate the parser visitors with: python tools/visitor_generator.py")
@@ -0,0 +1,103 @@
+"""Measures how long it takes to find the handler of a sensitive element, and the element itself.
+
+Collects the sensitive elements of the given documents once, then times, per element:
+- the handler registry, which anonymization uses;
+- the `match` ladder on CDA type and tag that the registry replaced, for comparison;
+- the XPath lookup of the element in its document that the ladder did in every branch, which is
+  no longer needed as elements keep a reference to themselves.
+
+    python tools/dispatch_benchmark.py tests/test_data/**/*.xml
+"""
+
+import argparse
+import timeit
+
+from lxml import etree
+
+from eicr_anonymization.element_parser import Element, Parser
+from eicr_anonymization.handlers import default_handlers
+
+NAMESPACES = {"ns": "urn:hl7-org:v3"}
+
+
+def ladder(element: Element) -> str:  # noqa: C901, PLR0911, PLR0912
+    """Dispatch like the `match` ladder did, returning the name of the branch taken."""
+    match element.cda_type:
+        case "TS" | "IVL_TS" | "PIVL_TS" | "IVXB_TS" | "SXCM_TS":
+            return "TS"
+        case "II":
+            return "II"
+        case "ADXP":
+            match element.name:
+                case "{urn:hl7-org:v3}city":
+                    return "city"
+                case "{urn:hl7-org:v3}streetAddressLine":
+                    return "streetAddressLine"
+                case "{urn:hl7-org:v3}country":
+                    return "country"
+                case "{urn:hl7-org:v3}county":
+                    return "county"
+                case "{urn:hl7-org:v3}postalCode":
+                    return "postalCode"
+                case "{urn:hl7-org:v3}state":
+                    return "state"
+                case _:
+                    return "ADXP"
+        case "ENXP":
+            match element.name:
+                case "{urn:hl7-org:v3}given":
+                    return "given"
+                case "{urn:hl7-org:v3}family":
+                    return "family"
+                case _:
+                    return "ENXP"
+        case "EN" | "PN" | "ON":
+            return "EN"
+        case "xhtml":
+            return "xhtml"
+        case "TEL":
+            return "TEL"
+        case "ED":
+            return "ED"
+        case _:
+            return "unknown"
+
+
+def xpath(element: Element) -> etree._Element:
+    """Look up an element in its document by its path."""
+    root = element.xml_element.getroottree().getroot()
+    return root.xpath(element.path, namespaces=NAMESPACES)[0]
+
+
+def time_per_element(function, elements: list, repeat: int) -> float:
+    """Get the fastest time of calling the function on every element, in nanoseconds per call."""
+
+    def run() -> None:
+        for element in elements:
+            function(element)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(elements) * 1e9
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("documents", nargs="+", help="eICR or RR documents.")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of timed runs.")
+    args = parser.parse_args()
+
+    element_parser = Parser()
+    elements = []
+    for document in args.documents:
+        root = etree.parse(document, None).getroot()
+        elements.extend(element_parser.collect_sensitive_elements_and_safe_words(root)[0])
+    # Elements in other namespaces, like sdtc, cannot be looked up with the HL7 namespace only
+    lookups = [element for element in elements if ":" not in element.path]
+    print(f"Sensitive elements: {len(elements)} in {len(args.documents)} documents")
+
+    resolve = default_handlers.resolve
+    for name, function, timed in [
+        ("Handler registry", lambda element: resolve(element.cda_type, element.name), elements),
+        ("Match ladder", ladder, elements),
+        ("XPath lookup", xpath, lookups),
+    ]:
+        print(f"{name:>16}: {time_per_element(function, timed, args.repeat):8.0f} ns per element")
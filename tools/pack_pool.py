@@ -0,0 +1,20 @@
+"""Packs a list of replacement values into the pool format that loads quickly.
+
+The input is either a text file with one value per line, or a YAML file in the same format as the
+pools in `src/eicr_anonymization/star-wars-data`. Only the values are kept, so abbreviations and
+qualifiers are dropped. The packed file can be used with `--data-pool TYPE=PATH`.
+
+    python tools/pack_pool.py surnames.txt surnames.pool
+"""
+
+import sys
+
+from eicr_anonymization.data_pools import load_pool_file, write_packed_pool
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:  # noqa: PLR2004
+        sys.exit("Usage: python tools/pack_pool.py INPUT OUTPUT")
+    input_path, output_path = sys.argv[1:]
+    values = [replacement["value"] for replacement in load_pool_file(input_path)]
+    write_packed_pool(values, output_path)
+    print(f"Packed {len(values)} values into {output_path}")
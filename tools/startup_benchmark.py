@@ -0,0 +1,71 @@
+"""Measures how long the command line takes to start, and which imports it spends the time on.
+
+Runs `python -X importtime -m eicr_anonymization --version` several times and prints the median
+wall clock time together with the slowest top-level imports of the median run. With `--max-ms` it
+fails if the median is slower, so it can guard against startup regressions.
+
+    python tools/startup_benchmark.py --runs 10 --max-ms 300
+    python tools/startup_benchmark.py -- serve --help
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("lxml", "pydantic", "yaml", "usaddress")
+
+
+def run_once(command: list[str]) -> tuple[float, dict[str, int]]:
+    """Run the command once, returning the wall clock seconds and the cumulative import times.
+
+    Only imports done directly by the command, not by other imports, are returned, in
+    microseconds.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return elapsed, imports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs.")
+    parser.add_argument("--top", type=int, default=10, help="Number of imports to show.")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median is slower than this.")
+    parser.add_argument(
+        "arguments",
+        nargs="*",
+        default=["--version"],
+        help="Arguments for the command line, `--version` by default.",
+    )
+    args = parser.parse_args()
+
+    command = ["-m", "eicr_anonymization", *args.arguments]
+    runs = sorted((run_once(command) for _ in range(args.runs)), key=lambda run: run[0])
+    elapsed, imports = runs[len(runs) // 2]
+    median_ms = elapsed * 1000
+
+    print(f"Median startup time over {args.runs} runs: {median_ms:.0f} ms")
+    print("Slowest top-level imports:")
+    for name, microseconds in sorted(imports.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {microseconds / 1000:8.1f} ms  {name}")
+
+    heavy = sorted(name for name in imports if name.split(".")[0] in HEAVY_MODULES)
+    if heavy:
+        print(f"Heavy modules imported at startup: {', '.join(heavy)}")
+    if args.max_ms is not None and median_ms > args.max_ms:
+        sys.exit(f"Startup is slower than {args.max_ms:.0f} ms")
@@ -0,0 +1,31 @@
+"""Generates the visitors of the parser for the structure and default configuration.
+
+Run it whenever `cda_structure.yaml`, `configs/default.yaml` or `codegen.py` change. Until then,
+parsers find that the generated module is stale and interpret the rules instead.
+
+    python tools/visitor_generator.py
+"""
+
+import argparse
+
+from eicr_anonymization.codegen import GENERATED_MODULE_PATH, generate_visitors
+from eicr_anonymization.element_parser import compile_config
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--config", help="Custom configuration to generate the visitors for, instead of default."
+    )
+    parser.add_argument(
+        "--output", default=str(GENERATED_MODULE_PATH), help="Path of the generated module."
+    )
+    args = parser.parse_args()
+
+    custom_config = None
+    if args.config is not None:
+        with open(args.config, "rb") as f:
+            custom_config = f.read()
+    plan = compile_config(custom_config)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(generate_visitors(plan))
+    print(f"Generated the visitors of {len(plan.rules)} types into {args.output}")